@@ -0,0 +1,120 @@
+-- Migration 034: all-or-nothing batch lock acquisition
+-- Dependencies: 001_core_schema.sql (file_locks, acquire_lock)
+--
+-- Agents routinely lock 20-80 files before a refactor. Calling acquire_lock()
+-- once per file is one round trip per path and leaves a half-locked set behind
+-- when a later path conflicts. acquire_locks() takes the whole set in one
+-- statement: either every path is acquired or refreshed for the caller, or
+-- nothing changes and every conflicting holder is reported.
+--
+-- Semantics per path match acquire_lock(): a path held by the caller is
+-- refreshed (expires_at moved, reason kept unless a new one is supplied), a
+-- free path is inserted, and a path held by another agent is a conflict.
+--
+-- Paths are de-duplicated and upserted in sorted order so two overlapping
+-- batches take row locks in the same order and cannot deadlock each other.
+-- The upsert runs in a sub-transaction; if any row was skipped because its
+-- holder is someone else (including a holder that won a concurrent insert
+-- race), the sub-transaction is rolled back and the conflicts are returned.
+
+CREATE OR REPLACE FUNCTION acquire_locks(
+    p_file_paths TEXT[],
+    p_agent_id TEXT,
+    p_agent_type TEXT,
+    p_session_id TEXT DEFAULT NULL,
+    p_reason TEXT DEFAULT NULL,
+    p_ttl_minutes INTEGER DEFAULT 120
+) RETURNS JSONB AS $$
+DECLARE
+    v_paths TEXT[];
+    v_expires_at TIMESTAMPTZ;
+    v_locks JSONB;
+    v_conflicts JSONB;
+BEGIN
+    -- Input validation (same reasons as acquire_lock)
+    IF p_file_paths IS NULL OR cardinality(p_file_paths) = 0 OR EXISTS (
+        SELECT 1 FROM unnest(p_file_paths) AS p(path)
+        WHERE p.path IS NULL OR length(trim(p.path)) = 0
+    ) THEN
+        RETURN jsonb_build_object('success', false, 'reason', 'invalid_file_path');
+    END IF;
+    IF p_agent_id IS NULL OR length(trim(p_agent_id)) = 0 THEN
+        RETURN jsonb_build_object('success', false, 'reason', 'invalid_agent_id');
+    END IF;
+    IF p_ttl_minutes < 1 OR p_ttl_minutes > 480 THEN
+        RETURN jsonb_build_object('success', false, 'reason', 'ttl_out_of_range');
+    END IF;
+
+    SELECT array_agg(DISTINCT p.path ORDER BY p.path)
+    INTO v_paths
+    FROM unnest(p_file_paths) AS p(path);
+
+    -- Clean up expired locks first
+    DELETE FROM file_locks WHERE expires_at < NOW();
+
+    v_expires_at := NOW() + (p_ttl_minutes || ' minutes')::INTERVAL;
+
+    BEGIN
+        WITH upserted AS (
+            INSERT INTO file_locks (
+                file_path, locked_by, agent_type, session_id, expires_at, reason
+            )
+            SELECT p.path, p_agent_id, p_agent_type, p_session_id, v_expires_at, p_reason
+            FROM unnest(v_paths) AS p(path)
+            ORDER BY p.path
+            ON CONFLICT (file_path) DO UPDATE
+            SET
+                expires_at = EXCLUDED.expires_at,
+                reason = COALESCE(EXCLUDED.reason, file_locks.reason)
+            WHERE file_locks.locked_by = EXCLUDED.locked_by
+            -- xmax = 0 only for freshly inserted tuples
+            RETURNING file_locks.file_path, (xmax = 0) AS inserted
+        )
+        SELECT jsonb_agg(
+            jsonb_build_object(
+                'success', true,
+                'action', CASE WHEN u.inserted THEN 'acquired' ELSE 'refreshed' END,
+                'file_path', u.file_path,
+                'expires_at', v_expires_at
+            )
+            ORDER BY u.file_path
+        )
+        INTO v_locks
+        FROM upserted u;
+
+        IF COALESCE(jsonb_array_length(v_locks), 0) < cardinality(v_paths) THEN
+            RAISE EXCEPTION USING ERRCODE = 'lock_not_available';
+        END IF;
+    EXCEPTION WHEN lock_not_available THEN
+        SELECT jsonb_agg(
+            jsonb_build_object(
+                'success', false,
+                'reason', 'locked_by_other',
+                'file_path', fl.file_path,
+                'locked_by', fl.locked_by,
+                'agent_type', fl.agent_type,
+                'locked_at', fl.locked_at,
+                'expires_at', fl.expires_at,
+                'lock_reason', fl.reason
+            )
+            ORDER BY fl.file_path
+        )
+        INTO v_conflicts
+        FROM file_locks fl
+        WHERE fl.file_path = ANY(v_paths)
+          AND fl.locked_by <> p_agent_id;
+
+        RETURN jsonb_build_object(
+            'success', false,
+            'reason', 'locked_by_other',
+            'conflicts', COALESCE(v_conflicts, '[]'::jsonb)
+        );
+    END;
+
+    RETURN jsonb_build_object(
+        'success', true,
+        'expires_at', v_expires_at,
+        'locks', v_locks
+    );
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,109 @@
+-- Migration 035: coordinator_policy NOTIFY triggers
+-- Dependencies: 007_agent_profiles.sql, 010_cedar_policy_store.sql,
+--               025_notify_enrich_change_id.sql (coordinator_notify)
+--
+-- The policy engines cache authorization decisions. Those decisions depend on
+-- three tables: agent_profiles (trust level, allowed/blocked operations),
+-- agent_profile_assignments (which profile an agent resolves to) and
+-- cedar_policies. These triggers announce changes on the coordinator_policy
+-- channel so the event bus can drop stale decisions immediately instead of
+-- waiting for the cache TTL.
+--
+-- Event types:
+--   trust.changed   agent_profile_assignments row changed; agent_id is the
+--                   affected agent, so only its decisions are dropped
+--   profile.changed agent_profiles row changed; may affect any agent
+--   policy.changed  cedar_policies row changed; may affect any agent
+--
+-- Skips NOTIFY when current_setting('app.coordinator_internal') = 'true'
+-- (same skip flag as all other triggers, enforced in coordinator_notify).
+
+CREATE OR REPLACE FUNCTION notify_profile_assignment_change() RETURNS TRIGGER AS $$
+DECLARE
+    v_agent_id TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_agent_id := OLD.agent_id;
+    ELSE
+        v_agent_id := NEW.agent_id;
+    END IF;
+    PERFORM coordinator_notify(
+        'coordinator_policy',
+        'trust.changed',
+        v_agent_id,
+        v_agent_id,
+        'Profile assignment ' || lower(TG_OP) || ': ' || v_agent_id
+    );
+    -- A re-assignment that renames the agent affects the old id as well.
+    IF TG_OP = 'UPDATE' AND OLD.agent_id IS DISTINCT FROM NEW.agent_id THEN
+        PERFORM coordinator_notify(
+            'coordinator_policy',
+            'trust.changed',
+            OLD.agent_id,
+            OLD.agent_id,
+            'Profile assignment update: ' || OLD.agent_id
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_profile_assignment_notify ON agent_profile_assignments;
+CREATE TRIGGER trg_profile_assignment_notify
+    AFTER INSERT OR UPDATE OR DELETE ON agent_profile_assignments
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_profile_assignment_change();
+
+
+CREATE OR REPLACE FUNCTION notify_agent_profile_change() RETURNS TRIGGER AS $$
+DECLARE
+    v_name TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_name := OLD.name;
+    ELSE
+        v_name := NEW.name;
+    END IF;
+    PERFORM coordinator_notify(
+        'coordinator_policy',
+        'profile.changed',
+        v_name,
+        'system',
+        'Agent profile ' || lower(TG_OP) || ': ' || v_name
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_agent_profile_notify ON agent_profiles;
+CREATE TRIGGER trg_agent_profile_notify
+    AFTER INSERT OR UPDATE OR DELETE ON agent_profiles
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_agent_profile_change();
+
+
+CREATE OR REPLACE FUNCTION notify_cedar_policy_change() RETURNS TRIGGER AS $$
+DECLARE
+    v_name TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_name := OLD.name;
+    ELSE
+        v_name := NEW.name;
+    END IF;
+    PERFORM coordinator_notify(
+        'coordinator_policy',
+        'policy.changed',
+        v_name,
+        'system',
+        'Cedar policy ' || lower(TG_OP) || ': ' || v_name
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_cedar_policy_event_notify ON cedar_policies;
+CREATE TRIGGER trg_cedar_policy_event_notify
+    AFTER INSERT OR UPDATE OR DELETE ON cedar_policies
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_cedar_policy_change();
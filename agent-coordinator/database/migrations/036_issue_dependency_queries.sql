@@ -0,0 +1,61 @@
+-- Migration 036: set-based ready/blocked issue queries
+-- Dependencies: 001_core_schema.sql (work_queue.depends_on),
+--               017_issue_tracking.sql (issue columns)
+--
+-- IssueService.ready() / blocked() used to fetch a page of open issues and
+-- then look up every dependency with its own query, so a board with
+-- dependency chains cost one round trip per dependency per issue. These
+-- functions resolve dependencies in the same statement, using the NOT EXISTS
+-- test claim_task() already applies: an issue is ready when none of its
+-- depends_on rows is still short of 'completed'. A dependency id with no row
+-- does not block, matching claim_task().
+--
+-- Both return a JSONB array of work_queue rows so the result goes through the
+-- same Issue.from_row() path as a table query on either DB backend.
+
+CREATE OR REPLACE FUNCTION list_ready_issues(
+    p_parent_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 50
+) RETURNS JSONB AS $$
+    SELECT COALESCE(
+        jsonb_agg(to_jsonb(r) ORDER BY r.priority, r.created_at),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT w.*
+        FROM work_queue w
+        WHERE w.task_type = 'issue'
+          AND w.status IN ('pending', 'claimed', 'running')
+          AND (p_parent_id IS NULL OR w.parent_id = p_parent_id)
+          AND (w.depends_on IS NULL OR NOT EXISTS (
+              SELECT 1 FROM work_queue dep
+              WHERE dep.id = ANY(w.depends_on)
+              AND dep.status NOT IN ('completed')
+          ))
+        ORDER BY w.priority, w.created_at
+        LIMIT p_limit
+    ) r;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION list_blocked_issues(
+    p_limit INTEGER DEFAULT 50
+) RETURNS JSONB AS $$
+    SELECT COALESCE(
+        jsonb_agg(to_jsonb(r) ORDER BY r.priority, r.created_at),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT w.*
+        FROM work_queue w
+        WHERE w.task_type = 'issue'
+          AND w.status IN ('pending', 'claimed', 'running')
+          AND w.depends_on IS NOT NULL
+          AND EXISTS (
+              SELECT 1 FROM work_queue dep
+              WHERE dep.id = ANY(w.depends_on)
+              AND dep.status NOT IN ('completed')
+          )
+        ORDER BY w.priority, w.created_at
+        LIMIT p_limit
+    ) r;
+$$ LANGUAGE sql STABLE;
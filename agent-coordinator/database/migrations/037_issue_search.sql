@@ -0,0 +1,104 @@
+-- Migration 037: server-side ranked issue search
+-- Dependencies: 017_issue_tracking.sql (issue columns, metadata)
+--
+-- IssueService.search() used to fetch the first page of issues and substring
+-- match title/body in Python, so anything past the page was never found and
+-- latency grew with the backlog. search_issues() searches every issue row in
+-- the database and returns a ranked, paginated page.
+--
+-- An issue matches when either
+--   * its full-text document matches websearch_to_tsquery(p_query), which
+--     accepts quoted phrases, OR and -negation and never raises on user input;
+--   * or its title/body contains p_query as a case-insensitive substring,
+--     preserving the old behaviour for partial words and identifiers.
+-- Both tests are served by partial GIN indexes over issue rows only.
+--
+-- Results are ordered by rank (title hits weigh more than body hits, plus
+-- trigram similarity to the title), then by priority and age.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- The issue body lives in metadata->>'body'. Older IssueService writes stored
+-- metadata as a JSON-encoded string scalar rather than an object, so unwrap
+-- that form too. IMMUTABLE so it can back the expression indexes below.
+CREATE OR REPLACE FUNCTION issue_body_text(p_metadata JSONB)
+RETURNS TEXT AS $$
+BEGIN
+    IF p_metadata IS NULL THEN
+        RETURN NULL;
+    END IF;
+    IF jsonb_typeof(p_metadata) = 'string' THEN
+        RETURN (p_metadata #>> '{}')::jsonb ->> 'body';
+    END IF;
+    IF jsonb_typeof(p_metadata) = 'object' THEN
+        RETURN p_metadata ->> 'body';
+    END IF;
+    RETURN NULL;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION issue_search_text(p_title TEXT, p_metadata JSONB)
+RETURNS TEXT AS $$
+    SELECT COALESCE(p_title, '') || ' ' || COALESCE(issue_body_text(p_metadata), '');
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE INDEX IF NOT EXISTS idx_work_queue_issue_fts
+    ON work_queue
+    USING GIN (to_tsvector('simple', issue_search_text(description, metadata)))
+    WHERE task_type = 'issue';
+
+CREATE INDEX IF NOT EXISTS idx_work_queue_issue_trgm
+    ON work_queue
+    USING GIN (issue_search_text(description, metadata) gin_trgm_ops)
+    WHERE task_type = 'issue';
+
+CREATE OR REPLACE FUNCTION search_issues(
+    p_query TEXT,
+    p_statuses TEXT[] DEFAULT NULL,
+    p_labels TEXT[] DEFAULT NULL,
+    p_limit INTEGER DEFAULT 50,
+    p_offset INTEGER DEFAULT 0
+) RETURNS JSONB AS $$
+DECLARE
+    v_query TEXT := trim(COALESCE(p_query, ''));
+    v_tsquery tsquery;
+    v_pattern TEXT;
+    v_result JSONB;
+BEGIN
+    IF v_query = '' THEN
+        RETURN '[]'::jsonb;
+    END IF;
+
+    v_tsquery := websearch_to_tsquery('simple', v_query);
+    v_pattern := '%' || replace(replace(replace(v_query, '\', '\\'), '%', '\%'), '_', '\_') || '%';
+
+    SELECT COALESCE(jsonb_agg(to_jsonb(m.w) ORDER BY m.rank DESC, m.priority, m.created_at), '[]'::jsonb)
+    INTO v_result
+    FROM (
+        SELECT
+            w,
+            w.priority,
+            w.created_at,
+            ts_rank_cd(
+                setweight(to_tsvector('simple', COALESCE(w.description, '')), 'A')
+                || setweight(to_tsvector('simple', COALESCE(issue_body_text(w.metadata), '')), 'B'),
+                v_tsquery
+            ) + similarity(COALESCE(w.description, ''), v_query) AS rank
+        FROM work_queue w
+        WHERE w.task_type = 'issue'
+          AND (p_statuses IS NULL OR w.status = ANY(p_statuses))
+          AND (p_labels IS NULL OR w.labels @> p_labels)
+          AND (
+              to_tsvector('simple', issue_search_text(w.description, w.metadata)) @@ v_tsquery
+              OR issue_search_text(w.description, w.metadata) ILIKE v_pattern
+          )
+        ORDER BY rank DESC, w.priority, w.created_at
+        LIMIT p_limit
+        OFFSET GREATEST(p_offset, 0)
+    ) m;
+
+    RETURN v_result;
+END;
+$$ LANGUAGE plpgsql STABLE;
@@ -0,0 +1,41 @@
+-- Migration 038: record the secret-scanner fingerprint per manifest entry
+-- Dependencies: 030_incremental_code_search_indexes.sql (file manifests)
+--
+-- Incremental indexing reuses a parent's digests for an unchanged Git blob id
+-- without re-reading or re-scanning the blob. That is only sound if the
+-- parent entry was scanned by a scanner with the same rules, so each eligible
+-- entry records the fingerprint of the scanner that vetted it. Existing rows
+-- keep NULL, which never matches a current scanner: their blobs are read and
+-- re-scanned once before being trusted again.
+
+ALTER TABLE code_search_index_file_attempts
+    ADD COLUMN IF NOT EXISTS scanner_fingerprint TEXT;
+
+ALTER TABLE code_search_index_files
+    ADD COLUMN IF NOT EXISTS scanner_fingerprint TEXT;
+
+DO $migration$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conname = 'code_search_index_file_attempts_scanner_fingerprint_ck'
+          AND conrelid = 'code_search_index_file_attempts'::regclass
+    ) THEN
+        ALTER TABLE code_search_index_file_attempts
+            ADD CONSTRAINT code_search_index_file_attempts_scanner_fingerprint_ck
+            CHECK (scanner_fingerprint IS NULL OR scanner_fingerprint ~ '^[0-9a-f]{64}$');
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_constraint
+        WHERE conname = 'code_search_index_files_scanner_fingerprint_ck'
+          AND conrelid = 'code_search_index_files'::regclass
+    ) THEN
+        ALTER TABLE code_search_index_files
+            ADD CONSTRAINT code_search_index_files_scanner_fingerprint_ck
+            CHECK (scanner_fingerprint IS NULL OR scanner_fingerprint ~ '^[0-9a-f]{64}$');
+    END IF;
+END;
+$migration$;
@@ -114,6 +114,7 @@ class AgentBackendConfig:
     args: list[str] = field(default_factory=list)
     env: dict[str, str] = field(default_factory=dict)
     timeout_seconds: int = 300
+    max_concurrent_trials: int = 1  # Trials of this backend allowed in flight
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AgentBackendConfig:
@@ -123,6 +124,7 @@ class AgentBackendConfig:
             args=data.get("args", []),
             env=data.get("env", {}),
             timeout_seconds=data.get("timeout_seconds", 300),
+            max_concurrent_trials=data.get("max_concurrent_trials", 1),
         )
 
 
@@ -152,6 +154,11 @@ class EvalConfig:
     num_trials: int = 3
     temperature: float = 0.0  # For reproducibility
 
+    # Scheduling: total trials in flight across all backends. Per-backend
+    # limits come from AgentBackendConfig.max_concurrent_trials. With more
+    # than one trial in flight each trial runs in its own workspace.
+    max_concurrent_trials: int = 1
+
     # Evaluation options
     enable_consensus_eval: bool = False  # Multi-LLM qualitative assessment
     consensus_judges: list[str] = field(
@@ -192,6 +199,7 @@ class EvalConfig:
             ablation_configs=ablation_configs,
             num_trials=data.get("num_trials", 3),
             temperature=data.get("temperature", 0.0),
+            max_concurrent_trials=data.get("max_concurrent_trials", 1),
             enable_consensus_eval=data.get("enable_consensus_eval", False),
             consensus_judges=data.get(
                 "consensus_judges", ["claude-sonnet-4-5-20250929", "gpt-4o"]
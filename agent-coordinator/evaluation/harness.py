@@ -3,25 +3,186 @@
 Loads configuration, selects tasks, runs trials across
 agent backends and ablation configurations, collects metrics,
 and generates reports.
+
+Trials are scheduled concurrently, bounded by ``EvalConfig.max_concurrent_trials``
+overall and ``AgentBackendConfig.max_concurrent_trials`` per backend. Results are
+reported in schedule order regardless of completion order. Every finished
+(task, backend, ablation, trial) cell is appended to a JSONL checkpoint in the
+output directory, so re-running with the same ``run_id`` only executes the
+missing cells.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import shutil
+import subprocess
+import tempfile
 import time
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 from itertools import product
+from pathlib import Path
 from typing import Any
 
 from .backends.base import AgentBackend, BackendResult
 from .config import AblationFlags, EvalConfig
-from .consensus import ConsensusEvaluator, ConsensusResult
-from .metrics import MetricsCollector, TaskMetrics, TrialMetrics
+from .consensus import ConsensusEvaluator, ConsensusResult, JudgeScore
+from .metrics import (
+    CoordinationMetrics,
+    CorrectnessMetrics,
+    MetricsCollector,
+    ParallelizationMetrics,
+    SafetyMetrics,
+    TaskMetrics,
+    TimingMetric,
+    TokenUsage,
+    TrialMetrics,
+)
 from .reports.generator import ReportGenerator
 from .tasks.registry import EvalTask, TaskRegistry
 
 logger = logging.getLogger(__name__)
 
+CellKey = tuple[str, str, str, int]
+
+
+@dataclass
+class TrialCell:
+    """One (task, backend, ablation, trial) unit of work.
+
+    ``index`` is the cell's position in the serial schedule and fixes the
+    order results are reported in.
+    """
+
+    index: int
+    task: EvalTask
+    backend: AgentBackend
+    ablation: AblationFlags
+    trial_num: int
+
+    @property
+    def key(self) -> CellKey:
+        return (self.task.id, self.backend.name, self.ablation.label(), self.trial_num)
+
+
+def _metrics_key(metrics: TaskMetrics) -> CellKey:
+    return (metrics.task_id, metrics.backend_name, metrics.ablation_label, metrics.trial_num)
+
+
+def _task_metrics_from_record(data: dict[str, Any]) -> TaskMetrics:
+    data = dict(data)
+    return TaskMetrics(
+        token_usage=TokenUsage(**data.pop("token_usage")),
+        correctness=CorrectnessMetrics(**data.pop("correctness")),
+        coordination=CoordinationMetrics(**data.pop("coordination")),
+        safety=SafetyMetrics(**data.pop("safety")),
+        parallelization=ParallelizationMetrics(**data.pop("parallelization")),
+        timings=[TimingMetric(**t) for t in data.pop("timings")],
+        **data,
+    )
+
+
+def _consensus_from_record(data: dict[str, Any]) -> ConsensusResult:
+    data = dict(data)
+    return ConsensusResult(
+        judge_scores=[JudgeScore(**js) for js in data.pop("judge_scores")],
+        **data,
+    )
+
+
+class TrialCheckpoint:
+    """Append-only JSONL record of finished trial cells.
+
+    One line per cell, written as soon as the cell (and its consensus
+    evaluation, if any) completes. A torn last line from an interrupted run
+    is ignored on load.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[CellKey, tuple[TaskMetrics, ConsensusResult | None]]:
+        """Return finished cells keyed by (task, backend, ablation, trial)."""
+        completed: dict[CellKey, tuple[TaskMetrics, ConsensusResult | None]] = {}
+        if not self.path.exists():
+            return completed
+        with open(self.path) as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    metrics = _task_metrics_from_record(record["metrics"])
+                    consensus = record.get("consensus")
+                    cr = _consensus_from_record(consensus) if consensus else None
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(
+                        "Ignoring unreadable checkpoint line %d in %s", line_no, self.path
+                    )
+                    continue
+                completed[_metrics_key(metrics)] = (metrics, cr)
+        return completed
+
+    def append(self, metrics: TaskMetrics, consensus: ConsensusResult | None) -> None:
+        """Record a finished cell."""
+        record = {
+            "metrics": asdict(metrics),
+            "consensus": asdict(consensus) if consensus is not None else None,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+class _TrialWorkspace:
+    """A private copy of the working directory for one trial.
+
+    Inside a git work tree this is a detached ``git worktree`` at HEAD (so
+    trials start from the committed state); otherwise the directory is copied.
+    """
+
+    def __init__(self, source: Path, prefix: str) -> None:
+        self._source = source.resolve()
+        self._root = Path(tempfile.mkdtemp(prefix=prefix))
+        self._checkout = self._root / "checkout"
+        self._git_toplevel: Path | None = None
+        self.path = self._checkout
+
+    def create(self) -> None:
+        proc = subprocess.run(
+            ["git", "-C", str(self._source), "rev-parse", "--show-toplevel", "--show-prefix"],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode == 0:
+            toplevel, _, prefix = proc.stdout.partition("\n")
+            subprocess.run(
+                ["git", "-C", toplevel, "worktree", "add", "--detach",
+                 str(self._checkout), "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self._git_toplevel = Path(toplevel)
+            self.path = self._checkout / prefix.strip()
+        else:
+            shutil.copytree(self._source, self._checkout, symlinks=True)
+
+    def remove(self) -> None:
+        if self._git_toplevel is not None:
+            subprocess.run(
+                ["git", "-C", str(self._git_toplevel), "worktree", "remove", "--force",
+                 str(self._checkout)],
+                capture_output=True,
+                text=True,
+            )
+        shutil.rmtree(self._root, ignore_errors=True)
+
 
 class EvalHarness:
     """Orchestrates evaluation runs.
@@ -71,42 +232,32 @@ class EvalHarness:
             logger.warning("No backends configured")
             return EvalResult(run_id=self._run_id)
 
-        # 2. Run trials
+        # 2. Run trials (skipping cells already in the checkpoint)
         self._collector.clear()
-        consensus_results: list[ConsensusResult] = []
-
-        for task, backend, ablation in product(
-            tasks, self._backends, self._config.ablation_configs
-        ):
-            for trial in range(self._config.num_trials):
-                logger.info(
-                    "Running: task=%s backend=%s ablation=%s trial=%d/%d",
-                    task.id, backend.name, ablation.label(),
-                    trial + 1, self._config.num_trials,
-                )
+        cells = self._plan_cells(tasks)
+        completed = TrialCheckpoint(self.checkpoint_path).load()
+        consensus_by_cell: dict[int, ConsensusResult] = {}
+        pending: list[TrialCell] = []
+        for cell in cells:
+            done = completed.get(cell.key)
+            if done is None:
+                pending.append(cell)
+                continue
+            metrics, cr = done
+            self._collector.add_task_metrics(metrics)
+            if cr is not None:
+                consensus_by_cell[cell.index] = cr
+        if len(pending) < len(cells):
+            logger.info(
+                "Resuming from checkpoint: %d of %d trials already done",
+                len(cells) - len(pending), len(cells),
+            )
 
-                metrics = await self._run_trial(
-                    task=task,
-                    backend=backend,
-                    ablation=ablation,
-                    trial_num=trial + 1,
-                    working_dir=working_dir,
-                )
+        await self._run_cells(pending, working_dir, consensus_by_cell)
 
-                # Consensus evaluation (on last trial only, to save cost)
-                if (
-                    self._config.enable_consensus_eval
-                    and self._consensus
-                    and trial == self._config.num_trials - 1
-                    and metrics.success
-                ):
-                    cr = await self._consensus.evaluate(
-                        task_id=task.id,
-                        task_description=task.description,
-                        task_output=metrics.output,
-                        golden_patch=task.golden_patch,
-                    )
-                    consensus_results.append(cr)
+        order = {cell.key: cell.index for cell in cells}
+        self._collector.sort_metrics(key=lambda m: order.get(_metrics_key(m), len(order)))
+        consensus_results = [consensus_by_cell[i] for i in sorted(consensus_by_cell)]
 
         # 3. Aggregate metrics
         all_metrics = self._collector.get_all_metrics()
@@ -135,6 +286,121 @@ class EvalHarness:
             json_report=json_path,
         )
 
+    @property
+    def checkpoint_path(self) -> Path:
+        """JSONL checkpoint of finished cells for this run."""
+        return Path(self._config.output_dir) / f"{self._run_id}.checkpoint.jsonl"
+
+    def _plan_cells(self, tasks: list[EvalTask]) -> list[TrialCell]:
+        """Enumerate every trial cell in serial schedule order."""
+        cells: list[TrialCell] = []
+        for task, backend, ablation in product(
+            tasks, self._backends, self._config.ablation_configs
+        ):
+            for trial in range(self._config.num_trials):
+                cells.append(TrialCell(
+                    index=len(cells),
+                    task=task,
+                    backend=backend,
+                    ablation=ablation,
+                    trial_num=trial + 1,
+                ))
+        return cells
+
+    def _backend_limit(self, backend_name: str) -> int:
+        for backend_config in self._config.backends:
+            if backend_config.name == backend_name:
+                return max(1, backend_config.max_concurrent_trials)
+        return 1
+
+    async def _run_cells(
+        self,
+        cells: list[TrialCell],
+        working_dir: str,
+        consensus_by_cell: dict[int, ConsensusResult],
+    ) -> None:
+        """Run trial cells concurrently within the configured limits."""
+        max_in_flight = max(1, self._config.max_concurrent_trials)
+        run_slots = asyncio.Semaphore(max_in_flight)
+        backend_slots = {
+            b.name: asyncio.Semaphore(self._backend_limit(b.name)) for b in self._backends
+        }
+        isolate = max_in_flight > 1
+        checkpoint = TrialCheckpoint(self.checkpoint_path)
+        workspace_lock = asyncio.Lock()
+
+        async def run_cell(cell: TrialCell) -> None:
+            # Take the backend slot first so a cell waiting on a busy backend
+            # does not hold one of the run-wide slots.
+            async with backend_slots[cell.backend.name], run_slots:
+                logger.info(
+                    "Running: task=%s backend=%s ablation=%s trial=%d/%d",
+                    cell.task.id, cell.backend.name, cell.ablation.label(),
+                    cell.trial_num, self._config.num_trials,
+                )
+                async with self._trial_workspace(
+                    cell, working_dir, isolate, workspace_lock
+                ) as trial_dir:
+                    metrics = await self._run_trial(
+                        task=cell.task,
+                        backend=cell.backend,
+                        ablation=cell.ablation,
+                        trial_num=cell.trial_num,
+                        working_dir=trial_dir,
+                    )
+
+            # Consensus evaluation (on last trial only, to save cost)
+            cr: ConsensusResult | None = None
+            if (
+                self._config.enable_consensus_eval
+                and self._consensus
+                and cell.trial_num == self._config.num_trials
+                and metrics.success
+            ):
+                cr = await self._consensus.evaluate(
+                    task_id=cell.task.id,
+                    task_description=cell.task.description,
+                    task_output=metrics.output,
+                    golden_patch=cell.task.golden_patch,
+                )
+                consensus_by_cell[cell.index] = cr
+
+            checkpoint.append(metrics, cr)
+
+        async with asyncio.TaskGroup() as group:
+            for cell in cells:
+                group.create_task(run_cell(cell))
+
+    @asynccontextmanager
+    async def _trial_workspace(
+        self,
+        cell: TrialCell,
+        working_dir: str,
+        isolate: bool,
+        lock: asyncio.Lock,
+    ) -> AsyncIterator[str]:
+        """Yield the directory a trial runs in.
+
+        Serial runs use ``working_dir`` directly. Concurrent runs give each
+        trial its own workspace; creation and removal are serialized because
+        ``git worktree`` updates shared repository metadata.
+        """
+        if not isolate:
+            yield working_dir
+            return
+        workspace = _TrialWorkspace(Path(working_dir), f"{self._run_id}-{cell.index}-")
+        async with lock:
+            try:
+                await asyncio.to_thread(workspace.create)
+            except BaseException:
+                await asyncio.to_thread(workspace.remove)
+                raise
+        try:
+            yield str(workspace.path)
+        finally:
+            async with lock:
+                await asyncio.to_thread(workspace.remove)
+
     async def _run_trial(
         self,
         task: EvalTask,
@@ -7,10 +7,12 @@ across trials with confidence intervals and effect sizes.
 
 from __future__ import annotations
 
+import contextvars
 import math
 import statistics
+import threading
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any
@@ -352,12 +354,24 @@ class MetricsCollector:
 
     Provides context managers for timing coordination operations
     and methods for recording token usage and correctness scores.
+
+    Safe for concurrent trials: the "current task" is tracked per
+    ``contextvars`` context, so each asyncio task (or thread) that calls
+    :meth:`start_task` records into its own :class:`TaskMetrics`, and the
+    shared list of finished metrics is guarded by a lock.
     """
 
     def __init__(self) -> None:
-        self._current_metrics: TaskMetrics | None = None
+        self._current: contextvars.ContextVar[TaskMetrics | None] = (
+            contextvars.ContextVar(f"metrics_collector_{id(self)}", default=None)
+        )
+        self._lock = threading.Lock()
         self._all_metrics: list[TaskMetrics] = []
 
+    @property
+    def _current_metrics(self) -> TaskMetrics | None:
+        return self._current.get()
+
     def start_task(
         self,
         task_id: str,
@@ -365,27 +379,38 @@ class MetricsCollector:
         backend_name: str,
         ablation_label: str,
     ) -> TaskMetrics:
-        """Begin collecting metrics for a task execution."""
-        self._current_metrics = TaskMetrics(
+        """Begin collecting metrics for a task execution.
+
+        The new metrics become current only in the calling context, so
+        concurrent trials each need their own asyncio task.
+        """
+        metrics = TaskMetrics(
             task_id=task_id,
             trial_num=trial_num,
             backend_name=backend_name,
             ablation_label=ablation_label,
         )
-        return self._current_metrics
+        self._current.set(metrics)
+        return metrics
 
     def finish_task(self) -> TaskMetrics | None:
         """Finalize and store metrics for the current task."""
-        if self._current_metrics is None:
-            return None
-        self._current_metrics.compute_coordination_overhead()
-        self._current_metrics.coordination.compute_rates()
-        self._current_metrics.safety.compute_rates()
-        self._all_metrics.append(self._current_metrics)
         result = self._current_metrics
-        self._current_metrics = None
+        if result is None:
+            return None
+        result.compute_coordination_overhead()
+        result.coordination.compute_rates()
+        result.safety.compute_rates()
+        with self._lock:
+            self._all_metrics.append(result)
+        self._current.set(None)
         return result
 
+    def add_task_metrics(self, metrics: TaskMetrics) -> None:
+        """Store already-finalized metrics, e.g. restored from a checkpoint."""
+        with self._lock:
+            self._all_metrics.append(metrics)
+
     @contextmanager
     def time_operation(
         self, operation: str, **metadata: Any
@@ -501,12 +526,22 @@ class MetricsCollector:
 
     def get_all_metrics(self) -> list[TaskMetrics]:
         """Get all collected task metrics."""
-        return list(self._all_metrics)
+        with self._lock:
+            return list(self._all_metrics)
+
+    def sort_metrics(self, key: Callable[[TaskMetrics], Any]) -> None:
+        """Reorder collected metrics, e.g. back into schedule order.
+
+        Concurrent trials finish in arbitrary order; sorting afterwards keeps
+        reports and trial aggregation deterministic.
+        """
+        with self._lock:
+            self._all_metrics.sort(key=key)
 
     def get_trial_metrics(self) -> list[TrialMetrics]:
         """Aggregate metrics by (task_id, backend, ablation) across trials."""
         groups: dict[tuple[str, str, str], list[TaskMetrics]] = {}
-        for m in self._all_metrics:
+        for m in self.get_all_metrics():
             key = (m.task_id, m.backend_name, m.ablation_label)
             groups.setdefault(key, []).append(m)
 
@@ -514,5 +549,6 @@ class MetricsCollector:
 
     def clear(self) -> None:
         """Clear all collected metrics."""
-        self._current_metrics = None
-        self._all_metrics.clear()
+        self._current.set(None)
+        with self._lock:
+            self._all_metrics.clear()
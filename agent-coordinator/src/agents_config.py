@@ -1565,10 +1565,13 @@ async def sync_profiles(
         # The profiles service caches lookups by agent_id:agent_type with a
         # TTL. At boot the cache is empty and this is a no-op; on a re-sync in
         # a live process it stops pre-sync trust levels from being served until
-        # the TTL expires.
+        # the TTL expires. Policy decisions derived from those trust levels
+        # are dropped for the same reason.
+        from src.policy_engine import get_decision_cache
         from src.profiles import get_profiles_service
 
         get_profiles_service().invalidate_cache()
+        get_decision_cache().invalidate()
 
     logger.info(
         "Profile sync: %d inserted, %d updated, %d disabled, %d unchanged; "
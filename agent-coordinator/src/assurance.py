@@ -9,6 +9,7 @@ from __future__ import annotations
 # Canonical mutation operations exposed via MCP tools.
 MCP_MUTATION_OPERATIONS: tuple[str, ...] = (
     "acquire_lock",
+    "acquire_locks",
     "release_lock",
     "complete_work",
     "submit_work",
@@ -20,6 +21,7 @@ MCP_MUTATION_OPERATIONS: tuple[str, ...] = (
 # Canonical mutation operations exposed via HTTP API endpoints.
 HTTP_MUTATION_OPERATIONS: tuple[str, ...] = (
     "acquire_lock",
+    "acquire_locks",
     "release_lock",
     "complete_work",
     "submit_work",
@@ -5,13 +5,66 @@ Audit entries are append-only — the database enforces immutability via trigger
 """
 
 import asyncio
+import logging
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from .config import get_config
 from .db import DatabaseClient, get_db
+from .telemetry import get_audit_meter
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Metric instruments — registered when the first AuditSink is created, None
+# when OTel is disabled
+# ---------------------------------------------------------------------------
+
+_audit_instruments: tuple[Any, Any, Any, Any] | None = None
+
+
+def _ensure_audit_instruments() -> tuple[Any, Any, Any, Any]:
+    global _audit_instruments
+    if _audit_instruments is None:
+        meter = get_audit_meter()
+        if meter is None:
+            _audit_instruments = (None, None, None, None)
+        else:
+            from opentelemetry.metrics import Observation
+
+            def _observe_depth(_options: Any) -> list[Any]:
+                service = _audit_service
+                depth = service.sink.queue_depth if service and service.sink else 0
+                return [Observation(depth)]
+
+            _audit_instruments = (
+                meter.create_histogram(
+                    "audit.flush.duration_ms",
+                    unit="ms",
+                    description="Batched audit INSERT latency",
+                ),
+                meter.create_counter(
+                    "audit.entries.dropped.total",
+                    unit="1",
+                    description="Audit entries dropped (queue full or write failed)",
+                ),
+                meter.create_observable_gauge(
+                    "audit.queue.depth",
+                    callbacks=[_observe_depth],
+                    unit="1",
+                    description="Audit entries waiting to be flushed",
+                ),
+                meter.create_histogram(
+                    "audit.flush.rows",
+                    unit="1",
+                    description="Audit entries per flushed batch",
+                ),
+            )
+    return _audit_instruments
 
 
 @dataclass
@@ -69,11 +122,198 @@ class AuditResult:
         )
 
 
+class AuditSink:
+    """Bounded buffer that writes audit entries to ``audit_log`` in batches.
+
+    ``submit`` never blocks: entries are appended to an in-memory queue and
+    a single background worker flushes them with ``insert_many`` once
+    ``batch_size`` entries are waiting or ``flush_interval_s`` has passed
+    since the first one arrived. When the queue is full new entries are
+    dropped and counted rather than applying backpressure to the caller.
+
+    The worker is bound to the event loop that first submits to it and is
+    recreated if a different loop submits later (one loop per test).
+    """
+
+    def __init__(
+        self,
+        db_getter: Callable[[], DatabaseClient],
+        *,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval_s: float = 0.25,
+    ):
+        self._db_getter = db_getter
+        self._max_queue_size = max(1, max_queue_size)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_s = max(0.001, flush_interval_s)
+        self._pending: deque[dict[str, Any]] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._full: asyncio.Event | None = None
+        self._closing = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_flush_ms: float | None = None
+        # Register the instruments up front so the queue-depth gauge is
+        # exported from startup, not only after the first flush or drop.
+        try:
+            _ensure_audit_instruments()
+        except Exception:
+            logger.debug("Failed to register audit metrics", exc_info=True)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, drop/failure counts and last flush latency."""
+        return {
+            "queue_depth": self.queue_depth,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+    def submit(self, data: dict[str, Any]) -> bool:
+        """Queue an entry for the next batch. Returns False if it was dropped."""
+        if len(self._pending) >= self._max_queue_size:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "Audit queue full (%d entries); %d entries dropped so far",
+                    self._max_queue_size,
+                    self.dropped,
+                )
+            self._record_dropped(1)
+            return False
+
+        self._pending.append(data)
+        self._ensure_worker()
+        assert self._wakeup is not None and self._full is not None
+        self._wakeup.set()
+        if len(self._pending) >= self._batch_size:
+            self._full.set()
+        return True
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None and self._full is not None
+        wakeup, full = self._wakeup, self._full
+        while not self._closing:
+            if not self._pending:
+                await wakeup.wait()
+                wakeup.clear()
+                continue
+            if len(self._pending) < self._batch_size and not self._closing:
+                try:
+                    await asyncio.wait_for(full.wait(), timeout=self._flush_interval_s)
+                except TimeoutError:
+                    pass
+            full.clear()
+            await self.flush()
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write every queued entry now, one ``insert_many`` per batch."""
+        while self._pending:
+            count = min(self._batch_size, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(count)]
+            t0 = time.monotonic()
+            try:
+                lost = await self._write_batch(batch)
+                self.written += len(batch) - lost
+                if lost:
+                    self.failed += lost
+                    self._record_dropped(lost)
+            finally:
+                self.last_flush_ms = (time.monotonic() - t0) * 1000
+                try:
+                    duration_hist, _, _, rows_hist = _ensure_audit_instruments()
+                    if duration_hist is not None:
+                        duration_hist.record(self.last_flush_ms)
+                    if rows_hist is not None:
+                        rows_hist.record(count)
+                except Exception:
+                    logger.debug("Failed to record audit flush metrics", exc_info=True)
+
+    async def _write_batch(self, batch: list[dict[str, Any]]) -> int:
+        """Insert *batch*, returning how many entries could not be written.
+
+        A failed bulk insert is retried row by row, so one bad entry (or a
+        transient error) only loses the rows that fail on their own.
+        """
+        db = self._db_getter()
+        try:
+            await db.insert_many("audit_log", batch)
+            return 0
+        except Exception:
+            if len(batch) == 1:
+                logger.warning("Audit insert failed; 1 entry lost", exc_info=True)
+                return 1
+            logger.warning(
+                "Audit batch insert of %d entries failed; retrying row by row",
+                len(batch),
+                exc_info=True,
+            )
+
+        lost = 0
+        for row in batch:
+            try:
+                await db.insert_many("audit_log", [row])
+            except Exception:
+                lost += 1
+                logger.debug("Audit row insert failed", exc_info=True)
+        if lost:
+            logger.warning("Audit batch retry lost %d of %d entries", lost, len(batch))
+        return lost
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker after draining everything queued so far."""
+        worker = self._worker
+        if worker is not None and not worker.done() and self._loop is asyncio.get_running_loop():
+            self._closing = True
+            assert self._wakeup is not None and self._full is not None
+            self._wakeup.set()
+            self._full.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(worker), timeout=timeout)
+            except TimeoutError:
+                logger.warning(
+                    "Audit drain timed out with %d entries queued", self.queue_depth
+                )
+                worker.cancel()
+        self._worker = None
+        await self.flush()
+
+    @staticmethod
+    def _record_dropped(count: int) -> None:
+        try:
+            _, dropped_counter, _, _ = _ensure_audit_instruments()
+            if dropped_counter is not None:
+                dropped_counter.add(count)
+        except Exception:
+            logger.debug("Failed to record audit drop metrics", exc_info=True)
+
+
 class AuditService:
     """Service for audit trail logging and querying."""
 
     def __init__(self, db: DatabaseClient | None = None):
         self._db = db
+        self._sink: AuditSink | None = None
 
     @property
     def db(self) -> DatabaseClient:
@@ -81,6 +321,27 @@ class AuditService:
             self._db = get_db()
         return self._db
 
+    @property
+    def sink(self) -> AuditSink | None:
+        """The batching sink, or None until the first async log."""
+        return self._sink
+
+    def _get_sink(self) -> AuditSink:
+        if self._sink is None:
+            audit_config = get_config().audit
+            self._sink = AuditSink(
+                lambda: self.db,
+                max_queue_size=audit_config.queue_max_size,
+                batch_size=audit_config.batch_size,
+                flush_interval_s=audit_config.flush_interval_ms / 1000,
+            )
+        return self._sink
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Flush buffered entries and stop the sink worker (shutdown hook)."""
+        if self._sink is not None:
+            await self._sink.close(timeout=timeout)
+
     async def log_operation(
         self,
         agent_id: str | None = None,
@@ -96,8 +357,9 @@ class AuditService:
     ) -> AuditResult:
         """Log a coordination operation to the audit trail.
 
-        When async_logging is enabled (default), this fires-and-forgets
-        the insert to avoid blocking the caller.
+        When async_logging is enabled (default), the entry is queued on the
+        service's AuditSink and written in a later batch, so the caller never
+        waits on the database. A full queue drops the entry and reports it.
 
         Also pushes the entry into the audit-triage ring buffer (D9)
         for downstream LLM classification.  The push is synchronous
@@ -142,9 +404,10 @@ class AuditService:
             pass
 
         if config.audit.async_logging:
-            # Fire-and-forget: don't block the caller
-            asyncio.create_task(self._insert_audit_entry(data))
-            return AuditResult(success=True)
+            # Buffered: don't block the caller
+            if self._get_sink().submit(data):
+                return AuditResult(success=True)
+            return AuditResult(success=False, error="audit_queue_full")
         else:
             return await self._insert_audit_entry(data)
 
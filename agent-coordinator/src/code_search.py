@@ -13,6 +13,7 @@ from time import monotonic
 from typing import Annotated, Any, Literal
 from uuid import UUID
 
+from code_search_pkg.query_cache import QueryResultCache
 from code_search_pkg.query_pg import (
     QueryableIndex,
     QueryProviderContract,
@@ -270,6 +271,7 @@ class CodeSearchService:
         grant_resolver: PrincipalGrantResolver,
         work_package_resolver: WorkPackageScopeResolver | None = None,
         observer: Observer | None = None,
+        result_cache: QueryResultCache | None = None,
     ) -> None:
         self._pool = pool
         self._embedder = embedder
@@ -277,6 +279,10 @@ class CodeSearchService:
         self._grant_resolver = grant_resolver
         self._work_package_resolver = work_package_resolver
         self._observer = observer
+        self._result_cache = result_cache
+        # Last canonical storage key seen per repository, so a promotion
+        # observed here can drop the replaced index's cached results.
+        self._canonical_storage_keys: dict[str, str] = {}
         self._state_counts: Counter[str] = Counter()
 
     async def search(
@@ -422,6 +428,7 @@ class CodeSearchService:
                 allow_path_regexes=effective_scope.allow_path_regexes,
                 deny_path_regexes=effective_scope.deny_path_regexes,
                 path_regexes=effective_scope.path_regexes,
+                cache=self._result_cache,
             )
             hits = [_hit(row, selected) for row in rows if effective_scope.allows(row.file_path)][
                 : validated.limit
@@ -450,7 +457,10 @@ class CodeSearchService:
 
     async def _select_index(self, request: CodeSearchRequest) -> QueryableIndex | None:
         if request.namespace.kind is NamespaceKind.MAIN:
-            return await select_main_index(self._pool, request.repo_slug)
+            selected = await select_main_index(self._pool, request.repo_slug)
+            if selected is not None:
+                self._track_canonical(request.repo_slug, selected.storage_key)
+            return selected
         assert request.index_id is not None
         return await select_exact_index(
             self._pool,
@@ -460,6 +470,16 @@ class CodeSearchService:
             namespace_key=request.namespace.key,
         )
 
+    def _track_canonical(self, repo_slug: str, storage_key: str) -> None:
+        previous = self._canonical_storage_keys.get(repo_slug)
+        self._canonical_storage_keys[repo_slug] = storage_key
+        if (
+            self._result_cache is not None
+            and previous is not None
+            and previous != storage_key
+        ):
+            self._result_cache.retire_storage_key(previous)
+
     def metrics_snapshot(self) -> dict[str, int]:
         """Return bounded per-state counters without request or source content."""
 
@@ -0,0 +1,205 @@
+"""Query-embedding micro-batching and vector cache for semantic code search.
+
+Every ``/search/code`` request needs one query embedding. Sending each one to
+the provider on its own means a full round trip per request, even when many
+agents ask the same or similar questions at once. :class:`QueryEmbeddingBatcher`
+collects the queries that arrive within a short window and embeds them in a
+single provider call. :class:`QueryVectorCache` keeps recent query vectors,
+keyed by ``(embedder fingerprint, normalized query)``, so repeated questions
+never reach the provider.
+
+Both live in the event loop that owns the code-search runtime and are not
+thread-safe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+#: Provider call signature: a batch of texts in, one vector per text out.
+EmbedMany = Callable[[Sequence[str]], Awaitable[Sequence[Sequence[float]]]]
+
+DEFAULT_BATCH_WINDOW_SECONDS = 0.002
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_CACHE_SIZE = 1024
+
+
+def normalize_query(text: str) -> str:
+    """Return the form of ``text`` that is embedded and used as a cache key.
+
+    Leading/trailing whitespace is dropped and internal runs collapse to one
+    space. Case is preserved: identifiers are case-sensitive.
+    """
+    return " ".join(text.split())
+
+
+class QueryVectorCache:
+    """Bounded LRU of query vectors keyed by ``(fingerprint, normalized query)``."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, ...]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, fingerprint: str, query: str) -> tuple[float, ...] | None:
+        key = (fingerprint, query)
+        vector = self._entries.get(key)
+        if vector is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return vector
+
+    def put(self, fingerprint: str, query: str, vector: Sequence[float]) -> None:
+        key = (fingerprint, query)
+        self._entries[key] = tuple(float(value) for value in vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+class QueryEmbeddingBatcher:
+    """Coalesce concurrent single-query embeddings into batched provider calls.
+
+    Awaiting the batcher with one query text returns that query's vector. The
+    first query to arrive opens a window of ``window_seconds``; every query that
+    arrives before it closes (or until ``max_batch_size`` queries are waiting)
+    is sent in the same provider call, with duplicates embedded once. A
+    provider failure fails every query in that batch.
+    """
+
+    def __init__(
+        self,
+        embed_many: EmbedMany,
+        *,
+        fingerprint: str,
+        window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        cache: QueryVectorCache | None = None,
+    ) -> None:
+        if window_seconds < 0 or max_batch_size < 1:
+            raise ValueError("embedding batch bounds must be positive")
+        self._embed_many = embed_many
+        self._fingerprint = fingerprint
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self.cache = cache
+        self._pending: list[tuple[str, asyncio.Future[tuple[float, ...]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.provider_calls = 0
+        self.embedded_queries = 0
+
+    async def __call__(self, text: str) -> list[float]:
+        if self._closed:
+            raise RuntimeError("query embedding batcher is closed")
+        query = normalize_query(text)
+        if self.cache is not None:
+            cached = self.cache.get(self._fingerprint, query)
+            if cached is not None:
+                return list(cached)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[tuple[float, ...]] = loop.create_future()
+        self._pending.append((query, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._dispatch)
+        return list(await future)
+
+    def stats(self) -> dict[str, Any]:
+        calls = self.provider_calls
+        return {
+            "provider_calls": calls,
+            "embedded_queries": self.embedded_queries,
+            "mean_batch_size": round(self.embedded_queries / calls, 4) if calls else 0.0,
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    async def close(self) -> None:
+        """Fail waiting queries and cancel in-flight provider calls."""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        for _query, future in pending:
+            future.cancel()
+        batches = list(self._batches)
+        for task in batches:
+            task.cancel()
+        if batches:
+            await asyncio.gather(*batches, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[str, asyncio.Future[tuple[float, ...]]]]
+    ) -> None:
+        # Callers that were cancelled while waiting no longer need a vector.
+        live = [(query, future) for query, future in batch if not future.done()]
+        texts = list(dict.fromkeys(query for query, _future in live))
+        if not texts:
+            return
+        try:
+            self.provider_calls += 1
+            vectors = await self._embed_many(texts)
+            if len(vectors) != len(texts):
+                raise RuntimeError("embedding provider returned an invalid response")
+            by_text = {
+                text: tuple(float(value) for value in vector)
+                for text, vector in zip(texts, vectors, strict=True)
+            }
+        except asyncio.CancelledError:
+            for _query, future in live:
+                future.cancel()
+            raise
+        except Exception as error:
+            for _query, future in live:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        self.embedded_queries += len(texts)
+        if self.cache is not None:
+            for text, vector in by_text.items():
+                self.cache.put(self._fingerprint, text, vector)
+        for query, future in live:
+            if not future.done():
+                future.set_result(by_text[query])
@@ -15,9 +15,20 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .code_search_embedding import (
+    DEFAULT_BATCH_WINDOW_SECONDS,
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MAX_BATCH_SIZE,
+    QueryEmbeddingBatcher,
+    QueryVectorCache,
+)
+from .telemetry import get_code_search_meter
+
 if TYPE_CHECKING:
     # Imported for typing only; the runtime import stays inside the function
     # below to avoid a circular import with code_search.
+    from code_search_pkg.query_cache import QueryResultCache
+
     from .code_search import CodeSearchResponse
 
 logger = logging.getLogger(__name__)
@@ -111,6 +122,10 @@ class CodeSearchRuntimeConfig:
     max_failure_backoff_seconds: float = 30.0
     max_concurrency: int = 4
     overload_timeout_seconds: float = 0.01
+    embedding_batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS
+    embedding_max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    query_vector_cache_size: int = DEFAULT_CACHE_SIZE
+    result_cache_size: int = 2048
 
     def __post_init__(self) -> None:
         positive = (
@@ -124,6 +139,13 @@ class CodeSearchRuntimeConfig:
         )
         if any(value <= 0 for value in positive) or self.max_concurrency < 1:
             raise ValueError("code-search runtime bounds must be positive")
+        if (
+            self.embedding_batch_window_seconds < 0
+            or self.embedding_max_batch_size < 1
+            or self.query_vector_cache_size < 0
+            or self.result_cache_size < 0
+        ):
+            raise ValueError("code-search embedding and cache bounds must be non-negative")
 
     @classmethod
     def from_env(cls, environment: Mapping[str, str] | None = None) -> CodeSearchRuntimeConfig:
@@ -140,6 +162,16 @@ class CodeSearchRuntimeConfig:
             ),
             max_concurrency=_int_env(env, "CODE_SEARCH_MAX_CONCURRENCY", 4),
             overload_timeout_seconds=_float_env(env, "CODE_SEARCH_OVERLOAD_TIMEOUT_SECONDS", 0.01),
+            embedding_batch_window_seconds=_float_env(
+                env, "CODE_SEARCH_EMBEDDING_BATCH_WINDOW_SECONDS", DEFAULT_BATCH_WINDOW_SECONDS
+            ),
+            embedding_max_batch_size=_int_env(
+                env, "CODE_SEARCH_EMBEDDING_MAX_BATCH_SIZE", DEFAULT_MAX_BATCH_SIZE
+            ),
+            query_vector_cache_size=_int_env(
+                env, "CODE_SEARCH_QUERY_CACHE_SIZE", DEFAULT_CACHE_SIZE
+            ),
+            result_cache_size=_int_env(env, "CODE_SEARCH_RESULT_CACHE_SIZE", 2048),
         )
 
 
@@ -162,6 +194,8 @@ class CodeSearchRuntime:
         self._pool: Any | None = None
         self._provider: Any | None = None
         self._service: Any | None = None
+        self._embedder: QueryEmbeddingBatcher | None = None
+        self._result_cache: QueryResultCache | None = None
         self._owner_loop: asyncio.AbstractEventLoop | None = None
         self._initial_status = _status("uninitialized", "uninitialized")
         self._provider_cache = _Cache()
@@ -229,6 +263,7 @@ class CodeSearchRuntime:
 
         try:
             if service_factory is None:
+                from code_search_pkg.query_cache import QueryResultCache
                 from code_search_pkg.query_pg import QueryProviderContract
 
                 from .code_search import CodeSearchService
@@ -239,15 +274,12 @@ class CodeSearchRuntime:
                 if provider is None:
                     raise RuntimeError("embedding provider is unavailable")
 
-                async def embed_one(text: str) -> list[float]:
-                    vectors = await provider.embed([text])
-                    if len(vectors) != 1:
-                        raise RuntimeError("embedding provider returned an invalid response")
-                    return list(vectors[0])
-
+                runtime._embedder = runtime._build_embedder(provider)
+                if runtime.config.result_cache_size > 0:
+                    runtime._result_cache = QueryResultCache(runtime.config.result_cache_size)
                 runtime._service = service_factory(
                     pool=runtime._pool,
-                    embedder=embed_one,
+                    embedder=runtime._embedder,
                     provider_contract=QueryProviderContract(
                         model=runtime._provider.model_id,
                         dimension=runtime._provider.dimension,
@@ -255,6 +287,7 @@ class CodeSearchRuntime:
                     ),
                     grant_resolver=grant_resolver,
                     work_package_resolver=work_package_resolver,
+                    result_cache=runtime._result_cache,
                 )
             else:
                 runtime._service = service_factory(
@@ -262,6 +295,7 @@ class CodeSearchRuntime:
                     provider=runtime._provider,
                 )
         except Exception:
+            await runtime._close_embedder()
             await runtime._close_pool()
             await runtime._close_provider()
             return runtime._finish_initialization(
@@ -273,12 +307,38 @@ class CodeSearchRuntime:
             started_at,
         )
 
+    def _build_embedder(self, provider: Any) -> QueryEmbeddingBatcher:
+        """Coalesce concurrent query embeddings and cache repeated queries."""
+
+        cache = (
+            QueryVectorCache(self.config.query_vector_cache_size)
+            if self.config.query_vector_cache_size > 0
+            else None
+        )
+        return QueryEmbeddingBatcher(
+            provider.embed,
+            fingerprint=provider.fingerprint,
+            window_seconds=self.config.embedding_batch_window_seconds,
+            max_batch_size=self.config.embedding_max_batch_size,
+            cache=cache,
+        )
+
     @property
     def state_counts(self) -> dict[tuple[str, str, str, str, str, str], int]:
         """Return privacy-safe completion counters for operational states."""
 
         return dict(self._state_counts)
 
+    def embedding_stats(self) -> dict[str, Any] | None:
+        """Return query-embedding batch and cache counters, if embedding is wired."""
+
+        return self._embedder.stats() if self._embedder is not None else None
+
+    def result_cache_stats(self) -> dict[str, Any] | None:
+        """Return KNN result-cache counters, if the cache is enabled."""
+
+        return self._result_cache.stats() if self._result_cache is not None else None
+
     def status_snapshot(self) -> CodeSearchStatus:
         """Return the last bounded status without starting optional work."""
 
@@ -451,9 +511,13 @@ class CodeSearchRuntime:
                 )
             except TimeoutError:
                 logger.warning("code_search_shutdown_timeout")
+        await self._close_embedder()
         await self._close_pool()
         await self._close_provider()
         self.invalidate()
+        if self._result_cache is not None:
+            self._result_cache.clear()
+            self._result_cache = None
         self._service = None
         self._provider = None
         self._initial_status = _status("uninitialized", "uninitialized")
@@ -490,6 +554,11 @@ class CodeSearchRuntime:
         cache.value = value
         cache.expires_at = monotonic() + delay
 
+    async def _close_embedder(self) -> None:
+        embedder, self._embedder = self._embedder, None
+        if embedder is not None:
+            await embedder.close()
+
     async def _close_pool(self) -> None:
         pool, self._pool = self._pool, None
         if pool is None:
@@ -528,6 +597,96 @@ class CodeSearchRuntime:
 
 _runtime: CodeSearchRuntime | Any | None = None
 
+# ---------------------------------------------------------------------------
+# Metric instruments — observable views over the published runtime's query
+# embedding batcher and cache counters; None when OTel is disabled.
+# ---------------------------------------------------------------------------
+
+_code_search_instruments: tuple[Any, ...] | None = None
+
+
+def _published_stats() -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    runtime = _runtime
+    if not isinstance(runtime, CodeSearchRuntime):
+        return None, None
+    return runtime.embedding_stats(), runtime.result_cache_stats()
+
+
+def _cache_stats() -> dict[str, dict[str, Any]]:
+    """Query-vector and KNN-result cache counters keyed by the ``cache`` label."""
+
+    embedding, results = _published_stats()
+    caches: dict[str, dict[str, Any]] = {}
+    if embedding is not None and embedding["cache"] is not None:
+        caches["query_vector"] = embedding["cache"]
+    if results is not None:
+        caches["knn_result"] = results
+    return caches
+
+
+def _ensure_code_search_instruments() -> tuple[Any, ...]:
+    global _code_search_instruments
+    if _code_search_instruments is None:
+        meter = get_code_search_meter()
+        if meter is None:
+            _code_search_instruments = (None, None, None, None)
+        else:
+            from opentelemetry.metrics import Observation
+
+            def _observe_lookups(_options: Any) -> list[Any]:
+                return [
+                    Observation(stats[key], {"cache": cache, "result": result})
+                    for cache, stats in _cache_stats().items()
+                    for key, result in (("hits", "hit"), ("misses", "miss"))
+                ]
+
+            def _observe_hit_rate(_options: Any) -> list[Any]:
+                return [
+                    Observation(stats["hit_rate"], {"cache": cache})
+                    for cache, stats in _cache_stats().items()
+                ]
+
+            def _observe_embedding(key: str) -> Callable[[Any], list[Any]]:
+                def _observe(_options: Any) -> list[Any]:
+                    embedding, _ = _published_stats()
+                    return [Observation(embedding[key])] if embedding is not None else []
+
+                return _observe
+
+            _code_search_instruments = (
+                meter.create_observable_counter(
+                    "code_search.cache.lookups",
+                    callbacks=[_observe_lookups],
+                    unit="1",
+                    description="Query-vector and KNN-result cache lookups by outcome",
+                ),
+                meter.create_observable_gauge(
+                    "code_search.cache.hit_rate",
+                    callbacks=[_observe_hit_rate],
+                    unit="1",
+                    description="Cache hit rate since the runtime started",
+                ),
+                meter.create_observable_counter(
+                    "code_search.embedding.provider_calls",
+                    callbacks=[_observe_embedding("provider_calls")],
+                    unit="1",
+                    description="Batched query-embedding provider calls",
+                ),
+                meter.create_observable_counter(
+                    "code_search.embedding.queries",
+                    callbacks=[_observe_embedding("embedded_queries")],
+                    unit="1",
+                    description="Queries embedded by the provider",
+                ),
+            )
+    return _code_search_instruments
+
+
+def reset_code_search_instruments() -> None:
+    """Reset cached instruments (for testing)."""
+    global _code_search_instruments
+    _code_search_instruments = None
+
 
 async def start_code_search_runtime() -> CodeSearchRuntime:
     """Create and publish the runtime in the current serving event loop."""
@@ -535,6 +694,10 @@ async def start_code_search_runtime() -> CodeSearchRuntime:
     global _runtime
     runtime = await CodeSearchRuntime.create()
     _runtime = runtime
+    try:
+        _ensure_code_search_instruments()
+    except Exception:
+        logger.debug("code_search_metrics_registration_failed", exc_info=True)
     return runtime
 
 
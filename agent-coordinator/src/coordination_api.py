@@ -102,6 +102,15 @@ class LockAcquireRequest(BaseModel):
     ttl_minutes: int = 30
 
 
+class LockAcquireBatchRequest(BaseModel):
+    file_paths: list[str] = Field(min_length=1, max_length=500)
+    agent_id: str
+    agent_type: str
+    session_id: str | None = None
+    reason: str | None = None
+    ttl_minutes: int = 30
+
+
 class LockReleaseRequest(BaseModel):
     file_path: str
     agent_id: str
@@ -368,6 +377,7 @@ class IssueSearchRequest(BaseModel):
     status: str | None = None
     labels: list[str] | None = None
     limit: int = 50
+    offset: int = Field(default=0, ge=0)
 
 
 class IssueReadyRequest(BaseModel):
@@ -631,10 +641,12 @@ def create_coordination_api() -> FastAPI:
                 exc_info=False,
             )
 
-        # Start event bus for status NOTIFY
+        # Start event bus for status NOTIFY and policy cache invalidation
         from .event_bus import get_event_bus
+        from .policy_engine import subscribe_policy_invalidation
 
         event_bus = get_event_bus()
+        subscribe_policy_invalidation(event_bus)
         try:
             await event_bus.start()
         except Exception:  # noqa: BLE001
@@ -691,7 +703,8 @@ def create_coordination_api() -> FastAPI:
 
         yield
 
-        # Shutdown merge watcher, sweeper, watchdog, notifier, event bus, langfuse
+        # Shutdown merge watcher, sweeper, watchdog, notifier, event bus, audit
+        # sink, code search, langfuse
         try:
             await merge_watcher.stop()
         except Exception:  # noqa: BLE001
@@ -712,6 +725,14 @@ def create_coordination_api() -> FastAPI:
             await event_bus.stop()
         except Exception:  # noqa: BLE001
             pass
+        # Drain buffered audit entries after the background producers above
+        # have stopped, so their final entries are written too.
+        try:
+            from .audit import get_audit_service
+
+            await get_audit_service().drain()
+        except Exception:  # noqa: BLE001
+            pass
         try:
             await stop_code_search_runtime()
         except Exception:  # noqa: BLE001
@@ -843,6 +864,35 @@ def create_coordination_api() -> FastAPI:
             "lock_reason": result.lock_reason,
         }
 
+    @app.post("/locks/acquire-batch")
+    async def acquire_locks_batch(
+        request: LockAcquireBatchRequest,
+        principal: dict[str, Any] = Depends(verify_api_key),
+    ) -> dict[str, Any]:
+        """Acquire several file locks in one call, all or nothing.
+
+        Authorization happens once for the whole batch inside
+        ``LockService.acquire_many``; a policy denial raises 403, the same
+        status ``/locks/acquire`` returns for a denied path.
+        """
+        agent_id, agent_type = resolve_identity(
+            principal, request.agent_id, request.agent_type
+        )
+
+        from .locks import get_lock_service
+
+        result = await get_lock_service().acquire_many(
+            file_paths=request.file_paths,
+            agent_id=agent_id,
+            agent_type=agent_type,
+            session_id=request.session_id,
+            reason=request.reason,
+            ttl_minutes=request.ttl_minutes,
+        )
+        if result.policy_denied:
+            raise HTTPException(status_code=403, detail=result.reason or "Forbidden")
+        return result.to_dict()
+
     @app.post("/locks/release")
     async def release_lock(
         request: LockReleaseRequest,
@@ -2048,6 +2098,7 @@ def create_coordination_api() -> FastAPI:
             "partition_count": len(composition.partitions),
             "cross_partition_count": len(composition.cross_partition_entries),
             "full_test_suite_required": composition.full_test_suite_required,
+            "partition_timings": composition.partition_timings,
             "partitions": [
                 {
                     "partition_id": p.partition_id,
@@ -2708,15 +2759,22 @@ def create_coordination_api() -> FastAPI:
         request: IssueSearchRequest,
         principal: dict[str, Any] = Depends(verify_api_key),
     ) -> dict[str, Any]:
-        """Search issues by text matching in title and description."""
+        """Ranked full-text search over issue titles and descriptions."""
         from .issue_service import get_issue_service
 
         service = get_issue_service()
-        issues = await service.search(query=request.query, limit=request.limit)
+        issues = await service.search(
+            query=request.query,
+            limit=request.limit,
+            offset=request.offset,
+            status=request.status,
+            labels=request.labels,
+        )
         return {
             "success": True,
             "issues": [i.to_dict() for i in issues],
             "count": len(issues),
+            "offset": request.offset,
         }
 
     @app.post("/issues/ready")
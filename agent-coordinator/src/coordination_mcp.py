@@ -61,6 +61,8 @@ async def _mcp_lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
 
     if _transport == "db":
         from .code_search_runtime import start_code_search_runtime
+        from .event_bus import get_event_bus
+        from .policy_engine import subscribe_policy_invalidation
 
         try:
             await start_code_search_runtime()
@@ -69,12 +71,33 @@ async def _mcp_lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
                 "Code-search startup failed — semantic search unavailable.",
                 exc_info=False,
             )
+
+        # This process evaluates policy directly, so it needs the same
+        # policy-change invalidation as the HTTP API; without the bus, cached
+        # decisions only expire on their TTL.
+        event_bus = get_event_bus()
+        subscribe_policy_invalidation(event_bus)
+        try:
+            await event_bus.start()
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                "Event bus startup failed — policy cache falls back to its TTL.",
+                exc_info=False,
+            )
     try:
         yield {}
     finally:
         if _transport == "db":
             from .code_search_runtime import stop_code_search_runtime
 
+            try:
+                await event_bus.stop()
+            except Exception:  # noqa: BLE001
+                pass
+            try:
+                await get_audit_service().drain()
+            except Exception:  # noqa: BLE001
+                logger.warning("Audit drain failed on shutdown.", exc_info=True)
             await stop_code_search_runtime()
         else:
             await http_proxy.shutdown_client()
@@ -163,6 +186,52 @@ async def acquire_lock(
     }
 
 
+@mcp.tool
+async def acquire_locks(
+    file_paths: list[str],
+    reason: str | None = None,
+    ttl_minutes: int | None = None,
+) -> dict[str, Any]:
+    """
+    Acquire exclusive locks on several files in one call, all or nothing.
+
+    Prefer this over repeated acquire_lock calls before a multi-file change.
+    Either every file is locked (or refreshed, if you already hold it) or
+    none are and the conflicting holders are reported.
+
+    Args:
+        file_paths: Paths to lock (relative to repo root)
+        reason: Why you need the locks (helps with debugging)
+        ttl_minutes: How long to hold the locks (default from config, usually 120)
+
+    Returns:
+        success: Whether every lock was acquired
+        locks: Per-file results ('acquired' or 'refreshed') on success
+        conflicts: Files held by other agents, with locked_by, on failure
+        expires_at: When the locks will expire (if successful)
+
+    Example:
+        result = acquire_locks(["src/a.py", "src/b.py"], reason="rename helper")
+        if result["success"]:
+            ...
+            for path in ["src/a.py", "src/b.py"]:
+                release_lock(path)
+    """
+    if _transport == "http":
+        return await http_proxy.proxy_acquire_locks(
+            file_paths=file_paths,
+            reason=reason,
+            ttl_minutes=ttl_minutes,
+        )
+    service = get_lock_service()
+    result = await service.acquire_many(
+        file_paths=file_paths,
+        reason=reason,
+        ttl_minutes=ttl_minutes,
+    )
+    return result.to_dict()
+
+
 @mcp.tool
 async def release_lock(file_path: str) -> dict[str, Any]:
     """
@@ -831,29 +900,42 @@ async def issue_blocked() -> dict[str, Any]:
 async def issue_search(
     query: str,
     limit: int = 50,
+    offset: int = 0,
+    status: str | None = None,
+    labels: list[str] | None = None,
 ) -> dict[str, Any]:
     """
-    Search issues by text matching in title and description.
+    Search issues by title and description, best matches first.
 
     Args:
-        query: Search string (case-insensitive substring match)
+        query: Search string. Full-text terms (quoted phrases, OR, -term)
+            and case-insensitive substrings both match.
         limit: Max results (default 50)
+        offset: Ranked results to skip, for pagination (default 0)
+        status: Filter by status (open, in_progress, closed, all)
+        labels: Filter by labels (must contain ALL specified)
 
     Returns:
         success: true
-        issues: List of matching issues
-        count: Number of matches
+        issues: List of matching issues, ranked
+        count: Number of matches in this page
+        offset: Offset of this page
     """
     if _transport == "http":
         return await http_proxy.proxy_issue_search(
             query=query,
             limit=limit,
+            offset=offset,
+            status=status,
+            labels=labels,
         )
     from .issue_service import get_issue_service
 
     service = get_issue_service()
     try:
-        issues = await service.search(query=query, limit=limit)
+        issues = await service.search(
+            query=query, limit=limit, offset=offset, status=status, labels=labels,
+        )
     except Exception as e:  # noqa: BLE001
         logger.exception("issue_search failed")
         return {"success": False, "reason": f"{type(e).__name__}: {e}"}
@@ -862,6 +944,7 @@ async def issue_search(
         "success": True,
         "issues": [i.to_dict() for i in issues],
         "count": len(issues),
+        "offset": offset,
     }
 
 
@@ -2189,7 +2272,8 @@ async def compose_train() -> dict[str, Any]:
 
     Returns:
         Dict with `train_id`, `partitions` (count + entry lists),
-        `cross_partition_entries`, and `full_test_suite_required`.
+        `cross_partition_entries`, `full_test_suite_required`, and
+        `partition_timings` (seconds spent speculating each partition).
     """
     from .merge_train import TrainAuthorizationError
     from .merge_train_service import get_merge_train_service
@@ -2212,6 +2296,7 @@ async def compose_train() -> dict[str, Any]:
         "partition_count": len(composition.partitions),
         "cross_partition_count": len(composition.cross_partition_entries),
         "full_test_suite_required": composition.full_test_suite_required,
+        "partition_timings": composition.partition_timings,
         "partitions": [
             {
                 "partition_id": p.partition_id,
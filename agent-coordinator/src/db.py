@@ -51,6 +51,10 @@ class DatabaseClient(Protocol):
         """Insert a row."""
         ...
 
+    async def insert_many(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Insert several rows sharing the same columns in one round trip."""
+        ...
+
     async def update(
         self,
         table: str,
@@ -181,6 +185,26 @@ class SupabaseClient:
         result = response.json()
         return result[0] if result else {}
 
+    async def insert_many(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Insert several rows with one bulk PostgREST request.
+
+        Args:
+            table: Table name
+            rows: Row data; every row must have the same keys
+        """
+        if not rows:
+            return
+
+        headers = self._headers()
+        headers["Prefer"] = "return=minimal"
+
+        response = await self.client.post(
+            f"{self.config.url}{self.config.rest_prefix}/{table}",
+            headers=headers,
+            json=rows,
+        )
+        response.raise_for_status()
+
     async def update(
         self,
         table: str,
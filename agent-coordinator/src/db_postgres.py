@@ -9,6 +9,8 @@ executed via asyncpg's connection pool.
 
 import json
 import re
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -16,6 +18,7 @@ from uuid import UUID
 import asyncpg  # noqa: I001
 
 from .config import PostgresConfig
+from .telemetry import get_db_meter
 
 _UUID_RE = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
@@ -109,16 +112,143 @@ def _serialize_for_asyncpg(value: Any) -> Any:
     return value
 
 
+# A parsed PostgREST filter shape: one entry per query-string part with the
+# literal values stripped out. Two requests that differ only in their filter
+# values share a shape, and therefore a compiled SQL template.
+_FilterShape = tuple[tuple[str, ...], ...]
+
+
+def _compile_query_template(table: str, select: str, shape: _FilterShape) -> str:
+    """Build the parameterised SQL text for a parsed filter shape.
+
+    All identifier validation happens here, so a shape that compiled once
+    is safe to reuse without re-running the identifier regexes.
+    """
+    where_clauses: list[str] = []
+    order_clause = ""
+    limit_clause = ""
+    param_idx = 1
+
+    for entry in shape:
+        kind = entry[0]
+        if kind == "order":
+            order_parts = entry[1].split(".")
+            col = _validate_identifier(order_parts[0], allow_qualified=True)
+            is_desc = len(order_parts) > 1 and order_parts[1] == "desc"
+            direction = "DESC" if is_desc else "ASC"
+            order_clause = f" ORDER BY {col} {direction}"
+        elif kind == "limit":
+            limit_clause = f" LIMIT {int(entry[1])}"
+        elif kind == "jsonb_eq":
+            _, jsonb_col, jsonb_key = entry
+            _validate_identifier(jsonb_col, allow_qualified=True)
+            _validate_identifier(jsonb_key)
+            where_clauses.append(f"{jsonb_col}->>'{jsonb_key}' = ${param_idx}")
+            param_idx += 1
+        elif kind == "cmp":
+            _, col, op = entry
+            _validate_identifier(col, allow_qualified=True)
+            where_clauses.append(f"{col} {op} ${param_idx}")
+            param_idx += 1
+        elif kind == "gt_now":
+            col = _validate_identifier(entry[1], allow_qualified=True)
+            where_clauses.append(f"{col} > NOW()")
+        elif kind == "in":
+            _, col, count = entry
+            _validate_identifier(col, allow_qualified=True)
+            placeholders = ", ".join(f"${param_idx + i}" for i in range(int(count)))
+            where_clauses.append(f"{col} IN ({placeholders})")
+            param_idx += int(count)
+
+    where = f" WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    safe_select = _validate_select_clause(select)
+    safe_table = _validate_identifier(table, allow_qualified=True)
+    return f"SELECT {safe_select} FROM {safe_table}{where}{order_clause}{limit_clause}"
+
+
+def _compile_rpc_template(function_name: str, param_names: tuple[str, ...]) -> str:
+    """Build the named-argument SELECT used to call a PostgreSQL function."""
+    _validate_identifier(function_name, allow_qualified=True)
+    param_clause = ", ".join(
+        f"{name} := ${i + 1}" for i, name in enumerate(param_names)
+    )
+    return f"SELECT {function_name}({param_clause})"
+
+
+class _TemplateCache:
+    """Bounded LRU of compiled SQL templates with hit/miss counters."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = max(0, maxsize)
+        self._entries: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(
+        self, key: tuple[Any, ...], compile_fn: Callable[[], str], kind: str
+    ) -> str:
+        sql = self._entries.get(key)
+        if sql is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _record_template_cache(kind, "hit")
+            return sql
+
+        # Compile before counting so a rejected (unsafe) shape is never cached.
+        sql = compile_fn()
+        self.misses += 1
+        _record_template_cache(kind, "miss")
+        if self._maxsize:
+            self._entries[key] = sql
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return sql
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ---------------------------------------------------------------------------
+# Lazy metric instruments — initialised on first use, None when OTel disabled
+# ---------------------------------------------------------------------------
+
+_template_cache_counter: Any = None
+_template_cache_counter_ready = False
+
+
+def _record_template_cache(kind: str, result: str) -> None:
+    global _template_cache_counter, _template_cache_counter_ready
+    try:
+        if not _template_cache_counter_ready:
+            meter = get_db_meter()
+            if meter is not None:
+                _template_cache_counter = meter.create_counter(
+                    "db.query_template.cache.total",
+                    unit="1",
+                    description="Compiled SQL template cache hits/misses",
+                )
+            _template_cache_counter_ready = True
+        if _template_cache_counter is not None:
+            _template_cache_counter.add(1, {"kind": kind, "result": result})
+    except Exception:
+        pass
+
+
 class DirectPostgresClient:
     """Direct PostgreSQL client using asyncpg connection pool.
 
     Translates the DatabaseClient interface to standard SQL.
     Use when connecting directly to PostgreSQL without PostgREST.
+
+    Query and RPC SQL is compiled once per filter shape and reused, so the
+    text sent to the server is byte-identical across calls and asyncpg's
+    per-connection statement cache serves the prepared statement.
     """
 
     def __init__(self, config: PostgresConfig | None = None):
         self._config = config or PostgresConfig()
         self._pool: asyncpg.Pool | None = None
+        self._templates = _TemplateCache(self._config.query_template_cache_size)
 
     async def _get_pool(self) -> asyncpg.Pool:
         if self._pool is None:
@@ -126,25 +256,34 @@ class DirectPostgresClient:
                 dsn=self._config.dsn,
                 min_size=self._config.pool_min,
                 max_size=self._config.pool_max,
+                statement_cache_size=self._config.statement_cache_size,
             )
         return self._pool
 
+    def template_cache_stats(self) -> dict[str, int]:
+        """Return compiled-template cache counters for diagnostics."""
+        return {
+            "hits": self._templates.hits,
+            "misses": self._templates.misses,
+            "size": len(self._templates),
+        }
+
     async def rpc(self, function_name: str, params: dict[str, Any]) -> Any:
         """Call a PostgreSQL function.
 
         Translates to: SELECT function_name(p1 := $1, p2 := $2, ...)
         """
-        _validate_identifier(function_name, allow_qualified=True)
+        param_names = tuple(params.keys())
+        query = self._templates.get_or_compile(
+            ("rpc", function_name, param_names),
+            lambda: _compile_rpc_template(function_name, param_names),
+            "rpc",
+        )
         pool = await self._get_pool()
 
-        # Build named parameter call — serialize dicts/lists for JSONB params
-        param_names = list(params.keys())
+        # Serialize dicts/lists for JSONB params
         param_values = [_serialize_for_asyncpg(v) for v in params.values()]
-        param_clause = ", ".join(
-            f"{name} := ${i + 1}" for i, name in enumerate(param_names)
-        )
 
-        query = f"SELECT {function_name}({param_clause})"
         async with pool.acquire() as conn:
             row = await conn.fetchrow(query, *param_values)
             if row is None:
@@ -167,26 +306,19 @@ class DirectPostgresClient:
     ) -> list[dict[str, Any]]:
         """Query a table with optional PostgREST-style filters.
 
-        Translates PostgREST filter syntax to SQL WHERE clauses.
+        Translates PostgREST filter syntax to SQL WHERE clauses. The filter
+        string is reduced to a value-free shape; the SQL for each shape is
+        compiled once and cached.
         """
-        pool = await self._get_pool()
-
-        where_clauses: list[str] = []
-        order_clause = ""
-        limit_clause = ""
-        values: list[Any] = []
-        param_idx = 1
+        shape: list[tuple[str, ...]] = []
+        raw_values: list[str] = []
 
         if query_params:
             for part in query_params.split("&"):
                 if part.startswith("order="):
-                    order_parts = part[6:].split(".")
-                    col = _validate_identifier(order_parts[0], allow_qualified=True)
-                    is_desc = len(order_parts) > 1 and order_parts[1] == "desc"
-                    direction = "DESC" if is_desc else "ASC"
-                    order_clause = f" ORDER BY {col} {direction}"
+                    shape.append(("order", part[6:]))
                 elif part.startswith("limit="):
-                    limit_clause = f" LIMIT {int(part[6:])}"
+                    shape.append(("limit", part[6:]))
                 elif "=eq." in part:
                     col, val = part.split("=eq.", 1)
                     # Accept PostgREST-style JSONB text extraction:
@@ -194,55 +326,40 @@ class DirectPostgresClient:
                     # becomes: parameters->>'change_id' = $N
                     if "->>" in col:
                         jsonb_col, jsonb_key = col.split("->>", 1)
-                        _validate_identifier(jsonb_col, allow_qualified=True)
-                        _validate_identifier(jsonb_key)
-                        where_clauses.append(
-                            f"{jsonb_col}->>'{jsonb_key}' = ${param_idx}"
-                        )
+                        shape.append(("jsonb_eq", jsonb_col, jsonb_key))
                     else:
-                        _validate_identifier(col, allow_qualified=True)
-                        where_clauses.append(f"{col} = ${param_idx}")
-                    values.append(_coerce_filter_value(val))
-                    param_idx += 1
+                        shape.append(("cmp", col, "="))
+                    raw_values.append(val)
                 elif "=gt." in part:
                     col, val = part.split("=gt.", 1)
-                    _validate_identifier(col, allow_qualified=True)
                     if val == "now()":
-                        where_clauses.append(f"{col} > NOW()")
+                        shape.append(("gt_now", col))
                     else:
-                        where_clauses.append(f"{col} > ${param_idx}")
-                        values.append(_coerce_filter_value(val))
-                        param_idx += 1
+                        shape.append(("cmp", col, ">"))
+                        raw_values.append(val)
                 elif "=gte." in part:
                     col, val = part.split("=gte.", 1)
-                    _validate_identifier(col, allow_qualified=True)
-                    where_clauses.append(f"{col} >= ${param_idx}")
-                    values.append(_coerce_filter_value(val))
-                    param_idx += 1
+                    shape.append(("cmp", col, ">="))
+                    raw_values.append(val)
                 elif "=lte." in part:
                     col, val = part.split("=lte.", 1)
-                    _validate_identifier(col, allow_qualified=True)
-                    where_clauses.append(f"{col} <= ${param_idx}")
-                    values.append(_coerce_filter_value(val))
-                    param_idx += 1
+                    shape.append(("cmp", col, "<="))
+                    raw_values.append(val)
                 elif "=in." in part:
                     col, val = part.split("=in.", 1)
-                    _validate_identifier(col, allow_qualified=True)
                     # Parse PostgREST IN syntax: (val1,val2,val3)
                     in_values = val.strip("()").replace('"', "").split(",")
-                    placeholders = ", ".join(
-                        f"${param_idx + i}" for i in range(len(in_values))
-                    )
-                    where_clauses.append(f"{col} IN ({placeholders})")
-                    values.extend(_coerce_filter_value(v) for v in in_values)
-                    param_idx += len(in_values)
-
-        where = f" WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-        safe_select = _validate_select_clause(select)
-        safe_table = _validate_identifier(table, allow_qualified=True)
-        query_sql = (
-            f"SELECT {safe_select} FROM {safe_table}{where}{order_clause}{limit_clause}"
+                    shape.append(("in", col, str(len(in_values))))
+                    raw_values.extend(in_values)
+
+        frozen_shape = tuple(shape)
+        query_sql = self._templates.get_or_compile(
+            ("query", table, select, frozen_shape),
+            lambda: _compile_query_template(table, select, frozen_shape),
+            "query",
         )
+        values = [_coerce_filter_value(v) for v in raw_values]
+        pool = await self._get_pool()
 
         async with pool.acquire() as conn:
             rows = await conn.fetch(query_sql, *values)
@@ -276,6 +393,33 @@ class DirectPostgresClient:
                 await conn.execute(query, *values)
                 return {}
 
+    async def insert_many(self, table: str, rows: list[dict[str, Any]]) -> None:
+        """Insert several rows that share the same columns.
+
+        Uses asyncpg's pipelined ``executemany`` with a single prepared
+        INSERT, so the batch costs one round trip and the statement text
+        stays stable regardless of how many rows are written.
+        """
+        if not rows:
+            return
+
+        columns = list(rows[0].keys())
+        _validate_identifier(table, allow_qualified=True)
+        for col in columns:
+            _validate_identifier(col, allow_qualified=False)
+        for row in rows:
+            if list(row.keys()) != columns:
+                raise ValueError("insert_many rows must share the same columns")
+
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(columns)))
+        col_list = ", ".join(columns)
+        query = f"INSERT INTO {table} ({col_list}) VALUES ({placeholders})"
+        args = [[_serialize_for_asyncpg(row[col]) for col in columns] for row in rows]
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.executemany(query, args)
+
     async def update(
         self,
         table: str,
@@ -1,8 +1,9 @@
 """Generalized event bus via PostgreSQL LISTEN/NOTIFY.
 
 Extends the single-channel pattern from policy_sync.py into a multi-channel
-event bus. Database triggers on approval_queue, work_queue, and agent_discovery
-emit NOTIFY events that the bus dispatches to registered callbacks.
+event bus. Database triggers on approval_queue, work_queue, agent_discovery,
+audit_log, and the authorization tables emit NOTIFY events that the bus
+dispatches to registered callbacks.
 """
 
 from __future__ import annotations
@@ -27,6 +28,9 @@ CHANNELS = (
     # New channel for audit_log NOTIFY (added by add-coordinator-kanban-viz).
     # The SSE /events/work handler subscribes to this alongside coordinator_task.
     "coordinator_audit",
+    # Profile, trust-assignment and Cedar policy changes (migration 035); the
+    # policy engine drops cached decisions when these arrive.
+    "coordinator_policy",
 )
 
 # Max NOTIFY payload ~8KB; we leave 1KB margin
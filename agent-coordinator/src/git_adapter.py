@@ -28,6 +28,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
+from .merge_tree_cache import CachedMergeTree, MergeTreeCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -178,10 +180,18 @@ class SubprocessGitAdapter:
 
     Performs a git version check on first use. The repo path is captured at
     construction time and used as `cwd` for every subprocess call.
+
+    With a :class:`~src.merge_tree_cache.MergeTreeCache`, merges whose base
+    and feature-branch commits were already evaluated skip `git merge-tree`.
     """
 
-    def __init__(self, repo_path: str | Path) -> None:
+    def __init__(
+        self,
+        repo_path: str | Path,
+        merge_tree_cache: MergeTreeCache | None = None,
+    ) -> None:
         self.repo_path = Path(repo_path)
+        self.merge_tree_cache = merge_tree_cache
         self._version_checked = False
 
     # ---- version check ----
@@ -252,6 +262,14 @@ class SubprocessGitAdapter:
 
         self._ensure_git_version()
 
+        cache_key = self._merge_cache_key(base_ref, feature_branch)
+        if cache_key is not None:
+            cached = self._create_from_cache(cache_key, ref_name)
+            if cached is not None:
+                return cached
+            # Build the commit on the resolved base so it matches the key.
+            base_ref = cache_key[0]
+
         merge_tree = self._run(
             ["merge-tree", "--write-tree", "--messages", base_ref, feature_branch]
         )
@@ -267,6 +285,11 @@ class SubprocessGitAdapter:
                     error=(merge_tree.stderr or merge_tree.stdout or "").strip()
                     or "git merge-tree failed",
                 )
+            if cache_key is not None and self.merge_tree_cache is not None:
+                self.merge_tree_cache.put(
+                    *cache_key,
+                    CachedMergeTree(success=False, conflict_files=conflict_files),
+                )
             return MergeTreeResult(
                 success=False,
                 conflict_files=conflict_files,
@@ -308,12 +331,60 @@ class SubprocessGitAdapter:
                 error=(update_ref.stderr or "git update-ref failed").strip(),
             )
 
+        if cache_key is not None and self.merge_tree_cache is not None:
+            self.merge_tree_cache.put(
+                *cache_key,
+                CachedMergeTree(success=True, tree_oid=tree_oid, commit_sha=commit_sha),
+            )
         return MergeTreeResult(
             success=True,
             tree_oid=tree_oid,
             commit_sha=commit_sha,
         )
 
+    def _merge_cache_key(self, base_ref: str, feature_branch: str) -> tuple[str, str] | None:
+        """Resolve both sides to commit SHAs, or None when caching is off or fails."""
+        if self.merge_tree_cache is None:
+            return None
+        # rev-parse echoes options back, so never hand it a leading dash.
+        if base_ref.startswith("-") or feature_branch.startswith("-"):
+            return None
+        resolved = self._run(
+            ["rev-parse", f"{base_ref}^{{commit}}", f"{feature_branch}^{{commit}}"]
+        )
+        shas = resolved.stdout.split()
+        if resolved.returncode != 0 or len(shas) != 2:
+            return None
+        if not all(re.match(r"^[a-f0-9]{40,64}$", sha) for sha in shas):
+            return None
+        return shas[0], shas[1]
+
+    def _create_from_cache(
+        self, cache_key: tuple[str, str], ref_name: str
+    ) -> MergeTreeResult | None:
+        """Answer from the merge-tree cache; None on a miss or a stale entry."""
+        assert self.merge_tree_cache is not None
+        cached = self.merge_tree_cache.get(*cache_key)
+        if cached is None:
+            return None
+        if not cached.success:
+            return MergeTreeResult(success=False, conflict_files=list(cached.conflict_files))
+        if cached.commit_sha is None:
+            self.merge_tree_cache.discard(*cache_key)
+            return None
+        # Reusing the commit keeps the next position's base SHA stable.
+        update_ref = self._run(["update-ref", ref_name, cached.commit_sha])
+        if update_ref.returncode != 0:
+            # The cached commit was pruned; fall back to a real merge.
+            logger.debug("merge-tree cache: stale commit for %s", cache_key)
+            self.merge_tree_cache.discard(*cache_key)
+            return None
+        return MergeTreeResult(
+            success=True,
+            tree_oid=cached.tree_oid,
+            commit_sha=cached.commit_sha,
+        )
+
     def delete_speculative_refs(self, train_id: str) -> int:
         """Delete all refs under `refs/speculative/train-<train_id>/`."""
         if not re.match(r"^[a-f0-9]{8,32}$", train_id):
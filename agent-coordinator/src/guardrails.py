@@ -206,6 +206,172 @@ class GuardrailResult:
         )
 
 
+# =============================================================================
+# Compiled matcher
+# =============================================================================
+
+# Characters that ``re.IGNORECASE`` treats as equal to an ASCII letter but that
+# ``str.lower()`` does not map onto that letter (dotted/dotless i, long s,
+# Kelvin sign).  Folding them first keeps the literal prefilter a strict
+# superset of what the regex engine can match.
+_FOLD_TABLE = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+# Constructs whose meaning depends on group numbering or on sitting at the very
+# start of the pattern; such patterns cannot be spliced into one alternation.
+_UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(|^\(\?[aiLmsux]+\)")
+
+
+def _fold(text: str) -> str:
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the ASCII literal every match of *pattern* must start with.
+
+    The result is case-folded and may be empty when the pattern starts with a
+    group, class, or anything else that is not a plain literal.
+    """
+    if _has_top_level_alternation(pattern):
+        return ""
+    literal: list[str] = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            # Escaped punctuation is literal; \s, \d, \n etc. are not.
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break
+            char, step = pattern[i + 1], 2
+        elif ch in _REGEX_META:
+            break
+        else:
+            char, step = ch, 1
+        if not char.isascii():
+            break
+        quantifier = pattern[i + step : i + step + 1]
+        if quantifier and quantifier in "*?{+":
+            if quantifier == "+":
+                literal.append(char)
+            break
+        literal.append(char)
+        i += step
+    return "".join(literal).lower()
+
+
+@dataclass
+class _CompiledPattern:
+    pattern: GuardrailPattern
+    regex: re.Pattern[str]
+    literal: str
+    gated: bool
+
+
+class _CompiledGuardrails:
+    """Guardrail patterns compiled once per loaded pattern set.
+
+    Matching is done in a single pass in the common case: every combinable
+    pattern is folded into one alternation, and when that alternation finds
+    nothing no individual pattern is evaluated at all.  Only on a hit are the
+    per-pattern regexes run (after the trust-level and literal-prefix checks)
+    so that violations keep their pattern attribution and matched text.
+    """
+
+    def __init__(self, patterns: list[GuardrailPattern]):
+        self.source = patterns
+        self.signature = self._signature(patterns)
+        self.entries: list[_CompiledPattern] = []
+        gated_sources: list[str] = []
+        for pattern in patterns:
+            regex = re.compile(pattern.pattern, re.IGNORECASE)
+            gated = _UNCOMBINABLE.search(pattern.pattern) is None
+            if gated:
+                gated_sources.append(f"(?:{pattern.pattern})")
+            self.entries.append(
+                _CompiledPattern(
+                    pattern=pattern,
+                    regex=regex,
+                    literal=_literal_prefix(pattern.pattern),
+                    gated=gated,
+                )
+            )
+
+        self.gate: re.Pattern[str] | None = None
+        if gated_sources:
+            try:
+                self.gate = re.compile("|".join(gated_sources), re.IGNORECASE)
+            except re.error:
+                logger.debug("Guardrail patterns not combinable; matching individually")
+                for entry in self.entries:
+                    entry.gated = False
+
+    @staticmethod
+    def _signature(patterns: list[GuardrailPattern]) -> tuple[tuple[Any, ...], ...]:
+        return tuple(
+            (p.name, p.category, p.pattern, p.severity, p.min_trust_level)
+            for p in patterns
+        )
+
+    def matches(self, patterns: list[GuardrailPattern]) -> bool:
+        """Whether this matcher was built from an identical pattern set."""
+        if patterns is self.source:
+            return True
+        if self._signature(patterns) != self.signature:
+            return False
+        self.source = patterns
+        return True
+
+    def search(
+        self, text: str, trust_level: int
+    ) -> list[tuple[GuardrailPattern, re.Match[str]]]:
+        """Return ``(pattern, match)`` for every applicable pattern, in order."""
+        hits: list[tuple[GuardrailPattern, re.Match[str]]] = []
+        gate_hit: bool | None = None
+        folded: str | None = None
+        for entry in self.entries:
+            if trust_level >= entry.pattern.min_trust_level:
+                continue
+            if entry.gated:
+                if gate_hit is None:
+                    gate_hit = self.gate is not None and self.gate.search(text) is not None
+                if not gate_hit:
+                    continue
+            if entry.literal:
+                if folded is None:
+                    folded = _fold(text)
+                if entry.literal not in folded:
+                    continue
+            match = entry.regex.search(text)
+            if match:
+                hits.append((entry.pattern, match))
+        return hits
+
+
 def _check_session_scope(
     file_paths: list[str],
     session_scope: dict[str, Any],
@@ -272,6 +438,7 @@ class GuardrailsService:
         self._db = db
         self._patterns_cache: list[GuardrailPattern] | None = None
         self._cache_expiry: float = 0
+        self._matcher: _CompiledGuardrails | None = None
 
     @property
     def db(self) -> DatabaseClient:
@@ -305,6 +472,12 @@ class GuardrailsService:
                 return self._patterns_cache
             raise
 
+    def _get_matcher(self, patterns: list[GuardrailPattern]) -> _CompiledGuardrails:
+        """Return the compiled matcher, rebuilding only when the pattern set changed."""
+        if self._matcher is None or not self._matcher.matches(patterns):
+            self._matcher = _CompiledGuardrails(patterns)
+        return self._matcher
+
     async def check_operation(
         self,
         operation_text: str,
@@ -343,26 +516,25 @@ class GuardrailsService:
 
             needs_approval = False
 
-            for pattern in patterns:
-                match = re.search(pattern.pattern, full_text, re.IGNORECASE)
-                if match and trust_level < pattern.min_trust_level:
-                    blocked = pattern.severity == "block"
-                    requires_approval = pattern.severity == "approval_required"
-                    if blocked:
-                        safe = False
-                    if requires_approval:
-                        needs_approval = True
-
-                    violations.append(
-                        GuardrailViolation(
-                            pattern_name=pattern.name,
-                            category=pattern.category,
-                            severity=pattern.severity,
-                            matched_text=match.group(0)[:200],
-                            blocked=blocked,
-                            approval_required=requires_approval,
-                        )
+            matcher = self._get_matcher(patterns)
+            for pattern, match in matcher.search(full_text, trust_level):
+                blocked = pattern.severity == "block"
+                requires_approval = pattern.severity == "approval_required"
+                if blocked:
+                    safe = False
+                if requires_approval:
+                    needs_approval = True
+
+                violations.append(
+                    GuardrailViolation(
+                        pattern_name=pattern.name,
+                        category=pattern.category,
+                        severity=pattern.severity,
+                        matched_text=match.group(0)[:200],
+                        blocked=blocked,
+                        approval_required=requires_approval,
                     )
+                )
 
             # Session scope enforcement (D6)
             if session_scope is not None and file_paths:
@@ -49,7 +49,7 @@ _register(HelpTopic(
         "codebase. Locks are advisory — agents should always check and respect them. "
         "Locks auto-expire after a configurable TTL (default 2 hours)."
     ),
-    tools=["acquire_lock", "release_lock", "check_locks"],
+    tools=["acquire_lock", "acquire_locks", "release_lock", "check_locks"],
     workflow=[
         "1. check_locks() to see if your target files are available",
         "2. acquire_lock(file_path, reason='...') to claim exclusive access",
@@ -61,6 +61,7 @@ _register(HelpTopic(
         "Provide a descriptive reason so other agents understand the hold",
         "Release locks promptly — don't hold across session boundaries",
         "Lock at the most specific scope possible (single file, not directory)",
+        "Use acquire_locks(file_paths) for multi-file changes — one call, all or nothing",
         "If a lock is held by a stale agent, wait for TTL expiry or contact the operator",
     ],
     examples=[
@@ -382,6 +382,21 @@ async def proxy_acquire_lock(
     return await _request("POST", "/locks/acquire", json_body=body)
 
 
+async def proxy_acquire_locks(
+    file_paths: list[str],
+    reason: str | None = None,
+    ttl_minutes: int | None = None,
+) -> dict[str, Any]:
+    """Proxy acquire_locks to POST /locks/acquire-batch."""
+    body = {
+        **_agent_identity(),
+        "file_paths": file_paths,
+        "reason": reason,
+        "ttl_minutes": ttl_minutes or 120,
+    }
+    return await _request("POST", "/locks/acquire-batch", json_body=body)
+
+
 async def proxy_release_lock(file_path: str) -> dict[str, Any]:
     """Proxy release_lock to POST /locks/release."""
     body = {
@@ -666,12 +681,18 @@ async def proxy_issue_comment(
 async def proxy_issue_search(
     query: str,
     limit: int = 50,
+    offset: int = 0,
+    status: str | None = None,
+    labels: list[str] | None = None,
 ) -> dict[str, Any]:
     """Proxy issue_search to POST /issues/search."""
     body = {
         **_agent_identity(),
         "query": query,
+        "status": status,
+        "labels": labels,
         "limit": limit,
+        "offset": offset,
     }
     return await _request("POST", "/issues/search", json_body=body)
 
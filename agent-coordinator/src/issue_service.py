@@ -483,108 +483,75 @@ class IssueService:
     ) -> list[Issue]:
         """List issues with no unresolved dependencies.
 
+        Dependencies are resolved server-side by ``list_ready_issues`` in a
+        single round trip, with the same test ``claim_task`` applies.
+
         Args:
             parent_id: Optional parent to scope to
             limit: Max results
         """
         limit = min(limit, MAX_PAGE_SIZE)
 
-        parts = [
-            "task_type=eq.issue",
-            "status=in.(pending,claimed,running)",
-            "order=priority.asc,created_at.asc",
-            f"limit={limit}",
-        ]
-        if parent_id:
-            parts.append(f"parent_id=eq.{parent_id}")
-
-        query = "&".join(parts)
-        rows = await self.db.query("work_queue", query)
-
-        # Filter out issues with unresolved dependencies
-        ready_issues: list[Issue] = []
-        for row in rows:
-            issue = Issue.from_row(row)
-            if not issue.depends_on:
-                ready_issues.append(issue)
-            else:
-                # Check if all dependencies are completed
-                all_resolved = True
-                for dep_id in issue.depends_on:
-                    dep_rows = await self.db.query(
-                        "work_queue", f"id=eq.{dep_id}"
-                    )
-                    if dep_rows and dep_rows[0]["status"] != "completed":
-                        all_resolved = False
-                        break
-                if all_resolved:
-                    ready_issues.append(issue)
-
-        return ready_issues
+        rows = await self.db.rpc(
+            "list_ready_issues",
+            {
+                "p_parent_id": str(parent_id) if parent_id else None,
+                "p_limit": limit,
+            },
+        )
+        return [Issue.from_row(r) for r in rows or []]
 
     async def blocked(self, limit: int = 50) -> list[Issue]:
         """List issues blocked by unresolved dependencies.
 
+        Resolved server-side by ``list_blocked_issues`` in a single round trip.
+
         Args:
             limit: Max results
         """
         limit = min(limit, MAX_PAGE_SIZE)
 
-        rows = await self.db.query(
-            "work_queue",
-            f"task_type=eq.issue&status=in.(pending,claimed,running)&order=priority.asc&limit={limit}",
-        )
-
-        blocked_issues: list[Issue] = []
-        for row in rows:
-            issue = Issue.from_row(row)
-            if not issue.depends_on:
-                continue
-            # Check if any dependency is unresolved
-            for dep_id in issue.depends_on:
-                dep_rows = await self.db.query(
-                    "work_queue", f"id=eq.{dep_id}"
-                )
-                if dep_rows and dep_rows[0]["status"] != "completed":
-                    blocked_issues.append(issue)
-                    break
-
-        return blocked_issues
+        rows = await self.db.rpc("list_blocked_issues", {"p_limit": limit})
+        return [Issue.from_row(r) for r in rows or []]
 
     async def search(
         self,
         query: str,
         limit: int = 50,
+        offset: int = 0,
+        status: str | None = None,
+        labels: list[str] | None = None,
     ) -> list[Issue]:
-        """Search issues by text matching in title and description.
+        """Search issues by title and description, best matches first.
 
-        Uses case-insensitive substring matching.
+        Runs server-side via the ``search_issues`` RPC over every issue row:
+        full-text matching (quoted phrases, ``OR``, ``-term``) plus
+        case-insensitive substring matching, ranked with title hits first.
 
         Args:
             query: Search string
-            limit: Max results
+            limit: Max results (capped at 100)
+            offset: Number of ranked results to skip, for pagination
+            status: Filter by friendly status (open, in_progress, closed, all)
+            labels: Filter by labels (must contain ALL specified)
         """
         limit = min(limit, MAX_PAGE_SIZE)
 
-        # Fetch all issues and filter in-memory (ILIKE not in PostgREST query syntax)
-        rows = await self.db.query(
-            "work_queue",
-            f"task_type=eq.issue&order=priority.asc&limit={MAX_PAGE_SIZE}",
-        )
-
-        query_lower = query.lower()
-        results: list[Issue] = []
-        for row in rows:
-            issue = Issue.from_row(row)
-            if query_lower in issue.title.lower():
-                results.append(issue)
-            elif issue.description and query_lower in issue.description.lower():
-                results.append(issue)
-
-            if len(results) >= limit:
-                break
+        statuses = None
+        if status and status != "all":
+            statuses = STATUS_MAP.get(status, [status])
 
-        return results
+        rows = await self.db.rpc(
+            "search_issues",
+            {
+                "p_query": query,
+                "p_statuses": statuses,
+                "p_labels": labels or None,
+                "p_limit": limit,
+                "p_offset": max(offset, 0),
+            },
+        )
+        return [Issue.from_row(r) for r in rows or []]
 
 
 # Global service instance
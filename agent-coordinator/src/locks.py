@@ -10,7 +10,7 @@ See docs/lock-key-namespaces.md for the full namespace reference.
 import logging
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -146,6 +146,65 @@ class LockResult:
         )
 
 
+@dataclass
+class BatchLockResult:
+    """Result of an all-or-nothing multi-file lock acquisition.
+
+    On success ``locks`` holds one acquired/refreshed entry per distinct
+    path. On failure nothing was locked and ``conflicts`` lists every path
+    held by another agent (empty when the batch failed validation).
+    ``policy_denied`` marks a batch refused by the policy engine, in which
+    case ``conflicts`` names the denied path instead of a holder.
+    """
+
+    success: bool
+    locks: list[LockResult] = field(default_factory=list)
+    conflicts: list[LockResult] = field(default_factory=list)
+    expires_at: datetime | None = None
+    reason: str | None = None
+    policy_denied: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BatchLockResult":
+        expires_at = None
+        if data.get("expires_at"):
+            expires_at = datetime.fromisoformat(
+                str(data["expires_at"]).replace("Z", "+00:00")
+            )
+
+        return cls(
+            success=data["success"],
+            locks=[LockResult.from_dict(item) for item in data.get("locks") or []],
+            conflicts=[
+                LockResult.from_dict(item) for item in data.get("conflicts") or []
+            ],
+            expires_at=expires_at,
+            reason=data.get("reason"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the HTTP and MCP surfaces."""
+
+        def _entry(lock: LockResult) -> dict[str, Any]:
+            return {
+                "success": lock.success,
+                "action": lock.action,
+                "file_path": lock.file_path,
+                "expires_at": lock.expires_at.isoformat() if lock.expires_at else None,
+                "reason": lock.reason,
+                "locked_by": lock.locked_by,
+                "lock_reason": lock.lock_reason,
+            }
+
+        return {
+            "success": self.success,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "reason": self.reason,
+            "locks": [_entry(lock) for lock in self.locks],
+            "conflicts": [_entry(lock) for lock in self.conflicts],
+        }
+
+
 class LockService:
     """Service for managing file locks."""
 
@@ -273,6 +332,143 @@ class LockService:
 
             return lock_result
 
+    async def acquire_many(
+        self,
+        file_paths: list[str],
+        agent_id: str | None = None,
+        agent_type: str | None = None,
+        session_id: str | None = None,
+        reason: str | None = None,
+        ttl_minutes: int | None = None,
+    ) -> BatchLockResult:
+        """Acquire locks on several files at once, all or nothing.
+
+        Backed by the set-based ``acquire_locks`` RPC, so the cost is one
+        round trip and one audit entry regardless of how many files are
+        requested. This is the only place the batch is authorized: every
+        path goes through one ``check_operations`` call (one policy audit
+        entry), and a single denial fails the whole batch without touching
+        the DB.
+
+        Args:
+            file_paths: Paths to lock (relative to repo root); duplicates
+                are collapsed
+            agent_id: Agent requesting the locks (default: from config)
+            agent_type: Type of agent (default: from config)
+            session_id: Optional session identifier
+            reason: Why the locks are needed (for debugging)
+            ttl_minutes: Lock TTL in minutes (default: from config)
+
+        Returns:
+            BatchLockResult with per-file locks or the conflicting holders
+        """
+        config = get_config()
+        resolved_agent_id = agent_id or config.agent.agent_id
+        resolved_agent_type = agent_type or config.agent.agent_type
+        paths = sorted(set(file_paths))
+
+        if not paths:
+            return BatchLockResult(success=False, reason="invalid_file_path")
+
+        span_attrs = {"file_count": len(paths), "agent_type": resolved_agent_type}
+        with start_span("lock.acquire_many", span_attrs) as span:
+            from .policy_engine import get_policy_engine
+
+            decisions = await get_policy_engine().check_operations(
+                agent_id=resolved_agent_id,
+                agent_type=resolved_agent_type,
+                operation="acquire_lock",
+                resources=paths,
+                context={"reason": reason},
+            )
+            for path, decision in zip(paths, decisions, strict=True):
+                if not decision.allowed:
+                    return BatchLockResult(
+                        success=False,
+                        conflicts=[
+                            LockResult(
+                                success=False,
+                                file_path=path,
+                                reason=decision.reason or "operation_not_permitted",
+                            )
+                        ],
+                        reason=decision.reason or "operation_not_permitted",
+                        policy_denied=True,
+                    )
+
+            resolved_ttl = ttl_minutes or config.lock.default_ttl_minutes
+
+            t0 = time.monotonic()
+            result = await self.db.rpc(
+                "acquire_locks",
+                {
+                    "p_file_paths": paths,
+                    "p_agent_id": resolved_agent_id,
+                    "p_agent_type": resolved_agent_type,
+                    "p_session_id": session_id or config.agent.session_id,
+                    "p_reason": reason,
+                    "p_ttl_minutes": resolved_ttl,
+                },
+            )
+            duration_ms = (time.monotonic() - t0) * 1000
+
+            batch_result = BatchLockResult.from_dict(result)
+
+            # --- Record metrics (best-effort) ---
+            try:
+                duration_hist, contention_counter, active_gauge, ttl_hist = _ensure_instruments()
+                if duration_hist is not None:
+                    if batch_result.success:
+                        outcome = "acquired"
+                    elif batch_result.conflicts:
+                        outcome = "denied"
+                    else:
+                        outcome = "error"
+
+                    labels = {"outcome": outcome, "agent_type": resolved_agent_type}
+                    duration_hist.record(duration_ms, labels)
+
+                    for _ in batch_result.conflicts:
+                        contention_counter.add(
+                            1,
+                            {
+                                "holder_type": "unknown",
+                                "requester_type": resolved_agent_type,
+                            },
+                        )
+
+                    acquired = sum(
+                        1 for lock in batch_result.locks if lock.action == "acquired"
+                    )
+                    if acquired:
+                        active_gauge.add(acquired)
+
+                    ttl_hist.record(resolved_ttl * 60, {"agent_type": resolved_agent_type})
+
+                    span.set_attribute("lock.outcome", outcome)
+                    span.set_attribute("lock.duration_ms", duration_ms)
+            except Exception:
+                logger.debug("Metric recording failed for lock.acquire_many", exc_info=True)
+
+            try:
+                await get_audit_service().log_operation(
+                    agent_id=resolved_agent_id,
+                    agent_type=resolved_agent_type,
+                    operation="acquire_lock",
+                    parameters={"file_paths": paths, "reason": reason},
+                    result={
+                        "actions": {
+                            lock.file_path: lock.action for lock in batch_result.locks
+                        },
+                        "conflicts": [lock.file_path for lock in batch_result.conflicts],
+                    },
+                    success=batch_result.success,
+                )
+            except Exception:
+                logger.warning("Audit log failed for acquire_lock batch", exc_info=True)
+
+            return batch_result
+
     async def release(
         self,
         file_path: str,
@@ -33,6 +33,9 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -65,6 +68,10 @@ MIN_COMPOSE_TRUST_LEVEL: int = 3
 #: whatever conflict put it there.
 BLOCKED_REEVAL_INTERVAL: timedelta = timedelta(hours=1)
 
+#: Default number of independent partitions compose_train speculates at once.
+#: Each speculation is a ``git merge-tree`` subprocess, so threads suffice.
+DEFAULT_COMPOSE_WORKERS: int = 4
+
 
 class TrainAuthorizationError(PermissionError):
     """Raised when a caller attempts a train operation without sufficient trust.
@@ -343,6 +350,7 @@ def compose_train(
     base_ref: str = "main",
     caller_trust_level: int = 3,
     force_recompose: bool = False,
+    max_workers: int = DEFAULT_COMPOSE_WORKERS,
 ) -> TrainComposition:
     """Compose a fresh merge train from queued entries (R1, R6, R11).
 
@@ -363,6 +371,14 @@ def compose_train(
          independent partitions. The conflict file list is stored in the
          entry's metadata.
 
+    Regular partitions are disjoint in lock-key prefix, so once the
+    cross-partition chain exists they are speculated concurrently on up to
+    ``max_workers`` threads. Every partition reserves its block of train
+    positions up front, in partition order, so ref names are identical to a
+    sequential composition. Wall-clock seconds spent per partition (and on
+    the cross-partition chain, under ``"(cross)"``) are recorded in
+    :attr:`TrainComposition.partition_timings`.
+
     Tree caching (task 2.4): an in-call ``(base_ref, feature_branch)``
     cache avoids redundant ``create_speculative_ref`` calls within one
     compose_train. A persistent cache across calls is deferred to the
@@ -376,6 +392,8 @@ def compose_train(
         caller_trust_level: The calling agent's trust level; must be >= 3.
         force_recompose: If True, recompose even if an existing train matches
             the input. Currently a no-op placeholder — v1 always recomposes.
+        max_workers: Upper bound on partitions speculated concurrently;
+            ``1`` composes sequentially on the calling thread.
 
     Returns:
         A :class:`TrainComposition` with all positions assigned and any
@@ -440,18 +458,22 @@ def compose_train(
     )
 
     # In-call tree cache (task 2.4). Keyed by (base_ref, feature_branch).
+    # Shared by the partition workers, hence the lock.
     tree_cache: dict[tuple[str, str | None], MergeTreeResult] = {}
+    tree_cache_lock = threading.Lock()
 
     def _speculate(
         entry: TrainEntry, base: str, position: int
     ) -> MergeTreeResult:
         """Call the git adapter with caching; falls through on cache miss."""
         cache_key = (base, entry.branch_name)
-        if not force_recompose and cache_key in tree_cache:
+        with tree_cache_lock:
+            cached = None if force_recompose else tree_cache.get(cache_key)
+        if cached is not None:
             logger.debug(
                 "compose_train: reusing cached merge result for %s", cache_key
             )
-            return tree_cache[cache_key]
+            return cached
         ref_name = _speculative_ref_name(train_id, position)
         if entry.branch_name is None:
             raise ValueError(
@@ -459,7 +481,8 @@ def compose_train(
                 "cannot create speculative ref"
             )
         result = git_adapter.create_speculative_ref(base, entry.branch_name, ref_name)
-        tree_cache[cache_key] = result
+        with tree_cache_lock:
+            tree_cache[cache_key] = result
         return result
 
     # Position counter is global across the train so ref names remain unique.
@@ -469,6 +492,7 @@ def compose_train(
     sorted_cross = _sort_entries_by_priority(
         [cpe.entry for cpe in partition_result.cross_partition_entries]
     )
+    cross_started = time.perf_counter()
     cross_base = base_ref
     for cross_entry in sorted_cross:
         position_counter += 1
@@ -488,6 +512,10 @@ def compose_train(
             ref_name=_speculative_ref_name(train_id, position_counter),
         )
         cross_base = _speculative_ref_name(train_id, position_counter)
+    if sorted_cross:
+        composition.partition_timings["(cross)"] = (
+            time.perf_counter() - cross_started
+        )
 
     # Track, per partition, the latest ref introduced by a cross-partition
     # entry so regular-partition entries can build on top of it.
@@ -499,14 +527,15 @@ def compose_train(
             spanned_partition_base[spanned] = cpe.entry.speculative_ref
 
     # ── Stage 2: regular partitions ───────────────────────────────────────
-    for partition in composition.partitions:
+    def _speculate_partition(partition: TrainPartition, first_position: int) -> None:
+        """Chain one partition's refs from its reserved position block."""
+        started = time.perf_counter()
         sorted_entries = _sort_entries_by_priority(partition.entries)
         # Start each partition from its cross-partition head if any.
         current_base = spanned_partition_base.get(partition.partition_id, base_ref)
-        prior_position_counter = position_counter
-        for idx, entry in enumerate(sorted_entries):
-            position_counter += 1
-            result = _speculate(entry, current_base, position_counter)
+        for offset, entry in enumerate(sorted_entries):
+            position = first_position + offset
+            result = _speculate(entry, current_base, position)
             if not result.success:
                 _handle_conflict(entry, result)
                 # Do NOT advance current_base on conflict — subsequent entries
@@ -518,16 +547,41 @@ def compose_train(
                 result,
                 train_id=train_id,
                 partition_id=partition.partition_id,
-                train_position=position_counter,
+                train_position=position,
                 base_ref=current_base,
-                ref_name=_speculative_ref_name(train_id, position_counter),
+                ref_name=_speculative_ref_name(train_id, position),
             )
-            current_base = _speculative_ref_name(train_id, position_counter)
-        if prior_position_counter == position_counter:
+            current_base = _speculative_ref_name(train_id, position)
+        if not sorted_entries:
             logger.debug(
                 "compose_train: partition %s produced no new refs",
                 partition.partition_id,
             )
+        composition.partition_timings[partition.partition_id] = (
+            time.perf_counter() - started
+        )
+
+    # Reserve each partition's positions in partition order so ref names do
+    # not depend on which worker finishes first.
+    work: list[tuple[TrainPartition, int]] = []
+    for partition in composition.partitions:
+        work.append((partition, position_counter + 1))
+        position_counter += len(partition.entries)
+
+    workers = min(max(max_workers, 1), len(work))
+    if workers <= 1:
+        for partition, first_position in work:
+            _speculate_partition(partition, first_position)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="merge-train-compose"
+        ) as pool:
+            futures = [
+                pool.submit(_speculate_partition, partition, first_position)
+                for partition, first_position in work
+            ]
+            for future in futures:
+                future.result()
 
     logger.info(
         "compose_train: id=%s partitions=%d cross=%d positions=%d",
@@ -33,6 +33,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import sqlite3
+import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -52,6 +54,7 @@ from .merge_train_types import (
     TrainComposition,
     TrainEntry,
 )
+from .merge_tree_cache import DEFAULT_MAX_ENTRIES, MergeTreeCache
 from .refresh_rpc_client import RefreshClientUnavailable, RefreshRpcClient
 
 logger = logging.getLogger(__name__)
@@ -62,6 +65,54 @@ METADATA_KEY = "merge_queue"
 # Stale threshold for the architecture graph — matches D8 and R9 defaults.
 GRAPH_STALE_MAX_AGE_HOURS = 6
 
+#: Path of the persistent merge-tree cache. Defaults to a file inside the
+#: repository's git common directory; set to an empty string to disable.
+MERGE_TREE_CACHE_PATH_ENV = "MERGE_TREE_CACHE_PATH"
+MERGE_TREE_CACHE_MAX_ENTRIES_ENV = "MERGE_TREE_CACHE_MAX_ENTRIES"
+
+
+def _default_merge_tree_cache(repo_path: str) -> MergeTreeCache | None:
+    """Open the persistent merge-tree cache; None when disabled or unavailable."""
+    configured = os.environ.get(MERGE_TREE_CACHE_PATH_ENV)
+    if configured is not None:
+        if not configured.strip():
+            return None
+        path = Path(configured)
+    else:
+        git_dir = _git_common_dir(repo_path)
+        if git_dir is None:
+            return None
+        path = git_dir / "coordinator-merge-tree-cache.sqlite"
+    max_entries_env = os.environ.get(MERGE_TREE_CACHE_MAX_ENTRIES_ENV)
+    try:
+        return MergeTreeCache(
+            path,
+            max_entries=int(max_entries_env) if max_entries_env else DEFAULT_MAX_ENTRIES,
+        )
+    except (OSError, ValueError, sqlite3.Error) as exc:
+        # The cache is an optimization — compose without it rather than fail.
+        logger.warning("merge-tree cache unavailable at %s (%s)", path, exc)
+        return None
+
+
+def _git_common_dir(repo_path: str) -> Path | None:
+    """Shared ``.git`` directory of *repo_path* (also correct for worktrees)."""
+    try:
+        result = subprocess.run(  # noqa: S603 — shell=False, explicit args
+            ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=False,
+            shell=False,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+    return Path(result.stdout.strip())
+
 
 def _parse_dt(val: Any) -> datetime | None:
     if not val:
@@ -153,7 +204,10 @@ class MergeTrainService:
             # process runs from the repo root. Override via constructor
             # injection in tests or non-standard deployments.
             repo_path = os.environ.get("MERGE_TRAIN_REPO_PATH") or str(Path.cwd())
-            self._git_adapter = SubprocessGitAdapter(repo_path=repo_path)
+            self._git_adapter = SubprocessGitAdapter(
+                repo_path=repo_path,
+                merge_tree_cache=_default_merge_tree_cache(repo_path),
+            )
         return self._git_adapter
 
     @property
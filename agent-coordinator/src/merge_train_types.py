@@ -197,6 +197,9 @@ class TrainComposition:
     #: instead of the affected-tests subset. Set by MergeTrainService based on
     #: the refresh_rpc_client probe in compose_train.
     full_test_suite_required: bool = False
+    #: Wall-clock seconds compose_train spent speculating each partition, keyed
+    #: by partition_id; the cross-partition chain is reported as ``"(cross)"``.
+    partition_timings: dict[str, float] = field(default_factory=dict)
 
     @classmethod
     def new_train_id(cls) -> str:
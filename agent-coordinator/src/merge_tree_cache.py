@@ -0,0 +1,155 @@
+"""Persistent cache of speculative merge results for the git adapter.
+
+``compose_train`` re-runs ``git merge-tree`` for every entry on every
+recomposition, even when neither side of the merge has moved. This module
+keeps the outcome of each merge in a small local SQLite store keyed by the
+resolved commit SHAs of ``(base, feature branch head)``, so the adapter can
+skip the merge for pairs it has already evaluated.
+
+A successful merge also remembers the speculative commit that was built for
+it. Re-pointing a new speculative ref at that same commit keeps the chain of
+speculative commits stable across recompositions: after an ejection only the
+entries whose base really changed miss the cache.
+
+Conflicts are cached (the same two commits always conflict the same way);
+git errors are not. Eviction is least-recently-used once ``max_entries`` is
+exceeded.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Default upper bound on cached (base, head) pairs.
+DEFAULT_MAX_ENTRIES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS merge_tree_results (
+    base_sha TEXT NOT NULL,
+    head_sha TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    tree_oid TEXT,
+    commit_sha TEXT,
+    conflict_files TEXT NOT NULL DEFAULT '[]',
+    last_used REAL NOT NULL,
+    PRIMARY KEY (base_sha, head_sha)
+)
+"""
+
+
+@dataclass
+class CachedMergeTree:
+    """A cached merge outcome for one ``(base_sha, head_sha)`` pair."""
+
+    success: bool
+    tree_oid: str | None = None
+    commit_sha: str | None = None
+    conflict_files: list[str] = field(default_factory=list)
+
+
+class MergeTreeCache:
+    """SQLite-backed LRU cache of merge-tree outcomes.
+
+    Safe to share between the threads ``compose_train`` uses to speculate
+    partitions concurrently. Pass ``":memory:"`` as the path for a
+    process-local cache.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.path = str(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, base_sha: str, head_sha: str) -> CachedMergeTree | None:
+        """Return the cached outcome and mark it most recently used."""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT success, tree_oid, commit_sha, conflict_files "
+                "FROM merge_tree_results WHERE base_sha = ? AND head_sha = ?",
+                (base_sha, head_sha),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE merge_tree_results SET last_used = ? "
+                "WHERE base_sha = ? AND head_sha = ?",
+                (time.time(), base_sha, head_sha),
+            )
+            self.hits += 1
+        success, tree_oid, commit_sha, conflict_files = row
+        return CachedMergeTree(
+            success=bool(success),
+            tree_oid=tree_oid,
+            commit_sha=commit_sha,
+            conflict_files=json.loads(conflict_files),
+        )
+
+    def put(self, base_sha: str, head_sha: str, result: CachedMergeTree) -> None:
+        """Store an outcome, evicting least-recently-used pairs past the bound."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO merge_tree_results "
+                "(base_sha, head_sha, success, tree_oid, commit_sha, "
+                "conflict_files, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    base_sha,
+                    head_sha,
+                    int(result.success),
+                    result.tree_oid,
+                    result.commit_sha,
+                    json.dumps(result.conflict_files),
+                    time.time(),
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM merge_tree_results WHERE rowid IN ("
+                "SELECT rowid FROM merge_tree_results "
+                "ORDER BY last_used DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def discard(self, base_sha: str, head_sha: str) -> None:
+        """Drop one pair, e.g. when its cached commit has been pruned."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM merge_tree_results WHERE base_sha = ? AND head_sha = ?",
+                (base_sha, head_sha),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM merge_tree_results")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM merge_tree_results"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -7,17 +7,23 @@ Provides a unified authorization interface with two backends:
 Selected via POLICY_ENGINE env var ('native' or 'cedar').
 """
 
+import asyncio
+import json
 import logging
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .config import get_config
 from .db import DatabaseClient, get_db
 from .telemetry import get_policy_meter, start_span
 from .trust_levels import MIN_ADMIN_TRUST, MIN_WRITE_TRUST, TrustLevel
 
+if TYPE_CHECKING:
+    from .event_bus import CoordinatorEvent, EventBusService
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -99,6 +105,154 @@ class PolicyDecision:
         return cls(allowed=False, reason=reason)
 
 
+# ---------------------------------------------------------------------------
+# Decision cache
+# ---------------------------------------------------------------------------
+
+#: Event-bus channel carrying profile, trust-assignment and Cedar policy
+#: changes (migration 035).
+POLICY_CHANNEL = "coordinator_policy"
+
+# Decisions produced by a transient fault rather than by policy. Caching them
+# would keep denying an agent after the fault cleared.
+_UNCACHEABLE_REASONS = (
+    "trust_resolution_failed",
+    "unknown_operation",
+    "policy_load_error",
+    "cedar_evaluation_error",
+)
+
+DecisionKey = tuple[str, str, str, str, str, str]
+
+
+def _fingerprint_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    raise TypeError(f"unhashable context value: {type(value).__name__}")
+
+
+class PolicyDecisionCache:
+    """Bounded LRU/TTL cache of :class:`PolicyDecision` results.
+
+    Keyed on engine, agent, operation, resource and a canonical fingerprint of
+    the request context, so a change in trust level, risk score or session
+    grants passed by the caller is a different entry. Entries expire after
+    ``ttl_seconds`` and are dropped early by :func:`handle_policy_event` when
+    the event bus reports a profile, trust-assignment or policy change.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self._maxsize = max(0, maxsize)
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[DecisionKey, tuple[PolicyDecision, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0 and self._ttl > 0
+
+    def key(
+        self,
+        engine: str,
+        agent_id: str,
+        agent_type: str,
+        operation: str,
+        resource: str,
+        context: dict[str, Any] | None,
+    ) -> DecisionKey | None:
+        """Build a cache key, or ``None`` when the request must not be cached."""
+        if not self.enabled:
+            return None
+        try:
+            fingerprint = json.dumps(
+                context or {}, sort_keys=True, default=_fingerprint_default,
+            )
+        except (TypeError, ValueError):
+            return None
+        return (engine, agent_id, agent_type, operation, resource, fingerprint)
+
+    def get(self, key: DecisionKey) -> PolicyDecision | None:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._record(key[0], "hit")
+            # Hand out a copy: callers may append diagnostics.
+            return replace(entry[0], diagnostics=list(entry[0].diagnostics))
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        self._record(key[0], "miss")
+        return None
+
+    def put(self, key: DecisionKey, decision: PolicyDecision) -> None:
+        if decision.reason.startswith(_UNCACHEABLE_REASONS):
+            return
+        self._entries[key] = (
+            replace(decision, diagnostics=list(decision.diagnostics)),
+            time.monotonic() + self._ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, agent_id: str | None = None) -> int:
+        """Drop cached decisions for *agent_id*, or all of them when ``None``."""
+        if agent_id is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+        stale = [k for k in self._entries if k[1] == agent_id]
+        for k in stale:
+            del self._entries[k]
+        return len(stale)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self._maxsize,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _record(engine: str, result: str) -> None:
+        try:
+            _, _, cache_counter = _ensure_policy_instruments()
+            if cache_counter is not None:
+                cache_counter.add(
+                    1, {"cache": "decision", "engine": engine, "result": result},
+                )
+        except Exception:
+            pass
+
+
+_decision_cache: PolicyDecisionCache | None = None
+
+
+def get_decision_cache() -> PolicyDecisionCache:
+    """Get the process-wide policy decision cache shared by both engines."""
+    global _decision_cache
+    if _decision_cache is None:
+        config = get_config()
+        _decision_cache = PolicyDecisionCache(
+            maxsize=config.policy_engine.decision_cache_size,
+            ttl_seconds=config.policy_engine.decision_cache_ttl_seconds,
+        )
+    return _decision_cache
+
+
+def reset_decision_cache() -> None:
+    """Reset the decision cache (for testing)."""
+    global _decision_cache
+    _decision_cache = None
+
+
 @dataclass
 class ValidationResult:
     """Result of validating a Cedar policy."""
@@ -145,9 +299,27 @@ class NativePolicyEngine:
         """
         t0 = time.monotonic()
         with start_span("policy.evaluate", {"engine": "native", "operation": operation}):
-            decision = await self._do_check_operation(
-                agent_id, agent_type, operation, resource, context,
-            )
+            cache = get_decision_cache()
+            key = cache.key("native", agent_id, agent_type, operation, resource, context)
+            cached = cache.get(key) if key is not None else None
+            if cached is not None:
+                decision = cached
+                await self._log_policy_decision(
+                    agent_id=agent_id,
+                    agent_type=agent_type,
+                    operation=operation,
+                    resource=resource,
+                    context=context or {},
+                    decision=decision,
+                    engine="native",
+                    cached=True,
+                )
+            else:
+                decision = await self._do_check_operation(
+                    agent_id, agent_type, operation, resource, context,
+                )
+                if key is not None:
+                    cache.put(key, decision)
 
         # Record metrics (best-effort)
         try:
@@ -164,6 +336,23 @@ class NativePolicyEngine:
 
         return decision
 
+    async def check_operations(
+        self,
+        agent_id: str,
+        agent_type: str,
+        operation: str,
+        resources: list[str],
+        context: dict[str, Any] | None = None,
+    ) -> list[PolicyDecision]:
+        """Check one operation against several resources in a single evaluation.
+
+        Decisions come back in ``resources`` order; the whole batch is
+        written as one ``policy_decision`` audit entry.
+        """
+        return await _check_operation_batch(
+            self, "native", agent_id, agent_type, operation, resources, context,
+        )
+
     async def _do_check_operation(
         self,
         agent_id: str,
@@ -173,6 +362,29 @@ class NativePolicyEngine:
         context: dict[str, Any] | None = None,
     ) -> PolicyDecision:
         """Internal check_operation logic (no metrics)."""
+        decision = await self._evaluate_operation(
+            agent_id, agent_type, operation, resource, context,
+        )
+        await self._log_policy_decision(
+            agent_id=agent_id,
+            agent_type=agent_type,
+            operation=operation,
+            resource=resource,
+            context=context or {},
+            decision=decision,
+            engine="native",
+        )
+        return decision
+
+    async def _evaluate_operation(
+        self,
+        agent_id: str,
+        agent_type: str,
+        operation: str,
+        resource: str = "",
+        context: dict[str, Any] | None = None,
+    ) -> PolicyDecision:
+        """Decide a single operation (no metrics, no audit)."""
         from .profiles import get_profiles_service
 
         profiles = get_profiles_service()
@@ -198,137 +410,47 @@ class NativePolicyEngine:
             try:
                 trust_level = await resolve_trust_level(agent_id, agent_type)
             except TrustResolutionError as exc:
-                decision = PolicyDecision.deny(f"trust_resolution_failed: {exc}")
-                await self._log_policy_decision(
-                    agent_id=agent_id,
-                    agent_type=agent_type,
-                    operation=operation,
-                    resource=resource,
-                    context=ctx,
-                    decision=decision,
-                    engine="native",
-                )
-                return decision
+                return PolicyDecision.deny(f"trust_resolution_failed: {exc}")
 
         # Suspended agents (TrustLevel.UNTRUSTED) are denied all operations
         if trust_level == TrustLevel.UNTRUSTED:
-            decision = PolicyDecision.deny(
+            return PolicyDecision.deny(
                 f"agent_suspended: trust_level={int(TrustLevel.UNTRUSTED)}"
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
 
         # Risk score check: high risk denies non-read operations
         risk_score = ctx.get("risk_score")
         if risk_score is not None and risk_score > 0.7 and operation not in READ_ACTIONS:
-            decision = PolicyDecision.deny("risk_score_exceeded")
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
+            return PolicyDecision.deny("risk_score_exceeded")
 
         # Session grants: elevate access for granted operations
         session_grants = ctx.get("session_grants")
         if session_grants and operation in session_grants:
-            decision = PolicyDecision.allow(
+            return PolicyDecision.allow(
                 f"session_grant_permitted: {operation}"
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
 
         # Check by action category
         if operation in READ_ACTIONS:
-            decision = PolicyDecision.allow("read_permitted")
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
+            return PolicyDecision.allow("read_permitted")
 
         if operation in WRITE_ACTIONS:
             if trust_level >= MIN_WRITE_TRUST:
-                decision = PolicyDecision.allow(
+                return PolicyDecision.allow(
                     f"write_permitted: trust_level={trust_level}"
                 )
-                await self._log_policy_decision(
-                    agent_id=agent_id,
-                    agent_type=agent_type,
-                    operation=operation,
-                    resource=resource,
-                    context=ctx,
-                    decision=decision,
-                    engine="native",
-                )
-                return decision
-            decision = PolicyDecision.deny(
+            return PolicyDecision.deny(
                 f"write_denied: trust_level={trust_level} < {int(MIN_WRITE_TRUST)}"
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
 
         if operation in ADMIN_ACTIONS:
             if trust_level >= MIN_ADMIN_TRUST:
-                decision = PolicyDecision.allow(
+                return PolicyDecision.allow(
                     f"admin_permitted: trust_level={trust_level}"
                 )
-                await self._log_policy_decision(
-                    agent_id=agent_id,
-                    agent_type=agent_type,
-                    operation=operation,
-                    resource=resource,
-                    context=ctx,
-                    decision=decision,
-                    engine="native",
-                )
-                return decision
-            decision = PolicyDecision.deny(
+            return PolicyDecision.deny(
                 f"admin_denied: trust_level={trust_level} < {int(MIN_ADMIN_TRUST)}"
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
 
         # Unknown operation — check via profile service
         try:
@@ -345,28 +467,9 @@ class NativePolicyEngine:
                 decision = PolicyDecision.deny(
                 f"profile_denied: {check.reason or operation}"
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
             return decision
         except Exception:
-            decision = PolicyDecision.deny(f"unknown_operation: {operation}")
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="native",
-            )
-            return decision
+            return PolicyDecision.deny(f"unknown_operation: {operation}")
 
     async def check_network_access(
         self,
@@ -430,6 +533,7 @@ class NativePolicyEngine:
             {"name": policy_name},
             {"policy_text": policy_text},
         )
+        get_decision_cache().invalidate()
         return {
             "success": True,
             "policy_name": policy_name,
@@ -445,21 +549,25 @@ class NativePolicyEngine:
         context: dict[str, Any],
         decision: PolicyDecision,
         engine: str,
+        cached: bool = False,
     ) -> None:
         """Best-effort policy decision audit logging."""
         try:
             from .audit import get_audit_service
 
+            parameters: dict[str, Any] = {
+                "operation": operation,
+                "resource": resource,
+                "engine": engine,
+                "context": context,
+            }
+            if cached:
+                parameters["cached"] = True
             await get_audit_service().log_operation(
                 agent_id=agent_id,
                 agent_type=agent_type,
                 operation="policy_decision",
-                parameters={
-                    "operation": operation,
-                    "resource": resource,
-                    "engine": engine,
-                    "context": context,
-                },
+                parameters=parameters,
                 result={
                     "allowed": decision.allowed,
                     "reason": decision.reason,
@@ -688,9 +796,27 @@ class CedarPolicyEngine:
         """
         t0 = time.monotonic()
         with start_span("policy.evaluate", {"engine": "cedar", "operation": operation}):
-            decision = await self._do_check_operation(
-                agent_id, agent_type, operation, resource, context,
-            )
+            cache = get_decision_cache()
+            key = cache.key("cedar", agent_id, agent_type, operation, resource, context)
+            cached = cache.get(key) if key is not None else None
+            if cached is not None:
+                decision = cached
+                await self._log_policy_decision(
+                    agent_id=agent_id,
+                    agent_type=agent_type,
+                    operation=operation,
+                    resource=resource,
+                    context=context or {},
+                    decision=decision,
+                    engine="cedar",
+                    cached=True,
+                )
+            else:
+                decision = await self._do_check_operation(
+                    agent_id, agent_type, operation, resource, context,
+                )
+                if key is not None:
+                    cache.put(key, decision)
 
         # Record metrics (best-effort)
         try:
@@ -707,6 +833,23 @@ class CedarPolicyEngine:
 
         return decision
 
+    async def check_operations(
+        self,
+        agent_id: str,
+        agent_type: str,
+        operation: str,
+        resources: list[str],
+        context: dict[str, Any] | None = None,
+    ) -> list[PolicyDecision]:
+        """Check one operation against several resources in a single evaluation.
+
+        Decisions come back in ``resources`` order; the whole batch is
+        written as one ``policy_decision`` audit entry.
+        """
+        return await _check_operation_batch(
+            self, "cedar", agent_id, agent_type, operation, resources, context,
+        )
+
     async def _do_check_operation(
         self,
         agent_id: str,
@@ -716,23 +859,36 @@ class CedarPolicyEngine:
         context: dict[str, Any] | None = None,
     ) -> PolicyDecision:
         """Internal check_operation logic (no metrics)."""
+        decision = await self._evaluate_operation(
+            agent_id, agent_type, operation, resource, context,
+        )
+        await self._log_policy_decision(
+            agent_id=agent_id,
+            agent_type=agent_type,
+            operation=operation,
+            resource=resource,
+            context=context or {},
+            decision=decision,
+            engine="cedar",
+        )
+        return decision
+
+    async def _evaluate_operation(
+        self,
+        agent_id: str,
+        agent_type: str,
+        operation: str,
+        resource: str = "",
+        context: dict[str, Any] | None = None,
+    ) -> PolicyDecision:
+        """Decide a single operation (no metrics, no audit)."""
         ctx = context or {}
         trust_level = ctx.get("trust_level", 1)
 
         try:
             policies = await self._load_policies()
         except Exception as e:
-            decision = PolicyDecision.deny(f"policy_load_error: {e}")
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="cedar",
-            )
-            return decision
+            return PolicyDecision.deny(f"policy_load_error: {e}")
 
         resource_type = self._determine_resource_type(operation)
         resource_entity = self._build_resource_entity(
@@ -755,21 +911,11 @@ class CedarPolicyEngine:
                 request, policies, entities
             )
         except Exception as e:
-            decision = PolicyDecision(
+            return PolicyDecision(
                 allowed=False,
                 reason=f"cedar_evaluation_error: {e}",
                 diagnostics=[str(e)],
             )
-            await self._log_policy_decision(
-                agent_id=agent_id,
-                agent_type=agent_type,
-                operation=operation,
-                resource=resource,
-                context=ctx,
-                decision=decision,
-                engine="cedar",
-            )
-            return decision
 
         allowed = response.decision == self._cedarpy.Decision.Allow
         reason_parts: list[str] = []
@@ -780,21 +926,11 @@ class CedarPolicyEngine:
             if hasattr(diag, "errors") and diag.errors:
                 reason_parts.extend(str(e) for e in diag.errors)
 
-        decision = PolicyDecision(
+        return PolicyDecision(
             allowed=allowed,
             reason=f"cedar:{'allow' if allowed else 'deny'}",
             diagnostics=reason_parts,
         )
-        await self._log_policy_decision(
-            agent_id=agent_id,
-            agent_type=agent_type,
-            operation=operation,
-            resource=resource,
-            context=ctx,
-            decision=decision,
-            engine="cedar",
-        )
-        return decision
 
     async def check_network_access(
         self,
@@ -856,9 +992,13 @@ class CedarPolicyEngine:
             return []
 
     def invalidate_cache(self) -> None:
-        """Invalidate the policy cache, forcing reload on next check."""
+        """Invalidate the policy cache, forcing reload on next check.
+
+        Cached decisions were made against the old policy set and go too.
+        """
         self._policies_cache = None
         self._policies_cache_time = 0.0
+        get_decision_cache().invalidate()
 
     async def list_policy_versions(
         self, policy_name: str, limit: int = 20
@@ -915,21 +1055,25 @@ class CedarPolicyEngine:
         context: dict[str, Any],
         decision: PolicyDecision,
         engine: str,
+        cached: bool = False,
     ) -> None:
         """Best-effort policy decision audit logging."""
         try:
             from .audit import get_audit_service
 
+            parameters: dict[str, Any] = {
+                "operation": operation,
+                "resource": resource,
+                "engine": engine,
+                "context": context,
+            }
+            if cached:
+                parameters["cached"] = True
             await get_audit_service().log_operation(
                 agent_id=agent_id,
                 agent_type=agent_type,
                 operation="policy_decision",
-                parameters={
-                    "operation": operation,
-                    "resource": resource,
-                    "engine": engine,
-                    "context": context,
-                },
+                parameters=parameters,
                 result={
                     "allowed": decision.allowed,
                     "reason": decision.reason,
@@ -942,6 +1086,95 @@ class CedarPolicyEngine:
             logger.debug("Failed to audit policy decision", exc_info=True)
 
 
+async def _check_operation_batch(
+    engine: "NativePolicyEngine | CedarPolicyEngine",
+    engine_name: str,
+    agent_id: str,
+    agent_type: str,
+    operation: str,
+    resources: list[str],
+    context: dict[str, Any] | None,
+) -> list[PolicyDecision]:
+    """Shared ``check_operations`` body: cached lookups, one audit entry."""
+    t0 = time.monotonic()
+    span_attrs = {
+        "engine": engine_name,
+        "operation": operation,
+        "resource_count": len(resources),
+    }
+    with start_span("policy.evaluate_batch", span_attrs):
+        cache = get_decision_cache()
+        keys = [
+            cache.key(engine_name, agent_id, agent_type, operation, resource, context)
+            for resource in resources
+        ]
+        decisions: list[PolicyDecision | None] = [
+            cache.get(key) if key is not None else None for key in keys
+        ]
+        misses = [i for i, decision in enumerate(decisions) if decision is None]
+        evaluated = await asyncio.gather(*(
+            engine._evaluate_operation(
+                agent_id, agent_type, operation, resources[i], context,
+            )
+            for i in misses
+        ))
+        for i, decision in zip(misses, evaluated, strict=True):
+            decisions[i] = decision
+            key = keys[i]
+            if key is not None:
+                cache.put(key, decision)
+        resolved = [decision for decision in decisions if decision is not None]
+
+        try:
+            from .audit import get_audit_service
+
+            parameters: dict[str, Any] = {
+                "operation": operation,
+                "resources": resources,
+                "engine": engine_name,
+                "context": context or {},
+            }
+            if len(misses) < len(resources):
+                parameters["cached"] = len(resources) - len(misses)
+            await get_audit_service().log_operation(
+                agent_id=agent_id,
+                agent_type=agent_type,
+                operation="policy_decision",
+                parameters=parameters,
+                result={
+                    "allowed": all(decision.allowed for decision in resolved),
+                    "denied": {
+                        resource: decision.reason
+                        for resource, decision in zip(resources, resolved, strict=True)
+                        if not decision.allowed
+                    },
+                },
+                success=True,
+            )
+        except Exception:
+            logger.debug("Failed to audit batched policy decision", exc_info=True)
+
+    # Record metrics (best-effort)
+    try:
+        duration_hist, decision_counter, _ = _ensure_policy_instruments()
+        allowed = sum(1 for decision in resolved if decision.allowed)
+        labels = {
+            "engine": engine_name,
+            "operation": operation,
+            "decision": "allow" if allowed == len(resolved) else "deny",
+        }
+        if duration_hist is not None:
+            duration_hist.record((time.monotonic() - t0) * 1000, labels)
+        if decision_counter is not None:
+            for label, count in (("allow", allowed), ("deny", len(resolved) - allowed)):
+                if count:
+                    decision_counter.add(count, {**labels, "decision": label})
+    except Exception:
+        logger.debug("Failed to record policy metrics", exc_info=True)
+
+    return resolved
+
+
 # Global engine instance
 _policy_engine: NativePolicyEngine | CedarPolicyEngine | None = None
 
@@ -973,3 +1206,35 @@ def reset_policy_instruments() -> None:
     """Reset cached metric instruments (for testing)."""
     global _policy_instruments
     _policy_instruments = None
+
+
+async def handle_policy_event(event: "CoordinatorEvent") -> None:
+    """Drop cached authorization state affected by a ``coordinator_policy`` event.
+
+    ``trust.changed`` names the re-assigned agent, so only its decisions go.
+    Profile and Cedar policy edits can affect any agent and clear everything.
+    """
+    from .profiles import get_profiles_service
+
+    if event.event_type == "trust.changed" and event.agent_id:
+        get_decision_cache().invalidate(event.agent_id)
+    else:
+        get_decision_cache().invalidate()
+
+    if event.event_type in ("trust.changed", "profile.changed"):
+        # Trust is resolved through the profiles cache; drop it too or the next
+        # evaluation would re-cache the old trust level.
+        get_profiles_service().invalidate_cache()
+    elif event.event_type == "policy.changed" and isinstance(
+        _policy_engine, CedarPolicyEngine
+    ):
+        _policy_engine.invalidate_cache()
+
+
+def subscribe_policy_invalidation(bus: "EventBusService") -> None:
+    """Register :func:`handle_policy_event` on the event bus policy channel.
+
+    Idempotent, so a restarted app lifespan does not register it twice.
+    """
+    bus.off_event(POLICY_CHANNEL, handle_policy_event)
+    bus.on_event(POLICY_CHANNEL, handle_policy_event)
@@ -25,6 +25,9 @@ _initialized = False
 _lock_meter: Any = None
 _queue_meter: Any = None
 _policy_meter: Any = None
+_db_meter: Any = None
+_audit_meter: Any = None
+_code_search_meter: Any = None
 
 # Tracer
 _tracer: Any = None
@@ -49,7 +52,9 @@ def init_telemetry() -> None:
     When OTEL_METRICS_ENABLED and OTEL_TRACES_ENABLED are both false,
     this function returns immediately with no side effects.
     """
-    global _initialized, _lock_meter, _queue_meter, _policy_meter, _tracer
+    global _initialized, _lock_meter, _queue_meter, _policy_meter, _db_meter, _audit_meter
+    global _code_search_meter
+    global _tracer
 
     if _initialized:
         return
@@ -73,7 +78,8 @@ def init_telemetry() -> None:
 
 def _init_metrics() -> None:
     """Set up MeterProvider with OTLP exporter."""
-    global _lock_meter, _queue_meter, _policy_meter
+    global _lock_meter, _queue_meter, _policy_meter, _db_meter, _audit_meter
+    global _code_search_meter
 
     from opentelemetry import metrics
     from opentelemetry.sdk.metrics import MeterProvider
@@ -138,6 +144,9 @@ def _init_metrics() -> None:
     _lock_meter = metrics.get_meter("coordinator.locks", "0.1.0")
     _queue_meter = metrics.get_meter("coordinator.queue", "0.1.0")
     _policy_meter = metrics.get_meter("coordinator.policy", "0.1.0")
+    _db_meter = metrics.get_meter("coordinator.db", "0.1.0")
+    _audit_meter = metrics.get_meter("coordinator.audit", "0.1.0")
+    _code_search_meter = metrics.get_meter("coordinator.code_search", "0.1.0")
 
     logger.info("OTel metrics initialized (service=%s)", service_name)
 
@@ -204,6 +213,21 @@ def get_policy_meter() -> Any:
     return _policy_meter
 
 
+def get_db_meter() -> Any:
+    """Return the database client meter, or None if metrics are disabled."""
+    return _db_meter
+
+
+def get_audit_meter() -> Any:
+    """Return the audit sink meter, or None if metrics are disabled."""
+    return _audit_meter
+
+
+def get_code_search_meter() -> Any:
+    """Return the code-search runtime meter, or None if metrics are disabled."""
+    return _code_search_meter
+
+
 def get_tracer() -> Any:
     """Return the tracer, or None if traces are disabled."""
     return _tracer
@@ -273,9 +297,14 @@ def get_prometheus_app() -> Any | None:
 
 def reset_telemetry() -> None:
     """Reset all telemetry state. For testing only."""
-    global _initialized, _lock_meter, _queue_meter, _policy_meter, _tracer
+    global _initialized, _lock_meter, _queue_meter, _policy_meter, _db_meter, _audit_meter
+    global _code_search_meter
+    global _tracer
     _initialized = False
     _lock_meter = None
     _queue_meter = None
     _policy_meter = None
+    _db_meter = None
+    _audit_meter = None
+    _code_search_meter = None
     _tracer = None
@@ -9,6 +9,7 @@ import respx
 
 from src.config import AgentConfig, Config, LockConfig, SupabaseConfig, reset_config
 from src.db import SupabaseClient, reset_db
+from src.policy_engine import reset_decision_cache
 
 
 def setup_api_config_env(monkeypatch: pytest.MonkeyPatch, test_key: str) -> Iterator[None]:
@@ -58,6 +59,7 @@ def setup_env(monkeypatch):
     yield
     reset_config()
     reset_db()
+    reset_decision_cache()
 
 
 @pytest.fixture
@@ -84,6 +84,7 @@ async def code_search_db() -> AsyncIterator[PostgresCase]:
                 "028_code_search_registry.sql",
                 "029_revision_aware_code_search_indexes.sql",
                 "030_incremental_code_search_indexes.sql",
+                "038_code_search_scanner_fingerprint.sql",
             ):
                 await connection.execute((MIGRATIONS / migration).read_text(encoding="utf-8"))
             repo_slug = f"ri03_{uuid4().hex[:12]}"
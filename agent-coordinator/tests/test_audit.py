@@ -1,12 +1,14 @@
 """Tests for the audit trail service."""
 
+import asyncio
+import json
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 from httpx import Response
 
-from src.audit import AuditEntry, AuditResult, AuditService
+from src.audit import AuditEntry, AuditResult, AuditService, AuditSink
 
 
 class TestAuditService:
@@ -111,6 +113,189 @@ class TestAuditService:
         assert len(results) == 0
 
 
+class _RecordingDB:
+    """Captures insert_many batches; optionally fails them.
+
+    ``fail`` rejects every call; ``bad_ops`` rejects any call containing a
+    row whose operation is listed, like a constraint violation would.
+    """
+
+    def __init__(self, fail: bool = False, bad_ops: frozenset[str] = frozenset()):
+        self.batches: list[list[dict]] = []
+        self.fail = fail
+        self.bad_ops = bad_ops
+
+    async def insert_many(self, table, rows):
+        assert table == "audit_log"
+        if self.fail or any(row["operation"] in self.bad_ops for row in rows):
+            raise RuntimeError("db down")
+        self.batches.append(list(rows))
+
+
+def _entry(i: int) -> dict:
+    return {"agent_id": "a", "operation": f"op-{i}"}
+
+
+class TestAuditSink:
+    """Tests for the bounded, batched audit writer."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_is_full(self):
+        db = _RecordingDB()
+        sink = AuditSink(lambda: db, batch_size=3, flush_interval_s=60)
+
+        for i in range(3):
+            assert sink.submit(_entry(i)) is True
+        await asyncio.sleep(0.01)
+
+        assert [len(b) for b in db.batches] == [3]
+        assert sink.stats()["written"] == 3
+        assert sink.queue_depth == 0
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self):
+        db = _RecordingDB()
+        sink = AuditSink(lambda: db, batch_size=100, flush_interval_s=0.02)
+
+        sink.submit(_entry(0))
+        sink.submit(_entry(1))
+        assert db.batches == []
+        await asyncio.sleep(0.1)
+
+        assert db.batches == [[_entry(0), _entry(1)]]
+        assert sink.last_flush_ms is not None
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self):
+        db = _RecordingDB()
+        sink = AuditSink(lambda: db, max_queue_size=2, batch_size=10, flush_interval_s=60)
+
+        assert sink.submit(_entry(0)) is True
+        assert sink.submit(_entry(1)) is True
+        assert sink.submit(_entry(2)) is False
+
+        assert sink.stats()["dropped"] == 1
+        assert sink.queue_depth == 2
+        await sink.close()
+        assert db.batches == [[_entry(0), _entry(1)]]
+
+    @pytest.mark.asyncio
+    async def test_close_drains_in_batches(self):
+        db = _RecordingDB()
+        sink = AuditSink(lambda: db, batch_size=4, flush_interval_s=60)
+        # Queue directly so no worker is running: close() alone must drain.
+        for i in range(10):
+            sink._pending.append(_entry(i))
+
+        await sink.close()
+
+        assert [len(b) for b in db.batches] == [4, 4, 2]
+        assert sink.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_counted(self):
+        sink = AuditSink(lambda: _RecordingDB(fail=True), batch_size=2, flush_interval_s=60)
+        sink.submit(_entry(0))
+        sink.submit(_entry(1))
+        await asyncio.sleep(0.01)
+
+        stats = sink.stats()
+        assert stats["failed"] == 2
+        assert stats["written"] == 0
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_rows_and_counts_only_bad_ones(self, monkeypatch):
+        dropped: list[int] = []
+        monkeypatch.setattr(AuditSink, "_record_dropped", staticmethod(dropped.append))
+        db = _RecordingDB(bad_ops=frozenset({"op-1"}))
+        sink = AuditSink(lambda: db, batch_size=3, flush_interval_s=60)
+        for i in range(3):
+            sink._pending.append(_entry(i))
+
+        await sink.flush()
+
+        assert db.batches == [[_entry(0)], [_entry(2)]]
+        assert sink.stats()["written"] == 2
+        assert sink.stats()["failed"] == 1
+        assert dropped == [1]
+
+    @pytest.mark.asyncio
+    async def test_flush_records_row_count_in_its_own_histogram(self, monkeypatch):
+        import src.audit as audit_mod
+
+        class _Histogram:
+            def __init__(self):
+                self.calls = []
+
+            def record(self, *args):
+                self.calls.append(args)
+
+        duration, rows = _Histogram(), _Histogram()
+        monkeypatch.setattr(
+            audit_mod,
+            "_ensure_audit_instruments",
+            lambda: (duration, None, None, rows),
+        )
+        sink = AuditSink(lambda: _RecordingDB(), batch_size=2, flush_interval_s=60)
+        for i in range(3):
+            sink._pending.append(_entry(i))
+
+        await sink.flush()
+
+        # Duration carries no per-batch-size label; sizes go to their own histogram.
+        assert [len(call) for call in duration.calls] == [1, 1]
+        assert rows.calls == [(2,), (1,)]
+
+    def test_instruments_registered_when_sink_is_created(self, monkeypatch):
+        import src.audit as audit_mod
+
+        calls: list[bool] = []
+        monkeypatch.setattr(
+            audit_mod,
+            "_ensure_audit_instruments",
+            lambda: calls.append(True) or (None, None, None, None),
+        )
+
+        AuditSink(lambda: _RecordingDB())
+
+        assert calls == [True]
+
+    @pytest.mark.asyncio
+    async def test_service_async_logging_uses_sink(self, monkeypatch):
+        monkeypatch.setenv("AUDIT_BATCH_SIZE", "2")
+        from src.config import reset_config
+
+        reset_config()
+        db = _RecordingDB()
+        service = AuditService(db)  # type: ignore[arg-type]
+
+        await service.log_operation(operation="acquire_lock", success=True)
+        await service.log_operation(operation="release_lock", success=True)
+        await service.drain()
+
+        assert len(db.batches) == 1
+        assert [row["operation"] for row in db.batches[0]] == [
+            "acquire_lock",
+            "release_lock",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_supabase_insert_many_posts_one_array(self, mock_supabase, db_client):
+        route = mock_supabase.post(
+            "https://test.supabase.co/rest/v1/audit_log"
+        ).mock(return_value=Response(201))
+
+        await db_client.insert_many("audit_log", [_entry(0), _entry(1)])
+
+        assert route.call_count == 1
+        request = route.calls[0].request
+        assert json.loads(request.content) == [_entry(0), _entry(1)]
+        assert request.headers["Prefer"] == "return=minimal"
+
+
 class TestAuditDataClasses:
     """Tests for audit dataclasses."""
 
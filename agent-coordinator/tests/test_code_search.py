@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 from datetime import UTC, datetime
 from types import SimpleNamespace
@@ -7,6 +8,7 @@ from typing import Any
 from uuid import UUID
 
 import pytest
+from code_search_pkg.query_cache import QueryResultCache
 from code_search_pkg.query_pg import QueryableIndex, QueryProviderContract
 from code_search_pkg.registry_models import NamespaceKind
 from code_search_pkg.schema import QueryResult
@@ -670,3 +672,50 @@ async def test_grant_resolver_failure_is_sanitized_before_semantic_work(
     assert "credential" not in rendered
     assert "query text" not in rendered
     assert "agent-coordinator/**" not in rendered
+
+
+@pytest.mark.asyncio
+async def test_new_canonical_index_retires_previous_cached_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = _index()
+    second = dataclasses.replace(
+        first,
+        index_id=UUID("22222222-2222-4222-8222-222222222222"),
+        storage_key="i_22222222222222222222222222222222",
+    )
+    canonical = iter([first, first, second])
+    service, _calls = _service(monkeypatch)
+
+    async def select_main(_pool: object, _repo_slug: str) -> QueryableIndex:
+        return next(canonical)
+
+    monkeypatch.setattr("src.code_search.select_main_index", select_main)
+    cache = QueryResultCache()
+    service._result_cache = cache  # type: ignore[attr-defined]
+
+    def cached(storage_key: str) -> None:
+        cache.put(
+            QueryResultCache.key(
+                storage_key,
+                [0.1, 0.2, 0.3],
+                limit=1,
+                offset=0,
+                languages=None,
+                allow_path_regexes=None,
+                deny_path_regexes=None,
+                path_regexes=None,
+            ),
+            [],
+        )
+
+    cached(first.storage_key)
+    cached(second.storage_key)
+    await service.search(_request(), principal_id="codex")
+    await service.search(_request(), principal_id="codex")
+    assert len(cache) == 2
+
+    await service.search(_request(), principal_id="codex")
+    assert len(cache) == 1
+    assert cache.retire_storage_key(first.storage_key) == 0
+    assert cache.retire_storage_key(second.storage_key) == 1
@@ -0,0 +1,119 @@
+"""Tests for query-embedding micro-batching and the query-vector cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from src.code_search_embedding import (
+    QueryEmbeddingBatcher,
+    QueryVectorCache,
+    normalize_query,
+)
+
+
+class _Provider:
+    def __init__(self, *, fail: bool = False, delay: float = 0.0) -> None:
+        self.calls: list[list[str]] = []
+        self.fail = fail
+        self.delay = delay
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_normalize_query_collapses_whitespace_and_keeps_case() -> None:
+    assert normalize_query("  find   LockService\n") == "find LockService"
+
+
+def test_cache_evicts_least_recently_used_and_reports_hit_rate() -> None:
+    cache = QueryVectorCache(max_entries=2)
+    cache.put("fp", "a", [1.0])
+    cache.put("fp", "b", [2.0])
+    assert cache.get("fp", "a") == (1.0,)
+    cache.put("fp", "c", [3.0])
+
+    assert cache.get("fp", "b") is None
+    assert cache.get("other", "a") is None
+    assert cache.get("fp", "c") == (3.0,)
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "hit_rate": 0.5,
+        "size": 2,
+        "max_entries": 2,
+    }
+    with pytest.raises(ValueError):
+        QueryVectorCache(max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_provider_call() -> None:
+    provider = _Provider()
+    batcher = QueryEmbeddingBatcher(provider.embed, fingerprint="fp", window_seconds=0.01)
+
+    vectors = await asyncio.gather(batcher("alpha"), batcher(" alpha "), batcher("beta"))
+
+    assert provider.calls == [["alpha", "beta"]]
+    assert vectors == [[5.0, 1.0], [5.0, 1.0], [4.0, 1.0]]
+    assert batcher.stats()["provider_calls"] == 1
+    assert batcher.stats()["embedded_queries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_batch_dispatches_without_waiting_for_window() -> None:
+    provider = _Provider()
+    batcher = QueryEmbeddingBatcher(
+        provider.embed, fingerprint="fp", window_seconds=10.0, max_batch_size=2
+    )
+
+    await asyncio.wait_for(asyncio.gather(batcher("a"), batcher("bb")), timeout=1.0)
+
+    assert provider.calls == [["a", "bb"]]
+
+
+@pytest.mark.asyncio
+async def test_cached_queries_skip_the_provider() -> None:
+    provider = _Provider()
+    cache = QueryVectorCache()
+    batcher = QueryEmbeddingBatcher(provider.embed, fingerprint="fp", cache=cache)
+
+    assert await batcher("where is the lock table") == [23.0, 1.0]
+    assert await batcher("where  is the lock table") == [23.0, 1.0]
+
+    assert len(provider.calls) == 1
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_fails_the_batch_and_is_not_cached() -> None:
+    provider = _Provider(fail=True)
+    cache = QueryVectorCache()
+    batcher = QueryEmbeddingBatcher(provider.embed, fingerprint="fp", cache=cache)
+
+    results = await asyncio.gather(batcher("a"), batcher("b"), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_waiting_queries_and_rejects_new_ones() -> None:
+    provider = _Provider(delay=10.0)
+    batcher = QueryEmbeddingBatcher(provider.embed, fingerprint="fp", window_seconds=0.0)
+    waiting = asyncio.ensure_future(batcher("a"))
+    await asyncio.sleep(0.01)
+
+    await batcher.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    with pytest.raises(RuntimeError):
+        await batcher("b")
@@ -370,3 +370,74 @@ def _request() -> CodeSearchRequest:
             "scope": {"kind": "explicit", "read_allow": ["agent-coordinator/**"]},
         }
     )
+
+
+def test_embedding_batch_and_cache_bounds_come_from_environment() -> None:
+    config = CodeSearchRuntimeConfig.from_env(
+        {
+            "CODE_SEARCH_EMBEDDING_BATCH_WINDOW_SECONDS": "0.005",
+            "CODE_SEARCH_EMBEDDING_MAX_BATCH_SIZE": "8",
+            "CODE_SEARCH_QUERY_CACHE_SIZE": "0",
+        }
+    )
+
+    assert config.embedding_batch_window_seconds == 0.005
+    assert config.embedding_max_batch_size == 8
+    assert config.query_vector_cache_size == 0
+    with pytest.raises(ValueError):
+        _config(embedding_max_batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_cache_and_batcher_counters_are_published_as_metrics(monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    from code_search_pkg.query_cache import QueryResultCache
+
+    import src.code_search_runtime as runtime_mod
+
+    provider = _Provider()
+    runtime = await CodeSearchRuntime.create(
+        _config(),
+        pool_factory=lambda: _async_value(_Pool()),
+        provider_factory=lambda: provider,
+        service_factory=lambda **_: _Service(),
+    )
+    runtime._embedder = runtime._build_embedder(provider)
+    runtime._result_cache = QueryResultCache(4)
+    runtime._result_cache.hits, runtime._result_cache.misses = 3, 1
+    await runtime._embedder("find the lock service")
+    await runtime._embedder("find the lock service")
+
+    meter = MagicMock()
+    monkeypatch.setattr(runtime_mod, "get_code_search_meter", lambda: meter)
+    monkeypatch.setattr(runtime_mod, "_runtime", runtime)
+    runtime_mod.reset_code_search_instruments()
+    try:
+        runtime_mod._ensure_code_search_instruments()
+        counters = {
+            c.args[0]: c.kwargs["callbacks"][0]
+            for c in meter.create_observable_counter.call_args_list
+        }
+        (hit_rate_call,) = meter.create_observable_gauge.call_args_list
+        lookups = {
+            (o.attributes["cache"], o.attributes["result"]): o.value
+            for o in counters["code_search.cache.lookups"](None)
+        }
+        hit_rates = {
+            o.attributes["cache"]: o.value
+            for o in hit_rate_call.kwargs["callbacks"][0](None)
+        }
+
+        assert lookups == {
+            ("query_vector", "hit"): 1,
+            ("query_vector", "miss"): 1,
+            ("knn_result", "hit"): 3,
+            ("knn_result", "miss"): 1,
+        }
+        assert hit_rates == {"query_vector": 0.5, "knn_result": 0.75}
+        [calls] = counters["code_search.embedding.provider_calls"](None)
+        assert calls.value == 1
+    finally:
+        runtime_mod.reset_code_search_instruments()
+        await runtime.close()
@@ -157,6 +157,84 @@ def test_acquire_lock_delegates_to_service(
     mock_service.acquire.assert_called_once()
 
 
+def test_acquire_locks_batch_delegates_to_service(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.locks import BatchLockResult, LockResult
+
+    mock_service = AsyncMock()
+    mock_service.acquire_many.return_value = BatchLockResult(
+        success=True,
+        locks=[
+            LockResult(success=True, action="acquired", file_path="src/a.py"),
+            LockResult(success=True, action="acquired", file_path="src/b.py"),
+        ],
+        expires_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    authorize = AsyncMock()
+    monkeypatch.setattr("src.coordination_api.authorize_operation", authorize)
+
+    import src.locks
+
+    monkeypatch.setattr(src.locks, "_lock_service", mock_service)
+
+    response = client.post(
+        "/locks/acquire-batch",
+        headers=_auth_headers(),
+        json={
+            "file_paths": ["src/b.py", "src/a.py"],
+            "agent_id": "agent-1",
+            "agent_type": "codex",
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert [lock["file_path"] for lock in data["locks"]] == ["src/a.py", "src/b.py"]
+    mock_service.acquire_many.assert_called_once()
+    # The service authorizes the batch; the endpoint must not repeat it.
+    authorize.assert_not_called()
+
+
+def test_acquire_locks_batch_policy_denial_is_403(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from src.locks import BatchLockResult, LockResult
+
+    mock_service = AsyncMock()
+    mock_service.acquire_many.return_value = BatchLockResult(
+        success=False,
+        conflicts=[LockResult(success=False, file_path="secrets/key.pem", reason="path_denied")],
+        reason="path_denied",
+        policy_denied=True,
+    )
+
+    import src.locks
+
+    monkeypatch.setattr(src.locks, "_lock_service", mock_service)
+
+    response = client.post(
+        "/locks/acquire-batch",
+        headers=_auth_headers(),
+        json={
+            "file_paths": ["src/a.py", "secrets/key.pem"],
+            "agent_id": "agent-1",
+            "agent_type": "codex",
+        },
+    )
+    assert response.status_code == 403
+    assert response.json()["detail"] == "path_denied"
+
+
+def test_acquire_locks_batch_rejects_empty_list(client: TestClient) -> None:
+    response = client.post(
+        "/locks/acquire-batch",
+        headers=_auth_headers(),
+        json={"file_paths": [], "agent_id": "agent-1", "agent_type": "codex"},
+    )
+    assert response.status_code == 422
+
+
 def test_release_lock_delegates_to_service(
     client: TestClient, monkeypatch: pytest.MonkeyPatch
 ) -> None:
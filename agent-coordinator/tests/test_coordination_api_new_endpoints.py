@@ -134,6 +134,31 @@ def test_issues_search_requires_auth(client: TestClient) -> None:
     assert response.status_code == 401
 
 
+def test_issues_search_forwards_filters_and_offset(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from unittest.mock import AsyncMock
+
+    from src import issue_service
+
+    mock_service = AsyncMock()
+    mock_service.search = AsyncMock(return_value=[])
+    monkeypatch.setattr(issue_service, "get_issue_service", lambda: mock_service)
+
+    response = client.post(
+        "/issues/search",
+        json={"query": "bug", "status": "open", "labels": ["api"], "limit": 10, "offset": 20},
+        headers=_auth_headers(),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["offset"] == 20
+    mock_service.search.assert_awaited_once_with(
+        query="bug", limit=10, offset=20, status="open", labels=["api"],
+    )
+
+
 def test_issues_ready_requires_auth(client: TestClient) -> None:
     response = client.post("/issues/ready", json={})
     assert response.status_code == 401
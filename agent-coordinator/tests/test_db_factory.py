@@ -247,3 +247,180 @@ class TestPostgresUpdateTimestampBinding:
         )
         assert isinstance(args[2], datetime)
         assert args[3] == issue_id
+
+
+def _capturing_pool(captured: list[tuple[str, tuple]]):
+    """Fake asyncpg pool that records (sql, args) for fetch/fetchrow/executemany."""
+
+    class FakeConn:
+        async def fetch(self, query, *args):
+            captured.append((query, args))
+            return []
+
+        async def executemany(self, query, *args):
+            captured.append((query, args))
+
+        async def fetchrow(self, query, *args):
+            captured.append((query, args))
+            return None
+
+    class FakeAcquire:
+        async def __aenter__(self):
+            return FakeConn()
+
+        async def __aexit__(self, *exc):
+            return None
+
+    class FakePool:
+        def acquire(self):
+            return FakeAcquire()
+
+    return FakePool()
+
+
+@pytest.mark.skipif(not HAS_ASYNCPG, reason="asyncpg not installed")
+class TestQueryTemplateCache:
+    """Filter shapes compile to SQL once; values are bound per call."""
+
+    @pytest.mark.asyncio
+    async def test_same_shape_reuses_identical_sql(self):
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.query("file_locks", "file_path=eq.src/a.py&expires_at=gt.now()")
+        await client.query("file_locks", "file_path=eq.src/b.py&expires_at=gt.now()")
+
+        (sql_a, args_a), (sql_b, args_b) = captured
+        assert sql_a is sql_b
+        assert sql_a == (
+            "SELECT * FROM file_locks WHERE file_path = $1 AND expires_at > NOW()"
+        )
+        assert args_a == ("src/a.py",)
+        assert args_b == ("src/b.py",)
+        assert client.template_cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    @pytest.mark.asyncio
+    async def test_compiled_sql_matches_all_operators(self):
+        from datetime import datetime
+        from uuid import UUID
+
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.query(
+            "work_queue",
+            "status=in.(pending,claimed)"
+            "&parameters->>change_id=eq.add-x"
+            "&priority=gte.3&priority=lte.7"
+            "&created_at=gt.2026-08-19T12:34:56+00:00"
+            "&id=eq.a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+            "&order=created_at.desc&limit=5",
+            select="id, status",
+        )
+
+        sql, args = captured[0]
+        assert sql == (
+            "SELECT id, status FROM work_queue WHERE status IN ($1, $2)"
+            " AND parameters->>'change_id' = $3 AND priority >= $4"
+            " AND priority <= $5 AND created_at > $6 AND id = $7"
+            " ORDER BY created_at DESC LIMIT 5"
+        )
+        assert args[:5] == ("pending", "claimed", "add-x", 3, 7)
+        assert isinstance(args[5], datetime)
+        assert isinstance(args[6], UUID)
+
+    @pytest.mark.asyncio
+    async def test_in_list_length_is_part_of_shape(self):
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.query("work_queue", "status=in.(pending)")
+        await client.query("work_queue", "status=in.(pending,claimed)")
+
+        assert captured[0][0].endswith("status IN ($1)")
+        assert captured[1][0].endswith("status IN ($1, $2)")
+        assert client.template_cache_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unsafe_shape_is_rejected_and_not_cached(self):
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Unsafe identifier"):
+                await client.query("work_queue", "id;DROP TABLE x=eq.1")
+
+        assert captured == []
+        assert client.template_cache_stats() == {"hits": 0, "misses": 0, "size": 0}
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_lru(self):
+        from src.config import PostgresConfig
+
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient(PostgresConfig(query_template_cache_size=2))
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.query("a")
+        await client.query("b")
+        await client.query("a")  # refresh "a"
+        await client.query("c")  # evicts "b"
+        await client.query("a")
+        await client.query("b")
+
+        stats = client.template_cache_stats()
+        assert stats["size"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 4
+
+    @pytest.mark.asyncio
+    async def test_rpc_template_keyed_by_parameter_names(self):
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.rpc("acquire_lock", {"p_file_path": "a.py", "p_agent_id": "x"})
+        await client.rpc("acquire_lock", {"p_file_path": "b.py", "p_agent_id": "y"})
+
+        assert captured[0][0] is captured[1][0]
+        assert captured[0][0] == (
+            "SELECT acquire_lock(p_file_path := $1, p_agent_id := $2)"
+        )
+        assert captured[1][1] == ("b.py", "y")
+        assert client.template_cache_stats()["hits"] == 1
+
+
+@pytest.mark.skipif(not HAS_ASYNCPG, reason="asyncpg not installed")
+class TestPostgresInsertMany:
+    """insert_many pipelines one prepared INSERT across every row."""
+
+    @pytest.mark.asyncio
+    async def test_insert_many_uses_executemany(self):
+        captured: list[tuple[str, tuple]] = []
+        client = DirectPostgresClient()
+        client._pool = _capturing_pool(captured)  # type: ignore[assignment]
+
+        await client.insert_many(
+            "audit_log",
+            [
+                {"operation": "a", "parameters": {"x": 1}},
+                {"operation": "b", "parameters": {}},
+            ],
+        )
+
+        assert captured == [
+            (
+                "INSERT INTO audit_log (operation, parameters) VALUES ($1, $2)",
+                ([["a", '{"x": 1}'], ["b", "{}"]],),
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_insert_many_rejects_mismatched_columns(self):
+        client = DirectPostgresClient()
+        with pytest.raises(ValueError, match="same columns"):
+            await client.insert_many("audit_log", [{"a": 1}, {"b": 2}])
@@ -1,12 +1,20 @@
 """Tests for evaluation harness."""
 
+import asyncio
+import subprocess
 from pathlib import Path
 
 import pytest
 
 from evaluation.backends.base import BackendResult
-from evaluation.config import AblationFlags, EvalConfig, TaskSource, TaskTier
-from evaluation.harness import EvalHarness, EvalResult
+from evaluation.config import (
+    AblationFlags,
+    AgentBackendConfig,
+    EvalConfig,
+    TaskSource,
+    TaskTier,
+)
+from evaluation.harness import EvalHarness, EvalResult, TrialCheckpoint
 from evaluation.metrics import TokenUsage
 from evaluation.tasks.registry import EvalTask, TaskRegistry
 
@@ -229,6 +237,207 @@ class TestEvalHarness:
         assert result.overall_success_rate == 0.0
 
 
+class RecordingBackend(MockBackend):
+    """Mock backend that tracks concurrency and the directories it ran in."""
+
+    def __init__(self, name: str = "mock", delays: dict[str, float] | None = None):
+        super().__init__(name)
+        self._delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.working_dirs: list[str] = []
+
+    async def execute_task(self, task_description, affected_files,
+                           working_dir, ablation, timeout_seconds=300):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.working_dirs.append(working_dir)
+        try:
+            await asyncio.sleep(self._delays.get(task_description, 0.01))
+            return await super().execute_task(
+                task_description, affected_files, working_dir, ablation, timeout_seconds
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class TestConcurrentTrials:
+    @pytest.mark.asyncio
+    async def test_per_backend_limits(self, tmp_path, registry_with_tasks):
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        config = EvalConfig(
+            tiers=[TaskTier.TIER1],
+            num_trials=2,
+            output_dir=tmp_path / "reports",
+            backends=[
+                AgentBackendConfig(name="a", command="a", max_concurrent_trials=2),
+                AgentBackendConfig(name="b", command="b"),
+            ],
+            max_concurrent_trials=8,
+        )
+        backends = [RecordingBackend("a"), RecordingBackend("b")]
+        harness = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=backends,
+        )
+
+        result = await harness.run(working_dir=str(workdir))
+
+        assert len(result.task_metrics) == 12
+        assert backends[0].max_in_flight == 2
+        assert backends[1].max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_results_in_schedule_order(self, tmp_path, registry_with_tasks):
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        config = EvalConfig(
+            tiers=[TaskTier.TIER1],
+            num_trials=2,
+            output_dir=tmp_path / "reports",
+            backends=[AgentBackendConfig(name="mock", command="m", max_concurrent_trials=6)],
+            max_concurrent_trials=6,
+        )
+        # Earlier tasks finish last.
+        backend = RecordingBackend(delays={
+            "Test task 0": 0.06, "Test task 1": 0.03, "Test task 2": 0.0,
+        })
+        harness = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=[backend],
+        )
+
+        result = await harness.run(working_dir=str(workdir))
+
+        assert [(m.task_id, m.trial_num) for m in result.task_metrics] == [
+            ("test-0", 1), ("test-0", 2),
+            ("test-1", 1), ("test-1", 2),
+            ("test-2", 1), ("test-2", 2),
+        ]
+        assert [t.task_id for t in result.trial_metrics] == ["test-0", "test-1", "test-2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_trials_get_isolated_workspaces(
+        self, tmp_path, registry_with_tasks
+    ):
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        (workdir / "seed.txt").write_text("seed")
+        config = EvalConfig(
+            tiers=[TaskTier.TIER1],
+            num_trials=1,
+            output_dir=tmp_path / "reports",
+            backends=[AgentBackendConfig(name="mock", command="m", max_concurrent_trials=3)],
+            max_concurrent_trials=3,
+        )
+        seen: list[bool] = []
+
+        class CheckingBackend(RecordingBackend):
+            async def execute_task(self, task_description, affected_files,
+                                   working_dir, ablation, timeout_seconds=300):
+                seen.append((Path(working_dir) / "seed.txt").exists())
+                return await super().execute_task(
+                    task_description, affected_files, working_dir, ablation,
+                    timeout_seconds,
+                )
+
+        backend = CheckingBackend()
+        harness = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=[backend],
+        )
+
+        await harness.run(working_dir=str(workdir))
+
+        assert seen == [True, True, True]
+        assert len(set(backend.working_dirs)) == 3
+        assert str(workdir) not in backend.working_dirs
+        assert not any(Path(d).exists() for d in backend.working_dirs)
+
+    @pytest.mark.asyncio
+    async def test_git_workspace_is_a_worktree(self, tmp_path, registry_with_tasks):
+        repo = tmp_path / "repo"
+        (repo / "sub").mkdir(parents=True)
+        (repo / "sub" / "tracked.txt").write_text("tracked")
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        subprocess.run([*git, "add", "."], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+        config = EvalConfig(
+            task_ids=["test-0", "test-1"],
+            num_trials=1,
+            output_dir=tmp_path / "reports",
+            backends=[AgentBackendConfig(name="mock", command="m", max_concurrent_trials=2)],
+            max_concurrent_trials=2,
+        )
+        backend = RecordingBackend()
+        harness = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=[backend],
+        )
+
+        await harness.run(working_dir=str(repo / "sub"))
+
+        assert all(Path(d).name == "sub" for d in backend.working_dirs)
+        worktrees = subprocess.run(
+            [*git, "worktree", "list"], capture_output=True, text=True, check=True,
+        ).stdout.splitlines()
+        assert len(worktrees) == 1
+
+
+class TestCheckpointResume:
+    @pytest.mark.asyncio
+    async def test_resume_runs_only_missing_cells(self, tmp_path, registry_with_tasks):
+        config = EvalConfig(
+            tiers=[TaskTier.TIER1],
+            num_trials=2,
+            output_dir=tmp_path,
+            run_id="resume-test",
+        )
+        first = RecordingBackend()
+        harness = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=[first],
+        )
+        await harness.run()
+        assert first.calls == 6
+
+        # Simulate an interruption: drop two finished cells and tear the tail.
+        lines = harness.checkpoint_path.read_text().splitlines()
+        harness.checkpoint_path.write_text("\n".join(lines[:4]) + "\n{\"metr")
+
+        second = RecordingBackend()
+        resumed = EvalHarness(
+            config=config, registry=registry_with_tasks, backends=[second],
+        )
+        result = await resumed.run()
+
+        assert second.calls == 2
+        assert len(result.task_metrics) == 6
+        assert all(m.correctness.tests_total == 3 for m in result.task_metrics)
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        from evaluation.consensus import ConsensusResult, JudgeScore
+        from evaluation.metrics import TaskMetrics, TimingMetric
+
+        checkpoint = TrialCheckpoint(tmp_path / "run.checkpoint.jsonl")
+        metrics = TaskMetrics(
+            task_id="t1", trial_num=2, backend_name="b", ablation_label="all-on",
+            success=True, output="patch",
+            timings=[TimingMetric("lock_acquire", 0.5, 1.0, {"file": "a.py"})],
+        )
+        metrics.token_usage = TokenUsage(input_tokens=5, total_tokens=5)
+        cr = ConsensusResult(
+            task_id="t1", task_output="patch",
+            judge_scores=[JudgeScore(judge_model="j", quality_score=0.9)],
+            consensus_score=0.9,
+        )
+        checkpoint.append(metrics, cr)
+
+        loaded = checkpoint.load()
+        restored, restored_cr = loaded[("t1", "b", "all-on", 2)]
+        assert restored == metrics
+        assert restored_cr == cr
+
+
 class TestEvalResult:
     def test_empty_result(self):
         result = EvalResult(run_id="empty")
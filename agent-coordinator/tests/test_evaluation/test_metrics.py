@@ -1,5 +1,7 @@
 """Tests for metrics collection and aggregation."""
 
+import asyncio
+
 import pytest
 
 from evaluation.metrics import (
@@ -196,6 +198,35 @@ class TestMetricsCollector:
         collector.clear()
         assert len(collector.get_all_metrics()) == 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_record_independently(self):
+        collector = MetricsCollector()
+
+        async def trial(task_id: str, passed: int) -> None:
+            collector.start_task(task_id, 1, "claude_code", "all-on")
+            await asyncio.sleep(0)
+            collector.record_correctness(tests_total=4, tests_passed=passed)
+            collector.record_lock_event()
+            await asyncio.sleep(0)
+            collector.finish_task()
+
+        await asyncio.gather(*(trial(f"task-{i}", i) for i in range(4)))
+
+        by_task = {m.task_id: m for m in collector.get_all_metrics()}
+        assert len(by_task) == 4
+        for i in range(4):
+            assert by_task[f"task-{i}"].correctness.tests_passed == i
+            assert by_task[f"task-{i}"].coordination.lock_acquisitions == 1
+
+    def test_sort_metrics(self):
+        collector = MetricsCollector()
+        for trial in (3, 1, 2):
+            collector.start_task("task-1", trial, "claude_code", "all-on")
+            collector.finish_task()
+
+        collector.sort_metrics(key=lambda m: m.trial_num)
+        assert [m.trial_num for m in collector.get_all_metrics()] == [1, 2, 3]
+
 
 class TestEffectSize:
     def test_identical_groups(self):
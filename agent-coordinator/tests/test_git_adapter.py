@@ -26,6 +26,7 @@ from src.git_adapter import (
     validate_branch_name,
     validate_speculative_ref_name,
 )
+from src.merge_tree_cache import MergeTreeCache
 
 # ---------------------------------------------------------------------------
 # Regex validation tests (R7)
@@ -286,6 +287,130 @@ class TestSubprocessGitAdapterCreate:
         assert "invalid tree OID" in (result.error or "")
 
 
+class TestSubprocessGitAdapterMergeTreeCache:
+    """A MergeTreeCache lets unchanged (base, head) commit pairs skip merge-tree."""
+
+    BASE_SHA = "1" * 40
+    HEAD_SHA = "2" * 40
+
+    def _adapter(self, tmp_repo: Path) -> SubprocessGitAdapter:
+        adapter = SubprocessGitAdapter(tmp_repo, merge_tree_cache=MergeTreeCache(":memory:"))
+        adapter._version_checked = True
+        return adapter
+
+    def _fake_git(
+        self,
+        calls: list[str],
+        *,
+        merge_returncode: int = 0,
+        fail_first_update_ref: bool = False,
+    ) -> Any:
+        commits = iter(f"{n:040x}" for n in range(1, 100))
+        update_ref_failures = [fail_first_update_ref]
+
+        def fake_run(args: list[str], **kwargs: Any) -> _FakeCompleted:
+            cmd = args[1]
+            calls.append(cmd)
+            if cmd == "rev-parse":
+                return _FakeCompleted(returncode=0, stdout=f"{self.BASE_SHA}\n{self.HEAD_SHA}\n")
+            if cmd == "merge-tree":
+                if merge_returncode:
+                    return _FakeCompleted(
+                        returncode=merge_returncode,
+                        stdout="CONFLICT (content): Merge conflict in src/users.py\n",
+                    )
+                return _FakeCompleted(returncode=0, stdout=f"{'a' * 40}\n")
+            if cmd == "commit-tree":
+                # The commit is built on the resolved base commit.
+                assert args[args.index("-p") + 1] == self.BASE_SHA
+                return _FakeCompleted(returncode=0, stdout=f"{next(commits)}\n")
+            if cmd == "update-ref":
+                if update_ref_failures.pop() if update_ref_failures else False:
+                    return _FakeCompleted(returncode=128, stderr="fatal: bad object\n")
+                return _FakeCompleted(returncode=0)
+            raise AssertionError(f"unexpected git subcommand: {cmd}")
+
+        return fake_run
+
+    def test_unchanged_pair_reuses_cached_commit(self, tmp_repo: Path) -> None:
+        adapter = self._adapter(tmp_repo)
+        calls: list[str] = []
+
+        with patch("src.git_adapter.subprocess.run", side_effect=self._fake_git(calls)):
+            first = adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-abcd1234/pos-1"
+            )
+            calls.clear()
+            second = adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-beef5678/pos-1"
+            )
+
+        assert second.success is True
+        assert second.commit_sha == first.commit_sha
+        assert second.tree_oid == first.tree_oid
+        assert calls == ["rev-parse", "update-ref"]
+
+    def test_conflict_is_cached(self, tmp_repo: Path) -> None:
+        adapter = self._adapter(tmp_repo)
+        calls: list[str] = []
+
+        fake = self._fake_git(calls, merge_returncode=1)
+        with patch("src.git_adapter.subprocess.run", side_effect=fake):
+            adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-abcd1234/pos-1"
+            )
+            calls.clear()
+            result = adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-beef5678/pos-1"
+            )
+
+        assert result.success is False
+        assert result.conflict_files == ["src/users.py"]
+        assert result.error is None
+        assert calls == ["rev-parse"]
+
+    def test_pruned_cached_commit_falls_back_to_merge(self, tmp_repo: Path) -> None:
+        adapter = self._adapter(tmp_repo)
+        calls: list[str] = []
+
+        fake = self._fake_git(calls, fail_first_update_ref=True)
+        with patch("src.git_adapter.subprocess.run", side_effect=self._fake_git(calls)):
+            adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-abcd1234/pos-1"
+            )
+        calls.clear()
+        with patch("src.git_adapter.subprocess.run", side_effect=fake):
+            result = adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-beef5678/pos-1"
+            )
+
+        assert result.success is True
+        assert calls == ["rev-parse", "update-ref", "merge-tree", "commit-tree", "update-ref"]
+
+    def test_unresolvable_refs_skip_the_cache(self, tmp_repo: Path) -> None:
+        adapter = self._adapter(tmp_repo)
+
+        def fake_run(args: list[str], **kwargs: Any) -> _FakeCompleted:
+            cmd = args[1]
+            if cmd == "rev-parse":
+                return _FakeCompleted(returncode=128, stderr="fatal: bad revision\n")
+            if cmd == "merge-tree":
+                return _FakeCompleted(returncode=0, stdout=f"{'a' * 40}\n")
+            if cmd == "commit-tree":
+                assert args[args.index("-p") + 1] == "main"
+                return _FakeCompleted(returncode=0, stdout=f"{'b' * 40}\n")
+            return _FakeCompleted(returncode=0)
+
+        with patch("src.git_adapter.subprocess.run", side_effect=fake_run):
+            result = adapter.create_speculative_ref(
+                "main", "feature/x", "refs/speculative/train-abcd1234/pos-1"
+            )
+
+        assert result.success is True
+        assert adapter.merge_tree_cache is not None
+        assert len(adapter.merge_tree_cache) == 0
+
+
 class TestSubprocessGitAdapterDelete:
     def test_delete_counts_refs(self, tmp_repo: Path) -> None:
         adapter = SubprocessGitAdapter(tmp_repo)
@@ -9,6 +9,8 @@ from src.guardrails import (
     GuardrailResult,
     GuardrailsService,
     GuardrailViolation,
+    _CompiledGuardrails,
+    _literal_prefix,
 )
 
 
@@ -315,3 +317,88 @@ class TestGuardrailDataClasses:
         })
         assert result.safe is False
         assert len(result.violations) == 1
+
+
+class TestCompiledGuardrails:
+    """Tests for the compiled single-pass matcher."""
+
+    SAMPLES = [
+        "git push --force origin main",
+        "GIT PUSH origin main --force-with-lease",
+        "git reset --hard HEAD~1",
+        "git clean -fd",
+        "git branch -D feature",
+        "rm -rf /tmp/build",
+        "rm -r /",
+        "psql -c 'drop table users'",
+        "truncate audit_log",
+        "edit .env.production",
+        "cat config/secrets.yaml",
+        "kubectl apply -f deploy.yaml",
+        "ls -la\nsrc/main.py",
+        "echo hello world",
+        "g\u0131t push --force",
+        "\u017fecrets.json",
+        "",
+    ]
+
+    @staticmethod
+    def _patterns() -> list[GuardrailPattern]:
+        return [GuardrailPattern.from_dict(p) for p in FALLBACK_PATTERNS]
+
+    @pytest.mark.parametrize("trust_level", [0, 2, 3, 4])
+    def test_matches_per_pattern_search(self, trust_level):
+        """The compiled matcher reports exactly what per-pattern re.search would."""
+        import re
+
+        patterns = self._patterns()
+        matcher = _CompiledGuardrails(patterns)
+        for text in self.SAMPLES:
+            expected = []
+            for p in patterns:
+                match = re.search(p.pattern, text, re.IGNORECASE)
+                if match and trust_level < p.min_trust_level:
+                    expected.append((p.name, match.group(0)))
+            actual = [(p.name, m.group(0)) for p, m in matcher.search(text, trust_level)]
+            assert actual == expected, text
+
+    def test_uncombinable_patterns_matched_individually(self):
+        """Backreferences and global flags are kept out of the alternation."""
+        patterns = [
+            GuardrailPattern("repeat", "misc", r"(\w+) \1", min_trust_level=5),
+            GuardrailPattern("verbose", "misc", r"(?x) drop \s+ database", min_trust_level=5),
+            GuardrailPattern("rm_rf", "file", r"rm\s+-rf\s+", min_trust_level=5),
+        ]
+        matcher = _CompiledGuardrails(patterns)
+
+        assert [e.gated for e in matcher.entries] == [False, False, True]
+        names = [p.name for p, _ in matcher.search("drop  database now now", 0)]
+        assert names == ["repeat", "verbose"]
+
+    def test_literal_prefix(self):
+        assert _literal_prefix(r"git\s+push") == "git"
+        assert _literal_prefix(r"DROP\s+TABLE") == "drop"
+        assert _literal_prefix(r"\.(env|env\.local)") == "."
+        assert _literal_prefix(r"rm?\s+") == "r"
+        assert _literal_prefix(r"ab+c") == "ab"
+        assert _literal_prefix(r"(kubectl|docker)\s+") == ""
+        assert _literal_prefix(r"foo|bar") == ""
+
+    @pytest.mark.asyncio
+    async def test_matcher_rebuilt_only_when_patterns_change(self):
+        """Refreshing the cache with identical patterns reuses the compiled matcher."""
+        service = GuardrailsService(db=object())  # type: ignore[arg-type]
+        service._patterns_cache = self._patterns()
+        service._cache_expiry = float("inf")
+
+        await service.check_operation("echo hi", trust_level=0)
+        first = service._matcher
+
+        service._patterns_cache = self._patterns()
+        await service.check_operation("echo hi", trust_level=0)
+        assert service._matcher is first
+
+        service._patterns_cache = self._patterns()[:1]
+        result = await service.check_operation("git reset --hard", trust_level=0)
+        assert service._matcher is not first
+        assert result.safe is True
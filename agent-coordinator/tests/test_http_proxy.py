@@ -505,6 +505,47 @@ async def test_proxy_acquire_lock_routes_to_http(_reset_client: None) -> None:
     assert result["success"] is True
 
 
+@pytest.mark.asyncio
+async def test_proxy_acquire_locks_routes_to_batch_endpoint(_reset_client: None) -> None:
+    """proxy_acquire_locks sends every path in one POST /locks/acquire-batch."""
+    config = HttpProxyConfig(
+        base_url="http://localhost:8081",
+        api_key="test-key",
+        agent_id="my-agent",
+        agent_type="claude_code",
+    )
+    http_proxy.init_client(config)
+
+    captured: dict[str, Any] = {}
+
+    class _MockResponse:
+        status_code = 200
+        text = '{"success": true, "locks": [], "conflicts": []}'
+
+        def json(self) -> dict[str, Any]:
+            return {"success": True, "locks": [], "conflicts": []}
+
+    async def _capture(method: str, url: str, **kw: Any) -> _MockResponse:
+        captured["method"] = method
+        captured["url"] = url
+        captured["json"] = kw.get("json")
+        return _MockResponse()
+
+    http_proxy.get_client().request = _capture  # type: ignore[method-assign]
+
+    result = await http_proxy.proxy_acquire_locks(
+        file_paths=["src/a.py", "src/b.py"],
+        reason="test",
+    )
+
+    assert captured["method"] == "POST"
+    assert captured["url"] == "/locks/acquire-batch"
+    assert captured["json"]["file_paths"] == ["src/a.py", "src/b.py"]
+    assert captured["json"]["ttl_minutes"] == 120
+    assert captured["json"]["agent_id"] == "my-agent"
+    assert result["success"] is True
+
+
 @pytest.mark.asyncio
 async def test_proxy_register_session_omits_implicit_identity_for_bound_key(
     _reset_client: None,
@@ -401,71 +401,59 @@ class TestIssueComment:
 
 class TestIssueReady:
     @pytest.mark.asyncio
-    async def test_ready_no_deps(self, service, mock_db):
-        """Issues with no dependencies are ready."""
-        mock_db.query.return_value = [
-            _make_issue_row(title="Ready"),
-        ]
-
-        issues = await service.ready()
-
-        assert len(issues) == 1
-        assert issues[0].title == "Ready"
-
-    @pytest.mark.asyncio
-    async def test_ready_deps_resolved(self, service, mock_db):
-        """Issues with resolved dependencies are ready."""
+    async def test_ready_single_rpc(self, service, mock_db):
+        """Ready issues come back from one RPC, never per-dependency queries."""
         dep_id = uuid4()
-        mock_db.query.side_effect = [
-            [_make_issue_row(title="Has dep", depends_on=[dep_id])],
-            [_make_issue_row(issue_id=dep_id, status="completed")],
+        mock_db.rpc.return_value = [
+            _make_issue_row(title="Ready"),
+            _make_issue_row(title="Has dep", depends_on=[dep_id]),
         ]
 
         issues = await service.ready()
 
-        assert len(issues) == 1
+        assert [i.title for i in issues] == ["Ready", "Has dep"]
+        assert issues[1].depends_on == [dep_id]
+        mock_db.rpc.assert_awaited_once_with(
+            "list_ready_issues", {"p_parent_id": None, "p_limit": 50},
+        )
+        mock_db.query.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_ready_deps_unresolved(self, service, mock_db):
-        """Issues with unresolved dependencies are not ready."""
-        dep_id = uuid4()
-        mock_db.query.side_effect = [
-            [_make_issue_row(title="Blocked", depends_on=[dep_id])],
-            [_make_issue_row(issue_id=dep_id, status="pending")],
-        ]
-
-        issues = await service.ready()
+    async def test_ready_empty(self, service, mock_db):
+        """An empty result (or SQL NULL) yields no issues."""
+        mock_db.rpc.return_value = None
 
-        assert len(issues) == 0
+        assert await service.ready() == []
 
     @pytest.mark.asyncio
     async def test_ready_with_parent(self, service, mock_db):
-        """Ready scoped to a parent."""
+        """Ready scoped to a parent; limit capped at the page size."""
         parent_id = uuid4()
-        mock_db.query.return_value = [
+        mock_db.rpc.return_value = [
             _make_issue_row(title="Child", parent_id=parent_id),
         ]
 
-        await service.ready(parent_id=parent_id)
+        await service.ready(parent_id=parent_id, limit=1000)
 
-        query = mock_db.query.call_args[0][1]
-        assert f"parent_id=eq.{parent_id}" in query
+        params = mock_db.rpc.call_args[0][1]
+        assert params == {"p_parent_id": str(parent_id), "p_limit": 100}
 
 
 class TestIssueBlocked:
     @pytest.mark.asyncio
-    async def test_blocked_returns_unresolved(self, service, mock_db):
-        """Blocked returns issues with unresolved deps."""
+    async def test_blocked_single_rpc(self, service, mock_db):
+        """Blocked returns issues with unresolved deps from one RPC."""
         dep_id = uuid4()
-        mock_db.query.side_effect = [
-            [_make_issue_row(title="Blocked", depends_on=[dep_id])],
-            [_make_issue_row(issue_id=dep_id, status="pending")],
+        mock_db.rpc.return_value = [
+            _make_issue_row(title="Blocked", depends_on=[dep_id]),
         ]
 
         issues = await service.blocked()
 
         assert len(issues) == 1
         assert issues[0].title == "Blocked"
+        mock_db.rpc.assert_awaited_once_with("list_blocked_issues", {"p_limit": 50})
+        mock_db.query.assert_not_called()
 
 
 # ===========================================================================
@@ -475,31 +463,46 @@ class TestIssueBlocked:
 
 class TestIssueSearch:
     @pytest.mark.asyncio
-    async def test_search_by_title(self, service, mock_db):
-        """Search matches in title (case insensitive)."""
-        mock_db.query.return_value = [
+    async def test_search_uses_ranked_rpc(self, service, mock_db):
+        """Search runs server-side and keeps the RPC's rank order."""
+        mock_db.rpc.return_value = [
             _make_issue_row(title="Fix CORS headers"),
-            _make_issue_row(title="Add /ready endpoint"),
+            _make_issue_row(
+                title="Task",
+                metadata={"body": "Need to add CORS middleware"},
+            ),
         ]
 
         issues = await service.search("cors")
 
-        assert len(issues) == 1
-        assert issues[0].title == "Fix CORS headers"
+        assert [i.title for i in issues] == ["Fix CORS headers", "Task"]
+        mock_db.rpc.assert_awaited_once_with(
+            "search_issues",
+            {
+                "p_query": "cors",
+                "p_statuses": None,
+                "p_labels": None,
+                "p_limit": 50,
+                "p_offset": 0,
+            },
+        )
+        mock_db.query.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_search_by_description(self, service, mock_db):
-        """Search matches in description."""
-        mock_db.query.return_value = [
-            _make_issue_row(
-                title="Task",
-                metadata={"body": "Need to add CORS middleware"},
-            ),
-        ]
+    async def test_search_filters_and_pagination(self, service, mock_db):
+        """Status maps to stored statuses; limit is capped, offset clamped."""
+        mock_db.rpc.return_value = None
 
-        issues = await service.search("CORS middleware")
+        issues = await service.search(
+            "cors", limit=500, offset=-3, status="open", labels=["api"],
+        )
 
-        assert len(issues) == 1
+        assert issues == []
+        params = mock_db.rpc.call_args[0][1]
+        assert params["p_statuses"] == ["pending", "claimed"]
+        assert params["p_labels"] == ["api"]
+        assert params["p_limit"] == 100
+        assert params["p_offset"] == 0
 
 
 # ===========================================================================
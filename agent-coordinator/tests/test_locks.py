@@ -3,7 +3,7 @@
 import pytest
 from httpx import Response
 
-from src.locks import Lock, LockResult, LockService
+from src.locks import BatchLockResult, Lock, LockResult, LockService
 from src.policy_engine import PolicyDecision
 
 
@@ -164,6 +164,148 @@ class TestLockService:
         assert result.reason == "insufficient_trust_level"
 
 
+class TestAcquireMany:
+    """Tests for all-or-nothing batch lock acquisition."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_single_rpc(self, mock_supabase, db_client):
+        """Every path is sent in one deduplicated, sorted acquire_locks call."""
+        expires = "2026-01-01T12:00:00+00:00"
+        route = mock_supabase.post(
+            "https://test.supabase.co/rest/v1/rpc/acquire_locks"
+        ).mock(
+            return_value=Response(
+                200,
+                json={
+                    "success": True,
+                    "expires_at": expires,
+                    "locks": [
+                        {"success": True, "action": "acquired",
+                         "file_path": "src/a.py", "expires_at": expires},
+                        {"success": True, "action": "refreshed",
+                         "file_path": "src/b.py", "expires_at": expires},
+                    ],
+                },
+            )
+        )
+
+        service = LockService(db_client)
+        result = await service.acquire_many(
+            ["src/b.py", "src/a.py", "src/b.py"], reason="refactor"
+        )
+
+        assert route.call_count == 1
+        import json
+
+        body = json.loads(route.calls[0].request.content)
+        assert body["p_file_paths"] == ["src/a.py", "src/b.py"]
+        assert body["p_ttl_minutes"] == 30
+        assert result.success is True
+        assert [lock.action for lock in result.locks] == ["acquired", "refreshed"]
+        assert result.expires_at is not None
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_reports_conflicts(
+        self, mock_supabase, db_client, lock_conflict_response
+    ):
+        """A conflicting path fails the batch and names its holder."""
+        conflict = {**lock_conflict_response, "file_path": "src/b.py"}
+        mock_supabase.post(
+            "https://test.supabase.co/rest/v1/rpc/acquire_locks"
+        ).mock(
+            return_value=Response(
+                200,
+                json={
+                    "success": False,
+                    "reason": "locked_by_other",
+                    "conflicts": [conflict],
+                },
+            )
+        )
+
+        service = LockService(db_client)
+        result = await service.acquire_many(["src/a.py", "src/b.py"])
+
+        assert result.success is False
+        assert result.reason == "locked_by_other"
+        assert result.locks == []
+        assert [c.file_path for c in result.conflicts] == ["src/b.py"]
+        assert result.conflicts[0].locked_by == "other-agent"
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_denied_path_skips_rpc(self, monkeypatch):
+        """One denied path fails the whole batch before the DB is touched."""
+
+        class DenyOnePolicyEngine:
+            async def check_operations(self, **kwargs):
+                return [
+                    PolicyDecision.deny("path_denied")
+                    if resource == "secrets/key.pem"
+                    else PolicyDecision.allow()
+                    for resource in kwargs["resources"]
+                ]
+
+        class FailDB:
+            async def rpc(self, *_args, **_kwargs):
+                raise AssertionError("DB RPC should not be called when denied")
+
+        monkeypatch.setattr(
+            "src.policy_engine.get_policy_engine",
+            lambda: DenyOnePolicyEngine(),
+        )
+
+        service = LockService(FailDB())
+        result = await service.acquire_many(["src/a.py", "secrets/key.pem"])
+
+        assert result.success is False
+        assert result.policy_denied is True
+        assert result.reason == "path_denied"
+        assert result.conflicts[0].file_path == "secrets/key.pem"
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_empty_is_invalid(self):
+        class FailDB:
+            async def rpc(self, *_args, **_kwargs):
+                raise AssertionError("DB RPC should not be called for empty batch")
+
+        result = await LockService(FailDB()).acquire_many([])
+
+        assert result.success is False
+        assert result.reason == "invalid_file_path"
+
+    @pytest.mark.asyncio
+    async def test_acquire_many_writes_one_audit_entry(self, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+
+        class AllowPolicyEngine:
+            def __init__(self):
+                self.calls = 0
+
+            async def check_operations(self, **kwargs):
+                self.calls += 1
+                return [PolicyDecision.allow() for _ in kwargs["resources"]]
+
+        class FakeDB:
+            async def rpc(self, *_args, **_kwargs):
+                return {"success": True, "locks": []}
+
+        audit = MagicMock()
+        audit.log_operation = AsyncMock()
+        engine = AllowPolicyEngine()
+        monkeypatch.setattr("src.policy_engine.get_policy_engine", lambda: engine)
+        monkeypatch.setattr("src.locks.get_audit_service", lambda: audit)
+
+        paths = [f"src/file_{i}.py" for i in range(40)]
+        await LockService(FakeDB()).acquire_many(paths)
+
+        assert engine.calls == 1
+
+        audit.log_operation.assert_called_once()
+        kwargs = audit.log_operation.call_args.kwargs
+        assert kwargs["operation"] == "acquire_lock"
+        assert kwargs["parameters"]["file_paths"] == sorted(paths)
+
+
 class TestLockDataClasses:
     """Tests for Lock and LockResult dataclasses."""
 
@@ -195,6 +337,26 @@ class TestLockDataClasses:
         assert result.reason == "locked_by_other"
         assert result.locked_by == "other-agent"
 
+    def test_batch_lock_result_to_dict(self):
+        result = BatchLockResult.from_dict(
+            {
+                "success": True,
+                "expires_at": "2026-01-01T12:00:00Z",
+                "locks": [
+                    {"success": True, "action": "acquired", "file_path": "a.py",
+                     "expires_at": "2026-01-01T12:00:00Z"},
+                ],
+            }
+        )
+
+        payload = result.to_dict()
+
+        assert payload["success"] is True
+        assert payload["expires_at"] == "2026-01-01T12:00:00+00:00"
+        assert payload["locks"][0]["file_path"] == "a.py"
+        assert payload["locks"][0]["action"] == "acquired"
+        assert payload["conflicts"] == []
+
 
 class TestLockAtomicity:
     """Tests for lock atomicity and race conditions."""
@@ -240,3 +402,4 @@ class TestLockAtomicity:
         result2 = await service.acquire("src/main.py")
         assert result2.success is False
         assert result2.reason == "locked_by_other"
+
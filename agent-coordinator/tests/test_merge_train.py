@@ -641,6 +641,94 @@ class TestComposeTrainCrossPartition:
         assert api_only_call[0] == cross_ref
 
 
+class TestComposeTrainConcurrentPartitions:
+    """Independent partitions speculate concurrently with deterministic refs."""
+
+    @staticmethod
+    def _entries() -> list[TrainEntry]:
+        return [
+            _make_entry("cross", ["api:x", "db:schema:y"], priority=10),
+            _make_entry("a1", ["api:x"], priority=9),
+            _make_entry("a2", ["api:x"], priority=8),
+            _make_entry("d1", ["db:schema:y"], priority=7),
+            _make_entry("e1", ["event:z"], priority=6),
+            _make_entry("e2", ["event:z"], priority=5),
+        ]
+
+    @staticmethod
+    def _refs(comp: TrainComposition) -> dict[str, tuple[int | None, str | None, str | None]]:
+        prefix = f"refs/speculative/train-{comp.train_id}/"
+        refs = {}
+        entries = comp.all_entries() + [c.entry for c in comp.cross_partition_entries]
+        for e in entries:
+            refs[e.feature_id] = (
+                e.train_position,
+                (e.speculative_ref or "").removeprefix(prefix) or None,
+                (e.base_ref or "").removeprefix(prefix) or None,
+            )
+        return refs
+
+    def test_concurrent_refs_match_sequential_composition(self) -> None:
+        from src.merge_train import compose_train
+
+        sequential = compose_train(
+            entries=self._entries(),
+            git_adapter=_FakeGitAdapter(),
+            caller_trust_level=3,
+            max_workers=1,
+        )
+        concurrent = compose_train(
+            entries=self._entries(),
+            git_adapter=_FakeGitAdapter(),
+            caller_trust_level=3,
+            max_workers=4,
+        )
+
+        assert self._refs(concurrent) == self._refs(sequential)
+        positions = sorted(p for p, _ref, _base in self._refs(concurrent).values())
+        assert positions == [1, 2, 3, 4, 5, 6]
+
+    def test_partitions_overlap_and_report_timings(self) -> None:
+        import threading
+
+        from src.merge_train import compose_train
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _BarrierAdapter(_FakeGitAdapter):
+            def create_speculative_ref(
+                self, base_ref: str, feature_branch: str, ref_name: str
+            ) -> MergeTreeResult:
+                # Both partitions must be in flight at once to pass the barrier.
+                barrier.wait()
+                return super().create_speculative_ref(base_ref, feature_branch, ref_name)
+
+        comp = compose_train(
+            entries=[
+                _make_entry("a1", ["api:x"]),
+                _make_entry("d1", ["db:schema:y"]),
+            ],
+            git_adapter=_BarrierAdapter(),
+            caller_trust_level=3,
+            max_workers=2,
+        )
+
+        assert all(e.status == MergeTrainStatus.SPECULATING for e in comp.all_entries())
+        assert set(comp.partition_timings) == {p.partition_id for p in comp.partitions}
+        assert all(seconds >= 0 for seconds in comp.partition_timings.values())
+
+    def test_cross_chain_timing_is_reported(self) -> None:
+        from src.merge_train import compose_train
+
+        comp = compose_train(
+            entries=self._entries(),
+            git_adapter=_FakeGitAdapter(),
+            caller_trust_level=3,
+        )
+
+        assert "(cross)" in comp.partition_timings
+
+
 class TestComposeTrainScale:
     """R11: 100-entry train should be manageable."""
 
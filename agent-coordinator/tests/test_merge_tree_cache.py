@@ -0,0 +1,70 @@
+"""Tests for the persistent merge-tree result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.merge_tree_cache import CachedMergeTree, MergeTreeCache
+
+BASE = "1" * 40
+
+
+def _head(n: int) -> str:
+    return f"{n:040x}"
+
+
+def _ok(n: int) -> CachedMergeTree:
+    return CachedMergeTree(success=True, tree_oid="a" * 40, commit_sha=_head(n))
+
+
+class TestMergeTreeCache:
+    def test_round_trips_success_and_conflict(self) -> None:
+        cache = MergeTreeCache(":memory:")
+        cache.put(BASE, _head(1), _ok(1))
+        cache.put(BASE, _head(2), CachedMergeTree(success=False, conflict_files=["a.py", "b.py"]))
+
+        assert cache.get(BASE, _head(1)) == _ok(1)
+        conflict = cache.get(BASE, _head(2))
+        assert conflict is not None
+        assert conflict.success is False
+        assert conflict.conflict_files == ["a.py", "b.py"]
+        assert cache.get(BASE, _head(3)) is None
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "cache.sqlite"
+        first = MergeTreeCache(path)
+        first.put(BASE, _head(1), _ok(1))
+        first.close()
+
+        second = MergeTreeCache(path)
+        assert second.get(BASE, _head(1)) == _ok(1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = MergeTreeCache(":memory:", max_entries=2)
+        cache.put(BASE, _head(1), _ok(1))
+        cache.put(BASE, _head(2), _ok(2))
+        # Touch head 1 so head 2 becomes the least recently used pair.
+        assert cache.get(BASE, _head(1)) is not None
+        cache.put(BASE, _head(3), _ok(3))
+
+        assert len(cache) == 2
+        assert cache.get(BASE, _head(2)) is None
+        assert cache.get(BASE, _head(1)) is not None
+        assert cache.get(BASE, _head(3)) is not None
+
+    def test_discard_and_clear(self) -> None:
+        cache = MergeTreeCache(":memory:")
+        cache.put(BASE, _head(1), _ok(1))
+        cache.put(BASE, _head(2), _ok(2))
+
+        cache.discard(BASE, _head(1))
+        assert cache.get(BASE, _head(1)) is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_non_positive_bound(self) -> None:
+        with pytest.raises(ValueError):
+            MergeTreeCache(":memory:", max_entries=0)
@@ -1,5 +1,6 @@
 """Tests for the policy engine module."""
 
+import time
 
 import pytest
 from httpx import Response
@@ -7,12 +8,17 @@ from httpx import Response
 from src.policy_engine import (
     ADMIN_ACTIONS,
     ALLOWED_DOMAINS,
+    POLICY_CHANNEL,
     READ_ACTIONS,
     WRITE_ACTIONS,
     NativePolicyEngine,
     PolicyDecision,
+    PolicyDecisionCache,
+    get_decision_cache,
     get_policy_engine,
+    handle_policy_event,
     reset_policy_engine,
+    subscribe_policy_invalidation,
 )
 
 
@@ -433,3 +439,196 @@ class TestPolicyEngineUsesSharedTrustResolver:
             context={"trust_level": 3},
         )
         assert result.allowed is True
+
+
+class TestCheckOperations:
+    """Batched authorization of one operation over many resources."""
+
+    @pytest.mark.asyncio
+    async def test_batch_writes_one_audit_entry(self, monkeypatch, db_client):
+        from unittest.mock import AsyncMock, MagicMock
+
+        audit = MagicMock()
+        audit.log_operation = AsyncMock()
+        monkeypatch.setattr("src.audit.get_audit_service", lambda: audit)
+        engine = NativePolicyEngine(db_client)
+
+        decisions = await engine.check_operations(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            resources=["src/a.py", "src/b.py", "src/c.py"],
+            context={"trust_level": 2},
+        )
+
+        assert [d.allowed for d in decisions] == [True, True, True]
+        audit.log_operation.assert_called_once()
+        kwargs = audit.log_operation.call_args.kwargs
+        assert kwargs["operation"] == "policy_decision"
+        assert kwargs["parameters"]["resources"] == ["src/a.py", "src/b.py", "src/c.py"]
+        assert kwargs["result"] == {"allowed": True, "denied": {}}
+
+    @pytest.mark.asyncio
+    async def test_batch_reuses_cached_decisions(self, monkeypatch, db_client):
+        calls: list[str] = []
+
+        async def _resolve(agent_id: str, agent_type: str) -> int:
+            calls.append(agent_id)
+            return 1
+
+        monkeypatch.setattr("src.trust_resolution.resolve_trust_level", _resolve)
+        engine = NativePolicyEngine(db_client)
+        await engine.check_operation(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            resource="src/a.py",
+        )
+
+        decisions = await engine.check_operations(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            resources=["src/a.py", "src/b.py"],
+        )
+
+        assert [d.allowed for d in decisions] == [False, False]
+        assert calls == ["a1", "a1"]
+        assert get_decision_cache().stats()["hits"] == 1
+
+
+class TestPolicyDecisionCache:
+    """Decision caching and event-bus invalidation."""
+
+    @staticmethod
+    def _counting_resolver(monkeypatch, trust: dict[str, int]) -> list[str]:
+        calls: list[str] = []
+
+        async def _resolve(agent_id: str, agent_type: str) -> int:
+            calls.append(agent_id)
+            return trust[agent_id]
+
+        monkeypatch.setattr("src.trust_resolution.resolve_trust_level", _resolve)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_repeat_check_served_from_cache(self, monkeypatch, db_client):
+        """Trust is resolved once for repeated identical checks."""
+        calls = self._counting_resolver(monkeypatch, {"a1": 2})
+        engine = NativePolicyEngine(db_client)
+
+        for _ in range(3):
+            result = await engine.check_operation(
+                agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+                resource="src/x.py",
+            )
+            assert result.allowed is True
+
+        assert calls == ["a1"]
+        stats = get_decision_cache().stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_context_is_part_of_the_key(self, monkeypatch, db_client):
+        """A different caller-supplied context is evaluated, not served stale."""
+        engine = NativePolicyEngine(db_client)
+
+        low = await engine.check_operation(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            context={"trust_level": 1},
+        )
+        high = await engine.check_operation(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            context={"trust_level": 3},
+        )
+        granted = await engine.check_operation(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+            context={"trust_level": 1, "session_grants": {"acquire_lock"}},
+        )
+
+        assert low.allowed is False
+        assert high.allowed is True
+        assert granted.allowed is True
+
+    @pytest.mark.asyncio
+    async def test_fault_decisions_not_cached(self, monkeypatch, db_client):
+        """A transient trust-resolution failure is retried on the next check."""
+        from src.trust_resolution import TrustResolutionError
+
+        async def _raise(agent_id: str, agent_type: str) -> int:
+            raise TrustResolutionError(agent_id, agent_type, "profile lookup failed")
+
+        monkeypatch.setattr("src.trust_resolution.resolve_trust_level", _raise)
+        engine = NativePolicyEngine(db_client)
+        await engine.check_operation(
+            agent_id="a1", agent_type="claude_code", operation="acquire_lock",
+        )
+
+        assert len(get_decision_cache()) == 0
+
+    @pytest.mark.asyncio
+    async def test_trust_event_invalidates_only_that_agent(
+        self, monkeypatch, db_client
+    ):
+        """trust.changed drops the named agent's decisions and keeps the rest."""
+        from src.event_bus import CoordinatorEvent
+
+        trust = {"a1": 2, "a2": 2}
+        calls = self._counting_resolver(monkeypatch, trust)
+        engine = NativePolicyEngine(db_client)
+
+        async def _check(agent_id: str) -> PolicyDecision:
+            return await engine.check_operation(
+                agent_id=agent_id, agent_type="claude_code", operation="acquire_lock",
+            )
+
+        await _check("a1")
+        await _check("a2")
+        trust["a1"] = 0
+
+        await handle_policy_event(CoordinatorEvent(
+            event_type="trust.changed", channel=POLICY_CHANNEL, entity_id="a1",
+            agent_id="a1", urgency="low", summary="reassigned",
+        ))
+
+        assert (await _check("a1")).allowed is False
+        assert (await _check("a2")).allowed is True
+        assert calls == ["a1", "a2", "a1"]
+
+    @pytest.mark.asyncio
+    async def test_policy_event_clears_all(self, db_client):
+        from src.event_bus import CoordinatorEvent
+
+        cache = get_decision_cache()
+        key = cache.key("native", "a1", "t", "acquire_lock", "", None)
+        assert key is not None
+        cache.put(key, PolicyDecision.allow())
+
+        await handle_policy_event(CoordinatorEvent(
+            event_type="policy.changed", channel=POLICY_CHANNEL, entity_id="p",
+            agent_id="system", urgency="low", summary="edited",
+        ))
+
+        assert len(cache) == 0
+
+    def test_subscribe_is_idempotent(self):
+        from src.event_bus import EventBusService
+
+        bus = EventBusService(dsn="postgresql://unused")
+        subscribe_policy_invalidation(bus)
+        subscribe_policy_invalidation(bus)
+
+        assert bus._callbacks[POLICY_CHANNEL] == [handle_policy_event]
+
+    def test_lru_and_ttl_bounds(self, monkeypatch):
+        cache = PolicyDecisionCache(maxsize=2, ttl_seconds=10)
+        keys = [cache.key("native", f"a{i}", "t", "op", "", None) for i in range(3)]
+        for k in keys:
+            assert k is not None
+            cache.put(k, PolicyDecision.allow())
+
+        assert len(cache) == 2
+        assert cache.get(keys[0]) is None
+
+        now = time.monotonic()
+        monkeypatch.setattr("src.policy_engine.time.monotonic", lambda: now + 11)
+        assert cache.get(keys[2]) is None
+
+    def test_disabled_when_size_zero(self):
+        cache = PolicyDecisionCache(maxsize=0, ttl_seconds=30)
+        assert cache.key("native", "a1", "t", "op", "", None) is None
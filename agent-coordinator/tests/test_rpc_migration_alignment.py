@@ -38,6 +38,7 @@ def test_coordination_api_rpc_calls_match_migrations() -> None:
         src_dir / "handoffs.py",
         src_dir / "profiles.py",
         src_dir / "feature_registry.py",
+        src_dir / "issue_service.py",
     ]
 
     called_rpcs: set[str] = set()
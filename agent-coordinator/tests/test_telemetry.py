@@ -9,6 +9,7 @@ import pytest
 
 from src.telemetry import (
     _NoOpSpan,
+    get_db_meter,
     get_lock_meter,
     get_policy_meter,
     get_prometheus_app,
@@ -39,6 +40,7 @@ class TestDisabledByDefault:
         assert get_lock_meter() is None
         assert get_queue_meter() is None
         assert get_policy_meter() is None
+        assert get_db_meter() is None
 
     def test_tracer_is_none(self) -> None:
         with patch.dict(os.environ, {}, clear=False):
@@ -118,6 +120,7 @@ class TestMetricsEnabled:
         assert get_lock_meter() is not None
         assert get_queue_meter() is not None
         assert get_policy_meter() is not None
+        assert get_db_meter() is not None
 
     def test_can_create_counter(self) -> None:
         init_telemetry()
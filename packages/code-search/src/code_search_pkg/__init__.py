@@ -21,6 +21,7 @@ from .identifiers import (
     validate_slug,
     validate_storage_key,
 )
+from .query_cache import QueryResultCache
 from .query_pg import build_search_sql, query_codebase_pg, to_pgvector_literal
 from .registry import (
     CanonicalPromotionError,
@@ -44,6 +45,7 @@ __all__ = [
     "storage_key_for_index",
     "validate_slug",
     "validate_storage_key",
+    "QueryResultCache",
     "build_search_sql",
     "query_codebase_pg",
     "to_pgvector_literal",
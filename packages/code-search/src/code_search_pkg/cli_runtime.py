@@ -59,6 +59,21 @@ def resolve_cocoindex_state_path(
     return base / app_name
 
 
+def resolve_scan_workers(environment: Mapping[str, str]) -> int:
+    """Secret-scan worker processes used while planning the source manifest."""
+
+    raw = environment.get("CODE_SEARCH_SCAN_WORKERS")
+    if not raw:
+        return 1
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise ValueError("CODE_SEARCH_SCAN_WORKERS must be a positive integer")
+    return workers
+
+
 async def ensure_repository(
     pool: Any,
     repo_slug: str,
@@ -105,7 +120,10 @@ async def execute_operation(context: Any) -> Any:
         verify_source_unchanged,
     )
 
-    scanner = LocalSecretScanner()
+    scanner = LocalSecretScanner(workers=resolve_scan_workers(context.environment))
+    # Every eligible manifest entry records the scanner that vetted it, so a
+    # later run trusts its blob id only under the same scanner rules.
+    scanner_digest = scanner.fingerprint
     changed_metadata: dict[str, SourceFilePlan] = {}
     proven_git_common_dir: Path | None = None
 
@@ -171,7 +189,6 @@ async def execute_operation(context: Any) -> Any:
         parent: Any,
         parent_manifest: tuple[Any, ...],
     ) -> Any:
-        del parent
         source_plan = await asyncio.to_thread(
             build_source_manifest,
             context.repo_root,
@@ -179,6 +196,9 @@ async def execute_operation(context: Any) -> Any:
             context.policy,
             scanner,
             parent_manifest=parent_manifest,
+            parent_policy_fingerprint=(
+                None if parent is None else parent.policy_fingerprint
+            ),
         )
         entries: list[FileManifestEntry] = []
         changed_metadata.clear()
@@ -201,6 +221,9 @@ async def execute_operation(context: Any) -> Any:
                     content_digest=file_plan.content_digest,
                     chunk_digest=file_plan.parent_chunk_digest,
                     chunk_count=file_plan.parent_chunk_count or 0,
+                    scanner_fingerprint=(
+                        scanner_digest if file_plan.eligible else None
+                    ),
                 )
             )
         return IndexBuildPlan(
@@ -208,6 +231,7 @@ async def execute_operation(context: Any) -> Any:
             unchanged_paths=source_plan.copied_paths,
             changed_paths=source_plan.changed_paths,
             removed_files=len(source_plan.removed_paths),
+            unread_files=len(source_plan.unread_paths),
         )
 
     async def process_changed(attempt: Any, changed_paths: tuple[str, ...]) -> Any:
@@ -262,6 +286,7 @@ async def execute_operation(context: Any) -> Any:
                     content_digest=metadata.content_digest,
                     chunk_digest=stats.chunk_digests[path],
                     chunk_count=stats.chunk_counts[path],
+                    scanner_fingerprint=scanner_digest,
                 )
             )
         return IndexProcessResult(
@@ -279,7 +304,10 @@ async def execute_operation(context: Any) -> Any:
         build_plan=build_plan,
         process_changed=process_changed,
     )
-    return await runtime.execute(context.request)
+    try:
+        return await runtime.execute(context.request)
+    finally:
+        scanner.close()
 
 
 def _git_common_dir(repo_root: Path) -> Path:
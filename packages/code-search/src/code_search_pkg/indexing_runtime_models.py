@@ -185,13 +185,15 @@ class IndexBuildPlan:
 
     ``entries`` contains copied eligible rows and final ineligible rows.
     Changed eligible paths are deliberately absent until ``process_changed``
-    returns their measured chunk metadata.
+    returns their measured chunk metadata. ``unread_files`` counts entries
+    whose digests were reused by Git blob id without opening the blob.
     """
 
     entries: tuple[FileManifestEntry, ...]
     unchanged_paths: tuple[str, ...]
     changed_paths: tuple[str, ...]
     removed_files: int = 0
+    unread_files: int = 0
 
     def __post_init__(self) -> None:
         entries = tuple(sorted(self.entries, key=lambda entry: entry.file_path))
@@ -216,6 +218,10 @@ class IndexBuildPlan:
             raise ValueError("changed paths must not have pre-finalized manifest rows")
         if isinstance(self.removed_files, bool) or self.removed_files < 0:
             raise ValueError("removed_files must not be negative")
+        if isinstance(self.unread_files, bool) or not (
+            0 <= self.unread_files <= len(entries)
+        ):
+            raise ValueError("unread_files must count pre-finalized manifest rows")
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,123 @@
+"""Bounded in-process cache of KNN results over immutable index storage.
+
+A published ``code_chunks__<storage_key>`` table never changes, so one
+``(storage_key, query vector, filters, limit, offset)`` tuple always yields the
+same rows. Entries never go stale. They only need dropping when a storage key
+is retired: a canonical promotion replaces it, or garbage collection deletes
+its table. :class:`~code_search_pkg.registry.SemanticIndexRegistry` does this
+when it is given the cache.
+
+Not thread-safe; share one instance per event loop.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+
+from .schema import QueryResult
+
+DEFAULT_MAX_ENTRIES = 2048
+
+_Filter = tuple[str, ...] | None
+QueryCacheKey = tuple[
+    str, tuple[float, ...], _Filter, _Filter, _Filter, _Filter, int, int
+]
+
+
+def _filter_key(values: Sequence[str] | None) -> _Filter:
+    return None if values is None else tuple(values)
+
+
+class QueryResultCache:
+    """LRU of ``query_codebase_pg`` results grouped by storage key."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[QueryCacheKey, tuple[QueryResult, ...]] = (
+            OrderedDict()
+        )
+        self._by_storage_key: dict[str, set[QueryCacheKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.retired = 0
+
+    @staticmethod
+    def key(
+        storage_key: str,
+        query_embedding: Sequence[float],
+        *,
+        limit: int,
+        offset: int,
+        languages: Sequence[str] | None,
+        allow_path_regexes: Sequence[str] | None,
+        deny_path_regexes: Sequence[str] | None,
+        path_regexes: Sequence[str] | None,
+    ) -> QueryCacheKey:
+        return (
+            storage_key,
+            tuple(float(value) for value in query_embedding),
+            _filter_key(languages),
+            _filter_key(allow_path_regexes),
+            _filter_key(deny_path_regexes),
+            _filter_key(path_regexes),
+            limit,
+            offset,
+        )
+
+    def get(self, key: QueryCacheKey) -> list[QueryResult] | None:
+        rows = self._entries.get(key)
+        if rows is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        # Hand out copies: QueryResult is mutable and callers own their list.
+        return [replace(row) for row in rows]
+
+    def put(self, key: QueryCacheKey, rows: Sequence[QueryResult]) -> None:
+        self._entries[key] = tuple(replace(row) for row in rows)
+        self._entries.move_to_end(key)
+        self._by_storage_key.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _rows = self._entries.popitem(last=False)
+            self._forget(evicted)
+
+    def retire_storage_key(self, storage_key: str) -> int:
+        """Drop every cached result for ``storage_key``; return how many."""
+        keys = self._by_storage_key.pop(storage_key, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        self.retired += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_storage_key.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "retired": self.retired,
+            "size": len(self._entries),
+            "storage_keys": len(self._by_storage_key),
+            "max_entries": self.max_entries,
+        }
+
+    def _forget(self, key: QueryCacheKey) -> None:
+        keys = self._by_storage_key.get(key[0])
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._by_storage_key[key[0]]
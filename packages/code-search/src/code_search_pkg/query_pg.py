@@ -11,6 +11,7 @@ from typing import Any, Protocol
 from uuid import UUID
 
 from .identifiers import index_chunk_table_name, validate_slug, validate_storage_key
+from .query_cache import QueryCacheKey, QueryResultCache
 from .registry_models import IndexIdentity, LEGACY_FINGERPRINT, NamespaceKind
 from .schema import QueryResult
 
@@ -283,8 +284,13 @@ async def query_codebase_pg(
     allow_path_regexes: list[str] | None = None,
     deny_path_regexes: list[str] | None = None,
     path_regexes: list[str] | None = None,
+    cache: QueryResultCache | None = None,
 ) -> list[QueryResult]:
-    """Run one bounded, parameterized KNN statement over exact index storage."""
+    """Run one bounded, parameterized KNN statement over exact index storage.
+
+    With ``cache``, identical searches over the same immutable storage key are
+    answered in process after the first statement.
+    """
     _validate_pagination(limit, offset)
     _validate_filters("languages", languages, _MAX_LANGUAGES, _MAX_LANGUAGE_LENGTH)
     _validate_filters(
@@ -305,6 +311,21 @@ async def query_codebase_pg(
         _MAX_CALLER_PATH_REGEXES,
         _MAX_COMPILED_PATH_REGEX_LENGTH,
     )
+    cache_key: QueryCacheKey | None = None
+    if cache is not None:
+        cache_key = QueryResultCache.key(
+            validate_storage_key(storage_key),
+            query_embedding,
+            limit=limit,
+            offset=offset,
+            languages=languages,
+            allow_path_regexes=allow_path_regexes,
+            deny_path_regexes=deny_path_regexes,
+            path_regexes=path_regexes,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
     try:
         rows = await pool.fetch(
             build_search_sql(storage_key),
@@ -322,7 +343,7 @@ async def query_codebase_pg(
                 "semantic storage unavailable"
             ) from error
         raise
-    return [
+    results = [
         QueryResult(
             file_path=str(row["file_path"]),
             language=str(row["language"]),
@@ -333,6 +354,9 @@ async def query_codebase_pg(
         )
         for row in rows
     ]
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, results)
+    return results
 
 
 def _validate_pagination(limit: int, offset: int) -> None:
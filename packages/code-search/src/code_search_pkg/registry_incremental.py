@@ -36,12 +36,14 @@ WITH current_lease AS (
 published AS (
     INSERT INTO code_search_index_files (
         index_id, file_path, git_blob_id, git_entry_type, eligible,
-        eligibility_reason, content_digest, chunk_digest, chunk_count
+        eligibility_reason, content_digest, chunk_digest, chunk_count,
+        scanner_fingerprint
     )
     SELECT attempt.index_id, attempt.file_path, attempt.git_blob_id,
            attempt.git_entry_type, attempt.eligible,
            attempt.eligibility_reason, attempt.content_digest,
-           attempt.chunk_digest, attempt.chunk_count
+           attempt.chunk_digest, attempt.chunk_count,
+           attempt.scanner_fingerprint
     FROM code_search_index_file_attempts AS attempt
     JOIN current_lease ON current_lease.index_id = attempt.index_id
     WHERE attempt.attempt_count = $3
@@ -52,7 +54,8 @@ published AS (
         eligibility_reason = EXCLUDED.eligibility_reason,
         content_digest = EXCLUDED.content_digest,
         chunk_digest = EXCLUDED.chunk_digest,
-        chunk_count = EXCLUDED.chunk_count
+        chunk_count = EXCLUDED.chunk_count,
+        scanner_fingerprint = EXCLUDED.scanner_fingerprint
     RETURNING index_id
 ),
 removed_stale AS (
@@ -366,20 +369,22 @@ class IncrementalRegistryMixin:
                     eligibility_reason text,
                     content_digest text,
                     chunk_digest text,
-                    chunk_count integer
+                    chunk_count integer,
+                    scanner_fingerprint text
                 )
             ),
             inserted AS (
                 INSERT INTO code_search_index_file_attempts (
                     index_id, attempt_count, file_path, git_blob_id,
                     git_entry_type, eligible, eligibility_reason,
-                    content_digest, chunk_digest, chunk_count
+                    content_digest, chunk_digest, chunk_count,
+                    scanner_fingerprint
                 )
                 SELECT current_lease.index_id, $3, payload.file_path,
                        payload.git_blob_id, payload.git_entry_type,
                        payload.eligible, payload.eligibility_reason,
                        payload.content_digest, payload.chunk_digest,
-                       payload.chunk_count
+                       payload.chunk_count, payload.scanner_fingerprint
                 FROM current_lease
                 CROSS JOIN payload
                 WHERE true
@@ -390,7 +395,8 @@ class IncrementalRegistryMixin:
                     eligibility_reason = EXCLUDED.eligibility_reason,
                     content_digest = EXCLUDED.content_digest,
                     chunk_digest = EXCLUDED.chunk_digest,
-                    chunk_count = EXCLUDED.chunk_count
+                    chunk_count = EXCLUDED.chunk_count,
+                    scanner_fingerprint = EXCLUDED.scanner_fingerprint
                 RETURNING index_id
             ),
             removed_stale AS (
@@ -317,6 +317,7 @@ class FileManifestEntry:
     content_digest: str | None
     chunk_digest: str | None
     chunk_count: int
+    scanner_fingerprint: str | None = None
 
     @classmethod
     def from_row(cls, row: Mapping[str, Any]) -> FileManifestEntry:
@@ -345,7 +346,7 @@ class FileManifestEntry:
             raise ValueError("git_blob_id must be a full lowercase Git object ID")
         if self.git_entry_type not in {None, "blob", "symlink"}:
             raise ValueError("git_entry_type must be 'blob', 'symlink', or None")
-        for name in ("content_digest", "chunk_digest"):
+        for name in ("content_digest", "chunk_digest", "scanner_fingerprint"):
             value = getattr(self, name)
             if value is not None and not _DIGEST_RE.fullmatch(value):
                 raise ValueError(f"{name} must be 64 lowercase hexadecimal characters")
@@ -369,6 +370,7 @@ class FileManifestEntry:
             "content_digest": self.content_digest,
             "chunk_digest": self.chunk_digest,
             "chunk_count": self.chunk_count,
+            "scanner_fingerprint": self.scanner_fingerprint,
         }
 
 
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import multiprocessing
 import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
+from typing import Self
+
+SCANNER_VERSION = 1
 
 
 class SecretScanError(RuntimeError):
@@ -52,9 +60,69 @@ _RULES: tuple[tuple[str, re.Pattern[bytes]], ...] = (
     ),
 )
 
+_LEADING_FLAGS_RE = re.compile(rb"^\(\?[imsx]+\)")
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, b"i"),
+    (re.MULTILINE, b"m"),
+    (re.DOTALL, b"s"),
+    (re.VERBOSE, b"x"),
+)
+
+
+def _combine_rules(
+    rules: Sequence[tuple[str, re.Pattern[bytes]]],
+) -> re.Pattern[bytes]:
+    """Join every rule into one alternation with each rule's flags scoped."""
+
+    parts: list[bytes] = []
+    for _, pattern in rules:
+        source = _LEADING_FLAGS_RE.sub(b"", pattern.pattern, count=1)
+        flags = b"".join(
+            letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag
+        )
+        if pattern.flags & re.VERBOSE:
+            # A trailing verbose comment must not swallow the closing group.
+            source += b"\n"
+        parts.append(b"(?" + flags + b":" + source + b")")
+    return re.compile(b"|".join(parts))
+
+
+# One pass over the content decides the common clean case; only content that
+# matches some rule is re-checked rule by rule to keep first-rule attribution.
+_ANY_RULE = _combine_rules(_RULES)
+
+
+def _rules_digest(rules: Sequence[tuple[str, re.Pattern[bytes]]]) -> str:
+    """Hash every rule's id, pattern source, and flags, in evaluation order."""
+
+    digest = hashlib.sha256()
+    for rule_id, pattern in rules:
+        for part in (rule_id.encode("utf-8"), pattern.pattern, b"%d" % pattern.flags):
+            digest.update(b"%d:" % len(part))
+            digest.update(part)
+    return digest.hexdigest()
+
+
+_RULES_DIGEST = _rules_digest(_RULES)
+
+
+def scanner_fingerprint(scanner: object) -> str | None:
+    """Return the scanner's ``fingerprint``, or None when it does not pin one.
+
+    Results recorded under one fingerprint may only be reused by a scanner
+    reporting the same fingerprint; a scanner without one is never trusted.
+    """
+
+    fingerprint = getattr(scanner, "fingerprint", None)
+    return fingerprint if isinstance(fingerprint, str) and fingerprint else None
+
 
 class LocalSecretScanner:
-    """Scan bounded local bytes using pinned built-in rules and safe evidence."""
+    """Scan bounded local bytes using pinned built-in rules and safe evidence.
+
+    ``scan_many`` scans a batch of blobs; with ``workers`` above one it spreads
+    them over a lazily started process pool that ``close`` shuts down.
+    """
 
     def __init__(
         self,
@@ -62,6 +130,7 @@ class LocalSecretScanner:
         max_file_bytes: int = 1_048_576,
         per_file_timeout_seconds: float = 0.5,
         operation_timeout_seconds: float = 30.0,
+        workers: int = 1,
         clock: Callable[[], float] = time.monotonic,
     ) -> None:
         if max_file_bytes <= 0:
@@ -70,12 +139,47 @@ class LocalSecretScanner:
             raise ValueError("per_file_timeout_seconds must be positive")
         if operation_timeout_seconds <= 0:
             raise ValueError("operation_timeout_seconds must be positive")
+        if isinstance(workers, bool) or workers < 1:
+            raise ValueError("workers must be a positive integer")
         self._max_file_bytes = max_file_bytes
         self._per_file_timeout_seconds = per_file_timeout_seconds
         self._operation_timeout_seconds = operation_timeout_seconds
         self._operation_deadline: float | None = None
+        self._workers = workers
+        self._pool: ProcessPoolExecutor | None = None
         self._clock = clock
 
+    @property
+    def fingerprint(self) -> str:
+        """Digest of everything that decides a blob's scan outcome.
+
+        Covers the scanner identity and version, the built-in rules, and the
+        per-file size bound. Timeouts and worker count are excluded: they can
+        only fail a scan, never change a clean or finding result.
+        """
+
+        payload = {
+            "max_file_bytes": self._max_file_bytes,
+            "rules": _RULES_DIGEST,
+            "scanner": f"{type(self).__module__}.{type(self).__qualname__}",
+            "scanner_version": SCANNER_VERSION,
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker pool, if one was started."""
+
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def scan_bytes(
         self,
         content: bytes,
@@ -99,14 +203,15 @@ class LocalSecretScanner:
             )
             file_deadline = started + self._per_file_timeout_seconds
             self._check_deadlines(file_deadline, operation_deadline)
-            for rule_id, pattern in _RULES:
-                self._check_deadlines(file_deadline, operation_deadline)
-                if pattern.search(content) is not None:
-                    return SecretScanResult(
-                        status=SecretScanStatus.FINDING,
-                        reason="secret_detected",
-                        rule_id=rule_id,
-                    )
+            if _ANY_RULE.search(content) is not None:
+                for rule_id, pattern in _RULES:
+                    self._check_deadlines(file_deadline, operation_deadline)
+                    if pattern.search(content) is not None:
+                        return SecretScanResult(
+                            status=SecretScanStatus.FINDING,
+                            reason="secret_detected",
+                            rule_id=rule_id,
+                        )
             self._check_deadlines(file_deadline, operation_deadline)
             return SecretScanResult(
                 status=SecretScanStatus.CLEAN,
@@ -120,6 +225,69 @@ class LocalSecretScanner:
                 "local secret scanner failed",
             ) from error
 
+    def scan_many(
+        self,
+        contents: Sequence[bytes],
+        *,
+        operation_deadline: float | None = None,
+    ) -> tuple[SecretScanResult, ...]:
+        """Scan several blobs, in parallel when workers were configured.
+
+        Results are returned in input order. The first failing blob, in input
+        order, raises its sanitized error; each blob keeps its per-file bound
+        and the whole batch stays within the operation deadline.
+        """
+
+        if self._workers == 1 or len(contents) < 2:
+            return tuple(
+                self.scan_bytes(content, operation_deadline=operation_deadline)
+                for content in contents
+            )
+        try:
+            started = self._clock()
+            operation_deadline = self._effective_operation_deadline(
+                started,
+                operation_deadline,
+            )
+            remaining = operation_deadline - started
+            if remaining <= 0:
+                raise _timeout_error()
+            pool = self._ensure_pool()
+            futures: list[Future[tuple[SecretScanResult | None, str | None]]] = [
+                pool.submit(
+                    _scan_in_worker,
+                    content,
+                    self._max_file_bytes,
+                    self._per_file_timeout_seconds,
+                    remaining,
+                )
+                for content in contents
+            ]
+            try:
+                results: list[SecretScanResult] = []
+                for future in futures:
+                    wait = operation_deadline - self._clock()
+                    if wait <= 0:
+                        raise _timeout_error()
+                    try:
+                        result, error_code = future.result(timeout=wait)
+                    except FutureTimeoutError as error:
+                        raise _timeout_error() from error
+                    if result is None:
+                        raise _sanitized_error(error_code)
+                    results.append(result)
+                return tuple(results)
+            finally:
+                for future in futures:
+                    future.cancel()
+        except SecretScanError:
+            raise
+        except Exception as error:
+            raise SecretScanError(
+                "scanner_error",
+                "local secret scanner failed",
+            ) from error
+
     def scan_file(
         self,
         path: str | Path,
@@ -149,6 +317,15 @@ class LocalSecretScanner:
             return self._operation_deadline
         return min(self._operation_deadline, requested_deadline)
 
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned workers do not inherit the caller's threads or locks.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
     def _check_deadlines(
         self,
         file_deadline: float,
@@ -158,7 +335,41 @@ class LocalSecretScanner:
         if now > file_deadline or (
             operation_deadline is not None and now > operation_deadline
         ):
-            raise SecretScanError(
-                "scanner_timeout",
-                "local secret scanner exceeded its time bound",
-            )
+            raise _timeout_error()
+
+
+def _timeout_error() -> SecretScanError:
+    return SecretScanError(
+        "scanner_timeout",
+        "local secret scanner exceeded its time bound",
+    )
+
+
+def _sanitized_error(code: str | None) -> SecretScanError:
+    if code == "scanner_timeout":
+        return _timeout_error()
+    if code == "scanner_input_too_large":
+        return SecretScanError(
+            "scanner_input_too_large",
+            "local secret scan input exceeds the configured bound",
+        )
+    return SecretScanError("scanner_error", "local secret scanner failed")
+
+
+def _scan_in_worker(
+    content: bytes,
+    max_file_bytes: int,
+    per_file_timeout_seconds: float,
+    operation_timeout_seconds: float,
+) -> tuple[SecretScanResult | None, str | None]:
+    """Scan one blob in a pool worker, returning an error code, not an error."""
+
+    scanner = LocalSecretScanner(
+        max_file_bytes=max_file_bytes,
+        per_file_timeout_seconds=per_file_timeout_seconds,
+        operation_timeout_seconds=operation_timeout_seconds,
+    )
+    try:
+        return scanner.scan_bytes(content), None
+    except SecretScanError as error:
+        return None, error.code
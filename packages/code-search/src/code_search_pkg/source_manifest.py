@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
+import selectors
 import subprocess
+import time
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
-from typing import Protocol
+from types import TracebackType
+from typing import Protocol, Self
 
 from .indexing_policy import IndexingPolicy, evaluate_path
-from .secret_scanner import SecretScanError, SecretScanStatus
+from .secret_scanner import SecretScanStatus, scanner_fingerprint
 from .source_proof import prove_source
 
 
 _GIT_TIMEOUT_SECONDS = 30.0
+_BATCH_READ_CHUNK = 1 << 16
+_SCAN_BATCH_FILES = 64
+_SCAN_BATCH_BYTES = 32 << 20
 _OBJECT_ID_RE = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})?$")
 _DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
 _REGULAR_MODES = frozenset({"100644", "100755"})
@@ -31,6 +38,8 @@ class SourceManifestError(RuntimeError):
 
 
 class SecretScanner(Protocol):
+    """Local scanner; one that also has ``scan_many`` is handed read batches."""
+
     def scan_bytes(self, content: bytes) -> object: ...
 
 
@@ -42,6 +51,7 @@ class ParentManifestEntry(Protocol):
     content_digest: str | None
     chunk_digest: str | None
     chunk_count: int
+    scanner_fingerprint: str | None
 
 
 @dataclass(frozen=True, slots=True)
@@ -58,6 +68,7 @@ class SourceFilePlan:
     disposition: str
     parent_chunk_digest: str | None = None
     parent_chunk_count: int | None = None
+    reused_by_blob_id: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,6 +80,8 @@ class SourceManifestPlan:
     changed_paths: tuple[str, ...]
     copied_paths: tuple[str, ...]
     removed_paths: tuple[str, ...]
+    unread_paths: tuple[str, ...] = ()
+    scanner_fingerprint: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -79,6 +92,13 @@ class _TrackedEntry:
     object_id: str
 
 
+@dataclass(frozen=True, slots=True)
+class _PendingRead:
+    slot: int
+    tracked_entry: _TrackedEntry
+    content: bytes
+
+
 def build_source_manifest(
     repo_root: str | Path,
     source_revision: str,
@@ -86,83 +106,61 @@ def build_source_manifest(
     scanner: SecretScanner,
     *,
     parent_manifest: Sequence[ParentManifestEntry] = (),
+    parent_policy_fingerprint: str | None = None,
 ) -> SourceManifestPlan:
-    """Plan exact tracked blobs, evaluating policy before any blob is opened."""
+    """Plan exact tracked blobs, evaluating policy before any blob is opened.
+
+    When ``parent_policy_fingerprint`` equals ``policy.fingerprint`` and a
+    parent entry's ``scanner_fingerprint`` equals the current scanner's, that
+    entry's blob was already read, scanned and hashed under the same policy
+    and secret-scanner rules, so an entry with an identical Git blob id reuses
+    the parent's digests without opening the blob. Those paths are reported in
+    ``unread_paths``. A scanner without a fingerprint, or a parent entry
+    recorded without one, always has its blob read and scanned again.
+    """
 
     proof = prove_source(repo_root, source_revision)
     root = Path(proof.repo_root)
     tracked = _list_tracked_entries(root, proof.source_revision)
     parents = _index_parent_manifest(parent_manifest)
-    files: list[SourceFilePlan] = []
-    changed: list[str] = []
-    copied: list[str] = []
-
-    for tracked_entry in tracked:
-        decision = evaluate_path(root, tracked_entry.path, policy)
-        entry_type = _entry_type(tracked_entry)
-        if not decision.eligible:
-            files.append(
-                _excluded_plan(
-                    tracked_entry,
-                    entry_type,
-                    decision.reason.value,
-                )
-            )
-            continue
-        if entry_type == "unsupported":
-            files.append(
-                _excluded_plan(
-                    tracked_entry,
-                    entry_type,
-                    "unsupported_git_entry",
-                )
-            )
-            continue
-        if entry_type == "symlink":
-            files.append(
-                _excluded_plan(
-                    tracked_entry,
-                    entry_type,
-                    "symlink_not_indexed",
-                )
-            )
-            continue
-
-        content = _read_blob(root, tracked_entry.object_id)
-        _scan_or_fail(scanner, content)
-        content_digest = hashlib.sha256(content).hexdigest()
-        parent = parents.get(tracked_entry.path)
-        if _can_copy(parent, tracked_entry, entry_type, content_digest):
-            assert parent is not None
-            copied.append(tracked_entry.path)
-            files.append(
-                SourceFilePlan(
-                    path=tracked_entry.path,
-                    git_mode=tracked_entry.git_mode,
-                    git_blob_id=tracked_entry.object_id,
-                    git_entry_type=entry_type,
-                    eligible=True,
-                    eligibility_reason="eligible",
-                    content_digest=content_digest,
-                    disposition="copied",
-                    parent_chunk_digest=parent.chunk_digest,
-                    parent_chunk_count=parent.chunk_count,
-                )
-            )
-        else:
-            changed.append(tracked_entry.path)
-            files.append(
-                SourceFilePlan(
-                    path=tracked_entry.path,
-                    git_mode=tracked_entry.git_mode,
-                    git_blob_id=tracked_entry.object_id,
-                    git_entry_type=entry_type,
-                    eligible=True,
-                    eligibility_reason="eligible",
-                    content_digest=content_digest,
-                    disposition="changed",
-                )
+    current_scanner = scanner_fingerprint(scanner)
+    trusted_scanner = (
+        current_scanner
+        if parent_policy_fingerprint is not None
+        and parent_policy_fingerprint == policy.fingerprint
+        else None
+    )
+    batch_limit = _SCAN_BATCH_FILES if _scans_in_batches(scanner) else 1
+    planned: list[SourceFilePlan | None] = []
+    pending: list[_PendingRead] = []
+    pending_bytes = 0
+
+    with _BatchBlobReader(root) as blob_reader:
+        for tracked_entry in tracked:
+            plan = _plan_tracked_entry(
+                root,
+                tracked_entry,
+                policy,
+                parents,
+                trusted_scanner=trusted_scanner,
             )
+            if plan is not None:
+                planned.append(plan)
+                continue
+            content = _read_blob(blob_reader, tracked_entry.object_id)
+            pending.append(_PendingRead(len(planned), tracked_entry, content))
+            planned.append(None)
+            pending_bytes += len(content)
+            if len(pending) >= batch_limit or pending_bytes >= _SCAN_BATCH_BYTES:
+                _plan_read_batch(scanner, pending, parents, planned)
+                pending = []
+                pending_bytes = 0
+        _plan_read_batch(scanner, pending, parents, planned)
+
+    files = [plan for plan in planned if plan is not None]
+    changed = [plan.path for plan in files if plan.disposition == "changed"]
+    copied = [plan.path for plan in files if plan.disposition == "copied"]
+    unread = [plan.path for plan in files if plan.reused_by_blob_id]
 
     current_by_path = {entry.path: entry for entry in files}
     removed = sorted(
@@ -177,6 +175,102 @@ def build_source_manifest(
         changed_paths=tuple(changed),
         copied_paths=tuple(copied),
         removed_paths=tuple(removed),
+        unread_paths=tuple(unread),
+        scanner_fingerprint=current_scanner,
+    )
+
+
+def _plan_tracked_entry(
+    root: Path,
+    tracked_entry: _TrackedEntry,
+    policy: IndexingPolicy,
+    parents: dict[str, ParentManifestEntry],
+    *,
+    trusted_scanner: str | None,
+) -> SourceFilePlan | None:
+    """Plan an entry that needs no blob content, or return None to read it."""
+
+    decision = evaluate_path(root, tracked_entry.path, policy)
+    entry_type = _entry_type(tracked_entry)
+    if not decision.eligible:
+        return _excluded_plan(tracked_entry, entry_type, decision.reason.value)
+    if entry_type == "unsupported":
+        return _excluded_plan(tracked_entry, entry_type, "unsupported_git_entry")
+    if entry_type == "symlink":
+        return _excluded_plan(tracked_entry, entry_type, "symlink_not_indexed")
+
+    parent = parents.get(tracked_entry.path)
+    if (
+        trusted_scanner is not None
+        and parent is not None
+        and parent.scanner_fingerprint == trusted_scanner
+        and parent.content_digest is not None
+        and _can_copy(parent, tracked_entry, entry_type, parent.content_digest)
+    ):
+        return _copied_plan(
+            tracked_entry,
+            entry_type,
+            parent,
+            parent.content_digest,
+            reused_by_blob_id=True,
+        )
+    return None
+
+
+def _plan_read_batch(
+    scanner: SecretScanner,
+    pending: Sequence[_PendingRead],
+    parents: dict[str, ParentManifestEntry],
+    planned: list[SourceFilePlan | None],
+) -> None:
+    """Scan read blobs, then hash and plan them into their reserved slots."""
+
+    if not pending:
+        return
+    _scan_all_or_fail(scanner, [read.content for read in pending])
+    for read in pending:
+        tracked_entry = read.tracked_entry
+        entry_type = _entry_type(tracked_entry)
+        content_digest = hashlib.sha256(read.content).hexdigest()
+        parent = parents.get(tracked_entry.path)
+        if _can_copy(parent, tracked_entry, entry_type, content_digest):
+            assert parent is not None
+            planned[read.slot] = _copied_plan(
+                tracked_entry, entry_type, parent, content_digest
+            )
+            continue
+        planned[read.slot] = SourceFilePlan(
+            path=tracked_entry.path,
+            git_mode=tracked_entry.git_mode,
+            git_blob_id=tracked_entry.object_id,
+            git_entry_type=entry_type,
+            eligible=True,
+            eligibility_reason="eligible",
+            content_digest=content_digest,
+            disposition="changed",
+        )
+
+
+def _copied_plan(
+    tracked: _TrackedEntry,
+    entry_type: str,
+    parent: ParentManifestEntry,
+    content_digest: str,
+    *,
+    reused_by_blob_id: bool = False,
+) -> SourceFilePlan:
+    return SourceFilePlan(
+        path=tracked.path,
+        git_mode=tracked.git_mode,
+        git_blob_id=tracked.object_id,
+        git_entry_type=entry_type,
+        eligible=True,
+        eligibility_reason="eligible",
+        content_digest=content_digest,
+        disposition="copied",
+        parent_chunk_digest=parent.chunk_digest,
+        parent_chunk_count=parent.chunk_count,
+        reused_by_blob_id=reused_by_blob_id,
     )
 
 
@@ -241,8 +335,164 @@ def _list_tracked_entries(
     return tuple(sorted(entries, key=lambda entry: entry.path))
 
 
-def _read_blob(repo_root: Path, blob_id: str) -> bytes:
-    return _run_git_bytes(repo_root, "cat-file", "blob", blob_id)
+def _read_blob(blob_reader: _BatchBlobReader, blob_id: str) -> bytes:
+    return blob_reader.read(blob_id)
+
+
+class _BatchBlobReader:
+    """One long-lived ``git cat-file --batch`` process per manifest build.
+
+    Spawning ``git cat-file blob`` per file costs a fork/exec per tracked
+    path; this keeps a single process and requests blobs over its stdin.
+    Responses are framed by the ``<oid> <type> <size>`` header, read in
+    bounded chunks, and every request carries the same per-call deadline as
+    the one-shot git commands. Any framing error, timeout or early exit
+    poisons the reader and fails closed.
+    """
+
+    def __init__(
+        self, repo_root: Path, *, timeout: float = _GIT_TIMEOUT_SECONDS
+    ) -> None:
+        self._repo_root = repo_root
+        self._timeout = timeout
+        self._process: subprocess.Popen[bytes] | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._buffer = bytearray()
+        self._broken = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def read(self, blob_id: str) -> bytes:
+        if self._broken or not _OBJECT_ID_RE.fullmatch(blob_id):
+            raise _git_read_error()
+        try:
+            process = self._ensure_started()
+            assert process.stdin is not None
+            process.stdin.write(blob_id.encode("ascii") + b"\n")
+            process.stdin.flush()
+            deadline = time.monotonic() + self._timeout
+            header = self._read_line(deadline)
+            parts = header.split(b" ")
+            if (
+                len(parts) != 3
+                or parts[0] != blob_id.encode("ascii")
+                or parts[1] != b"blob"
+                or not parts[2].isdigit()
+            ):
+                raise _git_read_error()
+            size = int(parts[2])
+            record = self._read_exact(size + 1, deadline)
+            if record[-1:] != b"\n":
+                raise _git_read_error()
+            return record[:-1]
+        except SourceManifestError:
+            self._poison()
+            raise
+        except (OSError, ValueError) as error:
+            self._poison()
+            raise _git_read_error() from error
+
+    def close(self) -> None:
+        process, self._process = self._process, None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        self._buffer.clear()
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=self._timeout)
+        except (OSError, subprocess.SubprocessError):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+    def _ensure_started(self) -> subprocess.Popen[bytes]:
+        if self._process is not None:
+            return self._process
+        try:
+            process = subprocess.Popen(
+                ["git", "-C", str(self._repo_root), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.SubprocessError) as error:
+            raise _git_read_error() from error
+        assert process.stdout is not None
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ)
+        self._process = process
+        self._selector = selector
+        return process
+
+    def _read_line(self, deadline: float) -> bytes:
+        while True:
+            newline = self._buffer.find(b"\n")
+            if newline >= 0:
+                line = bytes(self._buffer[:newline])
+                del self._buffer[: newline + 1]
+                return line
+            self._fill(deadline, _BATCH_READ_CHUNK)
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        if len(self._buffer) >= size:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            return data
+        # Preallocate once and fill in place so large blobs are not rebuilt
+        # through repeated concatenation.
+        data = bytearray(size)
+        view = memoryview(data)
+        filled = len(self._buffer)
+        view[:filled] = self._buffer
+        self._buffer.clear()
+        while filled < size:
+            chunk = self._read_chunk(deadline, min(size - filled, _BATCH_READ_CHUNK))
+            view[filled : filled + len(chunk)] = chunk
+            filled += len(chunk)
+        return bytes(data)
+
+    def _fill(self, deadline: float, limit: int) -> None:
+        self._buffer += self._read_chunk(deadline, limit)
+
+    def _read_chunk(self, deadline: float, limit: int) -> bytes:
+        assert self._process is not None and self._selector is not None
+        assert self._process.stdout is not None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not self._selector.select(remaining):
+            raise _git_read_error()
+        chunk = os.read(self._process.stdout.fileno(), limit)
+        if not chunk:
+            raise _git_read_error()
+        return chunk
+
+    def _poison(self) -> None:
+        self._broken = True
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+        self.close()
+
+
+def _git_read_error() -> SourceManifestError:
+    return SourceManifestError(
+        "git_manifest_failed",
+        "Git source manifest could not be read",
+    )
 
 
 def _run_git_bytes(repo_root: Path, *args: str) -> bytes:
@@ -266,19 +516,45 @@ def _run_git_bytes(repo_root: Path, *args: str) -> bytes:
     return result.stdout
 
 
-def _scan_or_fail(scanner: SecretScanner, content: bytes) -> None:
+def _scans_in_batches(scanner: SecretScanner) -> bool:
+    return callable(getattr(scanner, "scan_many", None))
+
+
+def _scan_all_or_fail(scanner: SecretScanner, contents: Sequence[bytes]) -> None:
+    scan_many = getattr(scanner, "scan_many", None)
+    if len(contents) == 1 or not callable(scan_many):
+        for content in contents:
+            _scan_or_fail(scanner, content)
+        return
     try:
-        result = scanner.scan_bytes(content)
-    except SecretScanError as error:
-        raise SourceManifestError(
-            "secret_scan_failed",
-            "local secret scan failed while planning source files",
-        ) from error
+        results = tuple(scan_many(contents))
     except Exception as error:
+        raise _scan_failed() from error
+    if len(results) != len(contents):
         raise SourceManifestError(
             "secret_scan_failed",
-            "local secret scan failed while planning source files",
-        ) from error
+            "local secret scan returned an invalid result",
+        )
+    for result in results:
+        _check_scan_result(result)
+
+
+def _scan_or_fail(scanner: SecretScanner, content: bytes) -> None:
+    try:
+        result = scanner.scan_bytes(content)
+    except Exception as error:
+        raise _scan_failed() from error
+    _check_scan_result(result)
+
+
+def _scan_failed() -> SourceManifestError:
+    return SourceManifestError(
+        "secret_scan_failed",
+        "local secret scan failed while planning source files",
+    )
+
+
+def _check_scan_result(result: object) -> None:
     if getattr(result, "status", None) is SecretScanStatus.FINDING:
         raise SourceManifestError(
             "secret_detected",
@@ -318,6 +594,7 @@ def _can_copy(
         and parent.git_blob_id == current.object_id
         and parent.git_entry_type == entry_type
         and parent.content_digest == content_digest
+        and _DIGEST_RE.fullmatch(content_digest)
         and parent.chunk_digest is not None
         and _DIGEST_RE.fullmatch(parent.chunk_digest)
         and not isinstance(parent.chunk_count, bool)
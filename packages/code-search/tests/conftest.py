@@ -157,6 +157,7 @@ async def index_e2e_case(sample_repo_copy: Path) -> AsyncIterator[IndexE2ECase]:
         "028_code_search_registry.sql",
         "029_revision_aware_code_search_indexes.sql",
         "030_incremental_code_search_indexes.sql",
+        "038_code_search_scanner_fingerprint.sql",
     ):
         await connection.execute((MIGRATIONS / migration).read_text(encoding="utf-8"))
     await connection.close()
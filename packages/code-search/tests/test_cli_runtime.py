@@ -13,7 +13,11 @@ from code_search_pkg.cli import (
     _ensure_repository,
     _execute_operation,
 )
-from code_search_pkg.cli_runtime import resolve_cocoindex_state_path
+from code_search_pkg.cli_runtime import (
+    execute_operation,
+    resolve_cocoindex_state_path,
+    resolve_scan_workers,
+)
 from code_search_pkg.indexing_runtime import (
     IndexExecutionRequest,
     IndexExecutionStatus,
@@ -24,6 +28,7 @@ from code_search_pkg.registry_models import (
     NamespaceKind,
     SemanticIndexRecord,
 )
+from code_search_pkg.source_manifest import SourceFilePlan, SourceManifestPlan
 
 REVISION = "a" * 40
 INDEX_ID = UUID("11111111-1111-4111-8111-111111111111")
@@ -70,6 +75,14 @@ def test_cocoindex_state_is_durable_and_never_inside_source(
         )
 
 
+def test_scan_workers_default_to_serial_and_reject_invalid_values() -> None:
+    assert resolve_scan_workers({}) == 1
+    assert resolve_scan_workers({"CODE_SEARCH_SCAN_WORKERS": "4"}) == 4
+    for raw in ("0", "-2", "many"):
+        with pytest.raises(ValueError, match="positive integer"):
+            resolve_scan_workers({"CODE_SEARCH_SCAN_WORKERS": raw})
+
+
 @pytest.mark.asyncio
 async def test_default_ready_no_op_does_not_import_cocoindex_adapter(
     tmp_path: Path,
@@ -129,6 +142,7 @@ async def test_default_ready_no_op_does_not_import_cocoindex_adapter(
         storage=object(),
         provider=UnusedProvider(),
         repo_root=tmp_path,
+        environment={},
         request=IndexExecutionRequest(
             identity=identity,
             repo_root=str(tmp_path),
@@ -143,6 +157,71 @@ async def test_default_ready_no_op_does_not_import_cocoindex_adapter(
     assert ready_result.reused is True
 
 
+@pytest.mark.asyncio
+async def test_build_plan_reports_files_reused_without_reading(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def file_plan(path: str, disposition: str, *, reused: bool) -> SourceFilePlan:
+        return SourceFilePlan(
+            path=path,
+            git_mode="100644",
+            git_blob_id="b" * 40,
+            git_entry_type="blob",
+            eligible=True,
+            eligibility_reason="eligible",
+            content_digest="c" * 64,
+            disposition=disposition,
+            parent_chunk_digest="d" * 64 if disposition == "copied" else None,
+            parent_chunk_count=1 if disposition == "copied" else None,
+            reused_by_blob_id=reused,
+        )
+
+    source_plan = SourceManifestPlan(
+        source_revision=REVISION,
+        files=(
+            file_plan("src/changed.py", "changed", reused=False),
+            file_plan("src/read.py", "copied", reused=False),
+            file_plan("src/unread.py", "copied", reused=True),
+        ),
+        changed_paths=("src/changed.py",),
+        copied_paths=("src/read.py", "src/unread.py"),
+        removed_paths=(),
+        unread_paths=("src/unread.py",),
+    )
+    monkeypatch.setattr(
+        "code_search_pkg.source_manifest.build_source_manifest",
+        lambda *_args, **_kwargs: source_plan,
+    )
+
+    class PlanOnlyRuntime:
+        def __init__(self, **kwargs: object) -> None:
+            self.build_plan = kwargs["build_plan"]
+
+        async def execute(self, _request: object) -> object:
+            proof = SimpleNamespace(source_revision=REVISION)
+            return await self.build_plan(proof, None, ())
+
+    monkeypatch.setattr(
+        "code_search_pkg.indexing_runtime.IndexingRuntime", PlanOnlyRuntime
+    )
+    context = SimpleNamespace(
+        registry=object(),
+        storage=object(),
+        provider=SimpleNamespace(check_readiness=None),
+        repo_root=tmp_path,
+        environment={},
+        policy=object(),
+        request=object(),
+    )
+
+    plan = await execute_operation(context)
+
+    assert plan.unread_files == 1
+    assert plan.unchanged_paths == ("src/read.py", "src/unread.py")
+    assert plan.changed_paths == ("src/changed.py",)
+
+
 @pytest.mark.asyncio
 async def test_repository_registration_preserves_explicit_contract(
     tmp_path: Path,
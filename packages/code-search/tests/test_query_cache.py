@@ -0,0 +1,67 @@
+"""Unit tests for the immutable-storage KNN result cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from code_search_pkg.query_cache import QueryResultCache
+from code_search_pkg.schema import QueryResult
+
+KEY_A = "i_11111111111141118111111111111111"
+KEY_B = "i_22222222222242228222222222222222"
+
+
+def _key(storage_key: str, *, offset: int = 0, languages: list[str] | None = None):
+    return QueryResultCache.key(
+        storage_key,
+        [0.1, 0.2],
+        limit=10,
+        offset=offset,
+        languages=languages,
+        allow_path_regexes=None,
+        deny_path_regexes=None,
+        path_regexes=None,
+    )
+
+
+def _result(path: str = "src/a.py") -> QueryResult:
+    return QueryResult(path, "python", "pass", 1, 1, 0.5)
+
+
+def test_cache_returns_copies_and_counts_hits() -> None:
+    cache = QueryResultCache()
+    assert cache.get(_key(KEY_A)) is None
+    cache.put(_key(KEY_A), [_result()])
+
+    first = cache.get(_key(KEY_A))
+    assert first == [_result()]
+    first[0].score = 0.0
+    assert cache.get(_key(KEY_A)) == [_result()]
+    assert cache.get(_key(KEY_A, languages=["python"])) is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_retiring_a_storage_key_drops_only_its_entries() -> None:
+    cache = QueryResultCache()
+    cache.put(_key(KEY_A), [_result()])
+    cache.put(_key(KEY_A, offset=10), [])
+    cache.put(_key(KEY_B), [_result("src/b.py")])
+
+    assert cache.retire_storage_key(KEY_A) == 2
+    assert cache.retire_storage_key(KEY_A) == 0
+    assert cache.get(_key(KEY_A)) is None
+    assert cache.get(_key(KEY_B)) == [_result("src/b.py")]
+    assert cache.stats()["storage_keys"] == 1
+
+
+def test_lru_eviction_keeps_storage_key_index_consistent() -> None:
+    cache = QueryResultCache(max_entries=1)
+    cache.put(_key(KEY_A), [])
+    cache.put(_key(KEY_B), [])
+
+    assert len(cache) == 1
+    assert cache.stats()["storage_keys"] == 1
+    assert cache.retire_storage_key(KEY_A) == 0
+    with pytest.raises(ValueError):
+        QueryResultCache(max_entries=0)
@@ -8,6 +8,7 @@ from uuid import UUID
 
 import pytest
 
+from code_search_pkg.query_cache import QueryResultCache
 from code_search_pkg.query_pg import (
     QueryProviderContract,
     QueryableIndex,
@@ -265,3 +266,28 @@ async def test_query_has_no_legacy_fallback_on_missing_storage() -> None:
         await query_codebase_pg(pool, STORAGE_KEY, [0.1])
     assert len(pool.calls) == 1
     assert "code_chunks__i_" in pool.calls[0][0]
+
+
+@pytest.mark.asyncio
+async def test_query_cache_skips_repeated_statements_for_same_storage() -> None:
+    pool = _FakePool(
+        rows=[
+            {
+                "file_path": "agent-coordinator/src/locks.py",
+                "language": "python",
+                "content": "def release(): ...",
+                "start_line": 10,
+                "end_line": 20,
+                "score": 0.5,
+            }
+        ]
+    )
+    cache = QueryResultCache()
+
+    first = await query_codebase_pg(pool, STORAGE_KEY, [0.1, 0.2], cache=cache)
+    second = await query_codebase_pg(pool, STORAGE_KEY, [0.1, 0.2], cache=cache)
+    await query_codebase_pg(pool, STORAGE_KEY, [0.1, 0.2], offset=1, cache=cache)
+
+    assert first == second
+    assert len(pool.calls) == 2
+    assert cache.stats()["hits"] == 1
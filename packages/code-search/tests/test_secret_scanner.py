@@ -132,3 +132,128 @@ def test_scanner_converts_unexpected_internal_errors_to_sanitized_failure() -> N
 
     assert caught.value.code == "scanner_error"
     assert "raw" not in str(caught.value)
+
+
+@pytest.mark.parametrize(
+    "content,rule_id",
+    [
+        (b"ordinary source\n", None),
+        (b"PASSWORD: " + b"y" * 24, "credential_assignment"),
+        (b"eyJ" + b"a" * 8 + b"." + b"b" * 8 + b"." + b"c" * 8, "jwt"),
+        (
+            b"token = eyJ"
+            + b"a" * 8
+            + b"."
+            + b"b" * 8
+            + b"."
+            + b"c" * 8
+            + b"\n-----BEGIN "
+            + b"PRIVATE KEY-----\n",
+            "private_key",
+        ),
+    ],
+)
+def test_single_pass_scan_keeps_first_rule_attribution(
+    content: bytes,
+    rule_id: str | None,
+) -> None:
+    from code_search_pkg.secret_scanner import _RULES
+
+    expected = next(
+        (rule for rule, pattern in _RULES if pattern.search(content) is not None),
+        None,
+    )
+
+    result = LocalSecretScanner().scan_bytes(content)
+
+    assert expected == rule_id
+    assert result.rule_id == rule_id
+    assert result.status is (
+        SecretScanStatus.CLEAN if rule_id is None else SecretScanStatus.FINDING
+    )
+
+
+def test_scan_many_returns_results_in_input_order() -> None:
+    scanner = LocalSecretScanner()
+
+    results = scanner.scan_many(
+        [b"clean", b"access = " + b"AKIA" + b"A" * 16, b"also clean"]
+    )
+
+    assert [result.rule_id for result in results] == [None, "aws_access_key", None]
+
+
+def test_parallel_scan_many_matches_serial_and_sanitizes_failures() -> None:
+    contents = [
+        b"clean\n" * 100,
+        b"password = '" + b"x" * 32 + b"'",
+        b"def f():\n    return 1\n",
+    ]
+    with LocalSecretScanner(workers=2) as scanner:
+        results = scanner.scan_many(contents)
+        assert [result.rule_id for result in results] == [
+            None,
+            "credential_assignment",
+            None,
+        ]
+
+    with (
+        LocalSecretScanner(workers=2, max_file_bytes=8) as scanner,
+        pytest.raises(SecretScanError) as caught,
+    ):
+        scanner.scan_many([b"short", b"123456789"])
+
+    assert caught.value.code == "scanner_input_too_large"
+    assert "123456789" not in str(caught.value)
+
+
+def test_parallel_scan_many_fails_closed_when_operation_deadline_elapsed() -> None:
+    scanner = LocalSecretScanner(workers=2, clock=_clock([10.0]))
+
+    with pytest.raises(SecretScanError) as caught:
+        scanner.scan_many([b"first", b"second"], operation_deadline=9.0)
+
+    assert caught.value.code == "scanner_timeout"
+    scanner.close()
+
+
+def test_scanner_rejects_non_positive_workers() -> None:
+    with pytest.raises(ValueError):
+        LocalSecretScanner(workers=0)
+
+
+def test_fingerprint_pins_rules_identity_and_bound() -> None:
+    import re
+
+    from code_search_pkg import secret_scanner
+
+    baseline = LocalSecretScanner().fingerprint
+    assert len(baseline) == 64
+    assert LocalSecretScanner(workers=2, per_file_timeout_seconds=1.0).fingerprint == (
+        baseline
+    )
+    assert LocalSecretScanner(max_file_bytes=1024).fingerprint != baseline
+
+    class CustomScanner(LocalSecretScanner):
+        pass
+
+    assert CustomScanner().fingerprint != baseline
+
+    extended = secret_scanner._RULES + (("extra", re.compile(rb"extra")),)
+    assert secret_scanner._rules_digest(extended) != secret_scanner._RULES_DIGEST
+    flags_changed = tuple(
+        (rule_id, re.compile(pattern.pattern, pattern.flags ^ re.IGNORECASE))
+        for rule_id, pattern in secret_scanner._RULES
+    )
+    assert secret_scanner._rules_digest(flags_changed) != secret_scanner._RULES_DIGEST
+
+
+def test_scanner_fingerprint_is_none_for_unpinned_scanners() -> None:
+    from code_search_pkg.secret_scanner import scanner_fingerprint
+
+    class Unpinned:
+        def scan_bytes(self, content: bytes) -> object:
+            return None
+
+    assert scanner_fingerprint(Unpinned()) is None
+    assert scanner_fingerprint(LocalSecretScanner()) == LocalSecretScanner().fingerprint
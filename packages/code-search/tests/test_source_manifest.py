@@ -22,6 +22,8 @@ from code_search_pkg.source_proof import SourceProofError
 
 
 class RecordingScanner:
+    fingerprint = "5" * 64
+
     def __init__(self) -> None:
         self.contents: list[bytes] = []
 
@@ -176,6 +178,131 @@ def test_compatible_parent_copies_only_same_path_blob_type_content_and_chunk_set
     same = next(entry for entry in second.files if entry.path == "src/same.py")
     assert same.parent_chunk_digest == "d" * 64
     assert same.parent_chunk_count == 1
+    assert same.reused_by_blob_id is False
+    assert second.unread_paths == ()
+
+
+def test_same_policy_parent_skips_reading_unchanged_blob_ids(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = init_repo(tmp_path)
+    (repo / "src").mkdir()
+    (repo / "src" / "same.py").write_bytes(b"SAME = 1\n")
+    (repo / "src" / "changed.py").write_bytes(b"VALUE = 1\n")
+    first_revision = commit_all(repo, "first")
+    policy = permissive_policy()
+    first = build_source_manifest(repo, first_revision, policy, RecordingScanner())
+    parent_manifest = tuple(
+        FileManifestEntry(
+            file_path=entry.path,
+            git_blob_id=entry.git_blob_id,
+            git_entry_type=entry.git_entry_type,
+            eligible=True,
+            eligibility_reason="eligible",
+            content_digest=entry.content_digest,
+            chunk_digest="d" * 64,
+            chunk_count=1,
+            scanner_fingerprint=RecordingScanner.fingerprint,
+        )
+        for entry in first.files
+    )
+    (repo / "src" / "changed.py").write_bytes(b"VALUE = 2\n")
+    second_revision = commit_all(repo, "second")
+
+    from code_search_pkg import source_manifest
+
+    original_read_blob = source_manifest._read_blob
+    read_blob_ids: list[str] = []
+
+    def recording_read_blob(reader, blob_id: str) -> bytes:
+        read_blob_ids.append(blob_id)
+        return original_read_blob(reader, blob_id)
+
+    monkeypatch.setattr(source_manifest, "_read_blob", recording_read_blob)
+    scanner = RecordingScanner()
+    plan = build_source_manifest(
+        repo,
+        second_revision,
+        policy,
+        scanner,
+        parent_manifest=parent_manifest,
+        parent_policy_fingerprint=policy.fingerprint,
+    )
+
+    by_path = {entry.path: entry for entry in plan.files}
+    same = by_path["src/same.py"]
+    assert plan.copied_paths == ("src/same.py",)
+    assert plan.changed_paths == ("src/changed.py",)
+    assert plan.unread_paths == ("src/same.py",)
+    assert same.reused_by_blob_id is True
+    assert same.content_digest == next(
+        entry.content_digest for entry in first.files if entry.path == "src/same.py"
+    )
+    assert same.parent_chunk_digest == "d" * 64
+    assert read_blob_ids == [by_path["src/changed.py"].git_blob_id]
+    assert scanner.contents == [b"VALUE = 2\n"]
+
+
+def test_blob_id_fast_path_requires_matching_policy_and_valid_parent(
+    tmp_path: Path,
+) -> None:
+    repo = init_repo(tmp_path)
+    (repo / "app.py").write_bytes(b"VALUE = 1\n")
+    revision = commit_all(repo, "first")
+    policy = permissive_policy()
+    current = build_source_manifest(repo, revision, policy, RecordingScanner()).files[0]
+
+    def parent(**overrides: object) -> SimpleNamespace:
+        values: dict[str, object] = {
+            "file_path": current.path,
+            "git_blob_id": current.git_blob_id,
+            "git_entry_type": current.git_entry_type,
+            "eligible": True,
+            "content_digest": current.content_digest,
+            "chunk_digest": "d" * 64,
+            "chunk_count": 1,
+            "scanner_fingerprint": RecordingScanner.fingerprint,
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    other_policy = IndexingPolicy(include=("**",), read_allow=("**",), deny=("x",))
+    for entry, fingerprint in (
+        (parent(), other_policy.fingerprint),
+        (parent(), None),
+        (parent(content_digest="not-a-digest"), policy.fingerprint),
+        (parent(content_digest=None), policy.fingerprint),
+        (parent(scanner_fingerprint=None), policy.fingerprint),
+        (parent(scanner_fingerprint="e" * 64), policy.fingerprint),
+    ):
+        scanner = RecordingScanner()
+        plan = build_source_manifest(
+            repo,
+            revision,
+            policy,
+            scanner,
+            parent_manifest=(entry,),
+            parent_policy_fingerprint=fingerprint,
+        )
+        assert plan.unread_paths == ()
+        assert scanner.contents == [b"VALUE = 1\n"]
+
+    class UnpinnedScanner(RecordingScanner):
+        fingerprint = None
+
+    scanner = UnpinnedScanner()
+    plan = build_source_manifest(
+        repo,
+        revision,
+        policy,
+        scanner,
+        parent_manifest=(parent(scanner_fingerprint=None),),
+        parent_policy_fingerprint=policy.fingerprint,
+    )
+    assert plan.unread_paths == ()
+    assert plan.scanner_fingerprint is None
+    assert scanner.contents == [b"VALUE = 1\n"]
 
 
 def test_invalid_parent_chunk_digest_forces_changed_file(tmp_path: Path) -> None:
@@ -304,6 +431,48 @@ def test_scanner_findings_and_failures_abort_without_source_evidence(
     assert "raw source" not in str(caught.value)
 
 
+def test_batch_capable_scanner_receives_read_blobs_in_batches(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = init_repo(tmp_path)
+    for index in range(5):
+        (repo / f"m{index}.py").write_bytes(f"VALUE = {index}\n".encode())
+    (repo / "secret.py").write_bytes(b"FLAGGED\n")
+    revision = commit_all(repo, "first")
+
+    class BatchScanner(RecordingScanner):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: list[list[bytes]] = []
+
+        def scan_many(self, contents: list[bytes]) -> tuple[SecretScanResult, ...]:
+            self.batches.append(list(contents))
+            return tuple(
+                SecretScanResult(SecretScanStatus.FINDING, "secret_detected", "t")
+                if content == b"FLAGGED\n"
+                else SecretScanResult(SecretScanStatus.CLEAN, "clean")
+                for content in contents
+            )
+
+    from code_search_pkg import source_manifest
+
+    monkeypatch.setattr(source_manifest, "_SCAN_BATCH_FILES", 2)
+    scanner = BatchScanner()
+    policy = IndexingPolicy(include=("m*.py",), read_allow=("m*.py",))
+    plan = build_source_manifest(repo, revision, policy, scanner)
+    serial = build_source_manifest(repo, revision, policy, RecordingScanner())
+
+    assert [len(batch) for batch in scanner.batches] == [2, 2]
+    assert scanner.contents == [b"VALUE = 4\n"]
+    assert plan == serial
+
+    with pytest.raises(SourceManifestError) as caught:
+        build_source_manifest(repo, revision, permissive_policy(), BatchScanner())
+
+    assert caught.value.code == "secret_detected"
+
+
 def test_dirty_or_mismatched_worktree_is_rejected_before_enumeration(
     tmp_path: Path,
 ) -> None:
@@ -319,3 +488,85 @@ def test_dirty_or_mismatched_worktree_is_rejected_before_enumeration(
             permissive_policy(),
             RecordingScanner(),
         )
+
+
+def test_blobs_are_read_through_one_batch_process(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo = init_repo(tmp_path)
+    contents = {
+        f"m{index}.py": f"VALUE = {index}\n".encode() * 5000 for index in range(5)
+    }
+    contents["empty.py"] = b""
+    contents["nl.py"] = b"\n\n"
+    for name, content in contents.items():
+        (repo / name).write_bytes(content)
+    revision = commit_all(repo, "many")
+    scanner = RecordingScanner()
+
+    from code_search_pkg import source_manifest
+
+    spawned: list[list[str]] = []
+    original_popen = subprocess.Popen
+
+    def recording_popen(args: list[str], **kwargs: object) -> subprocess.Popen[bytes]:
+        spawned.append(list(args))
+        return original_popen(args, **kwargs)  # type: ignore[call-overload, no-any-return]
+
+    monkeypatch.setattr(source_manifest.subprocess, "Popen", recording_popen)
+    plan = build_source_manifest(repo, revision, permissive_policy(), scanner)
+
+    cat_file_calls = [
+        args[args.index("cat-file") :] for args in spawned if "cat-file" in args
+    ]
+    assert cat_file_calls == [["cat-file", "--batch"]]
+    assert sorted(scanner.contents) == sorted(contents.values())
+    assert len(plan.changed_paths) == len(contents)
+
+
+def test_batch_reader_fails_closed_on_missing_object_and_stays_poisoned(
+    tmp_path: Path,
+) -> None:
+    repo = init_repo(tmp_path)
+    (repo / "app.py").write_bytes(b"VALUE = 1\n")
+    commit_all(repo, "first")
+    blob_id = subprocess.run(
+        ["git", "-C", str(repo), "rev-parse", "HEAD:app.py"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    from code_search_pkg.source_manifest import _BatchBlobReader
+
+    with _BatchBlobReader(repo) as reader:
+        assert reader.read(blob_id) == b"VALUE = 1\n"
+        with pytest.raises(SourceManifestError) as caught:
+            reader.read("0" * 40)
+        assert caught.value.code == "git_manifest_failed"
+        with pytest.raises(SourceManifestError):
+            reader.read(blob_id)
+
+    with _BatchBlobReader(repo) as reader, pytest.raises(SourceManifestError):
+        reader.read(f"{blob_id}\nHEAD")
+
+
+def test_batch_reader_times_out_on_stalled_git(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_bin = tmp_path / "bin"
+    fake_bin.mkdir()
+    fake_git = fake_bin / "git"
+    fake_git.write_text("#!/bin/sh\nexec sleep 30\n")
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{fake_bin}{os.pathsep}{os.environ['PATH']}")
+
+    from code_search_pkg.source_manifest import _BatchBlobReader
+
+    reader = _BatchBlobReader(tmp_path, timeout=0.2)
+    with pytest.raises(SourceManifestError) as caught:
+        reader.read("a" * 40)
+    assert caught.value.code == "git_manifest_failed"
+    assert reader._process is None
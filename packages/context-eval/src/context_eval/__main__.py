@@ -45,6 +45,7 @@ from .producers import scope_adapter
 from .producers.exact_search import (
     ApparatusError,
     ExactSearchProducer,
+    IndexedFileSearcher,
     RipgrepSearcher,
     TrackedFileSearcher,
 )
@@ -71,7 +72,7 @@ EXIT_REPORT_UNUSABLE = EXIT_GATE_FAILURE + 1
 
 INDEX_TIERS = ("none", "seeded", "live")
 TRANSPORTS = ("mcp", "http", "none")
-SEARCHERS = ("ripgrep", "tracked")
+SEARCHERS = ("ripgrep", "tracked", "indexed")
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -277,6 +278,10 @@ def _producers(args: argparse.Namespace, corpus: Corpus) -> dict[str, Any]:
     searcher: Any
     if args.searcher == "ripgrep":
         searcher = RipgrepSearcher(repository_root=args.repository_root)
+    elif args.searcher == "indexed":
+        searcher = IndexedFileSearcher(
+            repository_root=args.repository_root, revision=args.evaluated_revision
+        )
     else:
         searcher = TrackedFileSearcher(repository_root=args.repository_root)
 
@@ -33,6 +33,8 @@ one is written here as a literal.
 
 from __future__ import annotations
 
+import base64
+import json
 import re
 import subprocess
 from collections import Counter
@@ -141,6 +143,25 @@ class Searcher(Protocol):
         """Repository-relative path -> number of matching lines."""
 
 
+class BatchSearcher(Searcher, Protocol):
+    """A backend that can answer several terms with one search.
+
+    Optional: :meth:`ExactSearchProducer.rank` uses it when the injected backend
+    provides it and asks term by term otherwise. Every term in the result maps
+    to exactly what :meth:`Searcher.term_matches` would have returned for it.
+    """
+
+    def terms_matches(
+        self, terms: Sequence[str]
+    ) -> Mapping[str, Mapping[str, tuple[int, ...]]]:
+        """Term -> (repository-relative path -> sorted 1-based matching lines)."""
+
+
+#: A term rg and Python's ``re`` read identically, so a line rg reports for the
+#: combined search can be attributed back to each term without a second search.
+_PLAIN_TERM = re.compile(r"\w+")
+
+
 @dataclass(frozen=True)
 class RipgrepSearcher:
     """``run_eval.py``'s backend, with its silent-failure reflex removed.
@@ -153,9 +174,33 @@ class RipgrepSearcher:
     repository_root: Path
     executable: str = "rg"
     timeout_seconds: int = SEARCH_TIMEOUT_SECONDS
+    #: Per-term results, reused by every later query that shares the term, so
+    #: a corpus run costs one search per distinct term rather than per case.
+    _term_cache: dict[str, Mapping[str, tuple[int, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def term_matches(self, term: str) -> Mapping[str, tuple[int, ...]]:
-        return self._run(["-e", term])
+        return self.terms_matches((term,))[term]
+
+    def terms_matches(
+        self, terms: Sequence[str]
+    ) -> Mapping[str, Mapping[str, tuple[int, ...]]]:
+        """Answer every uncached term of *terms* with one ``rg --json`` run.
+
+        Terms rg and ``re`` might read differently are searched on their own,
+        where attribution is trivial; everything else shares one process.
+        """
+        missing = tuple(dict.fromkeys(term for term in terms if term not in self._term_cache))
+        batched = tuple(term for term in missing if _PLAIN_TERM.fullmatch(term))
+        if len(batched) == 1:
+            batched = ()
+        if batched:
+            self._term_cache.update(self._run_terms(batched))
+        for term in missing:
+            if term not in batched:
+                self._term_cache[term] = self._run(["-e", term])
+        return {term: self._term_cache[term] for term in terms}
 
     def phrase_matches(self, phrase: str) -> Mapping[str, tuple[int, ...]]:
         return self._run(["-F", "-e", phrase])
@@ -164,16 +209,20 @@ class RipgrepSearcher:
         return {path: len(lines) for path, lines in self.term_matches(term).items()}
 
     def _run(self, pattern_args: Sequence[str]) -> Mapping[str, tuple[int, ...]]:
-        command = [
-            self.executable,
-            "--line-number",
-            "--no-heading",
-            "--with-filename",
-            "--ignore-case",
-            *pattern_args,
-            "--",
-            ".",
-        ]
+        stdout = self._invoke(
+            ["--line-number", "--no-heading", "--with-filename", *pattern_args]
+        )
+        return _group_lines(_parse_grep_lines(stdout))
+
+    def _run_terms(
+        self, terms: Sequence[str]
+    ) -> Mapping[str, Mapping[str, tuple[int, ...]]]:
+        pattern_args = [argument for term in terms for argument in ("-e", term)]
+        stdout = self._invoke(["--json", *pattern_args])
+        return _attribute_json_matches(stdout, terms)
+
+    def _invoke(self, arguments: Sequence[str]) -> str:
+        command = [self.executable, "--ignore-case", *arguments, "--", "."]
         try:
             completed = subprocess.run(
                 command,
@@ -195,7 +244,7 @@ class RipgrepSearcher:
             raise ApparatusError(
                 f"{self.executable} exited {completed.returncode}: {completed.stderr.strip()}"
             )
-        return _group_lines(_parse_grep_lines(completed.stdout))
+        return completed.stdout
 
 
 @dataclass(frozen=True)
@@ -276,6 +325,114 @@ class TrackedFileSearcher:
         return found
 
 
+#: Maximal runs of the only characters a query term can contain. Every
+#: occurrence of a term inside a lowercased line lies wholly within one run, so
+#: "the runs that contain the term" is an exact substitute for scanning lines.
+_TOKEN_PATTERN = re.compile(r"[a-z_]+")
+
+#: Built indexes, shared across searchers that name the same root and revision.
+_INDEX_CACHE: dict[tuple[Path | None, str, tuple[str, ...] | None], _PostingsIndex] = {}
+
+
+@dataclass(frozen=True)
+class _PostingsIndex:
+    """Lowercased lines and line-level token postings for one tracked tree."""
+
+    lines: Mapping[str, tuple[str, ...]]
+    postings: Mapping[str, Mapping[str, tuple[int, ...]]]
+    vocabulary: tuple[str, ...]
+
+    @classmethod
+    def build(cls, texts: Mapping[str, str]) -> _PostingsIndex:
+        lines: dict[str, tuple[str, ...]] = {}
+        postings: dict[str, dict[str, list[int]]] = {}
+        for relative, text in texts.items():
+            lowered = tuple(line.lower() for line in text.splitlines())
+            lines[relative] = lowered
+            for number, line in enumerate(lowered, start=1):
+                for token in dict.fromkeys(_TOKEN_PATTERN.findall(line)):
+                    postings.setdefault(token, {}).setdefault(relative, []).append(number)
+        return cls(
+            lines=lines,
+            postings={
+                token: {path: tuple(numbers) for path, numbers in by_path.items()}
+                for token, by_path in postings.items()
+            },
+            vocabulary=tuple(sorted(postings)),
+        )
+
+    def search(self, needle: str) -> Mapping[str, tuple[int, ...]]:
+        if not _TOKEN_PATTERN.fullmatch(needle):
+            return self._scan(needle)
+        found: dict[str, set[int]] = {}
+        for token in self.vocabulary:
+            if needle in token:
+                for path, numbers in self.postings[token].items():
+                    found.setdefault(path, set()).update(numbers)
+        return {path: tuple(sorted(numbers)) for path, numbers in sorted(found.items())}
+
+    def _scan(self, needle: str) -> Mapping[str, tuple[int, ...]]:
+        found: dict[str, tuple[int, ...]] = {}
+        for relative, lines in sorted(self.lines.items()):
+            matched = tuple(
+                number for number, line in enumerate(lines, start=1) if needle in line
+            )
+            if matched:
+                found[relative] = matched
+        return found
+
+
+@dataclass(frozen=True)
+class IndexedFileSearcher(TrackedFileSearcher):
+    """:class:`TrackedFileSearcher` over an in-memory postings index.
+
+    The tracked backend re-reads and lowercases the whole checkout for every
+    term, and ``ExactSearchProducer.rank`` asks once per term per query. This
+    backend reads the tree once, records which lines each ``[a-z_]+`` run
+    appears on, and answers from memory. Match semantics are the tracked
+    backend's exactly — a case-insensitive substring of a line — so the two
+    produce identical rankings: a term is looked up in every indexed run that
+    contains it, and anything that is not a plain term (a phrase, say) is
+    scanned over the lowercased lines already held.
+
+    With *revision* set, the index is shared by every searcher naming the same
+    root, revision and file list, so repeated runs in one process build it once.
+    Without it, the index lives only as long as this searcher.
+    """
+
+    revision: str | None = None
+    _index: _PostingsIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _search(self, needle: str) -> Mapping[str, tuple[int, ...]]:
+        return self.index().search(needle)
+
+    def index(self) -> _PostingsIndex:
+        if self._index is None:
+            key = (self.repository_root, self.revision, self.file_list)
+            index = _INDEX_CACHE.get(key) if self.revision is not None else None
+            if index is None:
+                index = _PostingsIndex.build(self._read_tracked())
+                if self.revision is not None:
+                    _INDEX_CACHE[key] = index
+            object.__setattr__(self, "_index", index)
+        assert self._index is not None
+        return self._index
+
+    def _read_tracked(self) -> Mapping[str, str]:
+        tracked = self.files()
+        if not tracked:
+            return {}
+        root = self._root()
+        texts: dict[str, str] = {}
+        for relative in tracked:
+            try:
+                texts[relative] = (root / relative).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                # Unreadable tracked paths are skipped, as TrackedFileSearcher does.
+                continue
+        return texts
+
+
 def _parse_grep_lines(stdout: str) -> list[tuple[str, int]]:
     """``./path:12:content`` -> ``("path", 12)``, ignoring anything unparseable."""
     parsed: list[tuple[str, int]] = []
@@ -295,6 +452,45 @@ def _parse_grep_lines(stdout: str) -> list[tuple[str, int]]:
     return parsed
 
 
+def _json_text(value: Mapping[str, str]) -> str:
+    """rg's ``{"text": ...}`` or, for non-UTF-8 data, ``{"bytes": <base64>}``."""
+    if "text" in value:
+        return value["text"]
+    return base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="replace")
+
+
+def _attribute_json_matches(
+    stdout: str, terms: Sequence[str]
+) -> Mapping[str, Mapping[str, tuple[int, ...]]]:
+    """Split one multi-pattern ``rg --json`` run back into per-term line sets.
+
+    rg reports a line once however many patterns it matched, and its
+    submatches never overlap, so one term can hide another inside the same
+    word. Each reported line is therefore re-tested against every term, with
+    the same case-insensitive reading rg applied.
+    """
+    patterns = [(term, re.compile(term, re.IGNORECASE)) for term in terms]
+    pairs: dict[str, list[tuple[str, int]]] = {term: [] for term in terms}
+    for raw in stdout.splitlines():
+        try:
+            message = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(message, dict) or message.get("type") != "match":
+            continue
+        data = message.get("data", {})
+        line_number = data.get("line_number")
+        if not isinstance(line_number, int):
+            continue
+        path = _json_text(data.get("path", {}))
+        normalized = path[len("./") :] if path.startswith("./") else path
+        line = _json_text(data.get("lines", {}))
+        for term, pattern in patterns:
+            if pattern.search(line):
+                pairs[term].append((normalized, line_number))
+    return {term: _group_lines(found) for term, found in pairs.items()}
+
+
 def _group_lines(pairs: Sequence[tuple[str, int]]) -> Mapping[str, tuple[int, ...]]:
     grouped: dict[str, list[int]] = {}
     for path, line_number in pairs:
@@ -341,11 +537,18 @@ class ExactSearchProducer:
         if not terms:
             return ()
 
+        batch = getattr(self.searcher, "terms_matches", None)
+        by_term: Mapping[str, Mapping[str, tuple[int, ...]]] = (
+            batch(terms)
+            if batch is not None
+            else {term: self.searcher.term_matches(term) for term in terms}
+        )
+
         distinct: Counter[str] = Counter()
         total: Counter[str] = Counter()
         lines: dict[str, set[int]] = {}
         for term in terms:
-            for file_path, matched in sorted(self.searcher.term_matches(term).items()):
+            for file_path, matched in sorted(by_term[term].items()):
                 if not is_rankable(file_path):
                     continue
                 distinct[file_path] += 1
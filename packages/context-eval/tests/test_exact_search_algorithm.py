@@ -55,6 +55,8 @@ under measurement is the committed content.
 
 from __future__ import annotations
 
+import base64
+import json
 import shutil
 import subprocess
 import sys
@@ -74,9 +76,11 @@ from context_eval.loader import load_corpus  # noqa: E402
 from context_eval.models import Budget  # noqa: E402
 from context_eval.producers.exact_search import (  # noqa: E402
     ExactSearchProducer,
+    IndexedFileSearcher,
     RenderedHit,
     RipgrepSearcher,
     TrackedFileSearcher,
+    _attribute_json_matches,
     apply_budget,
     query_terms,
 )
@@ -408,3 +412,83 @@ def test_the_ripgrep_backend_produces_the_same_ranking(checkout: Path, budget: B
         for entry in ripgrep.rank(QUERY)
     )
     assert observed == EXPECTED_RANKING
+
+
+def test_one_multi_pattern_search_is_attributed_back_to_each_term() -> None:
+    """rg reports ``Locks`` once; both ``lock`` and ``locks`` still own that line."""
+    stdout = "\n".join(
+        json.dumps(message)
+        for message in (
+            {"type": "begin", "data": {"path": {"text": "./a.py"}}},
+            {
+                "type": "match",
+                "data": {
+                    "path": {"text": "./a.py"},
+                    "lines": {"text": "Locks expire\n"},
+                    "line_number": 3,
+                    "submatches": [{"match": {"text": "Locks"}, "start": 0, "end": 5}],
+                },
+            },
+            {
+                "type": "match",
+                "data": {
+                    "path": {"text": "./b.py"},
+                    "lines": {"bytes": base64.b64encode(b"after \xff LOCK\n").decode()},
+                    "line_number": 7,
+                    "submatches": [],
+                },
+            },
+            {"type": "summary", "data": {}},
+        )
+    )
+    assert _attribute_json_matches(stdout, ("after", "lock", "locks")) == {
+        "after": {"b.py": (7,)},
+        "lock": {"a.py": (3,), "b.py": (7,)},
+        "locks": {"a.py": (3,)},
+    }
+
+
+@pytest.mark.skipif(not _ripgrep_available(), reason="ripgrep is not installed")
+def test_batched_ripgrep_terms_match_per_term_searches_and_are_reused(checkout: Path) -> None:
+    searcher = RipgrepSearcher(repository_root=checkout)
+    terms = query_terms(QUERY)
+    batched = searcher.terms_matches(terms)
+
+    for term in terms:
+        assert batched[term] == RipgrepSearcher(repository_root=checkout).term_matches(term)
+    assert searcher.terms_matches(terms[:2]) == {term: batched[term] for term in terms[:2]}
+
+
+def test_the_indexed_backend_produces_identical_rankings_and_arms(
+    checkout: Path, budget: Budget, fixture_files: tuple[str, ...], producer
+) -> None:
+    """The postings index is a speed-up of the tracked backend, never a variant of it."""
+    indexed = ExactSearchProducer(
+        repository_root=checkout,
+        budget=budget,
+        searcher=IndexedFileSearcher(repository_root=checkout, file_list=fixture_files),
+    )
+    for query in (QUERY, "release the lease", "lock after", "_"):
+        assert indexed.rank(query) == producer.rank(query)
+        assert indexed.rank_phrase(query) == producer.rank_phrase(query)
+        assert indexed.render(query) == producer.render(query)
+        assert indexed.render_naive_phrase(query) == producer.render_naive_phrase(query)
+
+
+def test_the_indexed_backend_reads_the_tree_once(
+    checkout: Path, fixture_files: tuple[str, ...], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    searcher = IndexedFileSearcher(repository_root=checkout, file_list=fixture_files)
+    reads: list[str] = []
+    original = Path.read_text
+
+    def counting_read_text(self: Path, *args, **kwargs) -> str:
+        reads.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    for term in query_terms(QUERY):
+        searcher.term_matches(term)
+    searcher.phrase_matches(QUERY)
+
+    assert sorted(reads) == sorted(fixture_files)
@@ -4,14 +4,22 @@ Each adapter discovers sessions from its vendor-specific source and
 normalizes raw events into NormalizedEvent instances.  All adapters MUST
 fail soft (log a structured warning and skip) when their source is
 unavailable.
+
+File-backed adapters stream: ``iter_session`` reads the transcript one line
+at a time and yields each event as soon as it is normalized, so a session is
+never held in memory as raw text plus a parsed event list at once.
+``normalize_session`` remains the list-returning entry point.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 # Allow importing normalize from the parent scripts directory
 _SCRIPTS_DIR = Path(__file__).resolve().parent.parent
@@ -40,7 +48,9 @@ class AdapterBase(ABC):
     - ``normalize_session(session_id)`` — produce NormalizedEvent stream
 
     Both methods MUST fail soft: log a structured warning and return
-    empty results when the source is unavailable.
+    empty results when the source is unavailable.  Adapters that can
+    stream also override ``iter_session(session_id)``; the default
+    implementation just iterates ``normalize_session``.
     """
 
     # Subclasses set this to their harness identifier (e.g. "claude_code_cli")
@@ -67,6 +77,36 @@ class AdapterBase(ABC):
         """
         ...
 
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
+        """Yield a session's NormalizedEvent instances one at a time.
+
+        Same events, in the same order, as ``normalize_session``.
+        """
+        yield from self.normalize_session(session_id)
+
+    def _iter_jsonl(self, path: Path, session_id: str) -> Iterator[dict[str, Any]]:
+        """Stream the JSON object on each line of *path*.
+
+        Blank lines, malformed JSON, and non-object values are skipped.  An
+        I/O error logs a parse warning and ends the stream; records already
+        yielded stay valid.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        raw = json.loads(line)
+                    except json.JSONDecodeError as exc:
+                        logger.debug("Skipping malformed line in %s: %s", session_id, exc)
+                        continue
+                    if isinstance(raw, dict):
+                        yield raw
+        except (OSError, UnicodeDecodeError) as exc:
+            self._warn_parse_error(session_id, str(exc))
+
     def _warn_unavailable(self, reason: str) -> None:
         """Log a structured warning about source unavailability."""
         logger.warning(
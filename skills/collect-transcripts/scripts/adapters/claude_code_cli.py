@@ -18,6 +18,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -101,31 +102,18 @@ class ClaudeCodeCLIAdapter(AdapterBase):
     # ------------------------------------------------------------------
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         source_file = self._find_session_file(session_id)
         if source_file is None:
             self._warn_parse_error(session_id, "session file not found")
-            return []
+            return
 
-        try:
-            lines = source_file.read_text(encoding="utf-8").splitlines()
-        except OSError as exc:
-            self._warn_parse_error(session_id, str(exc))
-            return []
-
-        events: list[NormalizedEvent] = []
         seq = 0
         version = ""
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError as exc:
-                logger.debug("Skipping malformed line in %s: %s", session_id, exc)
-                continue
-
+        for raw in self._iter_jsonl(source_file, session_id):
             event_type = raw.get("type", "")
 
             if event_type == "summary":
@@ -133,22 +121,17 @@ class ClaudeCodeCLIAdapter(AdapterBase):
                 continue
 
             if event_type == "human":
-                event = self._parse_human_event(raw, session_id, seq, version)
-                events.append(event)
+                yield self._parse_human_event(raw, session_id, seq, version)
                 seq += 1
 
             elif event_type == "assistant":
-                event = self._parse_assistant_event(raw, session_id, seq, version)
-                events.append(event)
+                yield self._parse_assistant_event(raw, session_id, seq, version)
                 seq += 1
 
             elif event_type == "tool_result":
-                event = self._parse_tool_result_event(raw, session_id, seq, version)
-                events.append(event)
+                yield self._parse_tool_result_event(raw, session_id, seq, version)
                 seq += 1
 
-        return events
-
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
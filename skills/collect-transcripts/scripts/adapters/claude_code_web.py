@@ -19,6 +19,7 @@ import os
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 _SCRIPTS_DIR = Path(__file__).resolve().parent.parent
@@ -124,20 +125,19 @@ class ClaudeCodeWebAdapter(AdapterBase):
         return sessions
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         if not self._cli_available():
             self._warn_unavailable("claude CLI not found on PATH")
-            return []
+            return
 
         # Teleport the session to local disk
         if not self._teleport_session(session_id):
-            return []
+            return
 
-        # Delegate to the CLI adapter
+        # Delegate to the CLI adapter, re-tagging the harness as web
         cli_adapter = ClaudeCodeCLIAdapter(base_dir=self._base_dir)
-        events = cli_adapter.normalize_session(session_id)
-
-        # Re-tag the harness as web
-        for event in events:
+        for event in cli_adapter.iter_session(session_id):
             event.harness = self.HARNESS_ID
-
-        return events
+            yield event
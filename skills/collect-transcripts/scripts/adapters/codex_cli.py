@@ -21,6 +21,7 @@ import json
 import logging
 import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -101,30 +102,18 @@ class CodexCLIAdapter(AdapterBase):
     # ------------------------------------------------------------------
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         source_file = self._find_session_file(session_id)
         if source_file is None:
             self._warn_parse_error(session_id, "session file not found")
-            return []
+            return
 
-        try:
-            lines = source_file.read_text(encoding="utf-8").splitlines()
-        except OSError as exc:
-            self._warn_parse_error(session_id, str(exc))
-            return []
-
-        events: list[NormalizedEvent] = []
         seq = 0
         model = ""
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
+        for raw in self._iter_jsonl(source_file, session_id):
             line_type = raw.get("type", "")
 
             if line_type == "session_meta":
@@ -134,17 +123,15 @@ class CodexCLIAdapter(AdapterBase):
             if line_type == "event_msg":
                 event = self._parse_event_msg(raw, session_id, seq, model)
                 if event:
-                    events.append(event)
+                    yield event
                     seq += 1
 
             elif line_type == "response_item":
                 event = self._parse_response_item(raw, session_id, seq, model)
                 if event:
-                    events.append(event)
+                    yield event
                     seq += 1
 
-        return events
-
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
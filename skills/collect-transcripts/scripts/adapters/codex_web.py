@@ -16,6 +16,7 @@ import logging
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 _SCRIPTS_DIR = Path(__file__).resolve().parent.parent
@@ -106,19 +107,18 @@ class CodexWebAdapter(AdapterBase):
         return sessions
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         if not self._cli_available():
             self._warn_unavailable("codex CLI not found on PATH")
-            return []
+            return
 
         # Pull cloud sessions
         self._pull_cloud_sessions()
 
-        # Delegate to CLI adapter
+        # Delegate to CLI adapter, re-tagging as web
         cli_adapter = CodexCLIAdapter(base_dir=self._base_dir)
-        events = cli_adapter.normalize_session(session_id)
-
-        # Re-tag as web
-        for event in events:
+        for event in cli_adapter.iter_session(session_id):
             event.harness = self.HARNESS_ID
-
-        return events
+            yield event
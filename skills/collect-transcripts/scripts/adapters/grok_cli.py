@@ -21,6 +21,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -105,29 +106,17 @@ class GrokCLIAdapter(AdapterBase):
     # ------------------------------------------------------------------
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         source_file = self._find_session_file(session_id)
         if source_file is None:
             self._warn_parse_error(session_id, "session file not found")
-            return []
+            return
 
-        try:
-            lines = source_file.read_text(encoding="utf-8").splitlines()
-        except OSError as exc:
-            self._warn_parse_error(session_id, str(exc))
-            return []
-
-        events: list[NormalizedEvent] = []
         seq = 0
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                raw = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
+        for raw in self._iter_jsonl(source_file, session_id):
             # Skip the metadata header (sessionId present, no role).
             if "sessionId" in raw and "role" not in raw:
                 continue
@@ -135,11 +124,9 @@ class GrokCLIAdapter(AdapterBase):
             if "role" in raw:
                 event = self._parse_message_record(raw, session_id, seq)
                 if event is not None:
-                    events.append(event)
+                    yield event
                     seq += 1
 
-        return events
-
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
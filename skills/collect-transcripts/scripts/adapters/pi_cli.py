@@ -21,6 +21,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -113,30 +114,18 @@ class PiCLIAdapter(AdapterBase):
     # ------------------------------------------------------------------
 
     def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+        return list(self.iter_session(session_id))
+
+    def iter_session(self, session_id: str) -> Iterator[NormalizedEvent]:
         source_file = self._find_session_file(session_id)
         if source_file is None:
             self._warn_parse_error(session_id, "session file not found")
-            return []
-
-        try:
-            lines = source_file.read_text(encoding="utf-8").splitlines()
-        except OSError as exc:
-            self._warn_parse_error(session_id, str(exc))
-            return []
+            return
 
         session_model = ""
-        events: list[NormalizedEvent] = []
         seq = 0
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
+        for rec in self._iter_jsonl(source_file, session_id):
             etype = rec.get("type", "")
 
             if etype == "session":
@@ -147,11 +136,9 @@ class PiCLIAdapter(AdapterBase):
             if etype == "message_end":
                 event = self._parse_message_end(rec, session_id, seq, session_model)
                 if event is not None:
-                    events.append(event)
+                    yield event
                     seq += 1
 
-        return events
-
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -0,0 +1,222 @@
+"""Collect transcripts from every adapter into a sanitized JSONL spool.
+
+Steps 1-3 of the pipeline (discover, normalize, sanitize) as one streaming
+pass per session: each adapter's ``iter_session`` yields events as it reads
+the transcript, every event is sanitized as it arrives, and its JSONL line
+is written straight to the spool.  No step holds a whole session in memory,
+and sessions are spread across a process pool.
+
+Each session lands in ``<output-dir>/<harness>--<session-id>.jsonl`` (one
+``NormalizedEvent.to_jsonl_line`` per line), which ``triage.py --events-dir``
+and ``deep_analyze.py --events-file`` read incrementally.  A spool file is
+written under a temporary name and renamed into place, so a reader never
+sees a partial session.
+
+Usage:
+    python3 collect.py --output-dir docs/transcripts/2026-06-01/
+    python3 collect.py --adapter claude_code_cli --adapter codex_cli --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+from adapters.antigravity_cli import AntigravityCLIAdapter  # noqa: E402
+from adapters.base import AdapterBase  # noqa: E402
+from adapters.claude_code_cli import ClaudeCodeCLIAdapter  # noqa: E402
+from adapters.claude_code_web import ClaudeCodeWebAdapter  # noqa: E402
+from adapters.codex_cli import CodexCLIAdapter  # noqa: E402
+from adapters.codex_web import CodexWebAdapter  # noqa: E402
+from adapters.grok_cli import GrokCLIAdapter  # noqa: E402
+from adapters.pi_cli import PiCLIAdapter  # noqa: E402
+from sanitize_events import iter_sanitized_events  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+#: Adapter name (``HARNESS_ID``) -> adapter class, in collection order.
+ADAPTERS: dict[str, type[AdapterBase]] = {
+    cls.HARNESS_ID: cls
+    for cls in (
+        ClaudeCodeCLIAdapter,
+        ClaudeCodeWebAdapter,
+        CodexCLIAdapter,
+        CodexWebAdapter,
+        AntigravityCLIAdapter,
+        GrokCLIAdapter,
+        PiCLIAdapter,
+    )
+}
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+@dataclass
+class CollectResult:
+    """Outcome of spooling a single session."""
+    session_id: str = ""
+    harness: str = ""
+    output_path: str = ""
+    event_count: int = 0
+    redaction_count: int = 0
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def spool_path(output_dir: Path, harness: str, session_id: str) -> Path:
+    """Return the spool file for one session; unsafe characters become ``_``."""
+    name = f"{harness}--{session_id}"
+    return output_dir / f"{_UNSAFE_NAME_CHARS.sub('_', name)}.jsonl"
+
+
+def collect_session(
+    adapter: AdapterBase,
+    session_id: str,
+    output_dir: Path,
+) -> CollectResult:
+    """Stream one session through normalize -> sanitize into its spool file.
+
+    A session that yields no events writes no file.  Errors are reported on
+    the result rather than raised, so one bad session never aborts a run.
+    """
+    path = spool_path(output_dir, adapter.HARNESS_ID, session_id)
+    result = CollectResult(
+        session_id=session_id, harness=adapter.HARNESS_ID, output_path=str(path),
+    )
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            for event, redactions in iter_sanitized_events(
+                adapter.iter_session(session_id),
+            ):
+                out.write(event.to_jsonl_line())
+                out.write("\n")
+                result.event_count += 1
+                result.redaction_count += len(redactions)
+        if result.event_count:
+            os.replace(tmp_path, path)
+        else:
+            result.output_path = ""
+    except Exception as exc:  # noqa: BLE001 - fail soft per session
+        logger.warning(
+            "Collecting %s session %s failed: %s", adapter.HARNESS_ID, session_id, exc,
+        )
+        result.output_path = ""
+        result.error = str(exc)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return result
+
+
+def _collect_job(job: tuple[AdapterBase, str, str]) -> CollectResult:
+    """Process-pool entry point: unpack a job and spool its session."""
+    adapter, session_id, output_dir = job
+    return collect_session(adapter, session_id, Path(output_dir))
+
+
+def _resolve_jobs(jobs: int) -> int:
+    """``jobs <= 0`` means one worker per CPU."""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def collect(
+    adapters: list[AdapterBase],
+    output_dir: Path,
+    *,
+    jobs: int = 0,
+) -> list[CollectResult]:
+    """Discover every adapter's sessions and spool them into *output_dir*.
+
+    Sessions are spooled in parallel across ``jobs`` worker processes
+    (``<= 0`` uses one per CPU; ``1`` runs in-process).  Results come back
+    in discovery order.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pending: list[tuple[AdapterBase, str, str]] = [
+        (adapter, summary.session_id, str(output_dir))
+        for adapter in adapters
+        for summary in adapter.discover_sessions()
+    ]
+    if not pending:
+        return []
+
+    workers = min(_resolve_jobs(jobs), len(pending))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_collect_job, pending))
+    return [_collect_job(job) for job in pending]
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Collect, normalize, and sanitize transcripts into a JSONL spool"
+    )
+    parser.add_argument(
+        "--adapter",
+        action="append",
+        choices=sorted(ADAPTERS),
+        help="Adapter to collect from; repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default=None,
+        help="Spool directory (default: docs/transcripts/<today>/)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes across sessions (default: 0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output per-session results as JSON",
+    )
+    args = parser.parse_args(argv)
+
+    output_dir = Path(
+        args.output_dir
+        or Path("docs") / "transcripts" / datetime.date.today().isoformat()
+    )
+    adapters = [ADAPTERS[name]() for name in (args.adapter or ADAPTERS)]
+    results = collect(adapters, output_dir, jobs=args.jobs)
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], indent=2))
+    else:
+        spooled = [r for r in results if r.output_path]
+        print(
+            f"Spooled {len(spooled)} of {len(results)} sessions "
+            f"({sum(r.event_count for r in spooled)} events, "
+            f"{sum(r.redaction_count for r in results)} redactions) to {output_dir}"
+        )
+        for r in results:
+            if r.error:
+                print(f"  {r.harness} {r.session_id}: {r.error}", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
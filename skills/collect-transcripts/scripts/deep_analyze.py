@@ -27,7 +27,7 @@ _SCRIPTS_DIR = Path(__file__).resolve().parent
 if str(_SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS_DIR))
 
-from normalize import ContentType, EventRole, NormalizedEvent  # noqa: E402
+from normalize import ContentType, EventRole, NormalizedEvent, iter_events_file  # noqa: E402
 from triage import TriageScore  # noqa: E402
 
 
@@ -322,19 +322,7 @@ def main() -> int:
 
 def _load_events_file(path: Path) -> list[NormalizedEvent]:
     """Load NormalizedEvents from a JSONL file."""
-    events: list[NormalizedEvent] = []
-    try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(NormalizedEvent.from_jsonl_line(line))
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
-    except OSError:
-        pass
-    return events
+    return list(iter_events_file(path))
 
 
 if __name__ == "__main__":
@@ -8,8 +8,10 @@ operate on a single data shape.
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Any
 
 
@@ -171,3 +173,23 @@ class SessionSummary:
     start_time: str = ""
     event_count: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def iter_events_file(path: Path) -> Iterator[NormalizedEvent]:
+    """Stream NormalizedEvents from a JSONL spool file, one line at a time.
+
+    Blank and unparseable lines are skipped; an unreadable file yields
+    nothing.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield NormalizedEvent.from_jsonl_line(line)
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError):
+                    continue
+    except OSError:
+        return
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 # Import the session-log sanitizer
@@ -95,8 +96,20 @@ def sanitize_event(event: NormalizedEvent) -> tuple[NormalizedEvent, list[dict[s
     ), all_redactions
 
 
+def iter_sanitized_events(
+    events: Iterable[NormalizedEvent],
+) -> Iterator[tuple[NormalizedEvent, list[dict[str, str]]]]:
+    """Lazily sanitize an event stream, one event at a time.
+
+    Yields ``(sanitized_event, redactions)`` pairs, so a caller streaming
+    from an adapter to a spool never holds the whole session in memory.
+    """
+    for event in events:
+        yield sanitize_event(event)
+
+
 def sanitize_event_stream(
-    events: list[NormalizedEvent],
+    events: Iterable[NormalizedEvent],
 ) -> tuple[list[NormalizedEvent], list[dict[str, str]]]:
     """Sanitize a full stream of NormalizedEvents.
 
@@ -105,8 +118,7 @@ def sanitize_event_stream(
     all_redactions: list[dict[str, str]] = []
     sanitized_events: list[NormalizedEvent] = []
 
-    for event in events:
-        sanitized_event, redactions = sanitize_event(event)
+    for sanitized_event, redactions in iter_sanitized_events(events):
         sanitized_events.append(sanitized_event)
         all_redactions.extend(redactions)
 
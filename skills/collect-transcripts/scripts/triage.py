@@ -30,7 +30,7 @@ _SCRIPTS_DIR = Path(__file__).resolve().parent
 if str(_SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS_DIR))
 
-from normalize import ContentType, EventRole, NormalizedEvent  # noqa: E402
+from normalize import ContentType, EventRole, NormalizedEvent, iter_events_file  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -328,29 +328,30 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    # Load events
-    sessions: dict[str, list[NormalizedEvent]] = {}
-
+    # Score one spool file at a time so only a single session's events are
+    # in memory; a later file for the same session replaces the earlier score.
+    paths: list[Path] = []
     if args.events_file:
-        events = _load_events_file(Path(args.events_file))
-        if events:
-            sid = events[0].session_id or Path(args.events_file).stem
-            sessions[sid] = events
-
+        paths.append(Path(args.events_file))
     if args.events_dir:
         events_dir = Path(args.events_dir)
         if events_dir.is_dir():
-            for f in events_dir.glob("*.jsonl"):
-                events = _load_events_file(f)
-                if events:
-                    sid = events[0].session_id or f.stem
-                    sessions[sid] = events
+            paths.extend(sorted(events_dir.glob("*.jsonl")))
+
+    by_session: dict[str, TriageScore] = {}
+    for path in paths:
+        events = _load_events_file(path)
+        if events:
+            sid = events[0].session_id or path.stem
+            by_session[sid] = triage_session(
+                events, session_id=sid, threshold=args.threshold,
+            )
 
-    if not sessions:
+    if not by_session:
         print("No sessions found to triage.", file=sys.stderr)
         return 0
 
-    scores = triage_sessions(sessions, threshold=args.threshold)
+    scores = list(by_session.values())
 
     if args.json:
         print(json.dumps([s.to_dict() for s in scores], indent=2))
@@ -363,19 +364,7 @@ def main() -> int:
 
 def _load_events_file(path: Path) -> list[NormalizedEvent]:
     """Load NormalizedEvents from a JSONL file."""
-    events: list[NormalizedEvent] = []
-    try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(NormalizedEvent.from_jsonl_line(line))
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
-    except OSError:
-        pass
-    return events
+    return list(iter_events_file(path))
 
 
 if __name__ == "__main__":
@@ -110,3 +110,61 @@ class TestAdapterBase:
         assert "test_harness" in caplog.text
         assert "sess-123" in caplog.text
         assert "invalid JSON" in caplog.text
+
+    def test_default_iter_session_yields_normalize_session(self) -> None:
+        from adapters.base import AdapterBase
+        from normalize import NormalizedEvent, SessionSummary
+
+        class TestAdapter(AdapterBase):
+            HARNESS_ID = "test_harness"
+
+            def discover_sessions(self) -> list[SessionSummary]:
+                return []
+
+            def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+                return [NormalizedEvent(event_id="e0", session_id=session_id)]
+
+        events = list(TestAdapter().iter_session("sess-1"))
+        assert [(e.event_id, e.session_id) for e in events] == [("e0", "sess-1")]
+
+    def test_iter_jsonl_skips_blank_malformed_and_non_object_lines(
+        self, tmp_path: Path,
+    ) -> None:
+        from adapters.base import AdapterBase
+        from normalize import NormalizedEvent, SessionSummary
+
+        class TestAdapter(AdapterBase):
+            HARNESS_ID = "test_harness"
+
+            def discover_sessions(self) -> list[SessionSummary]:
+                return []
+
+            def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+                return []
+
+        source = tmp_path / "s.jsonl"
+        source.write_text('{"a": 1}\n\n{broken\n[1, 2]\n"text"\n{"a": 2}')
+
+        records = list(TestAdapter()._iter_jsonl(source, "sess-1"))
+        assert records == [{"a": 1}, {"a": 2}]
+
+    def test_iter_jsonl_warns_on_unreadable_file(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        from adapters.base import AdapterBase
+        from normalize import NormalizedEvent, SessionSummary
+
+        class TestAdapter(AdapterBase):
+            HARNESS_ID = "test_harness"
+
+            def discover_sessions(self) -> list[SessionSummary]:
+                return []
+
+            def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+                return []
+
+        with caplog.at_level(logging.WARNING):
+            records = list(TestAdapter()._iter_jsonl(tmp_path / "missing.jsonl", "sess-1"))
+
+        assert records == []
+        assert "sess-1" in caplog.text
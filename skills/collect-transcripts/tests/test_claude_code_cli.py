@@ -85,6 +85,16 @@ class TestClaudeCodeCLINormalization:
         # But we combine tool_result with the tool event — they become separate events
         assert len(events) > 0
 
+    def test_iter_session_streams_same_events(
+        self, adapter: "ClaudeCodeCLIAdapter"
+    ) -> None:
+        stream = adapter.iter_session("abc123")
+        first = next(stream)
+        streamed = [first, *stream]
+
+        expected = adapter.normalize_session("abc123")
+        assert [e.to_dict() for e in streamed] == [e.to_dict() for e in expected]
+
     def test_user_events_have_user_role(self, adapter: "ClaudeCodeCLIAdapter") -> None:
         from normalize import EventRole
 
@@ -0,0 +1,188 @@
+"""Tests for the streaming collect pipeline.
+
+Covers:
+- Sessions stream adapter -> sanitize -> one JSONL spool file per session
+- Spooled events are sanitized and readable by triage
+- Empty sessions and failing adapters fail soft without leaving files
+- Serial and process-pool collection produce the same spool
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+_SECRET = "sk-ant-REDACTED"
+
+
+@pytest.fixture
+def claude_dir(tmp_path: Path) -> Path:
+    proj_dir = tmp_path / "claude" / "-Users-me-proj"
+    proj_dir.mkdir(parents=True)
+    fixture = FIXTURES_DIR / "claude_code_cli" / "session-abc123.jsonl"
+    (proj_dir / "session-abc123.jsonl").write_text(fixture.read_text())
+    secret_line = json.dumps({
+        "type": "human",
+        "uuid": "u-secret",
+        "message": {"content": f"my key is {_SECRET}"},
+    })
+    (proj_dir / "session-leaky.jsonl").write_text(secret_line + "\n")
+    return tmp_path / "claude"
+
+
+@pytest.fixture
+def codex_dir(tmp_path: Path) -> Path:
+    day_dir = tmp_path / "codex" / "2024" / "05" / "01"
+    day_dir.mkdir(parents=True)
+    fixture = FIXTURES_DIR / "codex_cli" / "rollout-1714560000-sess-xyz789.jsonl"
+    (day_dir / fixture.name).write_text(fixture.read_text())
+    return tmp_path / "codex"
+
+
+class TestCollectSession:
+    """Test spooling a single session."""
+
+    def test_spools_sanitized_session(self, claude_dir: Path, tmp_path: Path) -> None:
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+        from collect import collect_session
+
+        out = tmp_path / "spool"
+        out.mkdir()
+        result = collect_session(ClaudeCodeCLIAdapter(str(claude_dir)), "leaky", out)
+
+        assert result.error == ""
+        assert result.event_count == 1
+        assert result.redaction_count >= 1
+        spool = Path(result.output_path)
+        assert spool.name == "claude_code_cli--leaky.jsonl"
+        assert _SECRET not in spool.read_text()
+        assert [p.name for p in out.iterdir()] == [spool.name]
+
+    def test_spool_round_trips_adapter_events(
+        self, claude_dir: Path, tmp_path: Path,
+    ) -> None:
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+        from collect import collect_session
+        from normalize import iter_events_file
+        from sanitize_events import sanitize_event_stream
+
+        adapter = ClaudeCodeCLIAdapter(str(claude_dir))
+        result = collect_session(adapter, "abc123", tmp_path)
+
+        expected, _ = sanitize_event_stream(adapter.normalize_session("abc123"))
+        spooled = list(iter_events_file(Path(result.output_path)))
+        assert [e.to_dict() for e in spooled] == [e.to_dict() for e in expected]
+
+    def test_empty_session_writes_no_file(self, claude_dir: Path, tmp_path: Path) -> None:
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+        from collect import collect_session
+
+        out = tmp_path / "spool"
+        out.mkdir()
+        result = collect_session(ClaudeCodeCLIAdapter(str(claude_dir)), "missing", out)
+
+        assert result.event_count == 0
+        assert result.output_path == ""
+        assert list(out.iterdir()) == []
+
+    def test_adapter_failure_is_reported_not_raised(self, tmp_path: Path) -> None:
+        from adapters.base import AdapterBase
+        from collect import collect_session
+        from normalize import NormalizedEvent, SessionSummary
+
+        class BrokenAdapter(AdapterBase):
+            HARNESS_ID = "broken"
+
+            def discover_sessions(self) -> list[SessionSummary]:
+                return []
+
+            def normalize_session(self, session_id: str) -> list[NormalizedEvent]:
+                return []
+
+            def iter_session(self, session_id: str):
+                yield NormalizedEvent(event_id="e0", session_id=session_id)
+                raise RuntimeError("transcript vanished")
+
+        result = collect_session(BrokenAdapter(), "s1", tmp_path)
+
+        assert result.error == "transcript vanished"
+        assert result.output_path == ""
+        assert list(tmp_path.iterdir()) == []
+
+    def test_spool_name_is_filesystem_safe(self, tmp_path: Path) -> None:
+        from collect import spool_path
+
+        path = spool_path(tmp_path, "codex_web", "../etc/pass wd")
+        assert path.parent == tmp_path
+        assert path.name == "codex_web--.._etc_pass_wd.jsonl"
+
+
+class TestCollect:
+    """Test collecting every discovered session across adapters."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_collects_all_adapters_in_discovery_order(
+        self, claude_dir: Path, codex_dir: Path, tmp_path: Path, jobs: int,
+    ) -> None:
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+        from adapters.codex_cli import CodexCLIAdapter
+        from collect import collect
+
+        out = tmp_path / "spool"
+        adapters = [ClaudeCodeCLIAdapter(str(claude_dir)), CodexCLIAdapter(str(codex_dir))]
+        results = collect(adapters, out, jobs=jobs)
+
+        assert sorted((r.harness, r.session_id) for r in results[:2]) == [
+            ("claude_code_cli", "abc123"),
+            ("claude_code_cli", "leaky"),
+        ]
+        assert (results[2].harness, results[2].session_id) == ("codex_cli", "sess-xyz789")
+        assert all(r.error == "" and r.event_count > 0 for r in results)
+        assert sorted(p.name for p in out.iterdir()) == [
+            "claude_code_cli--abc123.jsonl",
+            "claude_code_cli--leaky.jsonl",
+            "codex_cli--sess-xyz789.jsonl",
+        ]
+
+    def test_unavailable_adapter_collects_nothing(self, tmp_path: Path) -> None:
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+        from collect import collect
+
+        results = collect([ClaudeCodeCLIAdapter(str(tmp_path / "absent"))], tmp_path / "out")
+        assert results == []
+
+    def test_cli_spool_feeds_triage(
+        self,
+        claude_dir: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        import collect
+        import triage
+        from adapters.claude_code_cli import ClaudeCodeCLIAdapter
+
+        monkeypatch.setitem(
+            collect.ADAPTERS,
+            "claude_code_cli",
+            lambda: ClaudeCodeCLIAdapter(str(claude_dir)),
+        )
+        out = tmp_path / "spool"
+        assert collect.main([
+            "--adapter", "claude_code_cli", "--output-dir", str(out), "--jobs", "1",
+        ]) == 0
+        assert "Spooled 2 of 2 sessions" in capsys.readouterr().out
+
+        monkeypatch.setattr(
+            sys, "argv", ["triage.py", "--events-dir", str(out), "--json"],
+        )
+        assert triage.main() == 0
+        scores = json.loads(capsys.readouterr().out)
+        assert sorted(s["session_id"] for s in scores) == ["abc123", "leaky"]
@@ -219,6 +219,27 @@ class TestNormalizedEvent:
         assert restored.role == EventRole.TOOL
 
 
+class TestIterEventsFile:
+    """Test streaming NormalizedEvents back out of a JSONL spool file."""
+
+    def test_streams_events_skipping_bad_lines(self, tmp_path: Path) -> None:
+        from normalize import EventRole, NormalizedEvent, iter_events_file
+
+        spool = tmp_path / "events.jsonl"
+        good = [
+            NormalizedEvent(event_id=f"e{i}", role=EventRole.USER).to_jsonl_line()
+            for i in range(2)
+        ]
+        spool.write_text(good[0] + "\n\nnot json\n[1, 2]\n" + good[1])
+
+        assert [e.event_id for e in iter_events_file(spool)] == ["e0", "e1"]
+
+    def test_missing_file_yields_nothing(self, tmp_path: Path) -> None:
+        from normalize import iter_events_file
+
+        assert list(iter_events_file(tmp_path / "missing.jsonl")) == []
+
+
 class TestSessionSummary:
     """Session summary field tests."""
 
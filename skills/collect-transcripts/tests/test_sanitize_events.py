@@ -187,3 +187,31 @@ class TestSanitizeEventStream:
         sanitized, redactions = sanitize_event_stream([])
         assert sanitized == []
         assert redactions == []
+
+    def test_iter_sanitized_events_is_lazy(self) -> None:
+        from normalize import ContentBlock, ContentType, EventRole, NormalizedEvent
+        from sanitize_events import iter_sanitized_events
+
+        pulled: list[int] = []
+
+        def source():
+            for i in range(3):
+                pulled.append(i)
+                yield NormalizedEvent(
+                    event_id=f"e{i}",
+                    role=EventRole.USER,
+                    content=[
+                        ContentBlock(
+                            type=ContentType.TEXT,
+                            text="Key: sk-ant-REDACTED",
+                        )
+                    ],
+                )
+
+        stream = iter_sanitized_events(source())
+        event, redactions = next(stream)
+
+        assert pulled == [0]
+        assert event.event_id == "e0"
+        assert "sk-ant-" not in event.content[0].text
+        assert len(redactions) >= 1
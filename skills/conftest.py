@@ -0,0 +1,16 @@
+"""Repository-wide pytest fixtures for the skills tree."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_coordination_capability_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep coordination_bridge from reusing capability states across tests.
+
+    Tests stub the transport per case, so a state cached on disk by one test
+    would leak into the next (and into the developer's real cache dir).
+    Tests of the cache itself re-enable it against ``tmp_path``.
+    """
+    monkeypatch.setenv("COORDINATION_CAPABILITY_CACHE_TTL", "0")
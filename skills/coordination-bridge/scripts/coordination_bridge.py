@@ -8,9 +8,15 @@ when coordinator access is unavailable.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import http.client
 import json
 import logging
 import os
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import Any
 from urllib import error as url_error
 from urllib import parse as url_parse
@@ -20,6 +26,14 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_SECONDS = float(os.environ.get("COORDINATION_HTTP_TIMEOUT", "1.5"))
 
+# Seconds a detected capability state is reused across processes; 0 disables
+# the on-disk cache (COORDINATION_CAPABILITY_CACHE_TTL).
+DEFAULT_CAPABILITY_CACHE_TTL_SECONDS = 60.0
+_CAPABILITY_CACHE_TTL_ENV = "COORDINATION_CAPABILITY_CACHE_TTL"
+_CAPABILITY_CACHE_DIR_ENV = "COORDINATION_CAPABILITY_CACHE_DIR"
+# Opt in to HTTP/2 (COORDINATION_HTTP2=1); needs ``httpx`` with ``h2``.
+_HTTP2_ENV = "COORDINATION_HTTP2"
+
 _HTTP_URL_ENV_KEYS = (
     "COORDINATION_API_URL",
     "COORDINATOR_HTTP_URL",
@@ -277,6 +291,187 @@ def _decode_payload(raw_body: bytes) -> Any:
         return {"raw": text}
 
 
+# ---------------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------------
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP/1.1 connections reused per ``(scheme, host, port)``.
+
+    Skill scripts call several bridge helpers per phase; reusing the
+    connection saves a TCP (and, through the Cloudflare edge, TLS) setup on
+    every call after the first.  Thread-safe: a connection is checked out
+    for exactly one request at a time.
+    """
+
+    def __init__(self, max_idle_per_host: int = 4) -> None:
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._max_idle = max_idle_per_host
+
+    def request(
+        self,
+        *,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, bytes]:
+        """Send one request and return ``(status, reason, body)``."""
+        parsed = url_parse.urlsplit(url)
+        scheme = parsed.scheme
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        conn = self._checkout(key)
+        reused = conn is not None
+        while True:
+            if conn is None:
+                conn = self._connect(scheme, host, port, timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except ConnectionError:
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry
+                # once on a fresh one.
+                conn, reused = None, False
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return response.status, response.reason, payload
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _checkout(self, key: tuple[str, str, int]) -> http.client.HTTPConnection | None:
+        with self._lock:
+            conns = self._idle.get(key)
+            return conns.pop() if conns else None
+
+    def _checkin(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self._max_idle:
+                conns.append(conn)
+                return
+        conn.close()
+
+    @staticmethod
+    def _connect(
+        scheme: str, host: str, port: int, timeout: float,
+    ) -> http.client.HTTPConnection:
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+_POOL = _ConnectionPool()
+_HTTP2_CLIENT: Any = None
+_HTTP2_LOCK = threading.Lock()
+
+
+def _http2_client() -> Any:
+    """Return a shared ``httpx`` HTTP/2 client, or ``None`` when unavailable."""
+    global _HTTP2_CLIENT
+    if os.environ.get(_HTTP2_ENV, "").strip().lower() not in {"1", "true", "yes"}:
+        return None
+    with _HTTP2_LOCK:
+        if _HTTP2_CLIENT is None:
+            try:
+                import httpx
+
+                _HTTP2_CLIENT = httpx.Client(http2=True, follow_redirects=True)
+            except ImportError:
+                logger.debug("%s set but httpx/h2 is not installed", _HTTP2_ENV)
+                _HTTP2_CLIENT = False
+        return _HTTP2_CLIENT or None
+
+
+def _uses_proxy(url: str) -> bool:
+    parsed = url_parse.urlsplit(url)
+    return parsed.scheme in url_request.getproxies() and not url_request.proxy_bypass(
+        parsed.hostname or ""
+    )
+
+
+def _urlopen_send(
+    *,
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[int, str, bytes]:
+    request_obj = url_request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with url_request.urlopen(request_obj, timeout=timeout) as response:
+            return response.getcode(), response.reason, response.read()
+    except url_error.HTTPError as exc:
+        response_body = exc.read() if hasattr(exc, "read") else b""
+        return exc.code, str(exc.reason), response_body
+
+
+def _send(
+    *,
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[int, str, bytes]:
+    """Send a request over the pooled transport.
+
+    ``urllib`` is kept for proxied URLs (it honors ``*_PROXY``) and to
+    follow redirects, which raw keep-alive connections do not.
+    """
+    if _uses_proxy(url):
+        return _urlopen_send(
+            method=method, url=url, body=body, headers=headers, timeout=timeout,
+        )
+    client = _http2_client()
+    if client is not None:
+        import httpx
+
+        try:
+            response = client.request(
+                method, url, content=body, headers=headers, timeout=timeout,
+            )
+        except httpx.HTTPError as exc:
+            raise OSError(str(exc)) from exc
+        return response.status_code, response.reason_phrase, response.content
+    status, reason, response_body = _POOL.request(
+        method=method, url=url, body=body, headers=headers, timeout=timeout,
+    )
+    if 300 <= status < 400:
+        return _urlopen_send(
+            method=method, url=url, body=body, headers=headers, timeout=timeout,
+        )
+    return status, reason, response_body
+
+
 def _http_request(
     *,
     method: str,
@@ -303,30 +498,107 @@ def _http_request(
         headers["X-API-Key"] = api_key
     headers.update(_cf_access_headers())
 
-    request_obj = url_request.Request(
-        target_url,
-        data=body,
-        headers=headers,
-        method=method.upper(),
-    )
-
     try:
-        with url_request.urlopen(request_obj, timeout=timeout) as response:
-            response_body = response.read()
-            return {
-                "status_code": response.getcode(),
-                "data": _decode_payload(response_body),
-                "error": None,
-            }
-    except url_error.HTTPError as exc:
-        response_body = exc.read() if hasattr(exc, "read") else b""
-        return {
-            "status_code": exc.code,
-            "data": _decode_payload(response_body),
-            "error": str(exc),
-        }
-    except (url_error.URLError, TimeoutError, OSError, ValueError) as exc:
+        status_code, reason, response_body = _send(
+            method=method.upper(),
+            url=target_url,
+            body=body,
+            headers=headers,
+            timeout=timeout,
+        )
+    except (
+        url_error.URLError, http.client.HTTPException, TimeoutError, OSError, ValueError,
+    ) as exc:
         return {"status_code": None, "data": None, "error": str(exc)}
+    return {
+        "status_code": status_code,
+        "data": _decode_payload(response_body),
+        "error": f"HTTP Error {status_code}: {reason}" if status_code >= 400 else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Capability cache
+# ---------------------------------------------------------------------------
+
+
+def _capability_cache_ttl() -> float:
+    raw = os.environ.get(_CAPABILITY_CACHE_TTL_ENV, "").strip()
+    if not raw:
+        return DEFAULT_CAPABILITY_CACHE_TTL_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return DEFAULT_CAPABILITY_CACHE_TTL_SECONDS
+
+
+def _capability_cache_path(http_url: str, api_key: str | None) -> Path:
+    """Cache file for one coordinator URL and credential set.
+
+    Only a digest of the credentials is used, so neither the API key nor the
+    Cloudflare Access token is written to disk.
+    """
+    cache_dir = os.environ.get(_CAPABILITY_CACHE_DIR_ENV, "").strip()
+    if cache_dir:
+        base = Path(cache_dir)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / (
+            "agentic-coding-tools/coordination"
+        )
+    cf = _cf_access_headers()
+    fingerprint = hashlib.sha256(
+        "\0".join(
+            (http_url, api_key or "", cf.get("CF-Access-Client-Id", ""),
+             cf.get("CF-Access-Client-Secret", ""))
+        ).encode("utf-8")
+    ).hexdigest()
+    return base / f"capabilities-{fingerprint[:32]}.json"
+
+
+def _load_cached_state(http_url: str, api_key: str | None) -> dict[str, Any] | None:
+    if _capability_cache_ttl() <= 0:
+        return None
+    try:
+        entry = json.loads(_capability_cache_path(http_url, api_key).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("state"), dict):
+        return None
+    if not isinstance(entry.get("expires_at"), (int, float)) or entry["expires_at"] <= time.time():
+        return None
+    return entry["state"]
+
+
+def _store_cached_state(
+    http_url: str, api_key: str | None, state: dict[str, Any],
+) -> None:
+    ttl = _capability_cache_ttl()
+    if ttl <= 0:
+        return
+    path = _capability_cache_path(http_url, api_key)
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".capabilities-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"expires_at": time.time() + ttl, "state": state}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        logger.debug("cannot write capability cache %s: %s", path, exc)
+
+
+def _forget_cached_state(http_url: str | None, api_key: str | None) -> None:
+    """Drop a cached capability state once the coordinator stops answering."""
+    if not http_url:
+        return
+    try:
+        _capability_cache_path(http_url, api_key).unlink(missing_ok=True)
+    except OSError:
+        pass
 
 
 def _probe_capability(
@@ -382,8 +654,17 @@ def _probe_code_search_status(*, http_url: str, api_key: str | None) -> bool:
 def detect_coordination(
     http_url: str | None = None,
     api_key: str | None = None,
+    *,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
-    """Detect coordinator HTTP reachability and capability flags."""
+    """Detect coordinator HTTP reachability and capability flags.
+
+    A reachable coordinator's state is cached on disk for
+    ``COORDINATION_CAPABILITY_CACHE_TTL`` seconds (default 60), keyed by URL
+    and credentials, so the helpers a skill calls in one phase probe once.
+    Unreachable states are never cached.  Pass ``use_cache=False`` to force
+    a fresh probe.
+    """
     resolved_url = _resolve_http_url(http_url)
     if not resolved_url:
         return _coordinator_state(
@@ -393,6 +674,12 @@ def detect_coordination(
             reason="missing_http_url",
         )
 
+    resolved_api_key = _resolve_api_key(api_key)
+    if use_cache:
+        cached = _load_cached_state(resolved_url, resolved_api_key)
+        if cached is not None:
+            return cached
+
     health_response = _http_request(
         method="GET",
         path="/health",
@@ -415,7 +702,6 @@ def detect_coordination(
             reason=f"health_status_{health_status}",
         )
 
-    resolved_api_key = _resolve_api_key(api_key)
     flags = {
         name: _probe_capability(
             probes=probes,
@@ -429,13 +715,15 @@ def detect_coordination(
         api_key=resolved_api_key,
     )
 
-    return _coordinator_state(
+    state = _coordinator_state(
         available=True,
         transport="http",
         http_url=resolved_url,
         reason="http_reachable",
         flags=flags,
     )
+    _store_cached_state(resolved_url, resolved_api_key, state)
+    return state
 
 
 def _skipped_operation(
@@ -531,13 +819,16 @@ def _execute_single_endpoint_operation(
             state=state,
         )
 
+    resolved_api_key = _resolve_api_key(api_key)
     response = _http_request(
         method=method,
         path=path,
         payload=payload,
         http_url=state.get("http_url"),
-        api_key=_resolve_api_key(api_key),
+        api_key=resolved_api_key,
     )
+    if response["status_code"] is None:
+        _forget_cached_state(state.get("http_url"), resolved_api_key)
     return _normalize_operation_response(
         operation=operation,
         response=response,
@@ -582,6 +873,8 @@ def _execute_multi_endpoint_operation(
         if status_code == 404:
             saw_not_found = True
             continue
+        if status_code is None:
+            _forget_cached_state(state.get("http_url"), resolved_api_key)
         return _normalize_operation_response(
             operation=operation,
             response=response,
@@ -631,6 +924,41 @@ def try_lock(
     )
 
 
+def try_lock_batch(
+    *,
+    file_paths: list[str],
+    agent_id: str,
+    agent_type: str,
+    session_id: str | None = None,
+    reason: str | None = None,
+    ttl_minutes: int = 30,
+    http_url: str | None = None,
+    api_key: str | None = None,
+) -> dict[str, Any]:
+    """Acquire several coordinator locks in one all-or-nothing round trip.
+
+    Coordinators that predate ``/locks/acquire-batch`` answer 404, which
+    surfaces as ``reason="capability_unavailable"``; callers may then fall
+    back to one ``try_lock`` per path.
+    """
+    return _execute_single_endpoint_operation(
+        operation="try_lock_batch",
+        capability_flag="CAN_LOCK",
+        method="POST",
+        path="/locks/acquire-batch",
+        payload={
+            "file_paths": file_paths,
+            "agent_id": agent_id,
+            "agent_type": agent_type,
+            "session_id": session_id,
+            "reason": reason,
+            "ttl_minutes": ttl_minutes,
+        },
+        http_url=http_url,
+        api_key=api_key,
+    )
+
+
 def try_unlock(
     *,
     file_path: str,
@@ -1554,12 +1882,21 @@ def _main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument("--http-url", help="Coordinator HTTP base URL")
     parser.add_argument("--api-key", help="Coordinator API key")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Probe the coordinator even if a cached capability state is fresh",
+    )
     args = parser.parse_args(argv)
 
     if args.command == "detect":
         print(
             json.dumps(
-                detect_coordination(http_url=args.http_url, api_key=args.api_key),
+                detect_coordination(
+                    http_url=args.http_url,
+                    api_key=args.api_key,
+                    use_cache=not args.no_cache,
+                ),
                 indent=2,
                 sort_keys=True,
             )
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import sys
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import coordination_bridge
@@ -682,3 +688,218 @@ def test_try_issue_create_unauthorized_returns_skipped(monkeypatch) -> None:
 
     assert result["status"] == "skipped"
     assert result["reason"] == "unauthorized"
+
+
+def test_try_lock_batch_uses_batch_endpoint(monkeypatch) -> None:
+    monkeypatch.setattr(coordination_bridge, "detect_coordination", lambda **_: _state(CAN_LOCK=True))
+    captured: list[dict[str, Any]] = []
+
+    def fake_http_request(**kwargs: Any) -> dict[str, Any]:
+        captured.append(kwargs)
+        return {"status_code": 200, "data": {"success": True, "locks": []}, "error": None}
+
+    monkeypatch.setattr(coordination_bridge, "_http_request", fake_http_request)
+
+    result = coordination_bridge.try_lock_batch(
+        file_paths=["a.py", "b.py"],
+        agent_id="agent-1",
+        agent_type="codex",
+    )
+
+    assert result["status"] == "ok"
+    assert result["operation"] == "try_lock_batch"
+    assert captured[0]["path"] == "/locks/acquire-batch"
+    assert captured[0]["payload"]["file_paths"] == ["a.py", "b.py"]
+
+
+# ---------------------------------------------------------------------------
+# Pooled keep-alive transport
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[tuple[str, int]] = []
+    drop_after_response = False
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        type(self).peers.append(self.client_address)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Close without announcing it, as an idle-timeout at the edge would.
+        self.close_connection = type(self).drop_after_response
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path == "/missing":
+            self._reply(404, {"detail": "Not Found"})
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", "0"))
+        self._reply(200, json.loads(self.rfile.read(length) or b"{}"))
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def coordinator() -> Iterator[str]:
+    _Handler.peers = []
+    _Handler.drop_after_response = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        coordination_bridge._POOL.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_request_reuses_keep_alive_connection(coordinator: str) -> None:
+    first = coordination_bridge._http_request(method="GET", path="/health", http_url=coordinator)
+    second = coordination_bridge._http_request(
+        method="POST", path="/locks/acquire", payload={"file_path": "a.py"}, http_url=coordinator,
+    )
+
+    assert first == {"status_code": 200, "data": {"path": "/health"}, "error": None}
+    assert second["data"] == {"file_path": "a.py"}
+    assert len(_Handler.peers) == 2
+    assert len(set(_Handler.peers)) == 1
+
+
+def test_http_request_reports_http_errors(coordinator: str) -> None:
+    result = coordination_bridge._http_request(method="GET", path="/missing", http_url=coordinator)
+
+    assert result["status_code"] == 404
+    assert result["data"] == {"detail": "Not Found"}
+    assert result["error"] == "HTTP Error 404: Not Found"
+
+
+def test_http_request_retries_closed_keep_alive_connection(coordinator: str) -> None:
+    _Handler.drop_after_response = True
+
+    first = coordination_bridge._http_request(method="GET", path="/a", http_url=coordinator)
+    second = coordination_bridge._http_request(method="GET", path="/b", http_url=coordinator)
+
+    assert first["status_code"] == 200
+    assert second == {"status_code": 200, "data": {"path": "/b"}, "error": None}
+    assert len(set(_Handler.peers)) == 2
+
+
+def test_http_request_unreachable_returns_no_status() -> None:
+    result = coordination_bridge._http_request(
+        method="GET", path="/health", http_url="http://127.0.0.1:9", timeout=0.5,
+    )
+
+    assert result["status_code"] is None
+    assert result["error"]
+
+
+# ---------------------------------------------------------------------------
+# Capability cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def capability_cache(monkeypatch, tmp_path: Path) -> Path:
+    monkeypatch.setenv("COORDINATION_CAPABILITY_CACHE_TTL", "60")
+    monkeypatch.setenv("COORDINATION_CAPABILITY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(
+        coordination_bridge, "_resolve_http_url", lambda http_url=None: "http://coord.example",
+    )
+    return tmp_path
+
+
+def _counting_transport(monkeypatch, health_status: int | None = 200) -> list[str]:
+    calls: list[str] = []
+
+    def fake_http_request(*, path: str, **_: Any) -> dict[str, Any]:
+        calls.append(path)
+        if path == "/health":
+            return {"status_code": health_status, "data": {}, "error": None}
+        return {"status_code": 422, "data": {}, "error": "validation"}
+
+    monkeypatch.setattr(coordination_bridge, "_http_request", fake_http_request)
+    return calls
+
+
+def test_detect_coordination_reuses_cached_state(monkeypatch, capability_cache: Path) -> None:
+    calls = _counting_transport(monkeypatch)
+
+    first = coordination_bridge.detect_coordination(api_key="secret-key")
+    probes = len(calls)
+    second = coordination_bridge.detect_coordination(api_key="secret-key")
+
+    assert probes > 1
+    assert len(calls) == probes
+    assert second == first
+    cache_files = list(capability_cache.iterdir())
+    assert len(cache_files) == 1
+    assert "secret-key" not in cache_files[0].read_text()
+
+
+def test_detect_coordination_cache_is_keyed_by_credentials(monkeypatch, capability_cache: Path) -> None:
+    calls = _counting_transport(monkeypatch)
+
+    coordination_bridge.detect_coordination(api_key="key-a")
+    probes = len(calls)
+    coordination_bridge.detect_coordination(api_key="key-b")
+
+    assert len(calls) == 2 * probes
+
+
+def test_detect_coordination_bypasses_cache_on_request(monkeypatch, capability_cache: Path) -> None:
+    calls = _counting_transport(monkeypatch)
+
+    coordination_bridge.detect_coordination()
+    probes = len(calls)
+    coordination_bridge.detect_coordination(use_cache=False)
+
+    assert len(calls) == 2 * probes
+
+
+def test_detect_coordination_does_not_cache_unreachable(monkeypatch, capability_cache: Path) -> None:
+    calls = _counting_transport(monkeypatch, health_status=None)
+
+    coordination_bridge.detect_coordination()
+    coordination_bridge.detect_coordination()
+
+    assert calls == ["/health", "/health"]
+    assert list(capability_cache.iterdir()) == []
+
+
+def test_detect_coordination_ignores_expired_cache(monkeypatch, capability_cache: Path) -> None:
+    calls = _counting_transport(monkeypatch)
+    coordination_bridge.detect_coordination()
+    probes = len(calls)
+    for cache_file in capability_cache.iterdir():
+        entry = json.loads(cache_file.read_text())
+        entry["expires_at"] = 0
+        cache_file.write_text(json.dumps(entry))
+
+    coordination_bridge.detect_coordination()
+
+    assert len(calls) == 2 * probes
+
+
+def test_unreachable_operation_drops_cached_state(monkeypatch, capability_cache: Path) -> None:
+    _counting_transport(monkeypatch)
+    coordination_bridge.detect_coordination()
+    assert list(capability_cache.iterdir())
+    monkeypatch.setattr(
+        coordination_bridge,
+        "_http_request",
+        lambda **_: {"status_code": None, "data": None, "error": "timed out"},
+    )
+
+    result = coordination_bridge.try_lock(file_path="a.py", agent_id="agent-1", agent_type="codex")
+
+    assert result["reason"] == "coordinator_unreachable"
+    assert list(capability_cache.iterdir()) == []
@@ -5,8 +5,12 @@ This script runs as a Claude Code Stop hook. After each assistant response,
 it reads the session transcript and sends new conversation turns to Langfuse
 as traces with nested spans for tool invocations.
 
-The hook processes incrementally -- only new messages since the last run are
-sent, using a state file to track progress.
+The hook processes incrementally -- a per-session state file records the
+byte offset reached in the transcript plus the file's device/inode/size, so
+each run seeks straight to new content and restarts from the top when the
+transcript was truncated or replaced.  New turns are spooled to a queue and
+uploaded by a detached background process in batches, so the hook's own
+wall-time stays flat as the session grows.
 
 Usage (in ~/.claude/settings.json or .claude/settings.local.json):
     {
@@ -34,6 +38,7 @@ Environment variables:
     LANGFUSE_SECRET_KEY: Langfuse project secret key
     LANGFUSE_HOST: Langfuse server URL (default: http://localhost:3050)
     LANGFUSE_DEBUG: Enable debug logging (default: false)
+    LANGFUSE_HOOK_SYNC: Upload inline instead of in the background (default: false)
     CLAUDE_SESSION_ID: Override session ID (auto-detected from transcript path)
 """
 
@@ -44,10 +49,17 @@ import json
 import logging
 import os
 import re
+import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # Windows: no POSIX advisory file locks
+    fcntl = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -127,14 +139,19 @@ def get_state_path(session_id: str) -> Path:
 
 
 def load_state(session_id: str) -> dict[str, Any]:
-    """Load processing state for a session."""
+    """Load processing state for a session.
+
+    ``offset`` is the byte offset reached in the transcript and
+    ``fingerprint`` identifies the file it belongs to.  State written by
+    older hooks carries ``last_line`` instead; ``resume_offset`` converts it.
+    """
     path = get_state_path(session_id)
     if path.exists():
         try:
             return json.loads(path.read_text())
         except (json.JSONDecodeError, OSError):
             pass
-    return {"last_line": 0, "trace_count": 0}
+    return {"offset": 0, "trace_count": 0}
 
 
 def save_state(session_id: str, state: dict[str, Any]) -> None:
@@ -151,32 +168,88 @@ def save_state(session_id: str, state: dict[str, Any]) -> None:
 # ---------------------------------------------------------------------------
 
 
-def parse_transcript_lines(
-    transcript_path: Path, start_line: int
+def transcript_fingerprint(transcript_path: Path) -> dict[str, int] | None:
+    """Identify a transcript by device, inode, and current size."""
+    try:
+        st = transcript_path.stat()
+    except OSError as exc:
+        logger.error("Failed to stat transcript: %s", exc)
+        return None
+    return {"device": st.st_dev, "inode": st.st_ino, "size": st.st_size}
+
+
+def _offset_after_lines(transcript_path: Path, line_count: int) -> int:
+    """Byte offset just past the first *line_count* lines (legacy state)."""
+    offset = 0
+    try:
+        with open(transcript_path, "rb") as f:
+            for i, raw in enumerate(f):
+                if i >= line_count:
+                    break
+                offset += len(raw)
+    except OSError:
+        return 0
+    return offset
+
+
+def resume_offset(
+    transcript_path: Path,
+    state: dict[str, Any],
+    fingerprint: dict[str, int],
+) -> int:
+    """Return the byte offset where unprocessed transcript content starts.
+
+    Restarts from 0 when the transcript was replaced (different device or
+    inode) or truncated (smaller than when last read, or than the offset).
+    """
+    if "offset" not in state:
+        last_line = state.get("last_line", 0)
+        return _offset_after_lines(transcript_path, last_line) if last_line else 0
+
+    offset = state.get("offset")
+    previous = state.get("fingerprint")
+    if not isinstance(offset, int) or offset < 0 or not isinstance(previous, dict):
+        return 0
+    if (previous.get("device"), previous.get("inode")) != (
+        fingerprint["device"],
+        fingerprint["inode"],
+    ):
+        logger.info("Transcript was replaced; reading from the start")
+        return 0
+    if fingerprint["size"] < max(offset, previous.get("size", 0)):
+        logger.info("Transcript was truncated; reading from the start")
+        return 0
+    return offset
+
+
+def read_transcript_from(
+    transcript_path: Path, offset: int
 ) -> tuple[list[dict[str, Any]], int]:
-    """Read new lines from a transcript file starting at a given offset.
+    """Parse the JSONL records that follow byte *offset* in a transcript.
 
-    Returns (messages, lines_consumed) where lines_consumed counts all lines
-    read (including blank/invalid ones) so the cursor advances correctly.
+    Returns (messages, end_offset).  Blank and invalid lines are skipped but
+    still advance the offset.  A final line without a trailing newline is
+    only consumed when it parses, since it may still be being written.
     """
     messages: list[dict[str, Any]] = []
-    lines_consumed = 0
+    end = offset
     try:
-        with open(transcript_path, encoding="utf-8") as f:
-            for i, line in enumerate(f):
-                if i < start_line:
-                    continue
-                lines_consumed += 1
-                line = line.strip()
-                if not line:
-                    continue
+        with open(transcript_path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                line = raw.strip()
                 try:
-                    messages.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
+                    message = json.loads(line) if line else None
+                except ValueError:
+                    if not raw.endswith(b"\n"):
+                        break
+                    message = None
+                end += len(raw)
+                if message is not None:
+                    messages.append(message)
     except OSError as exc:
         logger.error("Failed to read transcript: %s", exc)
-    return messages, lines_consumed
+    return messages, end
 
 
 def group_into_turns(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -309,20 +382,16 @@ def sanitize_value(value: Any) -> Any:
 # ---------------------------------------------------------------------------
 
 
-def send_turns_to_langfuse(
-    turns: list[dict[str, Any]],
-    session_id: str,
-    project_name: str,
-) -> int:
-    """Send conversation turns to Langfuse as traces. Returns count of traces created."""
+def _create_client() -> Any:
+    """Create a Langfuse client, or return ``None`` when it is unavailable."""
     try:
-        from langfuse import Langfuse, propagate_attributes
+        from langfuse import Langfuse
     except ImportError:
         logger.error("langfuse package not available")
-        return 0
+        return None
 
     try:
-        lf = Langfuse(
+        return Langfuse(
             public_key=os.environ.get("LANGFUSE_PUBLIC_KEY", ""),
             secret_key=os.environ.get("LANGFUSE_SECRET_KEY", ""),
             host=os.environ.get("LANGFUSE_HOST", "http://localhost:3050"),
@@ -331,7 +400,30 @@ def send_turns_to_langfuse(
         )
     except Exception as exc:
         logger.warning("Failed to create Langfuse client: %s", exc)
-        return 0
+        return None
+
+
+def _close_client(lf: Any) -> None:
+    # Flush all events
+    try:
+        lf.flush()
+    except Exception as exc:
+        logger.warning("Langfuse flush failed: %s", exc)
+
+    try:
+        lf.shutdown()
+    except Exception:
+        pass
+
+
+def _emit_turns(
+    lf: Any,
+    turns: list[dict[str, Any]],
+    session_id: str,
+    project_name: str,
+) -> int:
+    """Record turns as observations on an open client. Returns the count."""
+    from langfuse import propagate_attributes
 
     agent_id = os.environ.get("AGENT_ID", os.environ.get("USER", "unknown"))
     count = 0
@@ -381,26 +473,121 @@ def send_turns_to_langfuse(
 
         count += 1
 
-    # Flush all events
-    try:
-        lf.flush()
-    except Exception as exc:
-        logger.warning("Langfuse flush failed: %s", exc)
+    return count
 
-    try:
-        lf.shutdown()
-    except Exception:
-        pass
 
+def send_turns_to_langfuse(
+    turns: list[dict[str, Any]],
+    session_id: str,
+    project_name: str,
+) -> int:
+    """Send conversation turns to Langfuse as traces. Returns count of traces created."""
+    lf = _create_client()
+    if lf is None:
+        return 0
+    count = _emit_turns(lf, turns, session_id, project_name)
+    _close_client(lf)
     return count
 
 
+# ---------------------------------------------------------------------------
+# Upload queue
+# ---------------------------------------------------------------------------
+
+
+def get_queue_dir() -> Path:
+    """Directory holding turn batches waiting for upload."""
+    return STATE_DIR / "langfuse_queue"
+
+
+def enqueue_turns(
+    turns: list[dict[str, Any]],
+    session_id: str,
+    project_name: str,
+) -> Path | None:
+    """Spool a batch of turns for the background uploader."""
+    queue_dir = get_queue_dir()
+    name = f"{time.time_ns():020d}-{os.getpid()}.json"
+    tmp = queue_dir / f".{name}.tmp"
+    try:
+        queue_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({
+            "session_id": session_id,
+            "project_name": project_name,
+            "turns": turns,
+        }))
+        # Rename last so the uploader never sees a half-written batch.
+        os.replace(tmp, queue_dir / name)
+    except OSError as exc:
+        logger.warning("Failed to queue turns: %s", exc)
+        tmp.unlink(missing_ok=True)
+        return None
+    return queue_dir / name
+
+
+def drain_queue() -> int:
+    """Upload queued batches, oldest first, until the queue is empty.
+
+    All batches share one client and one flush.  An exclusive lock keeps a
+    single uploader running; a second one waits for it and then picks up
+    whatever was queued meanwhile.  Delivery is at most once: a batch is
+    removed once it has been handed to the client.  Returns the number of
+    traces created.
+
+    Without ``fcntl`` (Windows) the drain is best effort and unlocked: two
+    overlapping uploaders may both send a batch before either removes it.
+    """
+    queue_dir = get_queue_dir()
+    queue_dir.mkdir(parents=True, exist_ok=True)
+    sent = 0
+    with open(queue_dir / ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        lf = None
+        while batches := sorted(queue_dir.glob("*.json")):
+            if lf is None:
+                lf = _create_client()
+                if lf is None:
+                    logger.warning("Dropping %d queued batch(es)", len(batches))
+            for path in batches:
+                try:
+                    batch = json.loads(path.read_text())
+                    if lf is not None:
+                        sent += _emit_turns(
+                            lf, batch["turns"], batch["session_id"], batch["project_name"],
+                        )
+                except (OSError, ValueError, KeyError, TypeError) as exc:
+                    logger.warning("Skipping unreadable batch %s: %s", path.name, exc)
+                path.unlink(missing_ok=True)
+        if lf is not None:
+            _close_client(lf)
+    return sent
+
+
+def spawn_uploader() -> bool:
+    """Start a detached ``--drain`` process; returns False if it cannot start."""
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--drain"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError as exc:
+        logger.warning("Failed to start background uploader: %s", exc)
+        return False
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
     setup_logging()
 
     if os.environ.get("LANGFUSE_ENABLED", "").lower() != "true":
@@ -410,47 +597,63 @@ def main() -> None:
         logger.warning("LANGFUSE_PUBLIC_KEY or LANGFUSE_SECRET_KEY not set, skipping")
         return
 
+    if "--drain" in args:
+        count = drain_queue()
+        logger.info("Uploaded %d queued turn(s) to Langfuse", count)
+        return
+
     transcript = find_transcript()
     if transcript is None:
         logger.debug("No transcript found")
         return
 
+    fingerprint = transcript_fingerprint(transcript)
+    if fingerprint is None:
+        return
+
     session_id = extract_session_id(transcript)
     project_name = extract_project_name(transcript)
     state = load_state(session_id)
+    offset = resume_offset(transcript, state, fingerprint)
 
     logger.debug(
-        "Processing session=%s project=%s from_line=%d",
-        session_id, project_name, state["last_line"],
+        "Processing session=%s project=%s from_offset=%d",
+        session_id, project_name, offset,
     )
 
-    messages, lines_consumed = parse_transcript_lines(transcript, state["last_line"])
-    if not messages:
-        # Still advance past any blank/invalid lines we consumed
-        if lines_consumed > 0:
-            state["last_line"] = state["last_line"] + lines_consumed
-            save_state(session_id, state)
-        logger.debug("No new messages to process")
-        return
+    messages, end = read_transcript_from(transcript, offset)
+    # Advance past everything consumed, including blank/invalid lines, so
+    # the next run never re-reads it.
+    state.pop("last_line", None)
+    state["offset"] = end
+    state["fingerprint"] = {**fingerprint, "size": max(fingerprint["size"], end)}
 
-    turns = group_into_turns(messages)
+    turns = group_into_turns(messages) if messages else []
     if not turns:
-        # Still advance cursor past consumed lines to avoid re-reading
-        state["last_line"] = state["last_line"] + lines_consumed
         save_state(session_id, state)
-        logger.debug("No complete turns found")
+        logger.debug("No new turns to process")
         return
 
-    count = send_turns_to_langfuse(turns, session_id, project_name)
+    queued = enqueue_turns(turns, session_id, project_name)
+    if queued is None:
+        count = send_turns_to_langfuse(turns, session_id, project_name)
+    else:
+        count = len(turns)
 
-    # Update state — advance by lines consumed (not messages parsed)
-    state["last_line"] = state["last_line"] + lines_consumed
+    # trace_count counts turns sent or queued for upload. State is saved
+    # before the uploader starts so the next run never re-reads these turns.
     state["trace_count"] = state.get("trace_count", 0) + count
     state["last_run"] = time.time()
     save_state(session_id, state)
 
+    if queued is not None and (
+        os.environ.get("LANGFUSE_HOOK_SYNC", "").lower() == "true"
+        or not spawn_uploader()
+    ):
+        drain_queue()
+
     logger.info(
-        "Sent %d turn(s) to Langfuse (session=%s, total_traces=%d)",
+        "Handed %d turn(s) to Langfuse (session=%s, total_traces=%d)",
         count, session_id, state["trace_count"],
     )
 
@@ -24,6 +24,7 @@ import json
 import logging
 import re
 import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -254,6 +255,13 @@ def match_score(a: Finding, b: Finding) -> tuple[float, str]:
         (score, basis) where score is 0.0-1.0 and basis describes
         the matching criteria used.
     """
+    return _match_score(a, b, _tokenize(a.description), _tokenize(b.description))
+
+
+def _match_score(
+    a: Finding, b: Finding, a_tokens: set[str], b_tokens: set[str],
+) -> tuple[float, str]:
+    """``match_score`` over pre-tokenized descriptions."""
     # Axis is part of the cross-vendor matching key: an observability
     # finding and a correctness finding on the same lines are two distinct
     # signals, and merging them would silently drop one.
@@ -274,7 +282,7 @@ def match_score(a: Finding, b: Finding) -> tuple[float, str]:
                 return 0.95, "location+type"
             return 0.8, "location"
 
-    desc_sim = _jaccard(_tokenize(a.description), _tokenize(b.description))
+    desc_sim = _jaccard(a_tokens, b_tokens)
 
     if same_file and same_type and desc_sim >= 0.25:
         return min(0.5 + desc_sim * 0.4, 0.85), "file+type+description"
@@ -321,6 +329,74 @@ def _agreed_axis(findings: list[Finding]) -> str:
     return max(counts, key=lambda axis: (counts[axis], best_criticality[axis]))
 
 
+def _path_bucket(path: str) -> str:
+    """Last component of a normalized path.
+
+    Every pair accepted by ``_paths_match`` shares it, so it is a safe
+    bucket key for location candidates.
+    """
+    return _normalize_path(path).rsplit("/", 1)[-1]
+
+
+class _FindingIndex:
+    """Candidate lookup for cross-vendor matching.
+
+    ``match_score`` is non-zero only for findings on the same axis that
+    either overlap by location in the same file or share at least one
+    description token.  Descriptions are tokenized once, and each vendor's
+    findings are bucketed by (axis, file) with a start-sorted line index and
+    by (axis, token) in an inverted index, so a lookup returns exactly the
+    findings that can score above zero instead of the vendor's whole list.
+    Findings are addressed by their position in the input list.
+    """
+
+    def __init__(self, findings: list[Finding]) -> None:
+        self.findings = findings
+        self.tokens = [_tokenize(f.description) for f in findings]
+        self.axes = [_canonical_axis(f.axis) for f in findings]
+        self.vendors: list[str] = list(dict.fromkeys(f.vendor for f in findings))
+
+        # (vendor, axis, file bucket) -> [(line_start, line_end, position)]
+        locations: dict[tuple[str, str, str], list[tuple[int, int, int]]] = {}
+        self._by_token: dict[tuple[str, str, str], list[int]] = {}
+        for pos, f in enumerate(findings):
+            axis = self.axes[pos]
+            if f.file_path and f.line_start is not None:
+                key = (f.vendor, axis, _path_bucket(f.file_path))
+                end = f.line_end or f.line_start
+                locations.setdefault(key, []).append((f.line_start, end, pos))
+            for token in self.tokens[pos]:
+                self._by_token.setdefault((f.vendor, axis, token), []).append(pos)
+
+        # Spans sorted by start, alongside their starts for bisection.
+        self._by_location = {
+            key: ([start for start, _, _ in spans], spans)
+            for key, spans in ((k, sorted(v)) for k, v in locations.items())
+        }
+
+    def candidates(self, pos: int, vendor: str) -> list[int]:
+        """Positions of *vendor*'s findings that may score above zero against *pos*."""
+        f = self.findings[pos]
+        axis = self.axes[pos]
+        found: set[int] = set()
+        if f.file_path and f.line_start is not None:
+            entry = self._by_location.get((vendor, axis, _path_bucket(f.file_path)))
+            if entry is not None:
+                starts, spans = entry
+                end = f.line_end or f.line_start
+                for _, other_end, other in spans[:bisect_right(starts, end)]:
+                    if other_end >= f.line_start:
+                        found.add(other)
+        for token in self.tokens[pos]:
+            found.update(self._by_token.get((vendor, axis, token), ()))
+        return sorted(found)
+
+    def score(self, a: int, b: int) -> tuple[float, str]:
+        return _match_score(
+            self.findings[a], self.findings[b], self.tokens[a], self.tokens[b],
+        )
+
+
 # ---------------------------------------------------------------------------
 # Synthesizer
 # ---------------------------------------------------------------------------
@@ -396,19 +472,18 @@ class ConsensusSynthesizer:
         )
 
     def _match_all(self, findings: list[Finding]) -> list[FindingMatch]:
-        """Match findings across vendors using greedy best-match."""
+        """Match findings across vendors using greedy best-match.
+
+        Each finding, in input order, claims the best-scoring unused
+        finding from every other vendor; ties go to the earlier finding.
+        Only candidates from :class:`_FindingIndex` are scored, since every
+        other finding scores zero and can never be the best match.
+        """
         used: set[tuple[str, int]] = set()
         matches: list[FindingMatch] = []
+        index = _FindingIndex(findings)
 
-        # Group findings by vendor
-        by_vendor: dict[str, list[Finding]] = {}
-        for f in findings:
-            by_vendor.setdefault(f.vendor, []).append(f)
-
-        vendors = list(by_vendor.keys())
-
-        # For each finding, find best matches from other vendors
-        for f in findings:
+        for pos, f in enumerate(findings):
             key = (f.vendor, f.id)
             if key in used:
                 continue
@@ -417,17 +492,18 @@ class ConsensusSynthesizer:
             used.add(key)
 
             # Find matches from other vendors
-            for other_vendor in vendors:
+            for other_vendor in index.vendors:
                 if other_vendor == f.vendor:
                     continue
                 best_score = 0.0
                 best_match: Finding | None = None
                 best_basis = ""
-                for candidate in by_vendor[other_vendor]:
+                for cpos in index.candidates(pos, other_vendor):
+                    candidate = findings[cpos]
                     ckey = (candidate.vendor, candidate.id)
                     if ckey in used:
                         continue
-                    s, basis = match_score(f, candidate)
+                    s, basis = index.score(pos, cpos)
                     if s > best_score:
                         best_score = s
                         best_match = candidate
@@ -24,10 +24,12 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -315,6 +317,115 @@ class ReviewResult:
     # OpenRouter/OpenAI-compatible generation id for spend reconciliation
     # (OpenSpec add-adaptive-model-router, D7/D10). None for CLI/SDK adapters.
     generation_id: str | None = None
+    # Wall-clock offsets from the start of the dispatch_and_wait() panel.
+    # completed_offset_seconds stays None for a vendor that was not awaited.
+    started_offset_seconds: float | None = None
+    completed_offset_seconds: float | None = None
+
+
+# ---------------------------------------------------------------------------
+# Vendor subprocess tracking
+# ---------------------------------------------------------------------------
+
+class DispatchCancelled(RuntimeError):
+    """Raised when a panel stops before a vendor's next subprocess starts."""
+
+
+class ProcessTracker:
+    """Thread-safe registry of the vendor CLI processes one panel started.
+
+    ``dispatch_and_wait`` hands one tracker to every worker.  When the
+    panel returns early (quorum or global deadline) it calls
+    ``terminate_all`` so vendors that are no longer awaited stop burning
+    tokens instead of running on until their own timeout.
+    """
+
+    def __init__(self, grace_seconds: float = 5.0) -> None:
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        self._live: set[subprocess.Popen[str]] = set()
+        self._cancelled = False
+
+    def run(
+        self,
+        cmd: list[str],
+        *,
+        input: str | None = None,
+        timeout: float,
+        cwd: str | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """``subprocess.run(capture_output=True, text=True)`` with a tracked Popen."""
+        with self._lock:
+            if self._cancelled:
+                raise DispatchCancelled("review panel already finished")
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=cwd,
+            )
+            self._live.add(proc)
+        try:
+            try:
+                stdout, stderr = proc.communicate(input=input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.communicate()
+                raise
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+        finally:
+            with self._lock:
+                self._live.discard(proc)
+
+    def terminate_all(self) -> int:
+        """Stop every live process (SIGTERM, then SIGKILL after the grace period).
+
+        Also refuses any later ``run``, so a worker cannot start a fallback
+        model after the panel has moved on.  Returns how many were stopped.
+        """
+        with self._lock:
+            self._cancelled = True
+            procs = list(self._live)
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+        deadline = time.monotonic() + self.grace_seconds
+        for proc in procs:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        return len(procs)
+
+
+def _run_cli(
+    cmd: list[str],
+    *,
+    input: str | None,
+    timeout: float,
+    cwd: str | None,
+    processes: ProcessTracker | None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a vendor CLI, through *processes* when a panel is tracking it."""
+    if processes is None:
+        return subprocess.run(
+            cmd,
+            input=input,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            cwd=cwd,
+        )
+    return processes.run(cmd, input=input, timeout=timeout, cwd=cwd)
+
+
+def _remaining(deadline: float | None, cap: float) -> float:
+    """Seconds left before monotonic *deadline*, never more than *cap*."""
+    if deadline is None:
+        return cap
+    return max(0.0, min(cap, deadline - time.monotonic()))
 
 
 # ---------------------------------------------------------------------------
@@ -420,6 +531,7 @@ class CliVendorAdapter:
         cwd: Path,
         timeout_seconds: int = 300,
         archetype_model: str | None = None,
+        processes: ProcessTracker | None = None,
     ) -> ReviewResult:
         """Dispatch a review with model fallback on capacity errors.
 
@@ -430,6 +542,8 @@ class CliVendorAdapter:
             archetype_model: Optional model override from archetype resolution.
                 When provided, overrides the agent's default primary model
                 but reuses the existing fallback chain (design decision D4).
+            processes: Tracker that owns the CLI subprocess when dispatched
+                from a panel, so the panel can stop it early.
         """
         primary = archetype_model or self.cli_config.model
         models_to_try: list[str | None] = [primary]
@@ -463,13 +577,12 @@ class CliVendorAdapter:
             start = time.monotonic()
 
             try:
-                result = subprocess.run(
+                result = _run_cli(
                     cmd,
                     input=stdin_text,
-                    capture_output=True,
-                    text=True,
                     timeout=timeout_seconds,
                     cwd=str(cwd),
+                    processes=processes,
                 )
                 elapsed = time.monotonic() - start
 
@@ -721,11 +834,14 @@ class CliVendorAdapter:
         mode: str,
         prompt: str,
         cwd: Path,
+        processes: ProcessTracker | None = None,
+        deadline: float | None = None,
     ) -> ReviewResult:
         """Submit an async dispatch and return immediately with task_id.
 
         The caller must subsequently call ``poll_for_result()`` to wait
-        for completion.
+        for completion.  ``deadline`` (a ``time.monotonic()`` value) caps
+        the submit timeout to the panel's remaining budget.
         """
         mode_config = self.cli_config.dispatch_modes[mode]
         if not mode_config.async_dispatch or not mode_config.poll:
@@ -761,13 +877,13 @@ class CliVendorAdapter:
             start = time.monotonic()
 
             try:
-                result = subprocess.run(
+                result = _run_cli(
                     cmd,
                     input=stdin_text,
-                    capture_output=True,
-                    text=True,
-                    timeout=120,  # submit timeout (not execution timeout)
+                    # submit timeout (not execution timeout)
+                    timeout=_remaining(deadline, 120),
                     cwd=str(cwd),
+                    processes=processes,
                 )
             except subprocess.TimeoutExpired:
                 return ReviewResult(
@@ -855,6 +971,8 @@ class CliVendorAdapter:
         task_id: str,
         poll_config: PollConfig,
         cwd: Path | None = None,
+        processes: ProcessTracker | None = None,
+        deadline: float | None = None,
     ) -> ReviewResult:
         """Poll an async task until completion or timeout.
 
@@ -862,6 +980,10 @@ class CliVendorAdapter:
             task_id: Task identifier extracted from async dispatch output.
             poll_config: Polling configuration from the mode config.
             cwd: Working directory for poll commands (optional).
+            processes: Tracker that owns the poll subprocesses (optional).
+            deadline: ``time.monotonic()`` value the polling must not run
+                past; each poll command and sleep is capped to the time
+                left before it (optional).
 
         Returns:
             ReviewResult with findings if successful, error otherwise.
@@ -875,26 +997,28 @@ class CliVendorAdapter:
         failure_re = re.compile(poll_config.failure_pattern, re.IGNORECASE)
 
         start = time.monotonic()
-        deadline = start + poll_config.timeout_seconds
+        poll_deadline = start + poll_config.timeout_seconds
+        if deadline is not None:
+            poll_deadline = min(poll_deadline, deadline)
         attempts = 0
 
-        while time.monotonic() < deadline:
+        while (left := poll_deadline - time.monotonic()) > 0:
             attempts += 1
             logger.info(
                 "Polling %s task %s (attempt %d)", self.vendor, task_id, attempts,
             )
 
             try:
-                result = subprocess.run(
+                result = _run_cli(
                     poll_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+                    input=None,
+                    timeout=min(30, left),
                     cwd=str(cwd) if cwd else None,
+                    processes=processes,
                 )
             except subprocess.TimeoutExpired:
                 logger.warning("Poll command timed out, retrying")
-                time.sleep(poll_config.interval_seconds)
+                time.sleep(min(poll_config.interval_seconds, left))
                 continue
 
             combined = result.stdout + "\n" + result.stderr
@@ -927,14 +1051,15 @@ class CliVendorAdapter:
                 )
 
             # Still running — wait and retry
-            time.sleep(poll_config.interval_seconds)
+            time.sleep(min(poll_config.interval_seconds, left))
 
         # Timeout
+        elapsed = time.monotonic() - start
         return ReviewResult(
             vendor=self.vendor,
             success=False,
-            elapsed_seconds=time.monotonic() - start,
-            error=f"Polling timed out after {poll_config.timeout_seconds}s ({attempts} attempts)",
+            elapsed_seconds=elapsed,
+            error=f"Polling timed out after {round(elapsed, 1)}s ({attempts} attempts)",
             error_class=ErrorClass.TRANSIENT,
             task_id=task_id,
         )
@@ -1719,11 +1844,30 @@ class ReviewOrchestrator:
         cwd: Path,
         timeout_seconds: int = 300,
         exclude_vendor: str | None = None,
+        deadline_seconds: float | None = None,
+        quorum: int | None = None,
     ) -> list[ReviewResult]:
-        """Dispatch reviews to available vendors and collect results.
+        """Dispatch reviews to available vendors concurrently and collect results.
 
-        Uses three-tier selection: CLI → SDK → skip.
-        Currently dispatches sequentially.
+        Uses three-tier selection: CLI → SDK → skip.  Every selected vendor
+        is dispatched at once on its own worker thread, so a panel costs the
+        slowest vendor's latency rather than the sum of them.
+
+        Args:
+            timeout_seconds: Per-vendor timeout handed to each adapter.
+            deadline_seconds: Optional wall-clock budget for the whole panel.
+                Adapter timeouts are capped to it, and a vendor still running
+                when it expires is reported as a TRANSIENT failure.
+            quorum: Optional early-completion threshold (for example
+                ``MIN_REVIEW_VENDORS``).  Once this many vendors succeed the
+                call returns without waiting for the rest; those are
+                reported as not awaited.
+
+        Results keep the order of ``discover_reviewers()`` regardless of
+        completion order, and carry their start/finish offsets from the
+        start of the panel.  On an early return the CLI subprocesses of
+        vendors that are not awaited are terminated (SDK calls cannot be
+        interrupted and finish on their daemon worker thread).
         """
         try:
             from api_key_resolver import ApiKeyResolver
@@ -1765,79 +1909,181 @@ class ReviewOrchestrator:
             )
 
         api_key_resolver = ApiKeyResolver()
-        results: list[ReviewResult] = []
+        vendor_timeout: float = timeout_seconds
+        if deadline_seconds is not None:
+            vendor_timeout = min(vendor_timeout, deadline_seconds)
 
-        for reviewer in available:
-            if reviewer.dispatch_tier == "cli":
-                # CLI dispatch
-                adapter = self.adapters[reviewer.agent_id]
-                if not adapter.can_dispatch(dispatch_mode):
-                    logger.info(
-                        "Skipping %s: dispatch mode '%s' not configured",
-                        reviewer.agent_id, dispatch_mode,
-                    )
-                    continue
+        panel_start = time.monotonic()
+        panel_deadline = (
+            panel_start + deadline_seconds if deadline_seconds is not None else None
+        )
+        processes = ProcessTracker()
+        completed: queue.Queue[tuple[int, ReviewResult | None, float]] = queue.Queue()
+        started: dict[int, float] = {}
 
-                mode_config = adapter.cli_config.dispatch_modes[dispatch_mode]
+        def _worker(index: int, reviewer: ReviewerInfo) -> None:
+            try:
+                result = self._dispatch_one(
+                    reviewer, review_type, dispatch_mode, prompt, cwd,
+                    vendor_timeout, api_key_resolver, processes, panel_deadline,
+                )
+            except DispatchCancelled:
+                return  # the panel already returned without this vendor
+            except Exception as exc:  # noqa: BLE001 — fail this vendor, not the panel
+                logger.exception("%s dispatch raised", reviewer.agent_id)
+                result = ReviewResult(
+                    vendor=reviewer.vendor,
+                    success=False,
+                    error=f"Dispatch raised {type(exc).__name__}: {exc}",
+                    error_class=ErrorClass.UNKNOWN,
+                )
+            completed.put((index, result, time.monotonic() - panel_start))
+
+        for index, reviewer in enumerate(available):
+            started[index] = time.monotonic() - panel_start
+            threading.Thread(
+                target=_worker,
+                args=(index, reviewer),
+                name=f"review-{reviewer.agent_id}",
+                daemon=True,
+            ).start()
+
+        by_index: dict[int, ReviewResult | None] = {}
+        successes = 0
+        stop_reason = ""
+        deadline_hit = False
+        while len(by_index) < len(available):
+            if quorum is not None and successes >= quorum:
+                stop_reason = f"Not awaited: quorum of {quorum} reached"
+                break
+            wait: float | None = None
+            if deadline_seconds is not None:
+                wait = deadline_seconds - (time.monotonic() - panel_start)
+                if wait <= 0:
+                    stop_reason = f"Global deadline of {deadline_seconds}s reached"
+                    deadline_hit = True
+                    break
+            try:
+                index, result, finished = completed.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if result is not None:
+                result.started_offset_seconds = round(started[index], 3)
+                result.completed_offset_seconds = round(finished, 3)
+                successes += int(result.success)
+            by_index[index] = result
 
-                if mode_config.async_dispatch:
-                    logger.info(
-                        "Async CLI dispatching %s review to %s",
-                        review_type, reviewer.agent_id,
-                    )
-                    submit_result = adapter.dispatch_async(
-                        mode=dispatch_mode, prompt=prompt, cwd=cwd,
-                    )
-                    if submit_result.success and submit_result.task_id and mode_config.poll:
-                        poll_result = adapter.poll_for_result(
-                            submit_result.task_id, mode_config.poll, cwd=cwd,
-                        )
-                        results.append(poll_result)
-                    else:
-                        results.append(submit_result)
-                else:
-                    logger.info(
-                        "Sync CLI dispatching %s review to %s",
-                        review_type, reviewer.agent_id,
-                    )
-                    result = adapter.dispatch(
-                        mode=dispatch_mode,
-                        prompt=prompt,
-                        cwd=cwd,
-                        timeout_seconds=timeout_seconds,
-                    )
+        if stop_reason:
+            stopped = processes.terminate_all()
+            if stopped:
+                logger.info("Stopped %d vendor process(es): %s", stopped, stop_reason)
+
+        results: list[ReviewResult] = []
+        for index, reviewer in enumerate(available):
+            if index in by_index:
+                result = by_index[index]
+                if result is not None:
                     results.append(result)
+                continue
+            # Only reachable after an early stop: report the vendor as not
+            # awaited. A deadline miss is retryable (TRANSIENT); a vendor cut
+            # off by quorum did not fail, so it carries no error class.
+            logger.info("%s: %s", reviewer.agent_id, stop_reason)
+            results.append(ReviewResult(
+                vendor=reviewer.vendor,
+                success=False,
+                elapsed_seconds=round(time.monotonic() - panel_start - started[index], 3),
+                error=stop_reason,
+                error_class=ErrorClass.TRANSIENT if deadline_hit else None,
+                started_offset_seconds=round(started[index], 3),
+            ))
+        return results
 
-            elif reviewer.dispatch_tier == "sdk":
-                # SDK dispatch
-                sdk_adapter = self.sdk_adapters[reviewer.agent_id]
-                api_key = api_key_resolver.resolve(
-                    sdk_adapter.openbao_role_id,
-                    sdk_adapter.sdk_config.api_key_env,
+    def _dispatch_one(
+        self,
+        reviewer: ReviewerInfo,
+        review_type: str,
+        dispatch_mode: str,
+        prompt: str,
+        cwd: Path,
+        timeout_seconds: float,
+        api_key_resolver: Any,
+        processes: ProcessTracker | None = None,
+        deadline: float | None = None,
+    ) -> ReviewResult | None:
+        """Run one reviewer's dispatch to completion; ``None`` when skipped.
+
+        CLI subprocesses run under *processes*; async polling stops at the
+        monotonic *deadline*.
+        """
+        if reviewer.dispatch_tier == "cli":
+            # CLI dispatch
+            adapter = self.adapters[reviewer.agent_id]
+            if not adapter.can_dispatch(dispatch_mode):
+                logger.info(
+                    "Skipping %s: dispatch mode '%s' not configured",
+                    reviewer.agent_id, dispatch_mode,
                 )
+                return None
+
+            mode_config = adapter.cli_config.dispatch_modes[dispatch_mode]
+
+            if mode_config.async_dispatch:
                 logger.info(
-                    "SDK dispatching %s review to %s (key: %s)",
+                    "Async CLI dispatching %s review to %s",
                     review_type, reviewer.agent_id,
-                    "resolved" if api_key else "missing",
                 )
-                if not api_key:
-                    results.append(ReviewResult(
-                        vendor=reviewer.vendor,
-                        success=False,
-                        error="No API key available for SDK dispatch",
-                    ))
-                    continue
+                submit_result = adapter.dispatch_async(
+                    mode=dispatch_mode, prompt=prompt, cwd=cwd,
+                    processes=processes, deadline=deadline,
+                )
+                if submit_result.success and submit_result.task_id and mode_config.poll:
+                    return adapter.poll_for_result(
+                        submit_result.task_id, mode_config.poll, cwd=cwd,
+                        processes=processes, deadline=deadline,
+                    )
+                return submit_result
 
-                result = sdk_adapter.dispatch(
-                    mode=dispatch_mode,
-                    prompt=prompt,
-                    cwd=cwd,
-                    timeout_seconds=timeout_seconds,
-                    api_key=api_key,
+            logger.info(
+                "Sync CLI dispatching %s review to %s",
+                review_type, reviewer.agent_id,
+            )
+            return adapter.dispatch(
+                mode=dispatch_mode,
+                prompt=prompt,
+                cwd=cwd,
+                timeout_seconds=timeout_seconds,
+                processes=processes,
+            )
+
+        if reviewer.dispatch_tier == "sdk":
+            # SDK dispatch
+            sdk_adapter = self.sdk_adapters[reviewer.agent_id]
+            api_key = api_key_resolver.resolve(
+                sdk_adapter.openbao_role_id,
+                sdk_adapter.sdk_config.api_key_env,
+            )
+            logger.info(
+                "SDK dispatching %s review to %s (key: %s)",
+                review_type, reviewer.agent_id,
+                "resolved" if api_key else "missing",
+            )
+            if not api_key:
+                return ReviewResult(
+                    vendor=reviewer.vendor,
+                    success=False,
+                    error="No API key available for SDK dispatch",
                 )
-                results.append(result)
 
-        return results
+            return sdk_adapter.dispatch(
+                mode=dispatch_mode,
+                prompt=prompt,
+                cwd=cwd,
+                timeout_seconds=timeout_seconds,
+                api_key=api_key,
+            )
+
+        return None
 
     def write_manifest(
         self,
@@ -1862,6 +2108,11 @@ class ReviewOrchestrator:
         raises ``ValueError`` instead of silently losing the requested name.
         ``vendors`` defaults to an empty index for callers that pre-date
         the per-vendor file write loop in main().
+
+        Each ``dispatches[]`` entry also records the vendor's
+        ``started_offset_seconds`` / ``completed_offset_seconds`` within the
+        concurrent panel (null for results built outside
+        ``dispatch_and_wait`` and for vendors that were not awaited).
         """
         if output_path.name != "review-manifest.json":
             raise ValueError(
@@ -1882,6 +2133,8 @@ class ReviewOrchestrator:
                 "elapsed_seconds": r.elapsed_seconds,
                 "error": r.error,
                 "error_class": r.error_class.value if r.error_class else None,
+                "started_offset_seconds": r.started_offset_seconds,
+                "completed_offset_seconds": r.completed_offset_seconds,
             }
             for r in results
         ]
@@ -2030,6 +2283,20 @@ def main() -> int:
         "--timeout", type=int, default=300,
         help="Per-vendor timeout in seconds",
     )
+    parser.add_argument(
+        "--deadline", type=float, default=None,
+        help=(
+            "Wall-clock budget in seconds for the whole panel; vendors still "
+            "running when it expires are reported as timed out"
+        ),
+    )
+    parser.add_argument(
+        "--early-quorum", action="store_true",
+        help=(
+            f"Return as soon as {MIN_REVIEW_VENDORS} vendors succeed instead "
+            f"of waiting for the slowest one"
+        ),
+    )
     parser.add_argument(
         "--agents-yaml", help="Path to agents.yaml (default: auto-detect)",
     )
@@ -2130,6 +2397,8 @@ def main() -> int:
         cwd=cwd,
         timeout_seconds=args.timeout,
         exclude_vendor=args.exclude_vendor,
+        deadline_seconds=args.deadline,
+        quorum=MIN_REVIEW_VENDORS if args.early_quorum else None,
     )
 
     # Write results via the shared checkpoint_findings helper. Per-vendor
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -10,7 +11,9 @@ import pytest
 from consensus_synthesizer import (
     ConsensusSynthesizer,
     Finding,
+    FindingMatch,
     VendorResult,
+    _FindingIndex,
     _jaccard,
     _paths_match,
     _tokenize,
@@ -268,6 +271,89 @@ class TestCrossVendorFormatSkew:
 # Consensus synthesis
 # ---------------------------------------------------------------------------
 
+def _brute_force_match_all(
+    findings: list[Finding], threshold: float,
+) -> list[FindingMatch]:
+    """Reference greedy matcher: score every pair with ``match_score``."""
+    used: set[tuple[str, int]] = set()
+    by_vendor: dict[str, list[Finding]] = {}
+    for f in findings:
+        by_vendor.setdefault(f.vendor, []).append(f)
+    matches = []
+    for f in findings:
+        if (f.vendor, f.id) in used:
+            continue
+        match = FindingMatch(primary=f)
+        used.add((f.vendor, f.id))
+        for other_vendor, candidates in by_vendor.items():
+            if other_vendor == f.vendor:
+                continue
+            best_score, best, best_basis = 0.0, None, ""
+            for c in candidates:
+                if (c.vendor, c.id) in used:
+                    continue
+                s, basis = match_score(f, c)
+                if s > best_score:
+                    best_score, best, best_basis = s, c, basis
+            if best and best_score >= threshold:
+                match.matched.append(best)
+                match.score = max(match.score, best_score)
+                match.basis = best_basis
+                used.add((best.vendor, best.id))
+        matches.append(match)
+    return matches
+
+
+class TestIndexedMatching:
+    def test_candidates_cover_location_and_token_overlap(self) -> None:
+        findings = [
+            _finding(id=1, file_path="src/api.py", line_start=10, line_end=12,
+                     description="alpha"),
+            _finding(id=1, vendor="grok", file_path="/repo/src/api.py",
+                     line_start=12, description="unrelated words"),
+            _finding(id=2, vendor="grok", file_path="src/api.py",
+                     line_start=13, description="different entirely"),
+            _finding(id=3, vendor="grok", description="alpha appears here"),
+        ]
+        finding = _finding(id=4, vendor="grok", description="alpha",
+                           file_path="src/api.py", line_start=10)
+        finding.axis = "security"
+        findings.append(finding)
+        index = _FindingIndex(findings)
+        assert index.candidates(0, "grok") == [1, 3]
+
+    def test_matches_brute_force_greedy(self) -> None:
+        rng = random.Random(7)
+        words = "auth token cache race lock leak retry timeout null handler".split()
+        paths = ["src/a.py", "./src/a.py", "/repo/src/a.py", "b/src/a.py",
+                 "src/b.py", None]
+        for _ in range(100):
+            findings = []
+            for vendor in ("codex", "grok", "gemini"):
+                for i in range(rng.randint(0, 12)):
+                    start = rng.choice([None, rng.randint(1, 30)])
+                    f = _finding(
+                        id=i, vendor=vendor,
+                        type=rng.choice(["bug", "correctness", "security"]),
+                        description=" ".join(rng.sample(words, rng.randint(0, 4))),
+                        file_path=rng.choice(paths), line_start=start,
+                        line_end=None if start is None else start + rng.randint(0, 5),
+                    )
+                    f.axis = rng.choice(["correctness", "Security"])
+                    findings.append(f)
+            rng.shuffle(findings)
+            for threshold in (0.6, 0.0):
+                got = ConsensusSynthesizer(match_threshold=threshold)._match_all(findings)
+                want = _brute_force_match_all(findings, threshold)
+                assert [
+                    (id(m.primary), [id(x) for x in m.matched], m.score, m.basis)
+                    for m in got
+                ] == [
+                    (id(m.primary), [id(x) for x in m.matched], m.score, m.basis)
+                    for m in want
+                ]
+
+
 class TestConsensusSynthesizer:
     def test_confirmed_finding(self) -> None:
         """Two vendors agree on same finding with same disposition."""
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import json
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,7 +17,9 @@ from review_dispatcher import (
     CliVendorAdapter,
     ErrorClass,
     ModeConfig,
+    ProcessTracker,
     ReviewOrchestrator,
+    ReviewerInfo,
     ReviewResult,
     SdkConfig,
     SdkVendorAdapter,
@@ -562,6 +567,157 @@ class TestOrchestrator:
         assert data["dispatches"][1]["error_class"] == "capacity_exhausted"
 
 
+# ---------------------------------------------------------------------------
+# Concurrent panel dispatch
+# ---------------------------------------------------------------------------
+
+def _panel(*vendors: str) -> list[ReviewerInfo]:
+    return [
+        ReviewerInfo(vendor=v, agent_id=f"{v}-local", dispatch_tier="cli")
+        for v in vendors
+    ]
+
+
+def _fake_dispatch(
+    delays: dict[str, float], failures: frozenset[str] = frozenset(),
+):
+    """Stand-in for ``_dispatch_one`` that sleeps per vendor, then reports."""
+    def _dispatch_one(
+        reviewer: ReviewerInfo, *args: object, **kwargs: object,
+    ) -> ReviewResult:
+        time.sleep(delays[reviewer.vendor])
+        if reviewer.vendor in failures:
+            raise RuntimeError("adapter exploded")
+        return ReviewResult(vendor=reviewer.vendor, success=True)
+    return _dispatch_one
+
+
+class TestConcurrentDispatch:
+    def _run(
+        self, tmp_path: Path, delays: dict[str, float], **kwargs: object,
+    ) -> tuple[list[ReviewResult], float]:
+        orch = ReviewOrchestrator({})
+        failures = kwargs.pop("failures", frozenset())
+        with patch.object(orch, "discover_reviewers", return_value=_panel(*delays)), \
+                patch.object(orch, "_dispatch_one",
+                             side_effect=_fake_dispatch(delays, failures)):  # type: ignore[arg-type]
+            start = time.monotonic()
+            results = orch.dispatch_and_wait(
+                "plan", "review", "prompt", cwd=tmp_path, **kwargs,  # type: ignore[arg-type]
+            )
+        return results, time.monotonic() - start
+
+    def test_vendors_run_concurrently(self, tmp_path: Path) -> None:
+        results, wall = self._run(
+            tmp_path, {"codex": 0.3, "gemini": 0.3, "claude": 0.3},
+        )
+        assert all(r.success for r in results)
+        # Sequential dispatch would take ~0.9s.
+        assert wall < 0.75
+
+    def test_results_keep_reviewer_order(self, tmp_path: Path) -> None:
+        results, _ = self._run(tmp_path, {"codex": 0.3, "gemini": 0.0, "claude": 0.1})
+        assert [r.vendor for r in results] == ["codex", "gemini", "claude"]
+        for r in results:
+            assert r.started_offset_seconds is not None
+            assert r.completed_offset_seconds is not None
+        assert results[1].completed_offset_seconds < results[0].completed_offset_seconds
+
+    def test_early_quorum_stops_waiting(self, tmp_path: Path) -> None:
+        results, wall = self._run(
+            tmp_path, {"codex": 0.0, "gemini": 0.0, "claude": 2.0}, quorum=2,
+        )
+        assert wall < 1.5
+        assert [r.vendor for r in results] == ["codex", "gemini", "claude"]
+        assert results[0].success and results[1].success
+        slow = results[2]
+        assert slow.success is False
+        assert slow.error == "Not awaited: quorum of 2 reached"
+        assert slow.error_class is None
+
+    def test_global_deadline_marks_stragglers_transient(self, tmp_path: Path) -> None:
+        results, wall = self._run(
+            tmp_path, {"codex": 0.0, "gemini": 2.0}, deadline_seconds=0.3,
+        )
+        assert wall < 1.5
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error_class == ErrorClass.TRANSIENT
+        assert "deadline" in (results[1].error or "")
+
+    def test_deadline_caps_adapter_timeout(self, tmp_path: Path) -> None:
+        orch = ReviewOrchestrator({})
+        seen: list[float] = []
+
+        def _dispatch_one(reviewer: ReviewerInfo, *args: object) -> ReviewResult:
+            seen.append(args[4])  # type: ignore[arg-type]
+            return ReviewResult(vendor=reviewer.vendor, success=True)
+
+        with patch.object(orch, "discover_reviewers", return_value=_panel("codex")), \
+                patch.object(orch, "_dispatch_one", side_effect=_dispatch_one):
+            orch.dispatch_and_wait(
+                "plan", "review", "prompt", cwd=tmp_path,
+                timeout_seconds=300, deadline_seconds=30,
+            )
+        assert seen == [30]
+
+    def test_early_return_terminates_outstanding_cli(self, tmp_path: Path) -> None:
+        orch = ReviewOrchestrator({})
+        finished = threading.Event()
+        outcome: dict[str, object] = {}
+
+        def _dispatch_one(reviewer: ReviewerInfo, *args: object) -> ReviewResult:
+            if reviewer.vendor == "claude":
+                processes = args[6]
+                assert isinstance(processes, ProcessTracker)
+                try:
+                    proc = processes.run(
+                        [sys.executable, "-c", "import time; time.sleep(30)"],
+                        timeout=60,
+                    )
+                    outcome["returncode"] = proc.returncode
+                finally:
+                    finished.set()
+            return ReviewResult(vendor=reviewer.vendor, success=True)
+
+        with patch.object(orch, "discover_reviewers",
+                          return_value=_panel("codex", "gemini", "claude")), \
+                patch.object(orch, "_dispatch_one", side_effect=_dispatch_one):
+            results = orch.dispatch_and_wait(
+                "plan", "review", "prompt", cwd=tmp_path, quorum=2,
+            )
+
+        assert results[2].error == "Not awaited: quorum of 2 reached"
+        assert finished.wait(timeout=10)
+        assert outcome["returncode"] != 0
+
+    def test_tracker_refuses_runs_after_terminate(self) -> None:
+        from review_dispatcher import DispatchCancelled
+
+        processes = ProcessTracker()
+        assert processes.terminate_all() == 0
+        with pytest.raises(DispatchCancelled):
+            processes.run([sys.executable, "-c", "pass"], timeout=5)
+
+    def test_worker_exception_fails_only_that_vendor(self, tmp_path: Path) -> None:
+        results, _ = self._run(
+            tmp_path, {"codex": 0.0, "gemini": 0.0},
+            failures=frozenset({"gemini"}),
+        )
+        assert results[0].success is True
+        assert results[1].success is False
+        assert results[1].error_class == ErrorClass.UNKNOWN
+        assert "adapter exploded" in (results[1].error or "")
+
+    def test_manifest_records_offsets(self, tmp_path: Path) -> None:
+        results, _ = self._run(tmp_path, {"codex": 0.0, "gemini": 0.1})
+        output = tmp_path / "review-manifest.json"
+        ReviewOrchestrator({}).write_manifest(results, output, "plan", "feat")
+        dispatches = json.loads(output.read_text())["dispatches"]
+        assert all("started_offset_seconds" in d for d in dispatches)
+        assert dispatches[1]["completed_offset_seconds"] >= 0.1
+
+
 # ---------------------------------------------------------------------------
 # Async dispatch + polling tests
 # ---------------------------------------------------------------------------
@@ -684,6 +840,31 @@ class TestAsyncDispatch:
         assert result.success is False
         assert "failed" in (result.error or "").lower()
 
+    @patch("review_dispatcher.subprocess.run")
+    def test_poll_timeout_capped_by_deadline(self, mock_run: MagicMock) -> None:
+        """Each poll command gets at most the time left before the deadline."""
+        from review_dispatcher import PollConfig
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="Status: running", stderr="",
+        )
+        adapter = _async_adapter()
+        poll_cfg = PollConfig(
+            command_template=["codex", "cloud", "status", "{task_id}"],
+            task_id_pattern=r"task[_\s:]+(\w+)",
+            success_pattern="completed",
+            interval_seconds=0.05,
+            timeout_seconds=600,
+        )
+        start = time.monotonic()
+        result = adapter.poll_for_result(
+            "abc123", poll_cfg, deadline=time.monotonic() + 0.3,
+        )
+        assert time.monotonic() - start < 1.0
+        assert result.success is False
+        assert result.error_class == ErrorClass.TRANSIENT
+        timeouts = [c.kwargs["timeout"] for c in mock_run.call_args_list]
+        assert timeouts and all(0 <= t <= 0.3 for t in timeouts)
+
     @patch("review_dispatcher.subprocess.run")
     @patch("review_dispatcher.time.sleep")
     @patch("review_dispatcher.time.monotonic")
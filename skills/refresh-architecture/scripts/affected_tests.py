@@ -22,10 +22,13 @@ import json
 import logging
 import sys
 import time
-from collections import defaultdict, deque
+from collections import deque
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from arch_utils.graph_index import ArchitectureGraph, normalize_path  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +43,9 @@ MAX_GRAPH_AGE_HOURS: int = 24
 #: return None (fall back to full suite) rather than block indefinitely.
 MAX_TRAVERSAL_NODES: int = 10_000
 
+#: Edge types followed in reverse so a change reaches its callers/importers.
+STRUCTURAL_EDGE_TYPES: frozenset[str] = frozenset({"import", "call"})
+
 
 # ---------------------------------------------------------------------------
 # Staleness / loading
@@ -68,70 +74,6 @@ def load_graph_with_mtime(graph_path: Path) -> tuple[dict[str, Any], float] | No
     return graph, graph_path.stat().st_mtime
 
 
-# ---------------------------------------------------------------------------
-# Path normalization
-# ---------------------------------------------------------------------------
-
-
-def _normalize_path(raw: str) -> str:
-    """Strip leading ./ and collapse redundant separators for comparison."""
-    p = raw.strip()
-    if p.startswith("./"):
-        p = p[2:]
-    return p
-
-
-def _build_file_to_nodes_index(
-    nodes: list[dict[str, Any]],
-) -> dict[str, list[str]]:
-    """Map file path → list of node ids declared in that file.
-
-    Uses the suffix-match trick: for a changed file ``src/feature_flags.py``,
-    we also index ``feature_flags.py`` and ``agent-coordinator/src/feature_flags.py``
-    so that partial path matches still find the node.
-    """
-    index: dict[str, list[str]] = defaultdict(list)
-    for n in nodes:
-        f = n.get("file")
-        if not f:
-            continue
-        norm = _normalize_path(f)
-        index[norm].append(n["id"])
-    return dict(index)
-
-
-# ---------------------------------------------------------------------------
-# Reverse edge index
-# ---------------------------------------------------------------------------
-
-
-def _build_reverse_test_covers_index(
-    edges: list[dict[str, Any]],
-) -> dict[str, list[str]]:
-    """Map source_node_id → list of test_node_ids that cover it."""
-    reverse: dict[str, list[str]] = defaultdict(list)
-    for e in edges:
-        if e.get("type") == "TEST_COVERS":
-            reverse[e["to"]].append(e["from"])
-    return dict(reverse)
-
-
-def _build_reverse_structural_index(
-    edges: list[dict[str, Any]],
-) -> dict[str, list[str]]:
-    """Map target_node_id → list of caller/importer ids (for transitive walk).
-
-    Phase 1 is import-level only — transitive closure is deferred. We still
-    follow ``import`` edges in reverse so that changing a module propagates
-    to modules that import it (one hop), as a shallow heuristic.
-    """
-    reverse: dict[str, list[str]] = defaultdict(list)
-    for e in edges:
-        if e.get("type") in {"import", "call"}:
-            reverse[e["to"]].append(e["from"])
-    return dict(reverse)
-
-
 # ---------------------------------------------------------------------------
 # Main query
 # ---------------------------------------------------------------------------
@@ -143,7 +85,7 @@ def _resolve_changed_to_node_ids(
 ) -> set[str]:
     """Map file paths to graph node ids, tolerating prefix differences."""
     out: set[str] = set()
-    changed_norm = [_normalize_path(p) for p in changed_files]
+    changed_norm = [normalize_path(p) for p in changed_files]
     for changed in changed_norm:
         # 1. Exact match
         if changed in file_index:
@@ -215,16 +157,23 @@ def affected_tests(
             return None
         graph, _mtime = loaded
 
+    return affected_tests_in_graph(changed_files, ArchitectureGraph(graph))
+
+
+def affected_tests_in_graph(
+    changed_files: list[str],
+    graph: ArchitectureGraph,
+) -> list[str] | None:
+    """Run the affected-test query against an already loaded *graph*.
+
+    Freshness is the caller's responsibility. The graph's file and reverse
+    edge indexes are built on first use and reused by later queries, so a
+    long-lived caller (``rpc_server``) pays for them once per graph.
+    """
     if not changed_files:
         return []
 
-    nodes: list[dict[str, Any]] = graph.get("nodes", [])
-    edges: list[dict[str, Any]] = graph.get("edges", [])
-    node_by_id: dict[str, dict[str, Any]] = {n["id"]: n for n in nodes}
-
-    file_index = _build_file_to_nodes_index(nodes)
-    reverse_test_covers = _build_reverse_test_covers_index(edges)
-    reverse_structural = _build_reverse_structural_index(edges)
+    file_index = graph.file_index
 
     start_nodes = _resolve_changed_to_node_ids(changed_files, file_index)
     if not start_nodes:
@@ -237,7 +186,7 @@ def affected_tests(
 
     # BFS with visited set (cycle safe) and traversal bound.
     visited: set[str] = set()
-    frontier: deque[str] = deque(start_nodes)
+    frontier: deque[str] = deque(sorted(start_nodes))
     test_ids: set[str] = set()
 
     while frontier:
@@ -253,17 +202,19 @@ def affected_tests(
         visited.add(nid)
 
         # Collect tests covering this node
-        for test_id in reverse_test_covers.get(nid, ()):
-            test_ids.add(test_id)
+        test_ids.update(graph.tests_covering(nid))
 
         # Walk structural edges (import/call) in reverse — shallow transitive
-        for upstream in reverse_structural.get(nid, ()):
+        for upstream in graph.reverse.sources(nid, STRUCTURAL_EDGE_TYPES):
             if upstream not in visited:
                 frontier.append(upstream)
 
     # Uncovered input warning
     covered_any = any(
-        any(sid in reverse_test_covers for sid in file_index.get(_normalize_path(f), []))
+        any(
+            graph.is_covered(sid)
+            for sid in file_index.get(normalize_path(f), [])
+        )
         for f in changed_files
     )
     if not covered_any and not test_ids:
@@ -275,9 +226,9 @@ def affected_tests(
     # Dedupe test file paths
     test_files: set[str] = set()
     for tid in test_ids:
-        node = node_by_id.get(tid)
+        node = graph.node_by_id.get(tid)
         if node and node.get("file"):
-            test_files.add(_normalize_path(node["file"]))
+            test_files.add(normalize_path(node["file"]))
     return sorted(test_files)
 
 
@@ -16,6 +16,8 @@ Examples:
     python scripts/analyze_python.py src/
     python scripts/analyze_python.py . --include "*.py" --exclude "test_*"
     python scripts/analyze_python.py . --output docs/architecture-analysis/python_analysis.json
+    python scripts/analyze_python.py src/ --jobs 0 \
+        --cache docs/architecture-analysis/.cache/python_analysis.cache.json
 """
 
 from __future__ import annotations
@@ -23,6 +25,7 @@ from __future__ import annotations
 import argparse
 import ast
 import fnmatch
+import hashlib
 import json
 import logging
 import os
@@ -32,11 +35,17 @@ import warnings
 
 logger = logging.getLogger(__name__)
 from collections import defaultdict
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
 
+#: Bump whenever ModuleAnalyzer's per-file output changes shape or content, so
+#: results cached by an older analyzer are never merged into a newer run.
+ANALYZER_VERSION = 1
+
+
 # ---------------------------------------------------------------------------
 # Data structures
 # ---------------------------------------------------------------------------
@@ -731,35 +740,139 @@ def file_to_module_name(filepath: Path, root: Path) -> str:
     return ".".join(parts) if parts else filepath.stem
 
 
+# ---------------------------------------------------------------------------
+# Per-file analysis and result cache
+# ---------------------------------------------------------------------------
+
+def _analyze_source(
+    rel_path: str, module_name: str, source: str, filename: str,
+) -> dict[str, Any]:
+    """Parse and analyze one module, returning its JSON-safe per-file record.
+
+    ``called_by`` is left empty here: it is a whole-program relationship and is
+    recomputed by ``_populate_called_by`` after every record is merged.
+
+    Raises:
+        SyntaxError: If the source does not parse.
+    """
+    tree = ast.parse(source, filename=filename)
+    analyzer = ModuleAnalyzer(rel_path, module_name, source)
+    analyzer.visit(tree)
+    return {
+        "imports": analyzer.imports,
+        "functions": [asdict(f) for f in analyzer.functions],
+        "classes": [asdict(c) for c in analyzer.classes],
+        "import_edges": [asdict(e) for e in analyzer.import_edges],
+        "entry_points": [asdict(ep) for ep in analyzer.entry_points],
+        "db_accesses": [asdict(da) for da in analyzer.db_accesses],
+    }
+
+
+def _analyze_job(
+    job: tuple[str, str, str, str],
+) -> tuple[dict[str, Any] | None, str | None]:
+    """Process-pool entry point: ``(record, None)`` or ``(None, warning)``."""
+    rel_path, module_name, source, filename = job
+    try:
+        return _analyze_source(rel_path, module_name, source, filename), None
+    except SyntaxError as exc:
+        return None, f"SyntaxError in {filename} (line {exc.lineno}): {exc.msg}"
+
+
+class AnalysisCache:
+    """Per-file analysis records keyed by content hash and analyzer version.
+
+    Stored as one JSON document. A cache written by a different
+    ``ANALYZER_VERSION`` is discarded whole, and a file's entry is reused only
+    when its module name and SHA-256 both match, so a cached record is always
+    what re-analyzing the file would have produced.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("analyzer_version") == ANALYZER_VERSION:
+            files = data.get("files")
+            if isinstance(files, dict):
+                self.entries = files
+
+    def get(self, rel_path: str, module_name: str, digest: str) -> dict[str, Any] | None:
+        entry = self.entries.get(rel_path)
+        if entry and entry.get("sha256") == digest and entry.get("module") == module_name:
+            self.hits += 1
+            return entry["record"]
+        self.misses += 1
+        return None
+
+    def put(
+        self, rel_path: str, module_name: str, digest: str, record: dict[str, Any],
+    ) -> None:
+        self.entries[rel_path] = {"sha256": digest, "module": module_name, "record": record}
+
+    def save(self, keep: set[str]) -> None:
+        """Write entries for *keep* only, so deleted files do not linger."""
+        directory = self.path.parent
+        if not directory.exists():
+            directory.mkdir(parents=True)
+            # A directory this cache created holds nothing worth committing.
+            (directory / ".gitignore").write_text("*\n", encoding="utf-8")
+        document = {
+            "analyzer_version": ANALYZER_VERSION,
+            "files": {k: v for k, v in sorted(self.entries.items()) if k in keep},
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+
+def _resolve_jobs(jobs: int) -> int:
+    """``jobs <= 0`` means one worker per CPU."""
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
 # ---------------------------------------------------------------------------
 # Post-processing
 # ---------------------------------------------------------------------------
 
 def _populate_called_by(functions: list[FunctionInfo]) -> None:
-    """Populate called_by reverse relationships across all functions."""
-    # Build a lookup from function names (various forms) to qualified names
-    name_to_qualified: dict[str, list[str]] = defaultdict(list)
+    """Populate called_by reverse relationships across all functions.
+
+    Call names resolve through one index from every name form a function
+    answers to (bare name, qualified name, and each dotted suffix such as
+    ``class.method``) to the matching qualified names. Both that index and
+    the per-target caller sets are dicts used as ordered sets, so recording
+    an edge is O(1) however many callers a hub function has, and
+    ``called_by`` keeps its first-seen order over the sorted file walk.
+    """
+    name_to_targets: dict[str, dict[str, None]] = defaultdict(dict)
     for func in functions:
-        name_to_qualified[func.name].append(func.qualified_name)
-        name_to_qualified[func.qualified_name].append(func.qualified_name)
-        # Also register the short qualified forms (class.method, module.func)
         parts = func.qualified_name.split(".")
-        for i in range(1, len(parts)):
-            partial = ".".join(parts[i:])
-            name_to_qualified[partial].append(func.qualified_name)
+        for i in range(len(parts)):
+            name_to_targets[".".join(parts[i:])][func.qualified_name] = None
+        name_to_targets[func.name][func.qualified_name] = None
+
+    callers: dict[str, dict[str, None]] = {}
+    for func in functions:
+        for call_name in dict.fromkeys(func.calls):
+            for target_qname in name_to_targets.get(call_name, ()):
+                callers.setdefault(target_qname, {})[func.qualified_name] = None
 
     qualified_to_func: dict[str, FunctionInfo] = {
         f.qualified_name: f for f in functions
     }
-
-    for func in functions:
-        for call_name in func.calls:
-            # Resolve call_name to possible qualified names
-            targets = name_to_qualified.get(call_name, [])
-            for target_qname in targets:
-                target_func = qualified_to_func.get(target_qname)
-                if target_func and func.qualified_name not in target_func.called_by:
-                    target_func.called_by.append(func.qualified_name)
+    for target_qname, seen in callers.items():
+        target_func = qualified_to_func[target_qname]
+        merged = dict.fromkeys(target_func.called_by)
+        merged.update(seen)
+        target_func.called_by[:] = merged
 
 
 def _compute_summary(
@@ -896,6 +1009,9 @@ def analyze_directory(
     root: Path,
     include_patterns: list[str] | None = None,
     exclude_patterns: list[str] | None = None,
+    *,
+    jobs: int = 1,
+    cache_path: Path | None = None,
 ) -> dict[str, Any]:
     """Run the full analysis pipeline on a directory.
 
@@ -903,6 +1019,11 @@ def analyze_directory(
         root: Root directory to analyze.
         include_patterns: Glob patterns for files to include (default: all .py).
         exclude_patterns: Glob patterns for files to exclude.
+        jobs: Worker processes for parsing and analysis; ``<= 0`` uses one per
+            CPU. Output is identical for every value.
+        cache_path: Optional per-file result cache. Files whose content and
+            module name are unchanged since the cache was written are not
+            re-parsed; the cache is rewritten at the end of the run.
 
     Returns:
         Analysis results as a dictionary matching the output JSON schema.
@@ -912,14 +1033,13 @@ def analyze_directory(
     exclude = exclude_patterns or []
 
     files = discover_python_files(root, include, exclude)
+    cache = AnalysisCache(cache_path) if cache_path is not None else None
 
-    all_modules: list[ModuleInfo] = []
-    all_functions: list[FunctionInfo] = []
-    all_classes: list[ClassInfo] = []
-    all_import_edges: list[ImportEdge] = []
-    all_entry_points: list[EntryPoint] = []
-    all_db_accesses: list[DbAccess] = []
-
+    # Read and hash serially (cheap), then analyze only what the cache lacks.
+    # Records are merged in discovery order whatever order workers finish in.
+    records: dict[str, dict[str, Any]] = {}
+    plan: list[tuple[str, str, str]] = []
+    pending: list[tuple[str, str, str, str]] = []
     for filepath in files:
         module_name = file_to_module_name(filepath, root)
         rel_path = str(filepath.relative_to(root))
@@ -930,29 +1050,57 @@ def analyze_directory(
             warnings.warn(f"Could not read {filepath}: {exc}", stacklevel=2)
             continue
 
-        try:
-            tree = ast.parse(source, filename=str(filepath))
-        except SyntaxError as exc:
-            warnings.warn(
-                f"SyntaxError in {filepath} (line {exc.lineno}): {exc.msg}",
-                stacklevel=2,
-            )
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        plan.append((rel_path, module_name, digest))
+        cached = cache.get(rel_path, module_name, digest) if cache is not None else None
+        if cached is not None:
+            records[rel_path] = cached
+        else:
+            pending.append((rel_path, module_name, source, str(filepath)))
+
+    workers = min(_resolve_jobs(jobs), len(pending))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_analyze_job, pending, chunksize=8))
+    else:
+        outcomes = [_analyze_job(job) for job in pending]
+
+    digests = {rel_path: digest for rel_path, _module, digest in plan}
+    for (rel_path, module_name, _source, _filename), (record, problem) in zip(
+        pending, outcomes,
+    ):
+        if record is None:
+            warnings.warn(problem or f"Could not analyze {rel_path}", stacklevel=2)
             continue
+        records[rel_path] = record
+        if cache is not None:
+            cache.put(rel_path, module_name, digests[rel_path], record)
+
+    if cache is not None:
+        cache.save({rel_path for rel_path, _module, _digest in plan})
+        logger.info(
+            "  Cache:      %d reused, %d analyzed", cache.hits, len(pending),
+        )
 
-        analyzer = ModuleAnalyzer(rel_path, module_name, source)
-        analyzer.visit(tree)
+    all_modules: list[ModuleInfo] = []
+    all_functions: list[FunctionInfo] = []
+    all_classes: list[ClassInfo] = []
+    all_import_edges: list[ImportEdge] = []
+    all_entry_points: list[EntryPoint] = []
+    all_db_accesses: list[DbAccess] = []
 
-        module_info = ModuleInfo(
-            name=module_name,
-            file=rel_path,
-            imports=analyzer.imports,
+    for rel_path, module_name, _digest in plan:
+        record = records.get(rel_path)
+        if record is None:
+            continue
+        all_modules.append(
+            ModuleInfo(name=module_name, file=rel_path, imports=list(record["imports"]))
         )
-        all_modules.append(module_info)
-        all_functions.extend(analyzer.functions)
-        all_classes.extend(analyzer.classes)
-        all_import_edges.extend(analyzer.import_edges)
-        all_entry_points.extend(analyzer.entry_points)
-        all_db_accesses.extend(analyzer.db_accesses)
+        all_functions.extend(FunctionInfo(**f) for f in record["functions"])
+        all_classes.extend(ClassInfo(**c) for c in record["classes"])
+        all_import_edges.extend(ImportEdge(**e) for e in record["import_edges"])
+        all_entry_points.extend(EntryPoint(**ep) for ep in record["entry_points"])
+        all_db_accesses.extend(DbAccess(**da) for da in record["db_accesses"])
 
     # Post-processing: populate called_by reverse relationships
     _populate_called_by(all_functions)
@@ -1022,6 +1170,18 @@ def build_parser() -> argparse.ArgumentParser:
         default="docs/architecture-analysis/python_analysis.json",
         help="Output file path (default: docs/architecture-analysis/python_analysis.json).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing and analysis (default: 1; 0 = one per CPU).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        help="Per-file result cache. Unchanged files are not re-analyzed (default: off).",
+    )
     return parser
 
 
@@ -1045,7 +1205,13 @@ def main(argv: list[str] | None = None) -> int:
     if exclude:
         logger.info("  Exclude patterns: %s", exclude)
 
-    result = analyze_directory(root, include, exclude)
+    result = analyze_directory(
+        root,
+        include,
+        exclude,
+        jobs=args.jobs,
+        cache_path=Path(args.cache) if args.cache else None,
+    )
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -7,9 +7,11 @@ duplicating graph I/O, traversal, or constant definitions.
 
 from arch_utils.constants import DEPENDENCY_EDGE_TYPES, Confidence, EdgeType, NodeKind
 from arch_utils.diagnostics import Diagnostic, DiagnosticCollector
+from arch_utils.graph_index import ArchitectureGraph, GraphCache
 from arch_utils.graph_io import load_graph, save_json
 from arch_utils.node_id import make_node_id, mermaid_id, parse_node_id
 from arch_utils.traversal import (
+    ReverseIndex,
     build_adjacency,
     find_cycles,
     reachable_from,
@@ -18,11 +20,14 @@ from arch_utils.traversal import (
 
 __all__ = [
     "DEPENDENCY_EDGE_TYPES",
+    "ArchitectureGraph",
     "Confidence",
     "Diagnostic",
     "DiagnosticCollector",
     "EdgeType",
+    "GraphCache",
     "NodeKind",
+    "ReverseIndex",
     "build_adjacency",
     "find_cycles",
     "load_graph",
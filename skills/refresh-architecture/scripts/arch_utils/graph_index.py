@@ -0,0 +1,264 @@
+"""A loaded architecture graph with the indexes the insight stages share.
+
+Layer 2 stages (flow tracing, impact ranking, parallel zones, affected-test
+selection, graph diffs) all need the same handful of derived structures:
+node lookup, forward adjacency, reverse adjacency, and the file-to-node and
+test-covers indexes.  :class:`ArchitectureGraph` builds them once per loaded
+graph so stages running in one process share them, and :class:`GraphCache`
+keeps one warm across queries until the file on disk changes.
+
+A graph can be loaded from ``architecture.graph.json`` or from the
+``architecture.sqlite`` written by ``compile_architecture_graph.emit_sqlite``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from arch_utils.constants import DEPENDENCY_EDGE_TYPES
+from arch_utils.traversal import ReverseIndex, build_adjacency
+
+logger = logging.getLogger(__name__)
+
+#: Edge types whose source is a test covering the target node.
+TEST_COVERS_EDGE_TYPES: frozenset[str] = frozenset({"TEST_COVERS"})
+
+
+def normalize_path(raw: str) -> str:
+    """Strip whitespace and a leading ``./`` so file paths compare equal."""
+    p = raw.strip()
+    if p.startswith("./"):
+        p = p[2:]
+    return p
+
+
+class ArchitectureGraph:
+    """Read-only view over one architecture graph plus lazily built indexes.
+
+    The underlying dict is not copied; callers must not mutate it after
+    construction.  Every index is derived on first use and memoized.
+    """
+
+    def __init__(self, graph: dict[str, Any]) -> None:
+        self.data = graph
+        self.nodes: list[dict[str, Any]] = graph.get("nodes", [])
+        self.edges: list[dict[str, Any]] = graph.get("edges", [])
+        self.entrypoints: list[dict[str, Any]] = graph.get("entrypoints", [])
+        self._reverse: ReverseIndex | None = None
+        self._node_by_id: dict[str, dict[str, Any]] | None = None
+        self._forward: dict[frozenset[str] | None, dict[str, list[str]]] = {}
+        self._file_index: dict[str, list[str]] | None = None
+
+    # ---- loading ----
+
+    @classmethod
+    def load(cls, path: Path) -> ArchitectureGraph:
+        """Load ``architecture.graph.json`` or ``architecture.sqlite``."""
+        if path.suffix == ".sqlite":
+            return cls.from_sqlite(path)
+        with open(path) as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_sqlite(cls, path: Path) -> ArchitectureGraph:
+        """Rebuild the graph from the tables written by ``emit_sqlite``.
+
+        Rows come back in insertion order, so nodes, edges, and entrypoints
+        keep the order of the JSON graph they were emitted from.
+        """
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            snapshots = [
+                {
+                    "generated_at": generated_at,
+                    "git_sha": git_sha,
+                    "tool_versions": json.loads(tool_versions),
+                    "notes": json.loads(notes) if notes is not None else [],
+                }
+                for generated_at, git_sha, tool_versions, notes in conn.execute(
+                    "SELECT generated_at, git_sha, tool_versions, notes "
+                    "FROM snapshots ORDER BY id"
+                )
+            ]
+            nodes = []
+            for (
+                node_id, kind, language, name, file, start, end, tags, signatures,
+            ) in conn.execute(
+                "SELECT id, kind, language, name, file, span_start, span_end, "
+                "tags, signatures FROM nodes ORDER BY rowid"
+            ):
+                node: dict[str, Any] = {
+                    "id": node_id,
+                    "kind": kind,
+                    "language": language,
+                    "name": name,
+                    "file": file,
+                }
+                if start is not None or end is not None:
+                    node["span"] = {"start": start, "end": end}
+                node["tags"] = json.loads(tags) if tags is not None else []
+                node["signatures"] = (
+                    json.loads(signatures) if signatures is not None else {}
+                )
+                nodes.append(node)
+            edges = [
+                {
+                    "from": src,
+                    "to": dst,
+                    "type": edge_type,
+                    "confidence": confidence,
+                    "evidence": evidence,
+                }
+                for src, dst, edge_type, confidence, evidence in conn.execute(
+                    "SELECT from_node, to_node, type, confidence, evidence "
+                    "FROM edges ORDER BY id"
+                )
+            ]
+            entrypoints = []
+            for node_id, kind, method, ep_path in conn.execute(
+                "SELECT node_id, kind, method, path FROM entrypoints ORDER BY id"
+            ):
+                ep: dict[str, Any] = {"node_id": node_id, "kind": kind}
+                if method is not None:
+                    ep["method"] = method
+                if ep_path is not None:
+                    ep["path"] = ep_path
+                entrypoints.append(ep)
+        finally:
+            conn.close()
+        return cls({
+            "snapshots": snapshots,
+            "nodes": nodes,
+            "edges": edges,
+            "entrypoints": entrypoints,
+        })
+
+    # ---- indexes ----
+
+    @property
+    def reverse(self) -> ReverseIndex:
+        """Shared :class:`ReverseIndex` over the edges, built on first use."""
+        if self._reverse is None:
+            self._reverse = ReverseIndex(self.edges)
+        return self._reverse
+
+    @property
+    def node_by_id(self) -> dict[str, dict[str, Any]]:
+        """Map node id → node; the last node wins on duplicate ids."""
+        if self._node_by_id is None:
+            self._node_by_id = {n["id"]: n for n in self.nodes}
+        return self._node_by_id
+
+    def adjacency(
+        self, edge_types: frozenset[str] | None = None,
+    ) -> dict[str, list[str]]:
+        """Forward adjacency (``build_adjacency``), memoized per edge-type filter."""
+        adj = self._forward.get(edge_types)
+        if adj is None:
+            adj = self._forward[edge_types] = build_adjacency(
+                self.edges, edge_types=edge_types,
+            )
+        return adj
+
+    def dependents_graph(
+        self, edge_types: frozenset[str] = DEPENDENCY_EDGE_TYPES,
+    ) -> dict[str, set[str]]:
+        """Reverse adjacency: node → set of direct dependents via *edge_types*."""
+        return self.reverse.reverse_adjacency(edge_types)
+
+    @property
+    def file_index(self) -> dict[str, list[str]]:
+        """Map normalized file path → ids of the nodes declared in that file."""
+        if self._file_index is None:
+            index: dict[str, list[str]] = defaultdict(list)
+            for n in self.nodes:
+                f = n.get("file")
+                if f:
+                    index[normalize_path(f)].append(n["id"])
+            self._file_index = dict(index)
+        return self._file_index
+
+    def tests_covering(self, node_id: str) -> list[str]:
+        """Return the ids of test nodes with a ``TEST_COVERS`` edge to *node_id*."""
+        return self.reverse.sources(node_id, TEST_COVERS_EDGE_TYPES)
+
+    def is_covered(self, node_id: str) -> bool:
+        """Return whether any test covers *node_id*."""
+        return self.reverse.has_sources(node_id, TEST_COVERS_EDGE_TYPES)
+
+
+def count_nodes(path: Path) -> int | None:
+    """Return the node count of the graph at *path* without building indexes.
+
+    ``None`` when the file is missing or unreadable.
+    """
+    try:
+        if path.suffix == ".sqlite":
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                return conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+            finally:
+                conn.close()
+        with open(path) as f:
+            return len(json.load(f).get("nodes", []))
+    except (OSError, json.JSONDecodeError, sqlite3.Error):
+        return None
+
+
+class GraphCache:
+    """Keep one :class:`ArchitectureGraph` warm per path.
+
+    A cached graph is reused while the file's ``(mtime_ns, size)`` is
+    unchanged and reloaded as soon as a refresh rewrites it.  Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, tuple[tuple[int, int], ArchitectureGraph]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, path: Path) -> ArchitectureGraph | None:
+        """Return the graph at *path*, or ``None`` if it is missing or unreadable."""
+        path = Path(path).resolve()
+        with self._lock:
+            try:
+                st = path.stat()
+            except OSError:
+                self._entries.pop(path, None)
+                return None
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = self._entries.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            try:
+                graph = ArchitectureGraph.load(path)
+            except (OSError, json.JSONDecodeError, sqlite3.Error) as exc:
+                logger.warning("cannot load architecture graph %s: %s", path, exc)
+                self._entries.pop(path, None)
+                return None
+            self.loads += 1
+            self._entries[path] = (signature, graph)
+            return graph
+
+    def peek(self, path: Path) -> ArchitectureGraph | None:
+        """Return the cached graph at *path* if it is still current; never loads."""
+        path = Path(path).resolve()
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is None:
+                return None
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            return cached[1] if cached[0] == (st.st_mtime_ns, st.st_size) else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -1,8 +1,9 @@
 """Graph traversal utilities used across the architecture pipeline.
 
-Provides adjacency building, reachability, cycle detection, and transitive
-dependent computation — all parameterised by edge-type filters so callers
-can restrict to structural, side-effect, or all edges.
+Provides adjacency building, reachability, cycle detection, transitive
+dependent computation, and a reusable reverse index — all parameterised by
+edge-type filters so callers can restrict to structural, side-effect, or all
+edges.
 """
 
 from __future__ import annotations
@@ -176,3 +177,79 @@ def transitive_dependents(
         result[node_id] = visited
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# Reusable reverse index
+# ---------------------------------------------------------------------------
+
+
+class ReverseIndex:
+    """Set-backed "who points at me" lookups over one graph's edges.
+
+    Built once per graph and shared by every stage that walks edges in
+    reverse (impact ranking, affected-test selection), so none of them has
+    to re-derive reverse adjacency. Sources are bucketed by edge type and
+    stored in sets; transitive dependent sets are memoized per
+    ``(edge_types, node)``.  Query results that are handed out as sequences
+    are sorted, so callers stay deterministic regardless of edge order.
+
+    The index does not observe later mutation of *edges*; build a new one
+    when the graph changes.
+    """
+
+    def __init__(self, edges: Iterable[dict[str, Any]]) -> None:
+        self._by_type: dict[str, dict[str, set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        for edge in edges:
+            self._by_type[edge.get("type", "")][edge["to"]].add(edge["from"])
+        self._merged: dict[frozenset[str], dict[str, set[str]]] = {}
+        self._dependents: dict[tuple[frozenset[str], str], frozenset[str]] = {}
+
+    def reverse_adjacency(self, edge_types: frozenset[str]) -> dict[str, set[str]]:
+        """Return node → set of direct sources via *edge_types* (memoized, shared).
+
+        Callers must treat the returned mapping and its sets as read-only.
+        """
+        merged = self._merged.get(edge_types)
+        if merged is None:
+            merged = defaultdict(set)
+            for edge_type in sorted(edge_types):
+                for target, sources in self._by_type.get(edge_type, {}).items():
+                    merged[target] |= sources
+            merged = self._merged[edge_types] = dict(merged)
+        return merged
+
+    def has_sources(self, node: str, edge_types: frozenset[str]) -> bool:
+        """Return whether any edge of *edge_types* points at *node*."""
+        return node in self.reverse_adjacency(edge_types)
+
+    def sources(self, node: str, edge_types: frozenset[str]) -> list[str]:
+        """Return the direct sources of edges of *edge_types* into *node*, sorted."""
+        return sorted(self.reverse_adjacency(edge_types).get(node, ()))
+
+    def dependents(
+        self,
+        node: str,
+        edge_types: frozenset[str] = DEPENDENCY_EDGE_TYPES,
+    ) -> frozenset[str]:
+        """Return every node that transitively reaches *node* via *edge_types*.
+
+        *node* itself is included only when it sits on a cycle.
+        """
+        key = (edge_types, node)
+        cached = self._dependents.get(key)
+        if cached is not None:
+            return cached
+        rev = self.reverse_adjacency(edge_types)
+        visited: set[str] = set()
+        stack = list(rev.get(node, ()))
+        while stack:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            stack.extend(rev.get(current, set()) - visited)
+        result = self._dependents[key] = frozenset(visited)
+        return result
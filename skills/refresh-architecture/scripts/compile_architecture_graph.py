@@ -12,7 +12,8 @@ canonical architecture graph by running the insight modules in sequence
     3b. test_linker        — append test nodes + TEST_COVERS edges
                              (reads test files directly, not python_analysis.json)
 
-  Concurrent (read-only analysis from the linked graph):
+  Concurrent (read-only analysis from the linked graph, loaded once into an
+  ``arch_utils.graph_index.ArchitectureGraph`` whose indexes they share):
     4. flow_tracer        — infer cross-layer flows
     5. impact_ranker      — compute high-impact nodes
     6. summary_builder    — compile summary (depends on 4 & 5 outputs)
@@ -43,6 +44,7 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 sys.path.insert(0, str(Path(__file__).resolve().parent / "insights"))
 
+from arch_utils.graph_index import ArchitectureGraph  # noqa: E402
 from arch_utils.graph_io import load_graph, save_json  # noqa: E402
 from arch_utils.determinism import generated_at_iso  # noqa: E402
 from insights import cross_layer_linker  # noqa: E402
@@ -169,13 +171,12 @@ def emit_sqlite(graph: dict[str, Any], output_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def _run_flow_tracer(graph: dict[str, Any], output_path: Path) -> None:
+async def _run_flow_tracer(graph: ArchitectureGraph, output_path: Path) -> None:
     """Run flow tracing in a thread to avoid blocking the event loop."""
     def _work() -> list[dict[str, Any]]:
-        nodes = graph.get("nodes", [])
-        edges = graph.get("edges", [])
-        entrypoints = graph.get("entrypoints", [])
-        return flow_tracer.infer_cross_layer_flows(nodes, edges, entrypoints)
+        return flow_tracer.infer_cross_layer_flows(
+            graph.nodes, graph.edges, graph.entrypoints, graph=graph,
+        )
 
     flows = await asyncio.to_thread(_work)
     result = {
@@ -186,12 +187,14 @@ async def _run_flow_tracer(graph: dict[str, Any], output_path: Path) -> None:
     logger.info(f"  flow_tracer: {len(flows)} flows → {output_path}")
 
 
-async def _run_impact_ranker(graph: dict[str, Any], output_path: Path, threshold: int = 5) -> None:
+async def _run_impact_ranker(
+    graph: ArchitectureGraph, output_path: Path, threshold: int = 5,
+) -> None:
     """Run impact ranking in a thread."""
     def _work() -> list[dict[str, Any]]:
-        nodes = graph.get("nodes", [])
-        edges = graph.get("edges", [])
-        return impact_ranker.compute_high_impact_nodes(nodes, edges, threshold)
+        return impact_ranker.compute_high_impact_nodes(
+            graph.nodes, graph.edges, threshold, index=graph.reverse,
+        )
 
     high_impact = await asyncio.to_thread(_work)
     result = {
@@ -313,6 +316,11 @@ def compile_graph(
         logger.error("Could not load linked graph.")
         return 1
 
+    # One set of indexes for stages 4-6. The flow tracer only builds forward
+    # adjacency and the impact ranker only reverse adjacency, so the two
+    # threads never memoize into the same structure.
+    indexed = ArchitectureGraph(graph)
+
     flows_path = output_dir / "cross_layer_flows.json"
     impact_path = output_dir / "high_impact_nodes.json"
     summary_path = output_dir / "architecture.summary.json"
@@ -321,8 +329,8 @@ def compile_graph(
 
     async def _run_parallel() -> None:
         # Stages 4 & 5 are fully independent
-        flow_task = asyncio.create_task(_run_flow_tracer(graph, flows_path))
-        impact_task = asyncio.create_task(_run_impact_ranker(graph, impact_path))
+        flow_task = asyncio.create_task(_run_flow_tracer(indexed, flows_path))
+        impact_task = asyncio.create_task(_run_impact_ranker(indexed, impact_path))
 
         # Wait for both to complete before running summary (which reads their output)
         await asyncio.gather(flow_task, impact_task)
@@ -28,8 +28,10 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from arch_utils.graph_io import load_graph, save_json  # noqa: E402
-from arch_utils.traversal import find_cycles, transitive_dependents  # noqa: E402
+from arch_utils.constants import DEPENDENCY_EDGE_TYPES  # noqa: E402
+from arch_utils.graph_index import ArchitectureGraph  # noqa: E402
+from arch_utils.graph_io import save_json  # noqa: E402
+from arch_utils.traversal import find_cycles  # noqa: E402
 
 
 def _node_set(graph: dict) -> dict[str, dict]:
@@ -47,10 +49,23 @@ def _entrypoint_set(graph: dict) -> dict[str, dict]:
     return {ep["node_id"]: ep for ep in graph.get("entrypoints", [])}
 
 
+def _as_indexed(graph: dict[str, Any] | ArchitectureGraph) -> ArchitectureGraph:
+    return graph if isinstance(graph, ArchitectureGraph) else ArchitectureGraph(graph)
+
+
 def diff_graphs(
-    baseline: dict[str, Any], current: dict[str, Any],
+    baseline: dict[str, Any] | ArchitectureGraph,
+    current: dict[str, Any] | ArchitectureGraph,
 ) -> dict[str, Any]:
-    """Compare two architecture graphs and produce a diff report."""
+    """Compare two architecture graphs and produce a diff report.
+
+    Either side may be an already loaded
+    :class:`~arch_utils.graph_index.ArchitectureGraph`, whose reverse index
+    is then reused for the high-impact comparison.
+    """
+    b_graph = _as_indexed(baseline)
+    c_graph = _as_indexed(current)
+    baseline, current = b_graph.data, c_graph.data
     b_nodes = _node_set(baseline)
     c_nodes = _node_set(current)
     b_edges = _edge_set(baseline)
@@ -70,12 +85,19 @@ def diff_graphs(
     c_cycle_sets = {tuple(sorted(c)) for c in c_cycles}
     new_cycles = [list(c) for c in c_cycle_sets - b_cycle_sets]
 
-    # High-impact modules
-    c_deps = transitive_dependents(current.get("edges", []))
-    b_deps = transitive_dependents(baseline.get("edges", []))
+    # High-impact modules: nodes in the current graph with more than 10
+    # transitive dependents that had none in the baseline. Candidates are
+    # visited in first-appearance order of their inbound dependency edges.
+    candidates = dict.fromkeys(
+        e["to"] for e in current.get("edges", [])
+        if e.get("type") in DEPENDENCY_EDGE_TYPES
+    )
     new_high_impact = []
-    for node_id, deps in c_deps.items():
-        if len(deps) > 10 and node_id not in b_deps:
+    for node_id in candidates:
+        if b_graph.reverse.has_sources(node_id, DEPENDENCY_EDGE_TYPES):
+            continue
+        deps = c_graph.reverse.dependents(node_id, DEPENDENCY_EDGE_TYPES)
+        if len(deps) > 10:
             new_high_impact.append({
                 "id": node_id,
                 "dependent_count": len(deps),
@@ -159,8 +181,8 @@ def main() -> int:
         logger.error("Current graph not found: %s", current_path)
         return 1
 
-    baseline = load_graph(baseline_path)
-    current = load_graph(current_path)
+    baseline = ArchitectureGraph.load(baseline_path)
+    current = ArchitectureGraph.load(current_path)
     report = diff_graphs(baseline, current)
 
     output_path = save_json(Path(args.output), report)
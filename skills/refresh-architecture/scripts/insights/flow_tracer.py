@@ -23,7 +23,7 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from arch_utils.constants import EdgeType  # noqa: E402
 from arch_utils.determinism import generated_at_iso  # noqa: E402
-from arch_utils.traversal import build_adjacency  # noqa: E402
+from arch_utils.graph_index import ArchitectureGraph  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,8 @@ def infer_cross_layer_flows(
     all_nodes: list[Node],
     all_edges: list[Edge],
     entrypoints: list[Entrypoint],
+    *,
+    graph: ArchitectureGraph | None = None,
 ) -> list[dict[str, Any]]:
     """Infer Frontend→Database indirect flows by chaining endpoint→service→query→table paths.
 
@@ -60,14 +62,20 @@ def infer_cross_layer_flows(
         All edges from the canonical architecture graph.
     entrypoints:
         Entrypoints from the canonical architecture graph.
+    graph:
+        Optional :class:`~arch_utils.graph_index.ArchitectureGraph` already
+        loaded over the same nodes and edges; its node lookup and forward
+        adjacency are reused instead of being rebuilt.
 
     Returns
     -------
     List of flow dicts, each describing a frontend-to-database path.
     """
     flows: list[dict[str, Any]] = []
-    node_map: dict[str, Node] = {n["id"]: n for n in all_nodes}
-    adj = build_adjacency(all_edges)
+    if graph is None:
+        graph = ArchitectureGraph({"nodes": all_nodes, "edges": all_edges})
+    node_map: dict[str, Node] = graph.node_by_id
+    adj = graph.adjacency()
 
     # Find cross-language API call edges
     cross_api_edges = [e for e in all_edges if e["type"] == EdgeType.API_CALL]
@@ -17,13 +17,13 @@ import argparse
 import json
 import logging
 import sys
-from collections import defaultdict, deque
 from pathlib import Path
 from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from arch_utils.constants import DEPENDENCY_EDGE_TYPES  # noqa: E402
 from arch_utils.determinism import generated_at_iso  # noqa: E402
+from arch_utils.traversal import ReverseIndex  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -44,40 +44,32 @@ def compute_high_impact_nodes(
     all_nodes: list[Node],
     all_edges: list[Edge],
     threshold: int = 5,
+    *,
+    index: ReverseIndex | None = None,
 ) -> list[dict[str, Any]]:
     """Return nodes whose reverse transitive dependent count meets *threshold*.
 
-    For each node the algorithm builds a reverse-adjacency graph (edges that
-    represent structural dependency are flipped) and then performs a BFS to
-    count the full transitive set of dependents.  Only nodes with at least
-    *threshold* dependents are included in the result.
+    Structural dependency edges are walked in reverse through a
+    :class:`~arch_utils.traversal.ReverseIndex` to count the full transitive
+    set of dependents of each node.  Pass *index* to reuse one already built
+    over *all_edges*.  Only nodes with at least *threshold* dependents are
+    included in the result.
 
     The returned list is sorted by ``dependent_count`` descending.
     """
-    reverse_adj: dict[str, set[str]] = defaultdict(set)
-    for edge in all_edges:
-        if edge["type"] in DEPENDENCY_EDGE_TYPES:
-            reverse_adj[edge["to"]].add(edge["from"])
+    if index is None:
+        index = ReverseIndex(all_edges)
 
     high_impact: list[dict[str, Any]] = []
     for node in all_nodes:
         nid = node["id"]
-        if nid not in reverse_adj:
+        if not index.has_sources(nid, DEPENDENCY_EDGE_TYPES):
             continue
-        visited: set[str] = set()
-        queue: deque[str] = deque(reverse_adj[nid])
-        while queue:
-            current = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-            for dep in reverse_adj.get(current, set()):
-                if dep not in visited:
-                    queue.append(dep)
-        if len(visited) >= threshold:
+        count = len(index.dependents(nid, DEPENDENCY_EDGE_TYPES))
+        if count >= threshold:
             high_impact.append({
                 "id": nid,
-                "dependent_count": len(visited),
+                "dependent_count": count,
             })
 
     # Node id breaks count ties, so the ranking is a function of the graph and
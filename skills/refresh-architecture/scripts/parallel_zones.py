@@ -26,7 +26,7 @@ _VALIDATE_PACKAGES_DIR = _SCRIPT_DIR.parent.parent / "validate-packages" / "scri
 if str(_VALIDATE_PACKAGES_DIR) not in sys.path:
     sys.path.insert(0, str(_VALIDATE_PACKAGES_DIR))
 from arch_utils.constants import DEPENDENCY_EDGE_TYPES  # noqa: E402
-from arch_utils.graph_io import load_graph  # noqa: E402
+from arch_utils.graph_index import ArchitectureGraph  # noqa: E402
 from arch_utils.determinism import generated_at_iso  # noqa: E402
 from arch_utils.traversal import reachable_from  # noqa: E402
 
@@ -370,12 +370,11 @@ def main(argv: list[str] | None = None) -> int:
         logger.error("graph file not found: %s", args.graph)
         return 1
 
-    graph = load_graph(args.graph)
+    indexed = ArchitectureGraph.load(args.graph)
+    graph = indexed.data
+    edges: list[dict] = indexed.edges
 
-    nodes: list[dict] = graph.get("nodes", [])
-    edges: list[dict] = graph.get("edges", [])
-
-    node_map: dict[str, dict] = {n["id"]: n for n in nodes}
+    node_map: dict[str, dict] = indexed.node_by_id
     node_ids = list(node_map.keys())
     node_id_set = set(node_ids)
 
@@ -385,7 +384,7 @@ def main(argv: list[str] | None = None) -> int:
     # --- Analysis ---
     components = compute_connected_components(node_ids, edges)
     leaf_ids = find_leaf_modules(node_id_set, edges)
-    dependents_graph = compute_dependents_graph(edges)
+    dependents_graph = indexed.dependents_graph()
     high_impact = find_high_impact_modules(
         node_id_set, dependents_graph, args.impact_threshold,
     )
@@ -41,6 +41,11 @@ PY_ANALYSIS="${ARCH_DIR}/python_analysis.json"
 TS_ANALYSIS="${ARCH_DIR}/ts_analysis.json"
 PG_ANALYSIS="${ARCH_DIR}/postgres_analysis.json"
 
+# Per-file Python analysis cache (content hash + analyzer version). Lives beside
+# the artifacts but is never one: the analyzer git-ignores the directory it makes.
+PY_ANALYSIS_CACHE="${PY_ANALYSIS_CACHE:-${ARCH_DIR}/.cache/python_analysis.cache.json}"
+PY_ANALYSIS_JOBS="${PY_ANALYSIS_JOBS:-0}"
+
 PYTHON="${PYTHON:-python3}"
 AUTO_INSTALL_DEPS="${AUTO_INSTALL_DEPS:-true}"
 SCRIPTS_ABS_DIR="$(cd "${SCRIPTS_DIR}" 2>/dev/null && pwd || true)"
@@ -216,7 +221,9 @@ elif [ ! -f "${SCRIPTS_DIR}/analyze_python.py" ]; then
 else
     if ${PYTHON} "${SCRIPTS_DIR}/analyze_python.py" \
         "${PYTHON_SRC_DIR}" \
-        --output "${PY_ANALYSIS}" 2>&1; then
+        --output "${PY_ANALYSIS}" \
+        --jobs "${PY_ANALYSIS_JOBS}" \
+        --cache "${PY_ANALYSIS_CACHE}" 2>&1; then
         info "Python analysis written to ${PY_ANALYSIS}"
         pass "python_analyzer"
     else
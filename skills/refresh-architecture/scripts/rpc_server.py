@@ -6,6 +6,7 @@ Implements the contract in ``contracts/internal/refresh-architecture-rpc.yaml``:
     is_graph_stale   — non-blocking freshness probe from file mtime
     trigger_refresh  — idempotently spawn a refresh subprocess
     get_refresh_status — poll an in-flight or completed refresh by id
+    affected_tests   — test selection against the server's warm graph
 
 Transport is subprocess-style. The coordinator invokes this module with
 
@@ -14,6 +15,10 @@ Transport is subprocess-style. The coordinator invokes this module with
 and parses the JSON result printed to stdout. This avoids a long-running
 service while still providing a callable surface across process boundaries.
 
+A ``RefreshServer`` held in-process keeps the loaded graph and its indexes
+(``arch_utils.graph_index.GraphCache``) warm between calls, reloading only
+when a refresh rewrites the graph file.
+
 ## Concurrency model
 
 - At most ONE refresh in flight per ``RefreshServer`` instance.
@@ -48,6 +53,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from arch_utils.graph_index import GraphCache, count_nodes  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -180,6 +188,7 @@ class RefreshServer:
         self._handles: dict[str, _RefreshHandle] = {}
         self._active_id: str | None = None
         self._lock = threading.Lock()
+        self._graphs = GraphCache()
 
     # ---- freshness probe ----
 
@@ -199,12 +208,12 @@ class RefreshServer:
             age_s = time.time() - mtime
             stale = age_s > threshold * 3600
             mtime_iso = datetime.fromtimestamp(mtime, tz=UTC).isoformat()
-            try:
-                with open(self.graph_path) as f:
-                    data = json.load(f)
-                node_count = len(data.get("nodes", []))
-            except (OSError, json.JSONDecodeError):
-                node_count = None
+            # A staleness probe must stay cheap: reuse a warm graph, but never
+            # load one (and its indexes) just to count nodes.
+            graph = self._graphs.peek(self.graph_path)
+            node_count = (
+                len(graph.nodes) if graph is not None else count_nodes(self.graph_path)
+            )
 
         with self._lock:
             in_flight, current_id = self._current_in_flight_locked()
@@ -364,6 +373,30 @@ class RefreshServer:
                 "error_message": handle.error_message,
             }
 
+    # ---- affected tests ----
+
+    def affected_tests(self, changed_files: list[str]) -> dict[str, Any]:
+        """Select the tests affected by *changed_files* from the warm graph.
+
+        ``tests`` is ``None`` when the graph is stale, missing, or the
+        traversal bound is exceeded; callers MUST then run the full suite.
+        """
+        if not isinstance(changed_files, list) or not all(
+            isinstance(path, str) for path in changed_files
+        ):
+            raise ValueError("changed_files must be a list of file paths")
+        from affected_tests import affected_tests_in_graph
+
+        graph = None
+        if not self.is_graph_stale()["stale"]:
+            graph = self._graphs.get(self.graph_path)
+        if graph is None:
+            logger.warning(
+                "affected_tests: graph stale or unavailable — full-suite fallback",
+            )
+            return {"tests": None}
+        return {"tests": affected_tests_in_graph(changed_files, graph)}
+
     # ---- internal helpers ----
 
     def _current_in_flight_locked(self) -> tuple[bool, str | None]:
@@ -407,7 +440,12 @@ def get_server() -> RefreshServer:
 # ---------------------------------------------------------------------------
 
 
-_METHODS: set[str] = {"is_graph_stale", "trigger_refresh", "get_refresh_status"}
+_METHODS: set[str] = {
+    "affected_tests",
+    "is_graph_stale",
+    "trigger_refresh",
+    "get_refresh_status",
+}
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -454,6 +492,8 @@ def main(argv: list[str] | None = None) -> int:
             result = server.is_graph_stale(**kwargs)
         elif args.method == "trigger_refresh":
             result = server.trigger_refresh(**kwargs)
+        elif args.method == "affected_tests":
+            result = server.affected_tests(**kwargs)
         else:  # get_refresh_status
             result = server.get_refresh_status(**kwargs)
     except (ValueError, TypeError) as exc:
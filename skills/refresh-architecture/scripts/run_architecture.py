@@ -32,6 +32,7 @@ if str(SCRIPTS_DIR) not in sys.path:
 #: Required outputs a full/quick refresh must stage before promotion.
 _REQUIRED_STAGED = ("architecture.graph.json", "architecture.summary.json")
 _STAGING_DIRNAME = ".architecture-staging"
+_ANALYSIS_CACHE = ".cache/python_analysis.cache.json"
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -52,6 +53,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--migrations-dir", help="Override MIGRATIONS_DIR for analysis")
     parser.add_argument("--arch-dir", help="Override ARCH_DIR output directory")
     parser.add_argument("--python", help="Python interpreter for the pipeline (maps to PYTHON)")
+    parser.add_argument(
+        "--analysis-jobs",
+        help="Python analyzer worker processes, 0 = one per CPU (maps to PY_ANALYSIS_JOBS)",
+    )
     parser.add_argument(
         "--quick",
         action="store_true",
@@ -87,6 +92,7 @@ def build_env(args: argparse.Namespace) -> dict[str, str]:
         "MIGRATIONS_DIR": args.migrations_dir,
         "ARCH_DIR": args.arch_dir,
         "PYTHON": args.python,
+        "PY_ANALYSIS_JOBS": args.analysis_jobs,
     }
     for key, value in overrides.items():
         if value is not None:
@@ -175,6 +181,13 @@ def run_staged(target_dir: Path, args: argparse.Namespace) -> int:
     shutil.rmtree(staging, ignore_errors=True)
     staging.mkdir(parents=True, exist_ok=True)
     env["ARCH_DIR"] = str(staging.resolve())
+    # The staging directory is discarded after every run, so the per-file
+    # analysis cache lives under the committed artifact directory instead —
+    # outside staging, hence never promoted, and reused by the next refresh.
+    env.setdefault(
+        "PY_ANALYSIS_CACHE",
+        str((target_dir / provenance.ARCH_DIR_DEFAULT / _ANALYSIS_CACHE).resolve()),
+    )
 
     try:
         rc = _run_pipeline(target_dir, env, args.quick)
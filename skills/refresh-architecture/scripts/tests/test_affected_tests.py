@@ -28,8 +28,10 @@ from affected_tests import (  # noqa: E402
     MAX_GRAPH_AGE_HOURS,
     MAX_TRAVERSAL_NODES,
     affected_tests,
+    affected_tests_in_graph,
     is_graph_stale,
 )
+from arch_utils.graph_index import ArchitectureGraph  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -289,6 +291,38 @@ class TestTraversalBound:
         assert result is not None
 
 
+# ---------------------------------------------------------------------------
+# Loaded graph + shared indexes
+# ---------------------------------------------------------------------------
+
+
+class TestSharedIndex:
+    def test_loaded_graph_answers_repeated_queries(self) -> None:
+        """One ArchitectureGraph serves several queries with the same indexes."""
+        graph = _build_graph(
+            source_modules=[
+                ("py:core", "src/core.py"),
+                ("py:api", "src/api.py"),
+                ("py:cli", "src/cli.py"),
+            ],
+            test_coverage=[
+                ("py:test:tests.test_api.test_a", "py:api"),
+                ("py:test:tests.test_cli.test_a", "py:cli"),
+            ],
+            extra_imports=[("py:api", "py:core")],
+        )
+        loaded = ArchitectureGraph(graph)
+
+        assert affected_tests_in_graph(["src/core.py"], loaded) == [
+            "tests/tests/test_api/test_a.py"
+        ]
+        file_index = loaded.file_index
+        assert affected_tests_in_graph(["./src/cli.py"], loaded) == [
+            "tests/tests/test_cli/test_a.py"
+        ]
+        assert loaded.file_index is file_index
+
+
 # ---------------------------------------------------------------------------
 # Provenance-gated freshness (ri-04: content-based, mtime-independent)
 # ---------------------------------------------------------------------------
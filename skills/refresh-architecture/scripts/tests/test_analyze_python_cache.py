@@ -0,0 +1,89 @@
+"""Tests for analyze_python's per-file result cache and process-pool mode."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import analyze_python
+
+
+def _write_tree(root: Path) -> None:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "core.py").write_text(
+        "def helper():\n    return 1\n\n\ndef run():\n    return helper()\n"
+    )
+    (root / "pkg" / "api.py").write_text(
+        "from pkg.core import run\n\n\n@app.get('/items')\nasync def items():\n    return run()\n"
+    )
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed: list[str] = []
+    original = analyze_python.ast.parse
+
+    def counting_parse(source, filename="<unknown>", *args, **kwargs):
+        parsed.append(Path(filename).name)
+        return original(source, filename, *args, **kwargs)
+
+    monkeypatch.setattr(analyze_python.ast, "parse", counting_parse)
+    return parsed
+
+
+def test_cached_run_reanalyzes_only_changed_files_with_identical_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    _write_tree(src)
+    cache = tmp_path / "arch" / ".cache" / "python_analysis.cache.json"
+
+    cold = analyze_python.analyze_directory(src, cache_path=cache)
+    assert (cache.parent / ".gitignore").read_text() == "*\n"
+
+    parsed = _count_parses(monkeypatch)
+    warm = analyze_python.analyze_directory(src, cache_path=cache)
+    assert parsed == []
+    assert warm == cold
+
+    (src / "pkg" / "core.py").write_text(
+        "def helper():\n    return 2\n\n\ndef run():\n    return helper() + helper()\n"
+    )
+    changed = analyze_python.analyze_directory(src, cache_path=cache)
+    assert parsed == ["core.py"]
+    assert changed == analyze_python.analyze_directory(src)
+    run = next(f for f in changed["functions"] if f["name"] == "run")
+    assert run["called_by"] == ["pkg.api.items"]
+
+
+def test_cache_from_another_analyzer_version_is_discarded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    _write_tree(src)
+    cache = tmp_path / "cache.json"
+    analyze_python.analyze_directory(src, cache_path=cache)
+    document = json.loads(cache.read_text())
+    document["analyzer_version"] = analyze_python.ANALYZER_VERSION + 1
+    cache.write_text(json.dumps(document))
+
+    parsed = _count_parses(monkeypatch)
+    analyze_python.analyze_directory(src, cache_path=cache)
+
+    assert sorted(parsed) == ["__init__.py", "api.py", "core.py"]
+
+
+def test_process_pool_output_matches_serial_output(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    _write_tree(src)
+    (src / "pkg" / "broken.py").write_text("def broken(:\n")
+
+    with pytest.warns(UserWarning, match="SyntaxError"):
+        serial = analyze_python.analyze_directory(src, jobs=1)
+    with pytest.warns(UserWarning, match="SyntaxError"):
+        pooled = analyze_python.analyze_directory(src, jobs=2)
+
+    assert pooled == serial
+    assert "pkg.broken" not in {m["name"] for m in serial["modules"]}
@@ -0,0 +1,43 @@
+"""Tests for analyze_python's reverse-call (called_by) resolution."""
+
+from __future__ import annotations
+
+import analyze_python
+from analyze_python import FunctionInfo
+
+
+def _func(qualified_name: str, calls: list[str] | None = None) -> FunctionInfo:
+    return FunctionInfo(
+        name=qualified_name.rsplit(".", 1)[-1],
+        qualified_name=qualified_name,
+        file="pkg/mod.py",
+        line_start=1,
+        line_end=2,
+        calls=calls or [],
+    )
+
+
+def test_called_by_resolves_suffixes_once_in_first_seen_order() -> None:
+    hub = _func("pkg.util.Helper.hub")
+    functions = [
+        hub,
+        _func("pkg.b.second", ["Helper.hub", "hub", "hub"]),
+        _func("pkg.a.first", ["pkg.util.Helper.hub", "util.Helper.hub"]),
+        _func("pkg.c.unrelated", ["other"]),
+    ]
+
+    analyze_python._populate_called_by(functions)
+
+    assert hub.called_by == ["pkg.b.second", "pkg.a.first"]
+    assert all(not f.called_by for f in functions[1:])
+
+
+def test_called_by_links_every_function_sharing_a_short_name() -> None:
+    left = _func("pkg.left.run")
+    right = _func("pkg.right.run")
+    caller = _func("pkg.main.main", ["run"])
+
+    analyze_python._populate_called_by([left, right, caller])
+
+    assert left.called_by == ["pkg.main.main"]
+    assert right.called_by == ["pkg.main.main"]
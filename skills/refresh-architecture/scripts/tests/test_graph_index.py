@@ -0,0 +1,103 @@
+"""Tests for arch_utils/graph_index.py (shared loaded graph + warm cache)."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from arch_utils.graph_index import ArchitectureGraph, GraphCache, count_nodes
+
+
+def test_sqlite_round_trip_matches_json(built_graph: dict[str, Any], tmp_path: Path) -> None:
+    """A graph loaded from emit_sqlite output matches the JSON it came from."""
+    from compile_architecture_graph import emit_sqlite
+
+    sqlite_path = tmp_path / "architecture.sqlite"
+    emit_sqlite(built_graph, sqlite_path)
+
+    loaded = ArchitectureGraph.load(sqlite_path)
+
+    assert [n["id"] for n in loaded.nodes] == [n["id"] for n in built_graph["nodes"]]
+    assert loaded.edges == [
+        {k: e[k] for k in ("from", "to", "type", "confidence", "evidence")}
+        for e in built_graph["edges"]
+    ]
+    assert loaded.entrypoints == built_graph["entrypoints"]
+    assert loaded.adjacency() == ArchitectureGraph(built_graph).adjacency()
+    for node in built_graph["nodes"]:
+        restored = loaded.node_by_id[node["id"]]
+        assert restored["file"] == node["file"]
+        assert restored["tags"] == node.get("tags", [])
+
+
+def test_indexes_are_memoized_and_normalize_paths() -> None:
+    graph = ArchitectureGraph({
+        "nodes": [
+            {"id": "py:a", "file": "./src/a.py"},
+            {"id": "py:test:t", "file": "tests/test_a.py"},
+        ],
+        "edges": [
+            {"from": "py:test:t", "to": "py:a", "type": "TEST_COVERS"},
+            {"from": "py:b", "to": "py:a", "type": "import"},
+        ],
+    })
+
+    assert graph.file_index == {"src/a.py": ["py:a"], "tests/test_a.py": ["py:test:t"]}
+    assert graph.tests_covering("py:a") == ["py:test:t"]
+    assert graph.is_covered("py:a") and not graph.is_covered("py:b")
+    assert graph.adjacency() is graph.adjacency()
+    assert graph.dependents_graph() == {"py:a": {"py:b"}}
+
+
+def test_reverse_index_is_built_on_first_use() -> None:
+    graph = ArchitectureGraph({
+        "nodes": [{"id": "a"}, {"id": "b"}],
+        "edges": [{"from": "b", "to": "a", "type": "import"}],
+    })
+    assert graph._reverse is None
+    assert graph.reverse is graph.reverse
+    assert graph.dependents_graph() == {"a": {"b"}}
+
+
+def test_count_nodes_reads_json_and_sqlite(
+    built_graph: dict[str, Any], tmp_path: Path,
+) -> None:
+    from compile_architecture_graph import emit_sqlite
+
+    json_path = tmp_path / "architecture.graph.json"
+    json_path.write_text(json.dumps(built_graph))
+    sqlite_path = tmp_path / "architecture.sqlite"
+    emit_sqlite(built_graph, sqlite_path)
+
+    assert count_nodes(json_path) == len(built_graph["nodes"])
+    assert count_nodes(sqlite_path) == len(built_graph["nodes"])
+    assert count_nodes(tmp_path / "missing.json") is None
+
+
+def test_cache_reuses_graph_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "architecture.graph.json"
+    path.write_text(json.dumps({"nodes": [{"id": "a"}], "edges": []}))
+    cache = GraphCache()
+
+    first = cache.get(path)
+    assert first is not None
+    assert cache.get(path) is first
+    assert cache.loads == 1
+
+    path.write_text(json.dumps({"nodes": [{"id": "a"}, {"id": "b"}], "edges": []}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = cache.get(path)
+    assert second is not first
+    assert [n["id"] for n in second.nodes] == ["a", "b"]
+    assert cache.loads == 2
+
+
+def test_cache_returns_none_for_missing_or_corrupt_graph(tmp_path: Path) -> None:
+    cache = GraphCache()
+    path = tmp_path / "architecture.graph.json"
+    assert cache.get(path) is None
+    path.write_text("{not json")
+    assert cache.get(path) is None
@@ -43,3 +43,29 @@ def test_compute_high_impact_nodes_empty_graph() -> None:
 
     result = compute_high_impact_nodes([], [], threshold=5)
     assert result == []
+
+
+def test_compute_high_impact_nodes_reuses_prebuilt_index() -> None:
+    """A shared ReverseIndex gives the same ranking, cycles included."""
+    from arch_utils.traversal import ReverseIndex
+    from insights.impact_ranker import compute_high_impact_nodes
+
+    nodes = [{"id": nid} for nid in ("a", "b", "c", "d")]
+    edges = [
+        {"from": "b", "to": "a", "type": "call"},
+        {"from": "c", "to": "b", "type": "import"},
+        {"from": "b", "to": "c", "type": "import"},
+        {"from": "d", "to": "a", "type": "db_access"},
+    ]
+    index = ReverseIndex(edges)
+
+    result = compute_high_impact_nodes(nodes, edges, threshold=1, index=index)
+
+    assert result == compute_high_impact_nodes(nodes, edges, threshold=1)
+    assert result == [
+        {"id": "a", "dependent_count": 2},
+        {"id": "b", "dependent_count": 2},
+        {"id": "c", "dependent_count": 2},
+    ]
+    assert index.dependents("a") == frozenset({"b", "c"})
+    assert index.sources("a", frozenset({"call", "db_access"})) == ["b", "d"]
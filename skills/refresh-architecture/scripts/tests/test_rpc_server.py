@@ -12,9 +12,11 @@ COMPLETED / FAILED states without shelling out to refresh_architecture.sh.
 from __future__ import annotations
 
 import json
+import os
 import sys
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -85,6 +87,8 @@ class TestIsGraphStale:
         assert result["stale"] is False
         assert result["node_count"] == 50
         assert result["graph_mtime"] is not None
+        # The probe counts nodes without loading the graph into the cache.
+        assert server._graphs.loads == 0
 
     def test_old_graph_stale(self, tmp_path: Path) -> None:
         path = tmp_path / "architecture.graph.json"
@@ -213,6 +217,63 @@ class TestGetRefreshStatus:
         assert status["status"] == RefreshStatus.UNKNOWN.value
 
 
+# ---------------------------------------------------------------------------
+# affected_tests (warm graph)
+# ---------------------------------------------------------------------------
+
+
+def _covered_graph(test_file: str) -> dict[str, Any]:
+    return {
+        "nodes": [
+            {"id": "py:core", "file": "src/core.py"},
+            {"id": "py:test:t", "file": test_file},
+        ],
+        "edges": [{"from": "py:test:t", "to": "py:core", "type": "TEST_COVERS"}],
+    }
+
+
+class TestAffectedTests:
+    def test_queries_share_one_loaded_graph(self, tmp_path: Path) -> None:
+        path = tmp_path / "architecture.graph.json"
+        path.write_text(json.dumps(_covered_graph("tests/test_core.py")))
+        server = RefreshServer(graph_path=path)
+
+        assert server.affected_tests(["src/core.py"]) == {
+            "tests": ["tests/test_core.py"]
+        }
+        assert server.affected_tests(["src/other.py"]) == {"tests": []}
+        assert server.is_graph_stale()["node_count"] == 2
+        assert server._graphs.loads == 1
+
+    def test_rewritten_graph_is_reloaded(self, tmp_path: Path) -> None:
+        path = tmp_path / "architecture.graph.json"
+        path.write_text(json.dumps(_covered_graph("tests/test_core.py")))
+        server = RefreshServer(graph_path=path)
+        server.affected_tests(["src/core.py"])
+
+        path.write_text(json.dumps(_covered_graph("tests/test_core_v2.py")))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert server.affected_tests(["src/core.py"]) == {
+            "tests": ["tests/test_core_v2.py"]
+        }
+
+    def test_stale_graph_falls_back_to_full_suite(self, tmp_path: Path) -> None:
+        path = tmp_path / "architecture.graph.json"
+        path.write_text(json.dumps(_covered_graph("tests/test_core.py")))
+        old = time.time() - 10 * 3600
+        os.utime(path, (old, old))
+        server = RefreshServer(graph_path=path, max_age_hours=6)
+
+        assert server.affected_tests(["src/core.py"]) == {"tests": None}
+
+    def test_rejects_non_list_argument(self, tmp_path: Path) -> None:
+        server = RefreshServer(graph_path=tmp_path / "architecture.graph.json")
+        with pytest.raises(ValueError):
+            server.affected_tests("src/core.py")  # type: ignore[arg-type]
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point (subprocess-style invocation)
 # ---------------------------------------------------------------------------
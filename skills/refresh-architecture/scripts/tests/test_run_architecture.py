@@ -163,6 +163,21 @@ class TestStagedGeneration:
         report = json.loads(capsys.readouterr().out)
         assert report["status"] == "generated"
 
+    def test_staged_keeps_the_analysis_cache_outside_staging(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        seen: dict[str, str] = {}
+        runner = _fake_pipeline()
+
+        def _capture(target_dir: Path, env: dict, quick: bool) -> int:
+            seen.update(env)
+            return runner(target_dir, env, quick)
+
+        with patch.object(run_architecture, "_run_pipeline", _capture):
+            assert run_architecture.main(["--target-dir", str(tmp_path), "--staged"]) == 0
+        assert seen["PY_ANALYSIS_CACHE"] == str(
+            (tmp_path / "docs/architecture-analysis/.cache/python_analysis.cache.json").resolve()
+        )
+
     def test_repeat_staged_refresh_is_byte_identical(self, tmp_path: Path) -> None:
         # Scenario architecture-refresh.9
         _init_repo(tmp_path)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+
+def _load_hook_module() -> ModuleType:
+    hook_path = Path(__file__).resolve().parents[2] / "langfuse" / "scripts" / "langfuse_hook.py"
+    spec = importlib.util.spec_from_file_location("portable_langfuse_hook_incremental", hook_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _line(role: str, content: str) -> str:
+    return json.dumps({"role": role, "content": content}) + "\n"
+
+
+@pytest.fixture
+def hook(monkeypatch, tmp_path: Path) -> ModuleType:
+    module = _load_hook_module()
+    monkeypatch.setattr(module, "STATE_DIR", tmp_path / "state")
+    monkeypatch.setattr(module, "LOG_FILE", tmp_path / "state" / "hook.log")
+    return module
+
+
+@pytest.fixture
+def uploads(monkeypatch) -> list[str]:
+    """Install a fake langfuse module; returns the user inputs it receives."""
+    received: list[str] = []
+
+    class Observation:
+        def start_observation(self, **kwargs):
+            return Observation()
+
+        def update(self, **kwargs):
+            pass
+
+        def end(self):
+            pass
+
+    class Client:
+        instances = 0
+
+        def __init__(self, **kwargs):
+            type(self).instances += 1
+
+        def start_observation(self, **kwargs):
+            received.append(kwargs["input"])
+            return Observation()
+
+        def flush(self):
+            pass
+
+        def shutdown(self):
+            pass
+
+    fake = SimpleNamespace(Langfuse=Client, propagate_attributes=lambda **kwargs: nullcontext())
+    monkeypatch.setitem(sys.modules, "langfuse", fake)
+    monkeypatch.setenv("LANGFUSE_ENABLED", "true")
+    monkeypatch.setenv("LANGFUSE_PUBLIC_KEY", "pk-lf-test")
+    monkeypatch.setenv("LANGFUSE_SECRET_KEY", "sk-lf-test")
+    monkeypatch.setenv("CLAUDE_SESSION_ID", "session")
+    return received
+
+
+class TestReadTranscriptFrom:
+    def test_reads_from_byte_offset(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        first = _line("user", "msg1")
+        transcript.write_text(first + "\n" + "not json\n" + _line("user", "msg2"))
+
+        messages, end = hook.read_transcript_from(transcript, len(first))
+
+        assert [m["content"] for m in messages] == ["msg2"]
+        assert end == transcript.stat().st_size
+
+    def test_leaves_partial_trailing_line_unread(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        complete = _line("user", "msg1")
+        transcript.write_text(complete + '{"role": "assist')
+
+        messages, end = hook.read_transcript_from(transcript, 0)
+
+        assert len(messages) == 1
+        assert end == len(complete)
+
+    def test_consumes_complete_unterminated_line(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_line("user", "msg1").rstrip("\n"))
+
+        messages, end = hook.read_transcript_from(transcript, 0)
+
+        assert len(messages) == 1
+        assert end == transcript.stat().st_size
+
+    def test_handles_missing_file(self, hook, tmp_path: Path) -> None:
+        assert hook.read_transcript_from(tmp_path / "missing.jsonl", 0) == ([], 0)
+
+
+class TestResumeOffset:
+    def _state_after_read(self, hook, transcript: Path) -> dict:
+        fingerprint = hook.transcript_fingerprint(transcript)
+        return {"offset": fingerprint["size"], "fingerprint": fingerprint}
+
+    def test_resumes_after_append(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_line("user", "msg1"))
+        state = self._state_after_read(hook, transcript)
+        with open(transcript, "a") as f:
+            f.write(_line("user", "msg2"))
+
+        offset = hook.resume_offset(transcript, state, hook.transcript_fingerprint(transcript))
+
+        assert offset == state["offset"]
+
+    def test_restarts_after_truncation(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_line("user", "msg1") + _line("user", "msg2"))
+        state = self._state_after_read(hook, transcript)
+        with open(transcript, "r+") as f:
+            f.truncate(0)
+            f.write(_line("user", "x"))
+
+        assert hook.resume_offset(transcript, state, hook.transcript_fingerprint(transcript)) == 0
+
+    def test_restarts_after_rotation(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        transcript.write_text(_line("user", "msg1"))
+        state = self._state_after_read(hook, transcript)
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text(_line("user", "msg1") + _line("user", "msg2"))
+        os.replace(replacement, transcript)
+
+        assert hook.resume_offset(transcript, state, hook.transcript_fingerprint(transcript)) == 0
+
+    def test_converts_legacy_line_cursor(self, hook, tmp_path: Path) -> None:
+        transcript = tmp_path / "t.jsonl"
+        first = _line("user", "msg1")
+        transcript.write_text(first + _line("user", "msg2"))
+        state = {"last_line": 1, "trace_count": 3}
+
+        offset = hook.resume_offset(transcript, state, hook.transcript_fingerprint(transcript))
+
+        assert offset == len(first)
+
+
+class TestStopHook:
+    def test_sends_only_new_turns(self, hook, uploads, monkeypatch, tmp_path: Path) -> None:
+        monkeypatch.setenv("LANGFUSE_HOOK_SYNC", "true")
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(_line("user", "first") + _line("assistant", "one"))
+        monkeypatch.setattr(hook, "find_transcript", lambda: transcript)
+
+        hook.main([])
+        with open(transcript, "a") as f:
+            f.write(_line("user", "second") + _line("assistant", "two"))
+        hook.main([])
+
+        assert uploads == ["first", "second"]
+        state = hook.load_state("session")
+        assert state["offset"] == transcript.stat().st_size
+        assert state["trace_count"] == 2
+        assert "last_line" not in state
+
+    def test_queues_turns_for_background_upload(
+        self, hook, uploads, monkeypatch, tmp_path: Path,
+    ) -> None:
+        transcript = tmp_path / "session.jsonl"
+        transcript.write_text(_line("user", "first") + _line("assistant", "one"))
+        monkeypatch.setattr(hook, "find_transcript", lambda: transcript)
+        spawned: list[bool] = []
+        monkeypatch.setattr(hook, "spawn_uploader", lambda: spawned.append(True) or True)
+
+        hook.main([])
+
+        assert spawned == [True]
+        assert uploads == []
+        assert len(list(hook.get_queue_dir().glob("*.json"))) == 1
+
+        hook.main(["--drain"])
+
+        assert uploads == ["first"]
+        assert list(hook.get_queue_dir().glob("*.json")) == []
+
+    def test_drain_uploads_all_batches_with_one_client(self, hook, uploads) -> None:
+        turn = {"assistant_messages": [], "tool_calls": [], "model": ""}
+        hook.enqueue_turns([{**turn, "user_message": "a"}], "s1", "p")
+        hook.enqueue_turns([{**turn, "user_message": "b"}], "s2", "p")
+
+        assert hook.drain_queue() == 2
+        assert uploads == ["a", "b"]
+        assert sys.modules["langfuse"].Langfuse.instances == 1
+
+    def test_drain_without_fcntl_runs_unlocked(self, hook, uploads, monkeypatch) -> None:
+        monkeypatch.setattr(hook, "fcntl", None)
+        turn = {"assistant_messages": [], "tool_calls": [], "model": ""}
+        hook.enqueue_turns([{**turn, "user_message": "a"}], "s1", "p")
+
+        assert hook.drain_queue() == 1
+        assert uploads == ["a"]
+        assert list(hook.get_queue_dir().glob("*.json")) == []